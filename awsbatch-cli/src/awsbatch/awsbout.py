@@ -12,11 +12,29 @@
 
 import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import argparse
 
 from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, config_logger
-from awsbatch.utils import convert_to_date, fail, get_job_type
+from awsbatch.utils import convert_to_date, fail, get_job_type, is_job_array
+
+LOG_GROUP_NAME = "/aws/batch/job"
+# The maximum number of log events returned by the get_log_events function is as many log events
+# as can fit in a response size of 1 MB, up to 10,000 log events
+GET_LOG_EVENTS_MAX_LIMIT = 10000
+# describe_jobs accepts at most 100 jobs per call, filter_log_events at most 100 log streams
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+FILTER_LOG_EVENTS_MAX_STREAMS = 100
+DEFAULT_STREAM_PERIOD = 5
+MIN_STREAM_PERIOD = 1
+FOLLOW_MAX_WORKERS = 8
+DESCRIBE_JOBS_MAX_WORKERS = 8
+# Log streams without events in this period before the latest event of their group of followed log streams are idle:
+# their new events are retrieved only from the earliest position of the active log streams, so that the events of
+# the whole group are not retrieved again at every poll
+FOLLOW_MAX_EVENTS_DELAY = 5 * 60 * 1000  # milliseconds
 
 
 def _get_parser():
@@ -34,7 +52,7 @@ def _get_parser():
 
     :return: the ArgumentParser object
     """
-    parser = argparse.ArgumentParser(description="Shows the output of the given Job.")
+    parser = argparse.ArgumentParser(description="Shows the output of the given Jobs.")
     parser.add_argument("-c", "--cluster", help="Cluster to use")
     parser.add_argument("-hd", "--head", help="Gets the first <head> lines of the job output", type=int)
     parser.add_argument("-t", "--tail", help="Gets the last <tail> lines of the job output", type=int)
@@ -46,9 +64,21 @@ def _get_parser():
         "latest <tail> lines of the job output",
         action="store_true",
     )
-    parser.add_argument("-sp", "--stream-period", help="Sets the streaming period. Default is 5", type=int)
+    parser.add_argument(
+        "-sp",
+        "--stream-period",
+        help="Sets the maximum streaming period. The output is checked more often while it is being produced. "
+        "Default is %s" % DEFAULT_STREAM_PERIOD,
+        type=int,
+    )
     parser.add_argument("-ll", "--log-level", help=argparse.SUPPRESS, default="ERROR")
-    parser.add_argument("job_id", help="The job ID")
+    parser.add_argument(
+        "job_ids",
+        help="The job IDs. The output of array and multi-node parallel jobs children is shown together, "
+        "prefixed by the child job ID",
+        metavar="job_id",
+        nargs="+",
+    )
     return parser
 
 
@@ -68,6 +98,118 @@ def _validate_parameters(args):
         fail("Parameters validation error: --stream-period can be used only with --stream option")
 
 
+def _format_event(event, prefix=None):
+    """
+    Format a log event as an output line.
+
+    :param event: event returned by get_log_events or filter_log_events
+    :param prefix: optional id of the job the event belongs to
+    :return: the line to print, newline included
+    """
+    line = "{0}: {1}\n".format(convert_to_date(event["timestamp"]), event["message"])
+    return "[{0}] {1}".format(prefix, line) if prefix else line
+
+
+def _write_lines(lines):
+    """
+    Write a batch of lines to the standard output at once.
+
+    :param lines: lines to write
+    """
+    if lines:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+
+
+def _get_container(job):
+    """
+    Get the container properties of the given job.
+
+    :param job: the job dictionary returned by AWS Batch api
+    :return: the container properties, empty if not available
+    """
+    if "nodeProperties" in job:
+        # MNP job
+        return job["nodeProperties"]["nodeRangeProperties"][0]["container"]
+    return job.get("container", {})
+
+
+class _LogStreamsFollower:
+    """Follow a group of log streams of the AWS Batch log group through filter_log_events."""
+
+    def __init__(self, logs_client, log_streams, start_times=None, max_period=DEFAULT_STREAM_PERIOD):
+        """
+        Initialize the object.
+
+        :param logs_client: logs boto3 client
+        :param log_streams: up to FILTER_LOG_EVENTS_MAX_STREAMS log streams to follow
+        :param start_times: timestamp of the first event to retrieve by log stream, all the events if not given
+        :param max_period: maximum number of seconds between two polls
+        """
+        self.__logs_client = logs_client
+        self.__log_streams = log_streams
+        # The cursor of each log stream is the timestamp of its latest event returned, together with the ids of the
+        # events returned with that timestamp, since startTime is inclusive
+        self.__cursors = {log_stream: ((start_times or {}).get(log_stream), set()) for log_stream in log_streams}
+        self.__max_period = max_period
+        self.period = MIN_STREAM_PERIOD
+        self.next_poll_time = time.monotonic() + self.period
+
+    def poll(self):
+        """
+        Retrieve the events produced since the previous poll and schedule the next one.
+
+        The polling period is halved while new events are produced and doubled while the log streams are idle.
+
+        :return: list of new events, sorted by timestamp
+        """
+        kwargs = {"logGroupName": LOG_GROUP_NAME, "logStreamNames": self.__log_streams}
+        start_time = self.__get_start_time()
+        if start_time is not None:
+            kwargs["startTime"] = start_time
+        events = []
+        while True:
+            response = self.__logs_client.filter_log_events(**kwargs)
+            events.extend(event for event in response["events"] if self.__is_new(event))
+            if not response.get("nextToken"):
+                break
+            kwargs["nextToken"] = response["nextToken"]
+
+        events.sort(key=lambda event: event["timestamp"])
+        for event in events:
+            timestamp, event_ids = self.__cursors[event["logStreamName"]]
+            if event["timestamp"] == timestamp:
+                event_ids.add(event["eventId"])
+            else:
+                self.__cursors[event["logStreamName"]] = (event["timestamp"], {event["eventId"]})
+
+        self.period = max(self.period / 2, MIN_STREAM_PERIOD) if events else min(self.period * 2, self.__max_period)
+        self.next_poll_time = time.monotonic() + self.period
+        return events
+
+    def __get_start_time(self):
+        """
+        Return the timestamp to retrieve the events from, the earliest cursor of the active log streams.
+
+        The log streams whose cursor is older than FOLLOW_MAX_EVENTS_DELAY before the latest one, or without events,
+        are idle and do not hold the start time back.
+        """
+        timestamps = [timestamp for timestamp, _ in self.__cursors.values() if timestamp is not None]
+        if not timestamps:
+            return None
+        latest_timestamp = max(timestamps)
+        return min(timestamp for timestamp in timestamps if timestamp >= latest_timestamp - FOLLOW_MAX_EVENTS_DELAY)
+
+    def __is_new(self, event):
+        """Tell whether the given event comes after the cursor of its log stream."""
+        timestamp, event_ids = self.__cursors[event["logStreamName"]]
+        return (
+            timestamp is None
+            or event["timestamp"] > timestamp
+            or (event["timestamp"] == timestamp and event["eventId"] not in event_ids)
+        )
+
+
 class AWSBoutCommand:
     """awsbout command."""
 
@@ -81,60 +223,99 @@ class AWSBoutCommand:
         self.log = log
         self.boto3_factory = boto3_factory
 
-    def run(self, job_id, head=None, tail=None, stream=None, stream_period=None):
-        """Print job output."""
-        log_stream = self.__get_log_stream(job_id)
-        if log_stream:
-            self.log.info("Log stream is (%s)" % log_stream)
-            self.__print_log_stream(log_stream, head, tail, stream, stream_period)
+    def run(self, job_ids, head=None, tail=None, stream=None, stream_period=None):
+        """Print jobs output."""
+        log_streams = self.__get_log_streams(job_ids)
+        if log_streams:
+            self.log.info("Log streams are (%s)" % log_streams)
+            # the job id is shown in front of each line only when multiple outputs are printed together
+            prefixes = (
+                OrderedDict((log_stream, job_id) for job_id, log_stream in log_streams.items())
+                if len(log_streams) > 1
+                else OrderedDict((log_stream, None) for log_stream in log_streams.values())
+            )
+            if stream:
+                self.__follow_log_streams(prefixes, tail, stream_period)
+            else:
+                for log_stream, prefix in prefixes.items():
+                    self.__print_log_stream(log_stream, head, tail, prefix)
 
-    def __get_log_stream(self, job_id):
+    def __get_log_streams(self, job_ids):
         """
-        Get log stream for the given job.
+        Get log streams for the given jobs, expanding array and MNP jobs into their children.
 
-        :param job_id: job id (ARN)
-        :return: the log_stream if there, or None
+        :param job_ids: job ids (ARN)
+        :return: an OrderedDict with the log stream of each job having one, by job id
         """
-        log_stream = None
+        log_streams = OrderedDict()
         try:
             batch_client = self.boto3_factory.get_client("batch")
-            jobs = batch_client.describe_jobs(jobs=[job_id])["jobs"]
-            if len(jobs) == 1:
-                job = jobs[0]
+            job_ids = list(OrderedDict.fromkeys(job_ids))
+            jobs = self.__describe_jobs(batch_client, job_ids)
+            if len(jobs) != len(job_ids):
+                fail("Error asking job output for job (%s). Job not found." % ", ".join(job_ids))
+
+            for job in jobs:
                 self.log.debug(job)
 
-                if "nodeProperties" in job:
-                    # MNP job
-                    container = job["nodeProperties"]["nodeRangeProperties"][0]["container"]
-                elif "container" in job:
-                    container = job["container"]
+                if get_job_type(job) == "SIMPLE":
+                    children = [job]
                 else:
-                    container = {}
+                    separator, size = (
+                        (":", job["arrayProperties"]["size"])
+                        if is_job_array(job)
+                        else ("#", job["nodeProperties"]["numNodes"])
+                    )
+                    children_ids = ["{0}{1}{2}".format(job["jobId"], separator, index) for index in range(size)]
+                    children = self.__describe_jobs(batch_client, children_ids)
 
-                if get_job_type(job) != "SIMPLE":
-                    fail("No output available for the Job (%s). Please ask for its children." % job["jobId"])
-                else:
+                for child in children:
+                    container = _get_container(child)
                     if "logStreamName" in container:
-                        log_stream = container.get("logStreamName")
+                        log_streams[child["jobId"]] = container.get("logStreamName")
                     else:
-                        print("No log stream found for job (%s) in the status (%s)" % (job_id, job["status"]))
-            else:
-                fail("Error asking job output for job (%s). Job not found." % job_id)
+                        print("No log stream found for job (%s) in the status (%s)" % (child["jobId"], child["status"]))
         except Exception as e:
             fail("Error listing jobs from AWS Batch. Failed with exception: %s" % e)
-        return log_stream
+        return log_streams
+
+    @staticmethod
+    def __describe_jobs(batch_client, job_ids):
+        """
+        Describe the given jobs concurrently, in chunks of DESCRIBE_JOBS_CHUNK_SIZE elements.
 
-    def __print_log_stream(self, log_stream, head=None, tail=None, stream=None, stream_period=None):  # noqa: C901 FIXME
+        :param batch_client: batch boto3 client
+        :param job_ids: list of ids for the jobs to describe
+        :return: list of described jobs, in the order of job_ids, without the jobs not found
+        """
+        chunks = [
+            job_ids[index : index + DESCRIBE_JOBS_CHUNK_SIZE]  # noqa: E203
+            for index in range(0, len(job_ids), DESCRIBE_JOBS_CHUNK_SIZE)
+        ]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(DESCRIBE_JOBS_MAX_WORKERS, len(chunks))) as executor:
+                responses = list(executor.map(lambda chunk: batch_client.describe_jobs(jobs=chunk), chunks))
+        else:
+            # nothing to parallelize
+            responses = [batch_client.describe_jobs(jobs=chunk) for chunk in chunks]
+
+        described_jobs = {}
+        for response in responses:
+            for job in response["jobs"]:
+                described_jobs[job["jobId"]] = job
+                described_jobs[job.get("jobArn")] = job
+        return [described_jobs[job_id] for job_id in job_ids if job_id in described_jobs]
+
+    def __print_log_stream(self, log_stream, head=None, tail=None, prefix=None):
         """
         Ask for log stream and print it.
 
         :param log_stream: job log stream
+        :param prefix: optional id of the job, shown in front of each line
         """
         logs_client = self.boto3_factory.get_client("logs")
         try:
-            # The maximum number of log events returned by the get_log_events function is as many log events
-            # as can fit in a response size of 1 MB, up to 10,000 log events
-            max_limit = 10000
+            max_limit = GET_LOG_EVENTS_MAX_LIMIT
             if head:
                 limit = head
                 start_from_head = True
@@ -146,34 +327,75 @@ class AWSBoutCommand:
                 start_from_head = False
 
             response = logs_client.get_log_events(
-                logGroupName="/aws/batch/job", logStreamName=log_stream, limit=limit, startFromHead=start_from_head
+                logGroupName=LOG_GROUP_NAME, logStreamName=log_stream, limit=limit, startFromHead=start_from_head
             )
             events = response["events"]
             self.log.debug(response)
             if not events:
                 print("No events found.")
 
-            self.__print_events(events)
-            if limit == max_limit or stream:
+            _write_lines([_format_event(event, prefix) for event in events])
+            if limit == max_limit:
                 # get paginated items
                 next_token = response["nextForwardToken"]
-                while next_token is not None or stream:
+                while next_token is not None:
                     self.log.info("Next Forward Token is (%s)" % next_token)
-                    if stream:
-                        period = stream_period if stream_period else 5
-                        self.log.info("Waiting other %s seconds..." % period)
-                        time.sleep(period)
                     response = logs_client.get_log_events(
-                        logGroupName="/aws/batch/job", logStreamName=log_stream, nextToken=next_token
+                        logGroupName=LOG_GROUP_NAME, logStreamName=log_stream, nextToken=next_token
                     )
-                    self.__print_events(response["events"])
+                    _write_lines([_format_event(event, prefix) for event in response["events"]])
                     # if nextForwardToken is the same we passed in, we reached the end of the stream
-                    if stream:
-                        next_token = response["nextForwardToken"]
-                    else:
-                        next_token = (
-                            response["nextForwardToken"] if response["nextForwardToken"] != next_token else None
-                        )
+                    next_token = response["nextForwardToken"] if response["nextForwardToken"] != next_token else None
+        except KeyboardInterrupt:
+            self.log.info("Interrupted by the user")
+            sys.exit(0)
+        except Exception as e:
+            fail("Error listing jobs from AWS Batch. Failed with exception: %s" % e)
+
+    def __follow_log_streams(self, prefixes, tail=None, stream_period=None):
+        """
+        Print the log streams and wait for additional output to be produced, until interrupted by the user.
+
+        The streams are followed in groups of FILTER_LOG_EVENTS_MAX_STREAMS, polled concurrently, each group backing
+        off up to stream_period seconds while its streams are idle. The streams are printed from their head, or from
+        their latest <tail> events when tail is given.
+
+        :param prefixes: OrderedDict with the prefix to show in front of the lines of each log stream
+        :param tail: number of latest events to print for each log stream before following them
+        :param stream_period: maximum number of seconds between two polls
+        """
+        logs_client = self.boto3_factory.get_client("logs")
+        log_streams = list(prefixes.keys())
+        max_period = max(stream_period or DEFAULT_STREAM_PERIOD, MIN_STREAM_PERIOD)
+        try:
+            with ThreadPoolExecutor(max_workers=min(FOLLOW_MAX_WORKERS, len(log_streams))) as executor:
+                events, start_times = (
+                    self.__get_latest_events(logs_client, executor, log_streams, tail) if tail else ([], {})
+                )
+                followers = [
+                    _LogStreamsFollower(logs_client, streams_group, start_times, max_period)
+                    for streams_group in (
+                        log_streams[index : index + FILTER_LOG_EVENTS_MAX_STREAMS]  # noqa: E203
+                        for index in range(0, len(log_streams), FILTER_LOG_EVENTS_MAX_STREAMS)
+                    )
+                ]
+                if not tail:
+                    # the first poll retrieves the streams from their head
+                    events = self.__poll(executor, followers)
+                if not events:
+                    print("No events found.")
+                self.__print_events(events, prefixes)
+
+                while True:
+                    delay = min(follower.next_poll_time for follower in followers) - time.monotonic()
+                    if delay > 0:
+                        self.log.info("Waiting other %.1f seconds..." % delay)
+                        time.sleep(delay)
+                    now = time.monotonic()
+                    self.__print_events(
+                        self.__poll(executor, [follower for follower in followers if follower.next_poll_time <= now]),
+                        prefixes,
+                    )
         except KeyboardInterrupt:
             self.log.info("Interrupted by the user")
             sys.exit(0)
@@ -181,14 +403,46 @@ class AWSBoutCommand:
             fail("Error listing jobs from AWS Batch. Failed with exception: %s" % e)
 
     @staticmethod
-    def __print_events(events):
+    def __get_latest_events(logs_client, executor, log_streams, tail):
         """
-        Print given events.
+        Retrieve the latest events of the given log streams concurrently.
 
-        :param events: events to print
+        :param logs_client: logs boto3 client
+        :param executor: executor to retrieve the log streams with
+        :param log_streams: log streams to retrieve
+        :param tail: number of latest events to retrieve for each log stream
+        :return: the events with the name of their log stream, and the timestamp to follow each log stream from
         """
-        for event in events:
-            print("{0}: {1}".format(convert_to_date(event["timestamp"]), event["message"]))
+
+        def _get_latest_events(log_stream):
+            return logs_client.get_log_events(
+                logGroupName=LOG_GROUP_NAME, logStreamName=log_stream, limit=tail, startFromHead=False
+            )["events"]
+
+        events = []
+        start_times = {}
+        for log_stream, latest_events in zip(log_streams, executor.map(_get_latest_events, log_streams)):
+            events.extend(dict(event, logStreamName=log_stream) for event in latest_events)
+            if latest_events:
+                # events with the same timestamp of the latest one printed are considered already printed
+                start_times[log_stream] = latest_events[-1]["timestamp"] + 1
+        return events, start_times
+
+    @staticmethod
+    def __poll(executor, followers):
+        """Poll the given followers concurrently and return their new events."""
+        return [event for events in executor.map(_LogStreamsFollower.poll, followers) for event in events]
+
+    @staticmethod
+    def __print_events(events, prefixes):
+        """
+        Print the events of multiple log streams, sorted by timestamp.
+
+        :param events: events with the name of their log stream
+        :param prefixes: OrderedDict with the prefix to show in front of the lines of each log stream
+        """
+        events.sort(key=lambda event: event["timestamp"])
+        _write_lines([_format_event(event, prefixes.get(event["logStreamName"])) for event in events])
 
 
 def main():
@@ -203,7 +457,7 @@ def main():
         boto3_factory = Boto3ClientFactory(region=config.region, proxy=config.proxy)
 
         AWSBoutCommand(log, boto3_factory).run(
-            job_id=args.job_id, head=args.head, tail=args.tail, stream=args.stream, stream_period=args.stream_period
+            job_ids=args.job_ids, head=args.head, tail=args.tail, stream=args.stream, stream_period=args.stream_period
         )
 
     except KeyboardInterrupt:
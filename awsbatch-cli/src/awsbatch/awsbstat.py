@@ -11,10 +11,12 @@
 # See the License for the specific language governing permissions and limitations under the License.
 
 import collections
+import itertools
 import re
 import sys
 from builtins import range
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import argparse
 
@@ -30,6 +32,9 @@ from awsbatch.utils import (
 )
 
 AWS_BATCH_JOB_STATUS = ["SUBMITTED", "PENDING", "RUNNABLE", "STARTING", "RUNNING", "SUCCEEDED", "FAILED"]
+# describe_jobs accepts at most 100 jobs per call
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+DESCRIBE_JOBS_MAX_WORKERS = 8
 
 
 def _get_parser():
@@ -75,6 +80,29 @@ def _get_parser():
 class Job:
     """Generic job object."""
 
+    # Jobs are kept in memory until the whole output is sorted and printed, which can mean
+    # thousands of rows when children are expanded, so avoid a per-instance __dict__
+    __slots__ = (
+        "id",
+        "name",
+        "creation_time",
+        "start_time",
+        "stop_time",
+        "status",
+        "status_reason",
+        "job_definition",
+        "queue",
+        "command",
+        "reason",
+        "exit_code",
+        "vcpus",
+        "memory",
+        "nodes",
+        "log_stream",
+        "log_stream_url",
+        "s3_folder_url",
+    )
+
     def __init__(
         self,
         job_id,
@@ -387,16 +415,12 @@ class AWSBstatCommand:
         :param parent_jobs: list of triplets (job_id, job_id_separator, job_size)
         """
         try:
-            expanded_job_ids = []
-            for parent_job in parent_jobs:
-                expanded_job_ids.extend(
-                    [
-                        "{JOB_ID}{SEPARATOR}{INDEX}".format(JOB_ID=parent_job[0], SEPARATOR=parent_job[1], INDEX=i)
-                        for i in range(0, parent_job[2])
-                    ]
+            if parent_jobs:
+                expanded_job_ids = (
+                    "{JOB_ID}{SEPARATOR}{INDEX}".format(JOB_ID=parent_job[0], SEPARATOR=parent_job[1], INDEX=i)
+                    for parent_job in parent_jobs
+                    for i in range(0, parent_job[2])
                 )
-
-            if expanded_job_ids:
                 jobs = self.__chunked_describe_jobs(expanded_job_ids)
 
                 # forcing details to be False since already retrieved.
@@ -410,30 +434,45 @@ class AWSBstatCommand:
 
         describe_jobs API call has a hard limit on the number of job that can be
         retrieved with a single call. In case job_ids has more than 100 items, this function
-        distributes the describe_jobs call across multiple requests.
+        distributes the describe_jobs call across multiple concurrent requests.
+        Described jobs are yielded as soon as their chunk is available, preserving the order of job_ids,
+        and at most DESCRIBE_JOBS_MAX_WORKERS chunks are in flight at any time.
 
-        :param job_ids: list of ids for the jobs to describe.
-        :return: list of described jobs.
+        :param job_ids: iterable of ids for the jobs to describe.
+        :return: generator of described jobs.
         """
-        jobs = []
-        for index in range(0, len(job_ids), 100):
-            jobs_chunk = job_ids[index : index + 100]  # noqa: E203
-            jobs.extend(self.batch_client.describe_jobs(jobs=jobs_chunk)["jobs"])
-        return jobs
+        job_ids = iter(job_ids)
+        chunks = iter(lambda: list(itertools.islice(job_ids, DESCRIBE_JOBS_CHUNK_SIZE)), [])
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            return
+        second_chunk = next(chunks, None)
+        if second_chunk is None:
+            # nothing to parallelize
+            yield from self.batch_client.describe_jobs(jobs=first_chunk)["jobs"]
+            return
+
+        with ThreadPoolExecutor(max_workers=DESCRIBE_JOBS_MAX_WORKERS) as executor:
+            pending = collections.deque()
+            for chunk in itertools.chain([first_chunk, second_chunk], chunks):
+                if len(pending) >= DESCRIBE_JOBS_MAX_WORKERS:
+                    yield from pending.popleft().result()["jobs"]
+                pending.append(executor.submit(self.batch_client.describe_jobs, jobs=chunk))
+            while pending:
+                yield from pending.popleft().result()["jobs"]
 
     def __add_jobs(self, jobs, details=False):
         """
         Get job info from AWS Batch and add to the output.
 
-        :param jobs: list of jobs items (output of the list_jobs function)
+        :param jobs: list or generator of jobs items (output of the list_jobs or describe_jobs functions)
         :param details: ask for job details
         """
         try:
             if jobs:
-                self.log.debug("Adding jobs to the output (%s)" % jobs)
                 if details:
                     self.log.info("Asking for jobs details")
-                    jobs_to_show = self.__chunked_describe_jobs([job["jobId"] for job in jobs])
+                    jobs_to_show = self.__chunked_describe_jobs(job["jobId"] for job in jobs)
                 else:
                     jobs_to_show = jobs
 
@@ -0,0 +1,304 @@
+import logging
+
+import pytest
+
+from awsbatch.awsbout import FOLLOW_MAX_EVENTS_DELAY, LOG_GROUP_NAME, AWSBoutCommand, _LogStreamsFollower
+
+
+class _LogsClientMock:
+    """Serve the events of in-memory log streams like the CloudWatch Logs APIs used by awsbout."""
+
+    def __init__(self, page_size=100):
+        self.streams = {}
+        self.filter_log_events_calls = []
+        self.get_log_events_calls = []
+        self.__page_size = page_size
+
+    def add_event(self, log_stream, timestamp, message):
+        events = self.streams.setdefault(log_stream, [])
+        events.append(
+            {
+                "logStreamName": log_stream,
+                "timestamp": timestamp,
+                "message": message,
+                "eventId": "{0}-{1}".format(log_stream, len(events)),
+            }
+        )
+        events.sort(key=lambda event: event["timestamp"])
+
+    def get_log_events(self, logGroupName, logStreamName, limit=None, startFromHead=None, nextToken=None):
+        assert logGroupName == LOG_GROUP_NAME
+        self.get_log_events_calls.append({"logStreamName": logStreamName, "limit": limit, "nextToken": nextToken})
+        if nextToken:
+            return {"events": [], "nextForwardToken": nextToken}
+        events = self.streams.get(logStreamName, [])
+        events = events[:limit] if startFromHead else events[-limit:]
+        return {
+            "events": [{"timestamp": event["timestamp"], "message": event["message"]} for event in events],
+            "nextForwardToken": "f/token",
+        }
+
+    def filter_log_events(self, logGroupName, logStreamNames, startTime=0, nextToken=None):
+        assert logGroupName == LOG_GROUP_NAME
+        self.filter_log_events_calls.append({"logStreamNames": logStreamNames, "startTime": startTime})
+        events = sorted(
+            (
+                event
+                for log_stream in logStreamNames
+                for event in self.streams.get(log_stream, [])
+                if event["timestamp"] >= startTime
+            ),
+            key=lambda event: event["timestamp"],
+        )
+        start = int(nextToken or 0)
+        response = {"events": events[start : start + self.__page_size]}  # noqa: E203
+        if start + self.__page_size < len(events):
+            response["nextToken"] = str(start + self.__page_size)
+        return response
+
+
+class _ClockMock:
+    """Clock advanced by the sleeps, which interrupts the command after max_sleeps sleeps."""
+
+    def __init__(self, max_sleeps):
+        self.now = 0
+        self.sleeps = []
+        self.on_sleep = []
+        self.max_sleeps = max_sleeps
+
+    def sleep(self, seconds):
+        if len(self.sleeps) == self.max_sleeps:
+            raise KeyboardInterrupt
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self.on_sleep:
+            self.on_sleep.pop(0)()
+
+
+@pytest.fixture()
+def clock(mocker):
+    clock = _ClockMock(max_sleeps=2)
+    mocker.patch("awsbatch.awsbout.time.monotonic", side_effect=lambda: clock.now)
+    mocker.patch("awsbatch.awsbout.time.sleep", side_effect=clock.sleep)
+    return clock
+
+
+def _job(job_id, log_stream=None, **properties):
+    job = {"jobId": job_id, "jobArn": "arn:" + job_id, "status": "RUNNING", **properties}
+    if log_stream:
+        job["container"] = {"logStreamName": log_stream}
+    return job
+
+
+def _run_command(mocker, jobs, logs_client, job_ids, **kwargs):
+    """Run awsbout for the given job ids, the AWS Batch jobs being described from the given ones."""
+    jobs_by_id = {job["jobId"]: job for job in jobs}
+    batch_client = mocker.MagicMock()
+    batch_client.describe_jobs.side_effect = lambda jobs: {
+        "jobs": [jobs_by_id[job_id] for job_id in jobs if job_id in jobs_by_id]
+    }
+    boto3_factory = mocker.MagicMock()
+    boto3_factory.get_client.side_effect = {"batch": batch_client, "logs": logs_client}.get
+    AWSBoutCommand(logging.getLogger(), boto3_factory).run(job_ids, **kwargs)
+    return batch_client
+
+
+ARRAY_JOB = [
+    _job("job", arrayProperties={"size": 2}),
+    _job("job:0", "stream0"),
+    _job("job:1", "stream1"),
+]
+
+
+@pytest.mark.usefixtures("convert_to_date_mock")
+class TestLogStreamsOutput:
+    @pytest.mark.parametrize(
+        "jobs, job_ids, expected_describe_jobs_calls, expected_output",
+        [
+            (
+                [_job("job", "stream0")],
+                ["job", "arn:job"],
+                [["job", "arn:job"]],
+                ["1970-01-01T00:00:01+00:00: first\n", "1970-01-01T00:00:02+00:00: second\n"],
+            ),
+            (
+                ARRAY_JOB,
+                ["job"],
+                [["job"], ["job:0", "job:1"]],
+                [
+                    "[job:0] 1970-01-01T00:00:01+00:00: first\n",
+                    "[job:0] 1970-01-01T00:00:02+00:00: second\n",
+                    "[job:1] 1970-01-01T00:00:01+00:00: child\n",
+                ],
+            ),
+            (
+                [
+                    _job("job", nodeProperties={"numNodes": 3, "nodeRangeProperties": [{"container": {}}]}),
+                    _job(
+                        "job#0", nodeProperties={"nodeRangeProperties": [{"container": {"logStreamName": "stream0"}}]}
+                    ),
+                    _job("job#1", status="SUBMITTED"),
+                    _job(
+                        "job#2", nodeProperties={"nodeRangeProperties": [{"container": {"logStreamName": "stream1"}}]}
+                    ),
+                ],
+                ["job"],
+                [["job"], ["job#0", "job#1", "job#2"]],
+                [
+                    "No log stream found for job (job#1) in the status (SUBMITTED)\n",
+                    "[job#0] 1970-01-01T00:00:01+00:00: first\n",
+                    "[job#0] 1970-01-01T00:00:02+00:00: second\n",
+                    "[job#2] 1970-01-01T00:00:01+00:00: child\n",
+                ],
+            ),
+        ],
+        ids=["simple", "array", "mnp"],
+    )
+    def test_children_expansion(self, mocker, capsys, jobs, job_ids, expected_describe_jobs_calls, expected_output):
+        logs_client = _LogsClientMock()
+        logs_client.add_event("stream0", 1000, "first")
+        logs_client.add_event("stream0", 2000, "second")
+        logs_client.add_event("stream1", 1000, "child")
+
+        batch_client = _run_command(mocker, jobs, logs_client, job_ids)
+
+        assert [call[1]["jobs"] for call in batch_client.describe_jobs.call_args_list] == expected_describe_jobs_calls
+        assert capsys.readouterr().out == "".join(expected_output)
+
+    def test_children_expansion_in_chunks(self, mocker, capsys):
+        jobs = [_job("job", arrayProperties={"size": 250})]
+        logs_client = _LogsClientMock()
+        for index in range(250):
+            jobs.append(_job("job:{0}".format(index), "stream{0}".format(index)))
+            logs_client.add_event("stream{0}".format(index), 1000, "child {0}".format(index))
+
+        batch_client = _run_command(mocker, jobs, logs_client, ["job"])
+
+        # The chunks of children are described concurrently, their log streams are printed in the order of the children
+        describe_jobs_calls = [call[1]["jobs"] for call in batch_client.describe_jobs.call_args_list]
+        assert sorted(len(jobs) for jobs in describe_jobs_calls) == [1, 50, 100, 100]
+        assert capsys.readouterr().out == "".join(
+            "[job:{0}] 1970-01-01T00:00:01+00:00: child {0}\n".format(index) for index in range(250)
+        )
+
+    def test_job_not_found(self, mocker, capsys):
+        with pytest.raises(SystemExit) as error:
+            _run_command(mocker, [_job("job", "stream0")], _LogsClientMock(), ["job", "missing"])
+        assert error.value.code == 1
+        assert "Job not found" in capsys.readouterr().err
+
+    def test_follow_from_head(self, mocker, capsys, clock):
+        # every log stream is followed by its own group, so that the events of multiple groups are merged
+        mocker.patch("awsbatch.awsbout.FILTER_LOG_EVENTS_MAX_STREAMS", 1)
+        logs_client = _LogsClientMock(page_size=1)
+        logs_client.add_event("stream0", 1000, "a0")
+        logs_client.add_event("stream1", 500, "b0")
+        logs_client.add_event("stream1", 2000, "b1")
+        # an event of the first stream delivered after the later events of the second stream
+        clock.on_sleep.append(lambda: logs_client.add_event("stream0", 1500, "a1"))
+
+        with pytest.raises(SystemExit) as error:
+            _run_command(mocker, ARRAY_JOB, logs_client, ["job"], stream=True)
+
+        assert error.value.code == 0
+        assert capsys.readouterr().out == (
+            "[job:1] 1970-01-01T00:00:00+00:00: b0\n"
+            "[job:0] 1970-01-01T00:00:01+00:00: a0\n"
+            "[job:1] 1970-01-01T00:00:02+00:00: b1\n"
+            "[job:0] 1970-01-01T00:00:01+00:00: a1\n"
+        )
+        # The streams are printed from their head by the first poll
+        assert logs_client.get_log_events_calls == []
+        assert [call["startTime"] for call in logs_client.filter_log_events_calls[:3]] == [0, 0, 0]
+        # The idle stream backs off, while the other one keeps being polled every second
+        assert clock.sleeps == [1, 1]
+        polled_streams = [call["logStreamNames"] for call in logs_client.filter_log_events_calls]
+        assert polled_streams.count(["stream0"]) == 4
+        assert polled_streams.count(["stream1"]) == 3
+
+    def test_follow_with_tail(self, mocker, capsys, clock):
+        logs_client = _LogsClientMock()
+        logs_client.add_event("stream0", 2000, "a0")
+        logs_client.add_event("stream0", 3000, "a1")
+        logs_client.add_event("stream1", 1000, "b0")
+        # an event of the second stream older than the latest event of the first one
+        clock.on_sleep.append(lambda: logs_client.add_event("stream1", 2000, "b1"))
+
+        with pytest.raises(SystemExit) as error:
+            _run_command(mocker, ARRAY_JOB, logs_client, ["job"], stream=True, tail=1)
+
+        assert error.value.code == 0
+        assert capsys.readouterr().out == (
+            "[job:1] 1970-01-01T00:00:01+00:00: b0\n"
+            "[job:0] 1970-01-01T00:00:03+00:00: a1\n"
+            "[job:1] 1970-01-01T00:00:02+00:00: b1\n"
+        )
+        assert [call["limit"] for call in logs_client.get_log_events_calls] == [1, 1]
+        # Each stream is followed from its own latest event
+        assert [call["startTime"] for call in logs_client.filter_log_events_calls] == [1001, 2000]
+
+    def test_follow_without_events(self, mocker, capsys, clock):
+        clock.max_sleeps = 0
+
+        with pytest.raises(SystemExit):
+            _run_command(mocker, [_job("job", "stream0")], _LogsClientMock(), ["job"], stream=True)
+
+        assert capsys.readouterr().out == "No events found.\n"
+
+
+class TestLogStreamsFollower:
+    def test_poll(self, clock):
+        logs_client = _LogsClientMock(page_size=2)
+        logs_client.add_event("stream0", 1000, "a0")
+        logs_client.add_event("stream0", 1000, "a1")
+        logs_client.add_event("stream0", 1000, "a2")
+        logs_client.add_event("stream1", 1500, "b0")
+        follower = _LogStreamsFollower(logs_client, ["stream0", "stream1"], start_times={"stream0": 1000})
+
+        assert [event["message"] for event in follower.poll()] == ["a0", "a1", "a2", "b0"]
+        assert logs_client.filter_log_events_calls[0]["startTime"] == 1000
+
+        # The events with the same timestamp of the latest ones are told apart by their id
+        logs_client.add_event("stream0", 1000, "a3")
+        logs_client.add_event("stream1", 1500, "b1")
+        assert [event["message"] for event in follower.poll()] == ["a3", "b1"]
+        assert logs_client.filter_log_events_calls[-1]["startTime"] == 1000
+        assert follower.poll() == []
+
+    @pytest.mark.parametrize(
+        "events, expected_periods",
+        [([], [2, 4, 5, 5]), ([("stream0", 1000)], [1, 2, 4, 5])],
+    )
+    def test_backoff(self, clock, events, expected_periods):
+        logs_client = _LogsClientMock()
+        for log_stream, timestamp in events:
+            logs_client.add_event(log_stream, timestamp, "message")
+        follower = _LogStreamsFollower(logs_client, ["stream0"], max_period=5)
+
+        periods = []
+        for _ in expected_periods:
+            follower.poll()
+            periods.append(follower.period)
+        assert periods == expected_periods
+        assert follower.next_poll_time == clock.now + 5
+
+    @pytest.mark.parametrize(
+        "start_times, expected_start_time",
+        [
+            ({"stream0": 0, "stream1": 10 * FOLLOW_MAX_EVENTS_DELAY}, 10 * FOLLOW_MAX_EVENTS_DELAY),
+            ({"stream1": 10 * FOLLOW_MAX_EVENTS_DELAY}, 10 * FOLLOW_MAX_EVENTS_DELAY),
+            (
+                {"stream0": 9 * FOLLOW_MAX_EVENTS_DELAY, "stream1": 10 * FOLLOW_MAX_EVENTS_DELAY},
+                9 * FOLLOW_MAX_EVENTS_DELAY,
+            ),
+        ],
+        ids=["idle_stream", "stream_without_events", "active_streams"],
+    )
+    def test_start_time_of_idle_streams(self, clock, start_times, expected_start_time):
+        logs_client = _LogsClientMock()
+        follower = _LogStreamsFollower(logs_client, ["stream0", "stream1"], start_times=start_times)
+
+        follower.poll()
+
+        # The events are not retrieved again from the latest event of an idle stream
+        assert logs_client.filter_log_events_calls[0]["startTime"] == expected_start_time
@@ -162,6 +162,34 @@ class TestOutput:
 
         assert capsys.readouterr().out == read_text(test_datadir / expected)
 
+    def test_array_job_children_chunks(self, capsys, mocker, shared_datadir):
+        response_parent = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_array_job.json")
+        )
+        response_parent["jobs"][0]["arrayProperties"]["size"] = 250
+        child_template = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_array_job_children.json")
+        )["jobs"][0]
+
+        def _describe_jobs(jobs):
+            if jobs == ["3286a19c-68a9-47c9-8000-427d23ffc7ca"]:
+                return response_parent
+            return {"jobs": [dict(child_template, jobId=job_id) for job_id in jobs]}
+
+        batch_client = mocker.MagicMock()
+        batch_client.describe_jobs.side_effect = _describe_jobs
+        mocker.patch("awsbatch.common.Boto3ClientFactory.get_client", return_value=batch_client)
+
+        awsbstat.main(["-c", "cluster", "3286a19c-68a9-47c9-8000-427d23ffc7ca"])
+
+        # children are described in chunks of 100, which can run concurrently
+        chunk_sizes = sorted(len(call[1]["jobs"]) for call in batch_client.describe_jobs.call_args_list[1:])
+        assert chunk_sizes == [50, 100, 100]
+        output_job_ids = [line.split()[0] for line in capsys.readouterr().out.splitlines()[2:]]
+        assert output_job_ids == ["3286a19c-68a9-47c9-8000-427d23ffc7ca"] + [
+            "3286a19c-68a9-47c9-8000-427d23ffc7ca:{0}".format(index) for index in sorted(range(250), key=str)
+        ]
+
     @pytest.mark.parametrize(
         "args, expected",
         [
@@ -7,9 +7,10 @@
 # limitations under the License.
 
 # pylint: disable=W0613
+import functools
 import logging
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pcluster.api.controllers.common import (
     check_cluster_version,
@@ -22,6 +23,8 @@ from pcluster.api.controllers.common import (
 )
 from pcluster.api.converters import (
     cloud_formation_status_to_cluster_status,
+    cluster_status_to_cloud_formation_statuses,
+    validation_profiles_to_api_model,
     validation_results_to_config_validation_errors,
 )
 from pcluster.api.errors import (
@@ -35,6 +38,7 @@ from pcluster.api.models import (
     Change,
     CloudFormationStackStatus,
     ClusterConfigurationStructure,
+    ClusterDescriptionFailure,
     ClusterInfoSummary,
     ClusterStatus,
     CreateClusterBadRequestExceptionResponseContent,
@@ -59,6 +63,7 @@ from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import StackNotFoundError
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.constants import LIST_CLUSTERS_MAX_WORKERS
 from pcluster.models.cluster import (
     Cluster,
     ClusterActionError,
@@ -66,9 +71,9 @@ from pcluster.models.cluster import (
     ConfigValidationError,
     NotFoundClusterActionError,
 )
-from pcluster.models.cluster_resources import ClusterStack
-from pcluster.utils import get_installed_version, to_utc_datetime
-from pcluster.validators.common import FailureLevel
+from pcluster.models.cluster_resources import ClusterInstance, ClusterStack
+from pcluster.utils import get_installed_version, run_concurrently, to_utc_datetime
+from pcluster.validators.common import FailureLevel, ValidationProfiler
 
 LOGGER = logging.getLogger(__name__)
 
@@ -82,6 +87,7 @@ def create_cluster(
     validation_failure_level: str = None,
     dryrun: bool = None,
     rollback_on_failure: bool = None,
+    debug_validation_profile: bool = None,
 ) -> CreateClusterResponseContent:
     """
     Create a managed cluster in a given region.
@@ -100,6 +106,10 @@ def create_cluster(
     :param rollback_on_failure: When set it automatically initiates a cluster stack rollback on failures.
     (Defaults to &#39;true&#39;.)
     :type rollback_on_failure: bool
+    :param debug_validation_profile: Return the execution statistics of the config validators (time, AWS calls and
+    cache hits) in the response, including the error response of an invalid configuration.
+    (Defaults to &#39;false&#39;.)
+    :type debug_validation_profile: bool
     """
     assert_valid_node_js()
     # Set defaults
@@ -115,20 +125,28 @@ def create_cluster(
         LOGGER.error("Failed: configuration is required and cannot be empty")
         raise BadRequestException("configuration is required and cannot be empty")
 
+    validation_profiler = ValidationProfiler() if debug_validation_profile else None
     try:
         cluster = Cluster(create_cluster_request_content.cluster_name, cluster_config)
 
         if dryrun:
             ignored_validation_failures = cluster.validate_create_request(
-                get_validator_suppressors(suppress_validators), FailureLevel[validation_failure_level], dry_run=dryrun
+                get_validator_suppressors(suppress_validators),
+                FailureLevel[validation_failure_level],
+                dry_run=dryrun,
+                validation_profiler=validation_profiler,
             )
             validation_messages = validation_results_to_config_validation_errors(ignored_validation_failures)
-            raise DryrunOperationException(validation_messages=validation_messages or None)
+            raise DryrunOperationException(
+                validation_messages=validation_messages or None,
+                validation_profile=validation_profiles_to_api_model(validation_profiler),
+            )
 
         stack_id, ignored_validation_failures = cluster.create(
             disable_rollback=not rollback_on_failure,
             validator_suppressors=get_validator_suppressors(suppress_validators),
             validation_failure_level=FailureLevel[validation_failure_level],
+            validation_profiler=validation_profiler,
         )
 
         return CreateClusterResponseContent(
@@ -142,12 +160,15 @@ def create_cluster(
                 scheduler=Scheduler(type=cluster.config.scheduling.scheduler),
             ),
             validation_messages=validation_results_to_config_validation_errors(ignored_validation_failures) or None,
+            validation_profile=validation_profiles_to_api_model(validation_profiler),
         )
     except ConfigValidationError as e:
         config_validation_messages = validation_results_to_config_validation_errors(e.validation_failures) or None
         raise CreateClusterBadRequestException(
             CreateClusterBadRequestExceptionResponseContent(
-                configuration_validation_errors=config_validation_messages, message=str(e)
+                configuration_validation_errors=config_validation_messages,
+                message=str(e),
+                validation_profile=validation_profiles_to_api_model(validation_profiler),
             )
         )
 
@@ -211,54 +232,20 @@ def describe_cluster(cluster_name, region=None):
     """
     cluster = Cluster(cluster_name)
     validate_cluster(cluster)
-    cfn_stack = cluster.stack
-
-    fleet_status = cluster.compute_fleet_status
-
-    config_url = "NOT_AVAILABLE"
-    try:
-        config_url = cluster.config_presigned_url
-    except ClusterActionError as e:
-        # Do not fail request when S3 bucket is not available
-        LOGGER.error(e)
-
-    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
-    response = DescribeClusterResponseContent(
-        creation_time=to_utc_datetime(cfn_stack.creation_time),
-        version=cfn_stack.version,
-        cluster_configuration=ClusterConfigurationStructure(url=config_url),
-        tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
-        cloud_formation_stack_status=cfn_stack.status,
-        cluster_name=cluster_name,
-        compute_fleet_status=fleet_status.value,
-        cloudformation_stack_arn=cfn_stack.id,
-        last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
-        region=os.environ.get("AWS_DEFAULT_REGION"),
-        cluster_status=cluster_status,
-        scheduler=Scheduler(type=cluster.stack.scheduler, metadata=cluster.get_plugin_metadata()),
-        failures=_get_creation_failures(cluster_status, cfn_stack),
-    )
 
     try:
         head_node = cluster.head_node_instance
-        response.head_node = EC2Instance(
-            instance_id=head_node.id,
-            launch_time=to_utc_datetime(head_node.launch_time),
-            public_ip_address=head_node.public_ip,
-            instance_type=head_node.instance_type,
-            state=InstanceState.from_dict(head_node.state),
-            private_ip_address=head_node.private_ip,
-        )
     except ClusterActionError as e:
         # This should not be treated as a failure cause head node might not be running in some cases
         LOGGER.info(e)
+        head_node = None
 
-    return response
+    return _get_cluster_description(cluster, head_node)
 
 
 @configure_aws_region()
 @convert_errors()
-def list_clusters(region=None, next_token=None, cluster_status=None):
+def list_clusters(region=None, next_token=None, cluster_status=None, cluster_names=None, detail=None):
     """
     Retrieve the list of existing clusters managed by the API. Deleted clusters are not listed by default.
 
@@ -268,30 +255,84 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
     :type next_token: str
     :param cluster_status: Filter by cluster status. (Defaults to all clusters.)
     :type cluster_status: list | bytes
+    :param cluster_names: Names of the clusters to retrieve, instead of listing all the clusters.
+    Cannot be used with nextToken.
+    :type cluster_names: List[str]
+    :param detail: Return the detailed information of the clusters, as returned by DescribeCluster.
+    Requires clusterNames. (Defaults to &#39;false&#39;.)
+    :type detail: bool
 
     :rtype: ListClustersResponseContent
     """
-    stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+    if detail and not cluster_names:
+        raise BadRequestException("The detailed information of the clusters can only be requested with clusterNames.")
+    if cluster_names:
+        if next_token:
+            raise BadRequestException("clusterNames cannot be used with nextToken.")
+        return _get_clusters(list(dict.fromkeys(cluster_names)), cluster_status, detail)
+
+    stack_statuses = cluster_status_to_cloud_formation_statuses(cluster_status) if cluster_status else None
+    stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(
+        next_token=next_token, stack_statuses=stack_statuses
+    )
     stacks = [ClusterStack(stack) for stack in stacks]
 
     clusters = []
     for stack in stacks:
         current_cluster_status = cloud_formation_status_to_cluster_status(stack.status)
         if not cluster_status or current_cluster_status in cluster_status:
-            cluster_info = ClusterInfoSummary(
-                cluster_name=stack.cluster_name,
-                cloudformation_stack_status=stack.status,
-                cloudformation_stack_arn=stack.id,
-                region=os.environ.get("AWS_DEFAULT_REGION"),
-                version=stack.version,
-                cluster_status=current_cluster_status,
-                scheduler=Scheduler(type=stack.scheduler),
-            )
-            clusters.append(cluster_info)
+            clusters.append(_get_cluster_summary(stack))
 
     return ListClustersResponseContent(clusters=clusters, next_token=next_token)
 
 
+def _get_clusters(cluster_names: List[str], cluster_status: Optional[List[str]], detail: bool):
+    """Retrieve the given clusters concurrently, reporting the ones that cannot be retrieved as failures."""
+    head_nodes = {}
+    if detail:
+        try:
+            head_nodes = Cluster.get_head_node_instances(cluster_names)
+        except ClusterActionError as e:
+            # This should not be treated as a failure cause head nodes are optional in the response
+            LOGGER.info(e)
+
+    def _get_cluster(cluster_name):
+        cluster = Cluster(cluster_name)
+        try:
+            validate_cluster(cluster)
+        except (BadRequestException, NotFoundException) as e:
+            return None, None, ClusterDescriptionFailure(cluster_name=cluster_name, message=e.content.message)
+        if cluster_status and cloud_formation_status_to_cluster_status(cluster.stack.status) not in cluster_status:
+            return None, None, None
+        details = _get_cluster_description(cluster, head_nodes.get(cluster_name)) if detail else None
+        return _get_cluster_summary(cluster.stack), details, None
+
+    results = run_concurrently(
+        [functools.partial(_get_cluster, cluster_name) for cluster_name in cluster_names],
+        max_workers=LIST_CLUSTERS_MAX_WORKERS,
+        thread_name_prefix="list-clusters",
+    )
+    summaries, details, failures = zip(*results)
+    return ListClustersResponseContent(
+        clusters=list(filter(None, summaries)),
+        cluster_details=list(filter(None, details)) if detail else None,
+        failed_clusters=list(filter(None, failures)),
+    )
+
+
+def _get_cluster_summary(stack: ClusterStack):
+    """Build the summary of the cluster of the given stack, as returned by ListClusters."""
+    return ClusterInfoSummary(
+        cluster_name=stack.cluster_name,
+        cloudformation_stack_status=stack.status,
+        cloudformation_stack_arn=stack.id,
+        region=os.environ.get("AWS_DEFAULT_REGION"),
+        version=stack.version,
+        cluster_status=cloud_formation_status_to_cluster_status(stack.status),
+        scheduler=Scheduler(type=stack.scheduler),
+    )
+
+
 @convert_errors()
 @http_success_status_code(202)
 def update_cluster(
@@ -302,6 +343,7 @@ def update_cluster(
     region=None,
     dryrun=None,
     force_update=None,
+    debug_validation_profile=None,
 ):
     """
     Update a cluster managed in a given region.
@@ -323,6 +365,10 @@ def update_cluster(
     :param force_update: Force update by ignoring the update validation errors.
     (Defaults to &#39;false&#39;.)
     :type force_update: bool
+    :param debug_validation_profile: Return the execution statistics of the config validators (time, AWS calls and
+    cache hits) in the response, including the error response of an invalid configuration.
+    (Defaults to &#39;false&#39;.)
+    :type debug_validation_profile: bool
 
     :rtype: UpdateClusterResponseContent
     """
@@ -339,6 +385,7 @@ def update_cluster(
         LOGGER.error("Failed: configuration is required and cannot be empty")
         raise BadRequestException("configuration is required and cannot be empty")
 
+    validation_profiler = ValidationProfiler() if debug_validation_profile else None
     try:
         cluster = Cluster(cluster_name)
         if not check_cluster_version(cluster, exact_match=True):
@@ -354,16 +401,22 @@ def update_cluster(
                 validator_suppressors=get_validator_suppressors(suppress_validators),
                 validation_failure_level=FailureLevel[validation_failure_level],
                 dry_run=dryrun,
+                validation_profiler=validation_profiler,
             )
             change_set, _ = _analyze_changes(changes)
             validation_messages = validation_results_to_config_validation_errors(ignored_validation_failures)
-            raise DryrunOperationException(change_set=change_set, validation_messages=validation_messages or None)
+            raise DryrunOperationException(
+                change_set=change_set,
+                validation_messages=validation_messages or None,
+                validation_profile=validation_profiles_to_api_model(validation_profiler),
+            )
 
         changes, ignored_validation_failures = cluster.update(
             target_source_config=cluster_config,
             validator_suppressors=get_validator_suppressors(suppress_validators),
             validation_failure_level=FailureLevel[validation_failure_level],
             force=force_update,
+            validation_profiler=validation_profiler,
         )
 
         change_set, _ = _analyze_changes(changes)
@@ -379,23 +432,26 @@ def update_cluster(
             ),
             validation_messages=validation_results_to_config_validation_errors(ignored_validation_failures) or None,
             change_set=change_set,
+            validation_profile=validation_profiles_to_api_model(validation_profiler),
         )
     except ConfigValidationError as e:
         config_validation_messages = validation_results_to_config_validation_errors(e.validation_failures) or None
         raise UpdateClusterBadRequestException(
             UpdateClusterBadRequestExceptionResponseContent(
-                configuration_validation_errors=config_validation_messages, message=str(e)
+                configuration_validation_errors=config_validation_messages,
+                message=str(e),
+                validation_profile=validation_profiles_to_api_model(validation_profiler),
             )
         )
     except ClusterUpdateError as e:
-        raise _handle_cluster_update_error(e)
+        raise _handle_cluster_update_error(e, validation_profiler)
     except (NotFoundClusterActionError, StackNotFoundError):
         raise NotFoundException(
             f"Cluster '{cluster_name}' does not exist or belongs to an incompatible ParallelCluster major version."
         )
 
 
-def _handle_cluster_update_error(e):
+def _handle_cluster_update_error(e, validation_profiler: ValidationProfiler = None):
     """Create an UpdateClusterBadRequestExceptionResponseContent in case of failure during patch validation.
 
     Note that patch validation is carried out once we have successfully validated the configuration. For this reason, we
@@ -406,7 +462,10 @@ def _handle_cluster_update_error(e):
     change_set, errors = _analyze_changes(e.update_changes)
     return UpdateClusterBadRequestException(
         UpdateClusterBadRequestExceptionResponseContent(
-            message=str(e), change_set=change_set, update_validation_errors=errors or None
+            message=str(e),
+            change_set=change_set,
+            update_validation_errors=errors or None,
+            validation_profile=validation_profiles_to_api_model(validation_profiler),
         )
     )
 
@@ -447,6 +506,51 @@ def _create_message(failure_reason, action_needed):
     return message or "Error during update"
 
 
+def _get_cluster_description(cluster: Cluster, head_node: Optional[ClusterInstance]):
+    """Build the DescribeCluster response of a validated cluster, given its head node instance if any."""
+    cfn_stack = cluster.stack
+
+    fleet_status = cluster.compute_fleet_status
+
+    config_url = "NOT_AVAILABLE"
+    try:
+        config_url = cluster.config_presigned_url
+    except ClusterActionError as e:
+        # Do not fail request when S3 bucket is not available
+        LOGGER.error(e)
+
+    # The scheduler metadata requires to load the cluster configuration, only do it when it can be there
+    metadata = cluster.get_plugin_metadata() if cfn_stack.scheduler == "plugin" else None
+    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
+    response = DescribeClusterResponseContent(
+        creation_time=to_utc_datetime(cfn_stack.creation_time),
+        version=cfn_stack.version,
+        cluster_configuration=ClusterConfigurationStructure(url=config_url),
+        tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
+        cloud_formation_stack_status=cfn_stack.status,
+        cluster_name=cluster.name,
+        compute_fleet_status=fleet_status.value,
+        cloudformation_stack_arn=cfn_stack.id,
+        last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
+        region=os.environ.get("AWS_DEFAULT_REGION"),
+        cluster_status=cluster_status,
+        scheduler=Scheduler(type=cfn_stack.scheduler, metadata=metadata),
+        failures=_get_creation_failures(cluster_status, cfn_stack),
+    )
+
+    if head_node:
+        response.head_node = EC2Instance(
+            instance_id=head_node.id,
+            launch_time=to_utc_datetime(head_node.launch_time),
+            public_ip_address=head_node.public_ip,
+            instance_type=head_node.instance_type,
+            state=InstanceState.from_dict(head_node.state),
+            private_ip_address=head_node.private_ip,
+        )
+
+    return response
+
+
 def _get_creation_failures(cluster_status, cfn_stack):
     """Get a list of Failure objects containing failure code and reason when cluster creation failed."""
     if cluster_status != ClusterStatus.CREATE_FAILED:
@@ -9,9 +9,9 @@ from typing import List
 
 from pcluster.api.models import CloudFormationStackStatus, ClusterStatus, ConfigValidationMessage, ImageBuildStatus
 from pcluster.api.models import NodeType as ApiNodeType
-from pcluster.api.models import ValidationLevel
+from pcluster.api.models import ValidationLevel, ValidatorProfile
 from pcluster.models.cluster import NodeType
-from pcluster.validators.common import ValidationResult
+from pcluster.validators.common import ValidationProfiler, ValidationResult
 
 
 def cloud_formation_status_to_cluster_status(cfn_status):
@@ -28,6 +28,15 @@ def cloud_formation_status_to_cluster_status(cfn_status):
     return mapping.get(cfn_status, cfn_status)
 
 
+def cluster_status_to_cloud_formation_statuses(cluster_statuses: List[str]):
+    """Return the CloudFormation stack statuses corresponding to the given cluster statuses."""
+    return [
+        cfn_status
+        for name, cfn_status in vars(CloudFormationStackStatus).items()
+        if name.isupper() and cloud_formation_status_to_cluster_status(cfn_status) in cluster_statuses
+    ]
+
+
 def cloud_formation_status_to_image_status(cfn_status):
     mapping = {
         CloudFormationStackStatus.CREATE_IN_PROGRESS: ImageBuildStatus.BUILD_IN_PROGRESS,
@@ -66,6 +75,23 @@ def validation_results_to_config_validation_errors(
     return configuration_validation_messages
 
 
+def validation_profiles_to_api_model(validation_profiler: ValidationProfiler) -> List[ValidatorProfile]:
+    if not validation_profiler:
+        return None
+    return [
+        ValidatorProfile(
+            type=profile["type"],
+            executions=profile["executions"],
+            total_time=profile["totalTime"],
+            max_time=profile["maxTime"],
+            aws_calls=profile["awsCalls"],
+            aws_operations=profile["awsOperations"],
+            cache_hits=profile["cacheHits"],
+        )
+        for profile in validation_profiler.get_profiles()
+    ]
+
+
 def api_node_type_to_cluster_node_type(node_type: ApiNodeType):
     mapping = {ApiNodeType.HEADNODE: NodeType.HEAD_NODE, ApiNodeType.COMPUTENODE: NodeType.COMPUTE}
     return mapping.get(node_type)
@@ -142,10 +142,14 @@ class DryrunOperationException(ParallelClusterApiException):
         content: str = "Request would have succeeded, but DryRun flag is set.",
         change_set=None,
         validation_messages=None,
+        validation_profile=None,
     ):
         super().__init__(
             DryrunOperationExceptionResponseContent(
-                message=content, change_set=change_set, validation_messages=validation_messages
+                message=content,
+                change_set=change_set,
+                validation_messages=validation_messages,
+                validation_profile=validation_profile,
             )
         )
 
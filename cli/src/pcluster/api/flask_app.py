@@ -24,7 +24,7 @@ from pcluster.api.errors import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, Cache
+from pcluster.aws.common import AWSClientError, Cache, CacheVolatility
 
 LOGGER = logging.getLogger(__name__)
 
@@ -93,8 +93,9 @@ class ParallelClusterFlaskApp:
 
         @self.flask_app.before_request
         def _clear_cache():
-            # Cache is meant to be reused only within a single request
-            Cache.clear_all()
+            # Request scoped cache entries are meant to be reused only within a single request,
+            # while stable and immutable data (e.g. official AMIs, instance types info) is kept until its TTL expires
+            Cache.clear(CacheVolatility.REQUEST)
             AWSApi.reset()
 
         @self.flask_app.before_request
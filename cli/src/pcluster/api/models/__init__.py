@@ -22,6 +22,7 @@ from pcluster.api.models.build_image_response_content import BuildImageResponseC
 from pcluster.api.models.change import Change
 from pcluster.api.models.cloud_formation_stack_status import CloudFormationStackStatus
 from pcluster.api.models.cluster_configuration_structure import ClusterConfigurationStructure
+from pcluster.api.models.cluster_description_failure import ClusterDescriptionFailure
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
 from pcluster.api.models.cluster_instance import ClusterInstance
 from pcluster.api.models.cluster_status import ClusterStatus
@@ -82,3 +83,4 @@ from pcluster.api.models.update_compute_fleet_request_content import UpdateCompu
 from pcluster.api.models.update_compute_fleet_response_content import UpdateComputeFleetResponseContent
 from pcluster.api.models.update_error import UpdateError
 from pcluster.api.models.validation_level import ValidationLevel
+from pcluster.api.models.validator_profile import ValidatorProfile
@@ -0,0 +1,102 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+import re
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class ClusterDescriptionFailure(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, cluster_name=None, message=None):
+        """ClusterDescriptionFailure - a model defined in OpenAPI
+
+        :param cluster_name: The cluster_name of this ClusterDescriptionFailure.
+        :type cluster_name: str
+        :param message: The message of this ClusterDescriptionFailure.
+        :type message: str
+        """
+        self.openapi_types = {"cluster_name": str, "message": str}
+
+        self.attribute_map = {"cluster_name": "clusterName", "message": "message"}
+
+        self._cluster_name = cluster_name
+        self._message = message
+
+    @classmethod
+    def from_dict(cls, dikt) -> "ClusterDescriptionFailure":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ClusterDescriptionFailure of this ClusterDescriptionFailure.
+        :rtype: ClusterDescriptionFailure
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def cluster_name(self):
+        """Gets the cluster_name of this ClusterDescriptionFailure.
+
+        Name of the cluster.
+
+        :return: The cluster_name of this ClusterDescriptionFailure.
+        :rtype: str
+        """
+        return self._cluster_name
+
+    @cluster_name.setter
+    def cluster_name(self, cluster_name):
+        """Sets the cluster_name of this ClusterDescriptionFailure.
+
+        Name of the cluster.
+
+        :param cluster_name: The cluster_name of this ClusterDescriptionFailure.
+        :type cluster_name: str
+        """
+        if cluster_name is None:
+            raise ValueError("Invalid value for `cluster_name`, must not be `None`")
+        if cluster_name is not None and not re.search(r"^[a-zA-Z][a-zA-Z0-9-]+$", cluster_name):
+            raise ValueError(
+                "Invalid value for `cluster_name`, must be a follow pattern or equal to `/^[a-zA-Z][a-zA-Z0-9-]+$/`"
+            )
+
+        self._cluster_name = cluster_name
+
+    @property
+    def message(self):
+        """Gets the message of this ClusterDescriptionFailure.
+
+        Reason why the cluster could not be retrieved.
+
+        :return: The message of this ClusterDescriptionFailure.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        """Sets the message of this ClusterDescriptionFailure.
+
+        Reason why the cluster could not be retrieved.
+
+        :param message: The message of this ClusterDescriptionFailure.
+        :type message: str
+        """
+        if message is None:
+            raise ValueError("Invalid value for `message`, must not be `None`")
+
+        self._message = message
@@ -14,6 +14,7 @@ from typing import List
 from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.config_validation_message import ConfigValidationMessage
+from pcluster.api.models.validator_profile import ValidatorProfile
 
 
 class CreateClusterBadRequestExceptionResponseContent(Model):
@@ -22,7 +23,7 @@ class CreateClusterBadRequestExceptionResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, configuration_validation_errors=None, message=None):
+    def __init__(self, configuration_validation_errors=None, message=None, validation_profile=None):
         """CreateClusterBadRequestExceptionResponseContent - a model defined in OpenAPI
 
         :param configuration_validation_errors: The configuration_validation_errors of this
@@ -30,13 +31,24 @@ class CreateClusterBadRequestExceptionResponseContent(Model):
         :type configuration_validation_errors: List[ConfigValidationMessage]
         :param message: The message of this CreateClusterBadRequestExceptionResponseContent.
         :type message: str
+        :param validation_profile: The validation_profile of this CreateClusterBadRequestExceptionResponseContent.
+        :type validation_profile: List[ValidatorProfile]
         """
-        self.openapi_types = {"configuration_validation_errors": List[ConfigValidationMessage], "message": str}
-
-        self.attribute_map = {"configuration_validation_errors": "configurationValidationErrors", "message": "message"}
+        self.openapi_types = {
+            "configuration_validation_errors": List[ConfigValidationMessage],
+            "message": str,
+            "validation_profile": List[ValidatorProfile],
+        }
+
+        self.attribute_map = {
+            "configuration_validation_errors": "configurationValidationErrors",
+            "message": "message",
+            "validation_profile": "validationProfile",
+        }
 
         self._configuration_validation_errors = configuration_validation_errors
         self._message = message
+        self._validation_profile = validation_profile
 
     @classmethod
     def from_dict(cls, dikt) -> "CreateClusterBadRequestExceptionResponseContent":
@@ -92,3 +104,26 @@ class CreateClusterBadRequestExceptionResponseContent(Model):
         """
 
         self._message = message
+
+    @property
+    def validation_profile(self):
+        """Gets the validation_profile of this CreateClusterBadRequestExceptionResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :return: The validation_profile of this CreateClusterBadRequestExceptionResponseContent.
+        :rtype: List[ValidatorProfile]
+        """
+        return self._validation_profile
+
+    @validation_profile.setter
+    def validation_profile(self, validation_profile):
+        """Sets the validation_profile of this CreateClusterBadRequestExceptionResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :param validation_profile: The validation_profile of this CreateClusterBadRequestExceptionResponseContent.
+        :type validation_profile: List[ValidatorProfile]
+        """
+
+        self._validation_profile = validation_profile
@@ -15,6 +15,7 @@ from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
 from pcluster.api.models.config_validation_message import ConfigValidationMessage
+from pcluster.api.models.validator_profile import ValidatorProfile
 
 
 class CreateClusterResponseContent(Model):
@@ -23,20 +24,31 @@ class CreateClusterResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, cluster=None, validation_messages=None):
+    def __init__(self, cluster=None, validation_messages=None, validation_profile=None):
         """CreateClusterResponseContent - a model defined in OpenAPI
 
         :param cluster: The cluster of this CreateClusterResponseContent.
         :type cluster: ClusterInfoSummary
         :param validation_messages: The validation_messages of this CreateClusterResponseContent.
         :type validation_messages: List[ConfigValidationMessage]
+        :param validation_profile: The validation_profile of this CreateClusterResponseContent.
+        :type validation_profile: List[ValidatorProfile]
         """
-        self.openapi_types = {"cluster": ClusterInfoSummary, "validation_messages": List[ConfigValidationMessage]}
-
-        self.attribute_map = {"cluster": "cluster", "validation_messages": "validationMessages"}
+        self.openapi_types = {
+            "cluster": ClusterInfoSummary,
+            "validation_messages": List[ConfigValidationMessage],
+            "validation_profile": List[ValidatorProfile],
+        }
+
+        self.attribute_map = {
+            "cluster": "cluster",
+            "validation_messages": "validationMessages",
+            "validation_profile": "validationProfile",
+        }
 
         self._cluster = cluster
         self._validation_messages = validation_messages
+        self._validation_profile = validation_profile
 
     @classmethod
     def from_dict(cls, dikt) -> "CreateClusterResponseContent":
@@ -95,3 +107,26 @@ class CreateClusterResponseContent(Model):
         :type validation_messages: List[ConfigValidationMessage]
         """
         self._validation_messages = validation_messages
+
+    @property
+    def validation_profile(self):
+        """Gets the validation_profile of this CreateClusterResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :return: The validation_profile of this CreateClusterResponseContent.
+        :rtype: List[ValidatorProfile]
+        """
+        return self._validation_profile
+
+    @validation_profile.setter
+    def validation_profile(self, validation_profile):
+        """Sets the validation_profile of this CreateClusterResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :param validation_profile: The validation_profile of this CreateClusterResponseContent.
+        :type validation_profile: List[ValidatorProfile]
+        """
+
+        self._validation_profile = validation_profile
@@ -16,6 +16,7 @@ from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.change import Change
 from pcluster.api.models.config_validation_message import ConfigValidationMessage
+from pcluster.api.models.validator_profile import ValidatorProfile
 
 
 class DryrunOperationExceptionResponseContent(Model):
@@ -24,7 +25,7 @@ class DryrunOperationExceptionResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, validation_messages=None, message=None, change_set=None):
+    def __init__(self, validation_messages=None, message=None, change_set=None, validation_profile=None):
         """DryrunOperationExceptionResponseContent - a model defined in OpenAPI
 
         :param validation_messages: The validation_messages of this DryrunOperationExceptionResponseContent.
@@ -33,22 +34,27 @@ class DryrunOperationExceptionResponseContent(Model):
         :type message: str
         :param change_set: The change_set of this DryrunOperationExceptionResponseContent.
         :type change_set: List[Change]
+        :param validation_profile: The validation_profile of this DryrunOperationExceptionResponseContent.
+        :type validation_profile: List[ValidatorProfile]
         """
         self.openapi_types = {
             "validation_messages": List[ConfigValidationMessage],
             "message": str,
             "change_set": List[Change],
+            "validation_profile": List[ValidatorProfile],
         }
 
         self.attribute_map = {
             "validation_messages": "validationMessages",
             "message": "message",
             "change_set": "changeSet",
+            "validation_profile": "validationProfile",
         }
 
         self._validation_messages = validation_messages
         self._message = message
         self._change_set = change_set
+        self._validation_profile = validation_profile
 
     @classmethod
     def from_dict(cls, dikt) -> "DryrunOperationExceptionResponseContent":
@@ -127,3 +133,26 @@ class DryrunOperationExceptionResponseContent(Model):
         """
 
         self._change_set = change_set
+
+    @property
+    def validation_profile(self):
+        """Gets the validation_profile of this DryrunOperationExceptionResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :return: The validation_profile of this DryrunOperationExceptionResponseContent.
+        :rtype: List[ValidatorProfile]
+        """
+        return self._validation_profile
+
+    @validation_profile.setter
+    def validation_profile(self, validation_profile):
+        """Sets the validation_profile of this DryrunOperationExceptionResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :param validation_profile: The validation_profile of this DryrunOperationExceptionResponseContent.
+        :type validation_profile: List[ValidatorProfile]
+        """
+
+        self._validation_profile = validation_profile
@@ -13,7 +13,9 @@ from typing import List
 
 from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.cluster_description_failure import ClusterDescriptionFailure
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
+from pcluster.api.models.describe_cluster_response_content import DescribeClusterResponseContent
 
 
 class ListClustersResponseContent(Model):
@@ -22,20 +24,36 @@ class ListClustersResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, next_token=None, clusters=None):
+    def __init__(self, next_token=None, clusters=None, cluster_details=None, failed_clusters=None):
         """ListClustersResponseContent - a model defined in OpenAPI
 
         :param next_token: The next_token of this ListClustersResponseContent.
         :type next_token: str
         :param clusters: The clusters of this ListClustersResponseContent.
         :type clusters: List[ClusterInfoSummary]
+        :param cluster_details: The cluster_details of this ListClustersResponseContent.
+        :type cluster_details: List[DescribeClusterResponseContent]
+        :param failed_clusters: The failed_clusters of this ListClustersResponseContent.
+        :type failed_clusters: List[ClusterDescriptionFailure]
         """
-        self.openapi_types = {"next_token": str, "clusters": List[ClusterInfoSummary]}
-
-        self.attribute_map = {"next_token": "nextToken", "clusters": "clusters"}
+        self.openapi_types = {
+            "next_token": str,
+            "clusters": List[ClusterInfoSummary],
+            "cluster_details": List[DescribeClusterResponseContent],
+            "failed_clusters": List[ClusterDescriptionFailure],
+        }
+
+        self.attribute_map = {
+            "next_token": "nextToken",
+            "clusters": "clusters",
+            "cluster_details": "clusterDetails",
+            "failed_clusters": "failedClusters",
+        }
 
         self._next_token = next_token
         self._clusters = clusters
+        self._cluster_details = cluster_details
+        self._failed_clusters = failed_clusters
 
     @classmethod
     def from_dict(cls, dikt) -> "ListClustersResponseContent":
@@ -93,3 +111,49 @@ class ListClustersResponseContent(Model):
             raise ValueError("Invalid value for `clusters`, must not be `None`")
 
         self._clusters = clusters
+
+    @property
+    def cluster_details(self):
+        """Gets the cluster_details of this ListClustersResponseContent.
+
+        Detailed information about the requested clusters, as returned by DescribeCluster. Only returned with detail.
+
+        :return: The cluster_details of this ListClustersResponseContent.
+        :rtype: List[DescribeClusterResponseContent]
+        """
+        return self._cluster_details
+
+    @cluster_details.setter
+    def cluster_details(self, cluster_details):
+        """Sets the cluster_details of this ListClustersResponseContent.
+
+        Detailed information about the requested clusters, as returned by DescribeCluster. Only returned with detail.
+
+        :param cluster_details: The cluster_details of this ListClustersResponseContent.
+        :type cluster_details: List[DescribeClusterResponseContent]
+        """
+
+        self._cluster_details = cluster_details
+
+    @property
+    def failed_clusters(self):
+        """Gets the failed_clusters of this ListClustersResponseContent.
+
+        Requested clusters that could not be retrieved, e.g. because they do not exist. Only returned with clusterNames.
+
+        :return: The failed_clusters of this ListClustersResponseContent.
+        :rtype: List[ClusterDescriptionFailure]
+        """
+        return self._failed_clusters
+
+    @failed_clusters.setter
+    def failed_clusters(self, failed_clusters):
+        """Sets the failed_clusters of this ListClustersResponseContent.
+
+        Requested clusters that could not be retrieved, e.g. because they do not exist. Only returned with clusterNames.
+
+        :param failed_clusters: The failed_clusters of this ListClustersResponseContent.
+        :type failed_clusters: List[ClusterDescriptionFailure]
+        """
+
+        self._failed_clusters = failed_clusters
@@ -16,6 +16,7 @@ from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.change import Change
 from pcluster.api.models.config_validation_message import ConfigValidationMessage
 from pcluster.api.models.update_error import UpdateError
+from pcluster.api.models.validator_profile import ValidatorProfile
 
 
 class UpdateClusterBadRequestExceptionResponseContent(Model):
@@ -25,7 +26,12 @@ class UpdateClusterBadRequestExceptionResponseContent(Model):
     """
 
     def __init__(
-        self, configuration_validation_errors=None, message=None, update_validation_errors=None, change_set=None
+        self,
+        configuration_validation_errors=None,
+        message=None,
+        update_validation_errors=None,
+        change_set=None,
+        validation_profile=None,
     ):
         """UpdateClusterBadRequestExceptionResponseContent - a model defined in OpenAPI
 
@@ -39,12 +45,15 @@ class UpdateClusterBadRequestExceptionResponseContent(Model):
         :type update_validation_errors: List[UpdateError]
         :param change_set: The change_set of this UpdateClusterBadRequestExceptionResponseContent.
         :type change_set: List[Change]
+        :param validation_profile: The validation_profile of this UpdateClusterBadRequestExceptionResponseContent.
+        :type validation_profile: List[ValidatorProfile]
         """
         self.openapi_types = {
             "configuration_validation_errors": List[ConfigValidationMessage],
             "message": str,
             "update_validation_errors": List[UpdateError],
             "change_set": List[Change],
+            "validation_profile": List[ValidatorProfile],
         }
 
         self.attribute_map = {
@@ -52,12 +61,14 @@ class UpdateClusterBadRequestExceptionResponseContent(Model):
             "message": "message",
             "update_validation_errors": "updateValidationErrors",
             "change_set": "changeSet",
+            "validation_profile": "validationProfile",
         }
 
         self._configuration_validation_errors = configuration_validation_errors
         self._message = message
         self._update_validation_errors = update_validation_errors
         self._change_set = change_set
+        self._validation_profile = validation_profile
 
     @classmethod
     def from_dict(cls, dikt) -> "UpdateClusterBadRequestExceptionResponseContent":
@@ -156,3 +167,26 @@ class UpdateClusterBadRequestExceptionResponseContent(Model):
         """
 
         self._change_set = change_set
+
+    @property
+    def validation_profile(self):
+        """Gets the validation_profile of this UpdateClusterBadRequestExceptionResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :return: The validation_profile of this UpdateClusterBadRequestExceptionResponseContent.
+        :rtype: List[ValidatorProfile]
+        """
+        return self._validation_profile
+
+    @validation_profile.setter
+    def validation_profile(self, validation_profile):
+        """Sets the validation_profile of this UpdateClusterBadRequestExceptionResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :param validation_profile: The validation_profile of this UpdateClusterBadRequestExceptionResponseContent.
+        :type validation_profile: List[ValidatorProfile]
+        """
+
+        self._validation_profile = validation_profile
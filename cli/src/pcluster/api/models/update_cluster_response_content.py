@@ -16,6 +16,7 @@ from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.change import Change
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
 from pcluster.api.models.config_validation_message import ConfigValidationMessage
+from pcluster.api.models.validator_profile import ValidatorProfile
 
 
 class UpdateClusterResponseContent(Model):
@@ -24,7 +25,7 @@ class UpdateClusterResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, cluster=None, validation_messages=None, change_set=None):
+    def __init__(self, cluster=None, validation_messages=None, change_set=None, validation_profile=None):
         """UpdateClusterResponseContent - a model defined in OpenAPI
 
         :param cluster: The cluster of this UpdateClusterResponseContent.
@@ -33,22 +34,27 @@ class UpdateClusterResponseContent(Model):
         :type validation_messages: List[ConfigValidationMessage]
         :param change_set: The change_set of this UpdateClusterResponseContent.
         :type change_set: List[Change]
+        :param validation_profile: The validation_profile of this UpdateClusterResponseContent.
+        :type validation_profile: List[ValidatorProfile]
         """
         self.openapi_types = {
             "cluster": ClusterInfoSummary,
             "validation_messages": List[ConfigValidationMessage],
             "change_set": List[Change],
+            "validation_profile": List[ValidatorProfile],
         }
 
         self.attribute_map = {
             "cluster": "cluster",
             "validation_messages": "validationMessages",
             "change_set": "changeSet",
+            "validation_profile": "validationProfile",
         }
 
         self._cluster = cluster
         self._validation_messages = validation_messages
         self._change_set = change_set
+        self._validation_profile = validation_profile
 
     @classmethod
     def from_dict(cls, dikt) -> "UpdateClusterResponseContent":
@@ -132,3 +138,26 @@ class UpdateClusterResponseContent(Model):
             raise ValueError("Invalid value for `change_set`, must not be `None`")
 
         self._change_set = change_set
+
+    @property
+    def validation_profile(self):
+        """Gets the validation_profile of this UpdateClusterResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :return: The validation_profile of this UpdateClusterResponseContent.
+        :rtype: List[ValidatorProfile]
+        """
+        return self._validation_profile
+
+    @validation_profile.setter
+    def validation_profile(self, validation_profile):
+        """Sets the validation_profile of this UpdateClusterResponseContent.
+
+        Execution statistics of the config validators, sorted by total execution time. Only returned when 'debugValidationProfile' is set.  # noqa: E501
+
+        :param validation_profile: The validation_profile of this UpdateClusterResponseContent.
+        :type validation_profile: List[ValidatorProfile]
+        """
+
+        self._validation_profile = validation_profile
@@ -0,0 +1,264 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+from __future__ import absolute_import
+
+from typing import List
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class ValidatorProfile(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(
+        self,
+        type=None,
+        executions=None,
+        total_time=None,
+        max_time=None,
+        aws_calls=None,
+        aws_operations=None,
+        cache_hits=None,
+    ):
+        """ValidatorProfile - a model defined in OpenAPI
+
+        :param type: The type of this ValidatorProfile.
+        :type type: str
+        :param executions: The executions of this ValidatorProfile.
+        :type executions: int
+        :param total_time: The total_time of this ValidatorProfile.
+        :type total_time: float
+        :param max_time: The max_time of this ValidatorProfile.
+        :type max_time: float
+        :param aws_calls: The aws_calls of this ValidatorProfile.
+        :type aws_calls: int
+        :param aws_operations: The aws_operations of this ValidatorProfile.
+        :type aws_operations: List[str]
+        :param cache_hits: The cache_hits of this ValidatorProfile.
+        :type cache_hits: int
+        """
+        self.openapi_types = {
+            "type": str,
+            "executions": int,
+            "total_time": float,
+            "max_time": float,
+            "aws_calls": int,
+            "aws_operations": List[str],
+            "cache_hits": int,
+        }
+
+        self.attribute_map = {
+            "type": "type",
+            "executions": "executions",
+            "total_time": "totalTime",
+            "max_time": "maxTime",
+            "aws_calls": "awsCalls",
+            "aws_operations": "awsOperations",
+            "cache_hits": "cacheHits",
+        }
+
+        self._type = type
+        self._executions = executions
+        self._total_time = total_time
+        self._max_time = max_time
+        self._aws_calls = aws_calls
+        self._aws_operations = aws_operations
+        self._cache_hits = cache_hits
+
+    @classmethod
+    def from_dict(cls, dikt) -> "ValidatorProfile":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ValidatorProfile of this ValidatorProfile.
+        :rtype: ValidatorProfile
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def type(self):
+        """Gets the type of this ValidatorProfile.
+
+        Type of the validator.
+
+        :return: The type of this ValidatorProfile.
+        :rtype: str
+        """
+        return self._type
+
+    @type.setter
+    def type(self, type):
+        """Sets the type of this ValidatorProfile.
+
+        Type of the validator.
+
+        :param type: The type of this ValidatorProfile.
+        :type type: str
+        """
+        if type is None:
+            raise ValueError("Invalid value for `type`, must not be `None`")
+
+        self._type = type
+
+    @property
+    def executions(self):
+        """Gets the executions of this ValidatorProfile.
+
+        Number of executions of the validator.
+
+        :return: The executions of this ValidatorProfile.
+        :rtype: int
+        """
+        return self._executions
+
+    @executions.setter
+    def executions(self, executions):
+        """Sets the executions of this ValidatorProfile.
+
+        Number of executions of the validator.
+
+        :param executions: The executions of this ValidatorProfile.
+        :type executions: int
+        """
+        if executions is None:
+            raise ValueError("Invalid value for `executions`, must not be `None`")
+
+        self._executions = executions
+
+    @property
+    def total_time(self):
+        """Gets the total_time of this ValidatorProfile.
+
+        Total execution time of the validator, in seconds.
+
+        :return: The total_time of this ValidatorProfile.
+        :rtype: float
+        """
+        return self._total_time
+
+    @total_time.setter
+    def total_time(self, total_time):
+        """Sets the total_time of this ValidatorProfile.
+
+        Total execution time of the validator, in seconds.
+
+        :param total_time: The total_time of this ValidatorProfile.
+        :type total_time: float
+        """
+        if total_time is None:
+            raise ValueError("Invalid value for `total_time`, must not be `None`")
+
+        self._total_time = total_time
+
+    @property
+    def max_time(self):
+        """Gets the max_time of this ValidatorProfile.
+
+        Longest execution time of the validator, in seconds.
+
+        :return: The max_time of this ValidatorProfile.
+        :rtype: float
+        """
+        return self._max_time
+
+    @max_time.setter
+    def max_time(self, max_time):
+        """Sets the max_time of this ValidatorProfile.
+
+        Longest execution time of the validator, in seconds.
+
+        :param max_time: The max_time of this ValidatorProfile.
+        :type max_time: float
+        """
+        if max_time is None:
+            raise ValueError("Invalid value for `max_time`, must not be `None`")
+
+        self._max_time = max_time
+
+    @property
+    def aws_calls(self):
+        """Gets the aws_calls of this ValidatorProfile.
+
+        Number of AWS API calls performed by the validator.
+
+        :return: The aws_calls of this ValidatorProfile.
+        :rtype: int
+        """
+        return self._aws_calls
+
+    @aws_calls.setter
+    def aws_calls(self, aws_calls):
+        """Sets the aws_calls of this ValidatorProfile.
+
+        Number of AWS API calls performed by the validator.
+
+        :param aws_calls: The aws_calls of this ValidatorProfile.
+        :type aws_calls: int
+        """
+        if aws_calls is None:
+            raise ValueError("Invalid value for `aws_calls`, must not be `None`")
+
+        self._aws_calls = aws_calls
+
+    @property
+    def aws_operations(self):
+        """Gets the aws_operations of this ValidatorProfile.
+
+        AWS API operations performed by the validator, in the service:Operation format.
+
+        :return: The aws_operations of this ValidatorProfile.
+        :rtype: List[str]
+        """
+        return self._aws_operations
+
+    @aws_operations.setter
+    def aws_operations(self, aws_operations):
+        """Sets the aws_operations of this ValidatorProfile.
+
+        AWS API operations performed by the validator, in the service:Operation format.
+
+        :param aws_operations: The aws_operations of this ValidatorProfile.
+        :type aws_operations: List[str]
+        """
+        if aws_operations is None:
+            raise ValueError("Invalid value for `aws_operations`, must not be `None`")
+
+        self._aws_operations = aws_operations
+
+    @property
+    def cache_hits(self):
+        """Gets the cache_hits of this ValidatorProfile.
+
+        Number of AWS calls avoided by the validator thanks to cached results.
+
+        :return: The cache_hits of this ValidatorProfile.
+        :rtype: int
+        """
+        return self._cache_hits
+
+    @cache_hits.setter
+    def cache_hits(self, cache_hits):
+        """Sets the cache_hits of this ValidatorProfile.
+
+        Number of AWS calls avoided by the validator thanks to cached results.
+
+        :param cache_hits: The cache_hits of this ValidatorProfile.
+        :type cache_hits: int
+        """
+        if cache_hits is None:
+            raise ValueError("Invalid value for `cache_hits`, must not be `None`")
+
+        self._cache_hits = cache_hits
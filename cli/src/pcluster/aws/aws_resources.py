@@ -16,6 +16,7 @@ from pcluster.constants import (
     PCLUSTER_IMAGE_ID_TAG,
     PCLUSTER_IMAGE_OS_TAG,
     PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_PREFIX,
     PCLUSTER_QUEUE_NAME_TAG,
     PCLUSTER_S3_BUCKET_TAG,
     PCLUSTER_S3_IMAGE_DIR_TAG,
@@ -110,36 +111,61 @@ class StackInfo:
 
 
 class InstanceInfo:
-    """Object to store Instance information, initialized with a describe_instances call."""
+    """
+    Object to store Instance information, initialized with a describe_instances call.
+
+    Only the fields exposed by the object are kept, in slots rather than in the whole describe_instances payload, to
+    limit the memory used when listing the instances of large clusters.
+    """
+
+    __slots__ = (
+        "_id",
+        "_state",
+        "_public_ip",
+        "_private_ip",
+        "_private_dns_name",
+        "_instance_type",
+        "_launch_time",
+        "_tags",
+    )
 
     def __init__(self, instance_data: dict):
-        self._instance_data = instance_data
-        self._tags = self._instance_data.get("Tags", [])
+        self._id = instance_data.get("InstanceId")
+        self._state = (instance_data.get("State") or {}).get("Name")
+        self._public_ip = instance_data.get("PublicIpAddress", None)
+        self._private_ip = instance_data.get("PrivateIpAddress")
+        self._private_dns_name = instance_data.get("PrivateDnsName")
+        self._instance_type = instance_data.get("InstanceType")
+        self._launch_time = instance_data.get("LaunchTime")
+        # Only the ParallelCluster tags are read
+        self._tags = {
+            tag["Key"]: tag["Value"] for tag in instance_data.get("Tags", []) if tag["Key"].startswith(PCLUSTER_PREFIX)
+        }
 
     @property
     def id(self) -> str:
         """Return instance id."""
-        return self._instance_data.get("InstanceId")
+        return self._id
 
     @property
     def state(self) -> str:
         """Return instance state."""
-        return self._instance_data.get("State").get("Name")
+        return self._state
 
     @property
     def public_ip(self) -> str:
         """Return Public Ip of the instance or None if not present."""
-        return self._instance_data.get("PublicIpAddress", None)
+        return self._public_ip
 
     @property
     def private_ip(self) -> str:
         """Return Private Ip of the instance."""
-        return self._instance_data.get("PrivateIpAddress")
+        return self._private_ip
 
     @property
     def private_dns_name(self) -> str:
         """Return Private DNS name of the instance (e.g. "ip-10-0-0-157.us-east-2.compute.internal")."""
-        return self._instance_data.get("PrivateDnsName")
+        return self._private_dns_name
 
     @property
     def private_dns_name_short(self) -> str:
@@ -149,12 +175,12 @@ class InstanceInfo:
     @property
     def instance_type(self) -> str:
         """Return instance type."""
-        return self._instance_data.get("InstanceType")
+        return self._instance_type
 
     @property
     def launch_time(self):
         """Return launch time of the instance."""
-        return self._instance_data.get("LaunchTime")
+        return self._launch_time
 
     @property
     def node_type(self) -> str:
@@ -167,7 +193,7 @@ class InstanceInfo:
         return self._get_tag(PCLUSTER_QUEUE_NAME_TAG)
 
     def _get_tag(self, tag_key):
-        return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
+        return self._tags.get(tag_key)
 
 
 class InstanceTypeInfo:
@@ -8,15 +8,17 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import json
 import logging
+from typing import List
 
 from botocore.exceptions import ClientError
 
 from pcluster.aws.aws_resources import StackInfo
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, StackNotFoundError
-from pcluster.constants import PCLUSTER_IMAGE_ID_TAG, PCLUSTER_VERSION_TAG
-from pcluster.utils import remove_none_values
+from pcluster.constants import LIST_CLUSTERS_MAX_WORKERS, PCLUSTER_IMAGE_ID_TAG, PCLUSTER_VERSION_TAG
+from pcluster.utils import remove_none_values, run_concurrently
 
 LOGGER = logging.getLogger(__name__)
 
@@ -147,11 +149,51 @@ class CfnClient(Boto3Client):
         return self._client.get_template(StackName=stack_name).get("TemplateBody")
 
     @AWSExceptionHandler.handle_client_exception
-    def list_pcluster_stacks(self, next_token=None):
-        """List existing pcluster cluster stacks."""
-        stacks, result_token = self._list_parentless_stacks_with_tag(PCLUSTER_VERSION_TAG, next_token)
-        # Only return stacks without image-id tag, which means they are cluster stacks.
-        return [stack for stack in stacks if StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG) is None], result_token
+    def list_pcluster_stacks(self, next_token=None, stack_statuses: List[str] = None):
+        """
+        List existing pcluster cluster stacks.
+
+        The stacks are looked up through the Resource Groups Tagging API, which only returns the stacks tagged by
+        ParallelCluster, rather than by describing all the stacks of the region, so that the cost of the call depends
+        on the number of clusters only.
+
+        :param next_token: token of the page of the tagged stacks to return
+        :param stack_statuses: statuses of the stacks to return, matched against the described stacks,
+                               all but DELETE_COMPLETE by default
+        :return: the stacks and the token of the next page
+        """
+        from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+
+        tagged_stacks, next_token = AWSApi.instance().resource_groups_tagging.get_stacks_with_tag(
+            PCLUSTER_VERSION_TAG, next_token
+        )
+        # Image stacks have the image-id tag, while nested stacks have the tags CloudFormation adds to the resources
+        # of their parent stack
+        stack_ids = [
+            stack_id
+            for stack_id, tags in tagged_stacks.items()
+            if PCLUSTER_IMAGE_ID_TAG not in tags and "aws:cloudformation:stack-id" not in tags
+        ]
+
+        stacks = run_concurrently(
+            [functools.partial(self._describe_stack_if_exists, stack_id) for stack_id in stack_ids],
+            max_workers=LIST_CLUSTERS_MAX_WORKERS,
+            thread_name_prefix="list-clusters",
+        )
+        return [
+            stack
+            for stack in sorted(filter(None, stacks), key=lambda stack: stack["StackName"])
+            if stack.get("ParentId") is None
+            and stack.get("StackStatus") != "DELETE_COMPLETE"
+            and (not stack_statuses or stack.get("StackStatus") in stack_statuses)
+        ], next_token
+
+    def _describe_stack_if_exists(self, stack_id: str):
+        """Describe the given stack, return None if it does not exist, e.g. it has been deleted after being listed."""
+        try:
+            return self.describe_stack(stack_id)
+        except StackNotFoundError:
+            return None
 
     def describe_stack_resource(self, stack_name: str, logic_resource_id: str):
         """Get stack resource information."""
@@ -10,10 +10,12 @@
 # limitations under the License.
 
 import functools
+import hashlib
 import logging
 import os
 import threading
 import time
+from collections import OrderedDict
 from enum import Enum
 from typing import Dict
 
@@ -134,16 +136,123 @@ def _log_boto3_calls(params, **kwargs):
     LOGGER.info(
         "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
     )
+    AWSCallsTracker.record_call(service, operation)
+
+
+# Default size of the connection pool of every boto3 client, to be greater than the number of concurrent validators
+BOTO3_MAX_POOL_CONNECTIONS = 20
+
+
+class Boto3ClientPool:
+    """
+    Process wide pool of boto3 clients, reused across AWSApi resets.
+
+    Boto3 clients are thread safe, boto3 resources are not: resources are created at every request and never shared.
+    Entries are keyed by service, region and botocore config and are bound to the fingerprint of the credentials
+    they have been created with, so that service models and open connections are reused as long as the same
+    credentials are in use. The size of the connection pool and the TCP keep-alive of the clients can be configured
+    with the PCLUSTER_BOTO3_MAX_POOL_CONNECTIONS and PCLUSTER_BOTO3_TCP_KEEPALIVE environment variables.
+    A backend can be set to serve boto3-like clients and resources in place of the boto3 ones, e.g. to run offline.
+    """
+
+    _entries = {}
+    _backend = None
+    # The creation of clients from the default boto3 session is not thread safe
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_default_session():
+        if boto3.DEFAULT_SESSION is None:
+            boto3.setup_default_session()
+        return boto3.DEFAULT_SESSION
+
+    @staticmethod
+    def _get_credentials_fingerprint(session):
+        credentials = session.get_credentials()
+        if not credentials:
+            return None
+        frozen_credentials = credentials.get_frozen_credentials()
+        return hashlib.sha256(
+            f"{frozen_credentials.access_key}:{frozen_credentials.secret_key}:{frozen_credentials.token}".encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _get_config(botocore_config_kwargs: Dict = None):
+        pool_config_kwargs = {
+            "max_pool_connections": int(
+                os.environ.get("PCLUSTER_BOTO3_MAX_POOL_CONNECTIONS", BOTO3_MAX_POOL_CONNECTIONS)
+            )
+        }
+        # TCP keep-alive is not supported by old botocore versions
+        if "tcp_keepalive" in Config.OPTION_DEFAULTS:
+            pool_config_kwargs["tcp_keepalive"] = os.environ.get("PCLUSTER_BOTO3_TCP_KEEPALIVE", "true") == "true"
+        config = Config(**pool_config_kwargs)
+        return config.merge(Config(**botocore_config_kwargs)) if botocore_config_kwargs else config
+
+    @staticmethod
+    def _get(service_name: str, botocore_config_kwargs: Dict, factory):
+        with Boto3ClientPool._lock:
+            session = Boto3ClientPool._get_default_session()
+            key = (service_name, session.region_name, repr(sorted((botocore_config_kwargs or {}).items())))
+            fingerprint = Boto3ClientPool._get_credentials_fingerprint(session)
+            entry = Boto3ClientPool._entries.get(key)
+            if not entry or entry[0] != fingerprint:
+                # Entries created with different credentials are replaced, so the pool does not grow unbounded
+                entry = (fingerprint, factory(Boto3ClientPool._get_config(botocore_config_kwargs)))
+                Boto3ClientPool._entries[key] = entry
+            return entry[1]
+
+    @staticmethod
+    def set_backend(backend):
+        """
+        Set the backend serving the clients and resources in place of boto3, None to restore boto3.
+
+        The backend must expose the get_client(service_name) and get_resource(service_name) methods.
+        """
+        with Boto3ClientPool._lock:
+            Boto3ClientPool._backend = backend
+
+    @staticmethod
+    def get_client(service_name: str, botocore_config_kwargs: Dict = None):
+        """Return a boto3 client for the given service, creating it if not available in the pool."""
+        if Boto3ClientPool._backend:
+            return Boto3ClientPool._backend.get_client(service_name)
+
+        def _create_client(config):
+            client = boto3.client(service_name, config=config)
+            client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+            return client
+
+        return Boto3ClientPool._get(service_name, botocore_config_kwargs, _create_client)
+
+    @staticmethod
+    def get_resource(service_name: str):
+        """Return a new boto3 resource for the given service, resources are not thread safe and are not pooled."""
+        if Boto3ClientPool._backend:
+            return Boto3ClientPool._backend.get_resource(service_name)
+
+        with Boto3ClientPool._lock:
+            resource = boto3.resource(service_name, config=Boto3ClientPool._get_config())
+        resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        return resource
+
+    @staticmethod
+    def clear():
+        """Remove all the clients from the pool."""
+        with Boto3ClientPool._lock:
+            Boto3ClientPool._entries.clear()
 
 
 class Boto3Client:
     """Boto3 client Class."""
 
     def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
-        self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._client = Boto3ClientPool.get_client(client_name, botocore_config_kwargs)
+
+    @property
+    def cache_scope(self):
+        """Identify the client in the caches shared across requests, where the client instance cannot be used."""
+        return self.__class__.__name__, self._client.meta.region_name
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -163,8 +272,127 @@ class Boto3Resource:
     """Boto3 resource Class."""
 
     def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
-        self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._resource = Boto3ClientPool.get_resource(resource_name)
+
+
+class AWSCallsTracker:
+    """
+    Context manager recording the boto3 calls and the cache hits happening in the current thread.
+
+    Trackers are thread-local and can be nested: every active tracker of the thread records the events.
+    """
+
+    _local = threading.local()
+
+    def __init__(self):
+        self.calls = {}
+        self.cache_hits = 0
+
+    def __enter__(self):
+        self._active_trackers().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._active_trackers().remove(self)
+
+    @property
+    def calls_count(self):
+        """Return the total number of recorded boto3 calls."""
+        return sum(self.calls.values())
+
+    @staticmethod
+    def _active_trackers():
+        if not hasattr(AWSCallsTracker._local, "trackers"):
+            AWSCallsTracker._local.trackers = []
+        return AWSCallsTracker._local.trackers
+
+    @staticmethod
+    def record_call(service: str, operation: str):
+        """Record a boto3 call in all the trackers active in the current thread."""
+        call = f"{service}:{operation}"
+        for tracker in AWSCallsTracker._active_trackers():
+            tracker.calls[call] = tracker.calls.get(call, 0) + 1
+
+    @staticmethod
+    def record_cache_hit():
+        """Record a cache hit in all the trackers active in the current thread."""
+        for tracker in AWSCallsTracker._active_trackers():
+            tracker.cache_hits += 1
+
+
+class CacheVolatility(Enum):
+    """
+    Volatility classes of the cached data, defining how long cached entries can be reused.
+
+    REQUEST entries can change at any time and must be reused only within a single request (e.g. stack state),
+    STABLE entries rarely change (e.g. official AMIs) and IMMUTABLE entries never change (e.g. instance types info):
+    both are kept across requests until their TTL expires.
+    """
+
+    REQUEST = "request"
+    STABLE = "stable"
+    IMMUTABLE = "immutable"
+
+
+CACHE_TTL = {
+    CacheVolatility.REQUEST: None,
+    CacheVolatility.STABLE: 10 * 60,  # seconds
+    CacheVolatility.IMMUTABLE: 6 * 60 * 60,  # seconds
+}
+# Maximum number of entries kept by every cache, the least recently used entries are evicted first
+CACHE_MAX_SIZE = 2048
+
+
+class CacheStore:
+    """Thread safe LRU store with entries expiring after the TTL of the given volatility class."""
+
+    _MISSING = object()
+
+    def __init__(self, volatility: CacheVolatility = CacheVolatility.REQUEST, max_size: int = CACHE_MAX_SIZE):
+        self.volatility = volatility
+        self._ttl = CACHE_TTL[volatility]
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the value stored for the given key, default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expiry, value = entry
+            if expiry is not None and expiry <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store the given value, evicting the least recently used entries if the store is full."""
+        expiry = time.monotonic() + self._ttl if self._ttl else None
+        with self._lock:
+            self._entries[key] = (expiry, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def update(self, values: dict):
+        """Store all the given key-value pairs."""
+        for key, value in values.items():
+            self.put(key, value)
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        return self.get(key, CacheStore._MISSING) is not CacheStore._MISSING
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
 
 
 class Cache:
@@ -177,6 +405,13 @@ class Cache:
         """Tell if the cache is enabled."""
         return not os.environ.get("PCLUSTER_CACHE_DISABLED")
 
+    @staticmethod
+    def create_store(volatility: CacheVolatility = CacheVolatility.REQUEST):
+        """Return a new store registered among the caches, so that it is cleared together with them."""
+        store = CacheStore(volatility)
+        Cache._caches.append(store)
+        return store
+
     @staticmethod
     def clear_all():
         """Clear the content of all caches."""
@@ -184,44 +419,63 @@ class Cache:
             cache.clear()
 
     @staticmethod
-    def _make_key(val):
+    def clear(volatility: CacheVolatility):
+        """Clear the content of the caches of the given volatility class."""
+        for cache in Cache._caches:
+            if cache.volatility == volatility:
+                cache.clear()
+
+    @staticmethod
+    def _make_key(val, scoped=False):
         if isinstance(val, list):
-            key = hash(tuple(Cache._make_key(x) for x in val))
+            key = hash(tuple(Cache._make_key(x, scoped) for x in val))
         elif isinstance(val, tuple):
-            key = hash(val)
+            key = hash(tuple(Cache._make_key(x, scoped) for x in val)) if scoped else hash(val)
         elif isinstance(val, dict):
-            key = hash(tuple((key, Cache._make_key(val[key])) for key in sorted(val.keys())))
+            key = hash(tuple((key, Cache._make_key(val[key], scoped)) for key in sorted(val.keys())))
+        elif scoped and getattr(val, "cache_scope", None) is not None:
+            key = hash(val.cache_scope)
         else:
             key = hash(val)
         return key
 
     @staticmethod
-    def cached(function):
+    def cached(function=None, volatility: CacheVolatility = CacheVolatility.REQUEST):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
+        The decorator can be used as is or specifying the volatility class of the returned data,
+        e.g. @Cache.cached(volatility=CacheVolatility.IMMUTABLE).
+        Entries of caches shared across requests are keyed by the cache_scope of the arguments exposing it
+        (e.g. the region of the Boto3Client) instead of their identity.
+
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
         """
-        cache = {}
+        if function is None:
+            return functools.partial(Cache.cached, volatility=volatility)
+
+        cache = Cache.create_store(volatility)
+        scoped = volatility != CacheVolatility.REQUEST
         mutexes = {}
         lock = threading.Lock()
-        Cache._caches.append(cache)
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
+            cache_key = Cache._make_key(args, scoped) + Cache._make_key(kwargs, scoped)
             with lock:
                 if cache_key not in mutexes:
                     mutexes[cache_key] = threading.Lock()
 
             with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
-                else:
-                    return_value = function(*args, **kwargs)
                 if Cache.is_enabled():
-                    cache[cache_key] = return_value
+                    return_value = cache.get(cache_key, CacheStore._MISSING)
+                    if return_value is not CacheStore._MISSING:
+                        AWSCallsTracker.record_cache_hit()
+                        return return_value
+                return_value = function(*args, **kwargs)
+                if Cache.is_enabled():
+                    cache.put(cache_key, return_value)
                 return return_value
 
         return wrapper
@@ -9,35 +9,63 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, List, Tuple
+from typing import Any, Iterable, Iterator, List, Tuple
 
 from botocore.exceptions import ClientError
 
 from pcluster import utils
 from pcluster.aws.aws_resources import ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache, ImageNotFoundError, get_region
+from pcluster.aws.common import (
+    AWSClientError,
+    AWSExceptionHandler,
+    Boto3Client,
+    Cache,
+    CacheVolatility,
+    ImageNotFoundError,
+    get_region,
+)
+from pcluster.aws.persistent_cache import PersistentCache
 from pcluster.constants import (
+    EC2_DESCRIBE_INSTANCES_PAGE_SIZE,
     IMAGE_NAME_PART_TO_OS_MAP,
     IMAGEBUILDER_ARN_TAG,
     IMAGEBUILDER_RESOURCE_NAME_PREFIX,
+    INSTANCE_TYPES_PERSISTENT_CACHE_TTL,
     OS_TO_IMAGE_NAME_PART_MAP,
     PCLUSTER_IMAGE_BUILD_STATUS_TAG,
     PCLUSTER_IMAGE_ID_TAG,
+    TERMINATE_INSTANCES_BATCH_SIZE,
+    TERMINATE_INSTANCES_BURST,
+    TERMINATE_INSTANCES_MAX_WORKERS,
+    TERMINATE_INSTANCES_RATE,
 )
-from pcluster.utils import get_partition
+from pcluster.utils import TokenBucket, get_partition, grouper
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of instance types that can be passed to a single DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_MAX_ITEMS = 100
 
 
 class Ec2Client(Boto3Client):
     """Implement EC2 Boto3 client."""
 
+    # Instance types data never changes, so it is shared by all the clients, e.g. across the requests of the API
+    _instance_types_data_cache = Cache.create_store(CacheVolatility.IMMUTABLE)
+
     def __init__(self):
         super().__init__("ec2")
         self.additional_instance_types_data = {}
         self.security_groups_cache = {}
         self.subnets_cache = {}
         self.capacity_reservations_cache = {}
+        self.instance_types_persistent_cache = PersistentCache(
+            "instance-types", ttl=INSTANCE_TYPES_PERSISTENT_CACHE_TTL
+        )
 
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
@@ -56,7 +84,7 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_instance_type_offerings, **kwargs))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.STABLE)
     def get_default_instance_type(self):
         """If current region support free tier, return the free tier instance type. Otherwise, return t3.micro."""
         kwargs = {
@@ -111,7 +139,7 @@ class Ec2Client(Boto3Client):
         return result
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.IMMUTABLE)
     def get_subnet_avail_zone(self, subnet_id):
         """Return the availability zone associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -124,7 +152,7 @@ class Ec2Client(Boto3Client):
         return {subnet_id: self.get_subnet_avail_zone(subnet_id) for subnet_id in subnet_ids}
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.IMMUTABLE)
     def get_subnet_vpc(self, subnet_id):
         """Return a vpc associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -133,7 +161,7 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.IMMUTABLE)
     def get_subnet_cidr(self, subnet_id):
         """Return cidr block  of the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -272,10 +300,77 @@ class Ec2Client(Boto3Client):
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_instance_type_info(self, instance_type):
-        """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
-        return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+        """
+        Return the results of calling EC2's DescribeInstanceTypes API for the given instance type.
+
+        Data retrieved from EC2 is stored in the persistent cache to be reused by subsequent CLI invocations
+        and in memory to be reused by subsequent API requests.
+        """
+        instance_type_data = self.additional_instance_types_data.get(instance_type)
+        if instance_type_data:
+            return InstanceTypeInfo(instance_type_data)
+
+        instance_type_data = self._instance_types_data_cache.get(self._instance_type_cache_key(instance_type))
+        if not instance_type_data:
+            instance_type_data = self.instance_types_persistent_cache.get(instance_type)
+        if not instance_type_data:
+            response = self._client.describe_instance_types(InstanceTypes=[instance_type])
+            instance_type_data = response.get("InstanceTypes")[0]
+            self.instance_types_persistent_cache.put(instance_type, instance_type_data)
+        self._instance_types_data_cache.put(self._instance_type_cache_key(instance_type), instance_type_data)
+        return InstanceTypeInfo(instance_type_data)
+
+    def _instance_type_cache_key(self, instance_type):
+        return self.cache_scope, instance_type
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_instance_types(self, instance_types: List[str]):
+        """Return the results of calling EC2's DescribeInstanceTypes API for the given list of instance types."""
+        return list(self._paginate_results(self._client.describe_instance_types, InstanceTypes=instance_types))
+
+    def prefetch_instance_types_info(self, instance_types: List[str]):
+        """
+        Retrieve the information of the given instance types with bulk requests and store them in cache.
+
+        Instance types already cached are not requested again. Since this is an optimization only, failures are
+        not raised: the instance types of the failed requests are retrieved one by one by get_instance_type_info,
+        where errors are reported to the caller.
+        """
+        # Names without the family/size separator (e.g. AWS Batch "optimal" or instance families) are skipped,
+        # otherwise they would make the whole bulk request fail
+        missed_instance_types = [
+            instance_type
+            for instance_type in dict.fromkeys(instance_types)
+            if instance_type
+            and "." in instance_type
+            and instance_type not in self.additional_instance_types_data
+            and self._instance_type_cache_key(instance_type) not in self._instance_types_data_cache
+        ]
+        self._update_instance_types_data_cache(self.instance_types_persistent_cache.get_all(missed_instance_types))
+        missed_instance_types = [
+            instance_type
+            for instance_type in missed_instance_types
+            if self._instance_type_cache_key(instance_type) not in self._instance_types_data_cache
+        ]
+
+        for instance_types_chunk in grouper(missed_instance_types, DESCRIBE_INSTANCE_TYPES_MAX_ITEMS):
+            try:
+                response = self.describe_instance_types(list(instance_types_chunk))
+            except AWSClientError as e:
+                LOGGER.warning("Unable to retrieve information of instance types %s: %s", instance_types_chunk, e)
+                continue
+            instance_types_data = {
+                instance_type_data.get("InstanceType"): instance_type_data for instance_type_data in response
+            }
+            self._update_instance_types_data_cache(instance_types_data)
+            self.instance_types_persistent_cache.put_all(instance_types_data)
+
+    def _update_instance_types_data_cache(self, instance_types_data: dict):
+        self._instance_types_data_cache.update(
+            {
+                self._instance_type_cache_key(instance_type): instance_type_data
+                for instance_type, instance_type_data in instance_types_data.items()
+            }
         )
 
     @AWSExceptionHandler.handle_client_exception
@@ -293,7 +388,7 @@ class Ec2Client(Boto3Client):
         return max(images, key=lambda image: ("0" if self._is_image_deprecated(image) else "1") + image["CreationDate"])
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.STABLE)
     def get_official_image_id(self, os, architecture, filters=None):
         """Return the id of the current official image, for the provided os-architecture combination."""
         owner = filters.owner if filters and filters.owner else "amazon"
@@ -307,7 +402,7 @@ class Ec2Client(Boto3Client):
         return self._find_valid_official_image(images).get("ImageId")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.STABLE)
     def get_official_images(self, os=None, architecture=None):
         """Get the list of official images, optionally filtered by os and architecture."""
         owners = ["amazon"]
@@ -348,6 +443,32 @@ class Ec2Client(Boto3Client):
         """Terminate list of EC2 instances."""
         return self._client.terminate_instances(InstanceIds=instance_ids)
 
+    def terminate_instances_concurrently(self, instance_ids: Iterable[str]) -> int:
+        """
+        Terminate the given instances in batches, with a pool of workers rate limited by a token bucket.
+
+        The instance ids are consumed while the batches are being terminated, so that listing and termination can be
+        pipelined. All the batches are processed before raising the error of the first failed one, if any.
+
+        :param instance_ids: ids of the instances to terminate, e.g. a lazy iterator on a paginated listing
+        :return: number of terminated instances
+        """
+        bucket = TokenBucket(rate=TERMINATE_INSTANCES_RATE, capacity=TERMINATE_INSTANCES_BURST)
+
+        def _terminate(batch):
+            bucket.acquire()
+            LOGGER.info("Terminating following instances: %s", batch)
+            self.terminate_instances(batch)
+            return len(batch)
+
+        with ThreadPoolExecutor(
+            max_workers=TERMINATE_INSTANCES_MAX_WORKERS, thread_name_prefix="terminate-instances"
+        ) as executor:
+            futures = [
+                executor.submit(_terminate, batch) for batch in grouper(instance_ids, TERMINATE_INSTANCES_BATCH_SIZE)
+            ]
+        return sum(future.result() for future in futures)
+
     @AWSExceptionHandler.handle_client_exception
     def list_instance_ids(self, filters):
         """Retrieve a filtered list of instance ids."""
@@ -358,19 +479,34 @@ class Ec2Client(Boto3Client):
         ]
 
     @AWSExceptionHandler.handle_client_exception
-    def describe_instances(self, filters, next_token=None) -> Tuple[List[Any], str]:
+    def describe_instances(self, filters, next_token=None, max_results=None) -> Tuple[List[Any], str]:
         """Retrieve a filtered list of instances."""
         describe_stacks_kwargs = {}
         if next_token:
             describe_stacks_kwargs["NextToken"] = next_token
+        if max_results:
+            describe_stacks_kwargs["MaxResults"] = max_results
         response = self._client.describe_instances(Filters=filters, **describe_stacks_kwargs)
         instances = []
         for reservation in response["Reservations"]:
             instances.extend(reservation["Instances"])
         return instances, response.get("NextToken")
 
+    def iter_instances(self, filters, page_size=EC2_DESCRIBE_INSTANCES_PAGE_SIZE) -> Iterator[Any]:
+        """
+        Iterate over a filtered list of instances, retrieving the pages lazily while iterating.
+
+        Only one page of instances is held at a time, so large lists can be processed without loading them at once.
+        """
+        next_token = None
+        while True:
+            instances, next_token = self.describe_instances(filters, next_token, max_results=page_size)
+            yield from instances
+            if not next_token:
+                return
+
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.STABLE)
     def get_supported_az_for_instance_type(self, instance_type: str):
         """
         Return a tuple of availability zones that have the instance_type.
@@ -19,7 +19,8 @@ class LogsClient(Boto3Client):
     """Logs Boto3 client."""
 
     def __init__(self):
-        super().__init__("logs")
+        # The adaptive retry mode limits the rate of the requests, shared by all the threads, when throttled
+        super().__init__("logs", botocore_config_kwargs={"retries": {"mode": "adaptive"}})
 
     def log_group_exists(self, log_group_name):
         """Return true if log group exists, false otherwise."""
@@ -0,0 +1,228 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the local stand-in of the AWS services used to build the cluster templates without any AWS call.
+#
+# The stand-in clients answer the read-only EC2 and STS operations needed to load a cluster configuration and to
+# synthesize its template, from the data of a YAML or JSON file with the following format:
+#   Region: us-east-1
+#   AccountId: "123456789012"
+#   InstanceTypes: [...]  # items returned by EC2 DescribeInstanceTypes
+#   Subnets: [...]  # items returned by EC2 DescribeSubnets
+#   Images: [...]  # items returned by EC2 DescribeImages
+# Any other operation fails as an AWS call would, with the UnsupportedOperation error code.
+#
+import fnmatch
+import logging
+import os
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, Boto3ClientPool, Cache
+from pcluster.utils import load_yaml_dict
+
+LOGGER = logging.getLogger(__name__)
+
+UNSUPPORTED_OPERATION_ERROR_CODE = "UnsupportedOperation"
+
+
+class OfflineAWSBackend:
+    """Serve the clients answering from the offline AWS data in place of the boto3 ones."""
+
+    def __init__(self, aws_data: dict, region: str):
+        self._region = region
+        self._account_id = str(aws_data.get("AccountId", "123456789012"))
+        self._instance_types = {item["InstanceType"]: item for item in aws_data.get("InstanceTypes", [])}
+        self._subnets = {item["SubnetId"]: item for item in aws_data.get("Subnets", [])}
+        self._images = {item["ImageId"]: item for item in aws_data.get("Images", [])}
+        self._operations = {
+            ("ec2", "describe_instance_types"): self._describe_instance_types,
+            ("ec2", "describe_subnets"): self._describe_subnets,
+            ("ec2", "describe_images"): self._describe_images,
+            ("sts", "get_caller_identity"): self._get_caller_identity,
+        }
+
+    def get_client(self, service_name: str):
+        """Return the client of the given service."""
+        return _OfflineClient(service_name, self._region, self._operations)
+
+    @staticmethod
+    def get_resource(service_name: str):
+        """Fail, since boto3 resources are not available offline."""
+        raise AWSClientError("get_resource", f"The {service_name} resource is not available in offline mode")
+
+    def _describe_instance_types(self, InstanceTypes=None, Filters=None, **_):  # noqa: N803
+        missing_instance_types = [
+            instance_type for instance_type in InstanceTypes or [] if instance_type not in self._instance_types
+        ]
+        if missing_instance_types:
+            raise _client_error(
+                "describe_instance_types",
+                "InvalidInstanceType",
+                f"The following supplied instance types do not exist: {missing_instance_types}",
+            )
+        instance_types = (
+            [self._instance_types[instance_type] for instance_type in InstanceTypes]
+            if InstanceTypes
+            else list(self._instance_types.values())
+        )
+        return {"InstanceTypes": _filter(instance_types, Filters)}
+
+    def _describe_subnets(self, SubnetIds=None, Filters=None, **_):  # noqa: N803
+        for subnet_id in SubnetIds or []:
+            if subnet_id not in self._subnets:
+                raise _client_error(
+                    "describe_subnets", "InvalidSubnetID.NotFound", f"The subnet ID '{subnet_id}' does not exist"
+                )
+        subnets = [self._subnets[subnet_id] for subnet_id in SubnetIds] if SubnetIds else list(self._subnets.values())
+        return {"Subnets": _filter(subnets, Filters)}
+
+    def _describe_images(self, ImageIds=None, Filters=None, **_):  # noqa: N803
+        # The owners are ignored, all the images in the offline data are considered as owned by the requested ones
+        missing_image_ids = [image_id for image_id in ImageIds or [] if image_id not in self._images]
+        if missing_image_ids:
+            raise _client_error(
+                "describe_images", "InvalidAMIID.NotFound", f"The image ids '{missing_image_ids}' do not exist"
+            )
+        images = [self._images[image_id] for image_id in ImageIds] if ImageIds else list(self._images.values())
+        return {"Images": _filter(images, Filters)}
+
+    def _get_caller_identity(self, **_):
+        return {
+            "Account": self._account_id,
+            "UserId": self._account_id,
+            "Arn": f"arn:aws:iam::{self._account_id}:root",
+        }
+
+
+class _OfflineClient:
+    """boto3-like client exposing the offline operations of a service."""
+
+    # Keys of the paginated results of the offline operations
+    _RESULT_KEYS = {
+        "describe_instance_types": "InstanceTypes",
+        "describe_subnets": "Subnets",
+        "describe_images": "Images",
+    }
+
+    def __init__(self, service_name: str, region: str, operations: dict):
+        self._service_name = service_name
+        self._operations = operations
+        self.meta = SimpleNamespace(service_model=SimpleNamespace(service_name=service_name), region_name=region)
+
+    def __getattr__(self, operation_name):
+        if operation_name.startswith("_"):
+            raise AttributeError(operation_name)
+        operation = self._operations.get((self._service_name, operation_name))
+
+        def call(**kwargs):
+            if not operation:
+                raise _client_error(
+                    operation_name,
+                    UNSUPPORTED_OPERATION_ERROR_CODE,
+                    f"{self._service_name}.{operation_name} is not available in offline mode",
+                )
+            LOGGER.debug("Serving %s.%s offline with parameters %s", self._service_name, operation_name, kwargs)
+            return operation(**kwargs)
+
+        # The name of the operation is used to retrieve its paginator
+        call.__name__ = operation_name
+        return call
+
+    def get_paginator(self, operation_name):
+        """Return a paginator returning all the results of the operation in a single page."""
+        return _OfflinePaginator(getattr(self, operation_name), self._RESULT_KEYS.get(operation_name))
+
+
+class _OfflinePaginator:
+    """boto3-like paginator of an offline operation."""
+
+    def __init__(self, operation, result_key: str):
+        self._operation = operation
+        self._result_key = result_key
+        self._response = None
+
+    def paginate(self, **kwargs):
+        """Call the operation with the given parameters."""
+        self._response = self._operation(**kwargs)
+        return self
+
+    def result_key_iters(self):
+        """Return the iterators of the results of the operation, one per result key."""
+        return [iter(self._response.get(self._result_key, []))]
+
+
+def _client_error(operation_name: str, error_code: str, message: str):
+    return ClientError({"Error": {"Code": error_code, "Message": message}}, operation_name)
+
+
+def _get_filter_values(item: dict, filter_name: str):
+    if filter_name.startswith("tag:"):
+        tag_key = filter_name.split(":", 1)[1]
+        return [tag["Value"] for tag in item.get("Tags", []) if tag["Key"] == tag_key]
+    # e.g. free-tier-eligible filters the FreeTierEligible attribute
+    attribute = "".join(part.capitalize() for part in filter_name.split("-"))
+    if attribute not in item:
+        return []
+    value = item[attribute]
+    return [str(value).lower() if isinstance(value, bool) else str(value)]
+
+
+def _filter(items: list, filters: list):
+    """
+    Return the items matching all the given filters, supporting wildcards in the filter values.
+
+    Only the tag:<key> filters and the ones on top level attributes (e.g. name) are supported.
+    """
+    for item_filter in filters or []:
+        items = [
+            item
+            for item in items
+            if any(
+                fnmatch.fnmatchcase(value, pattern)
+                for value in _get_filter_values(item, item_filter["Name"])
+                for pattern in item_filter["Values"]
+            )
+        ]
+    return items
+
+
+@contextmanager
+def offline_mode(aws_data_file: str):
+    """
+    Serve all the AWS calls from the given offline AWS data within the context.
+
+    The region of the data, if any, replaces the one configured in the environment.
+    """
+    aws_data = load_yaml_dict(aws_data_file) or {}
+    previous_region = os.environ.get("AWS_DEFAULT_REGION")
+    region = aws_data.get("Region") or previous_region
+    if not region:
+        raise AWSClientError("offline_mode", "AWS region not configured, set it in the Region field of the AWS data")
+
+    os.environ["AWS_DEFAULT_REGION"] = region
+    # The data cached across requests cannot be shared between the actual AWS services and the offline ones
+    Cache.clear_all()
+    AWSApi.reset()
+    Boto3ClientPool.set_backend(OfflineAWSBackend(aws_data, region))
+    try:
+        yield
+    finally:
+        Boto3ClientPool.set_backend(None)
+        Cache.clear_all()
+        AWSApi.reset()
+        if previous_region:
+            os.environ["AWS_DEFAULT_REGION"] = previous_region
+        else:
+            os.environ.pop("AWS_DEFAULT_REGION", None)
@@ -0,0 +1,162 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from enum import Enum
+
+from pcluster.aws.common import AWSCallsTracker, AWSClientError, get_region
+from pcluster.utils import get_installed_version
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump this value every time the layout of the cache files changes
+PERSISTENT_CACHE_FORMAT_VERSION = "1"
+
+
+class PersistentCacheMode(Enum):
+    """Modes the persistent cache can be operated with."""
+
+    USE = "use"
+    REFRESH = "refresh"
+    BYPASS = "bypass"
+
+    def __str__(self):
+        return self.value
+
+
+class PersistentCache:
+    """
+    File based cache used to share immutable AWS data across different CLI invocations.
+
+    Entries are stored in a JSON file per namespace, inside a directory keyed by cache format version,
+    ParallelCluster version and region. Every entry expires after the given TTL.
+    The cache is disabled unless a mode is explicitly configured (e.g. by the CLI entrypoint) and can be turned off
+    by setting the PCLUSTER_PERSISTENT_CACHE_DISABLED environment variable.
+    Any I/O error is logged and treated as a cache miss, so the cache never makes an AWS call fail.
+    """
+
+    _mode = None
+    _lock = threading.Lock()
+
+    def __init__(self, namespace: str, ttl: int):
+        self._namespace = namespace
+        self._ttl = ttl
+        self._entries = None
+        self._entries_path = None
+
+    @classmethod
+    def configure(cls, mode: PersistentCacheMode):
+        """Set the mode used by all the persistent caches; None disables them."""
+        cls._mode = mode
+
+    @classmethod
+    def is_enabled(cls):
+        """Tell if the persistent cache is enabled."""
+        return cls._mode in (PersistentCacheMode.USE, PersistentCacheMode.REFRESH) and not os.environ.get(
+            "PCLUSTER_PERSISTENT_CACHE_DISABLED"
+        )
+
+    @classmethod
+    def is_readable(cls):
+        """Tell if cached values can be returned, i.e. the cache is enabled and it is not being refreshed."""
+        return cls.is_enabled() and cls._mode != PersistentCacheMode.REFRESH
+
+    @staticmethod
+    def get_cache_dir():
+        """Return the root directory of the persistent cache."""
+        default_cache_dir = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache"))
+        return os.environ.get("PCLUSTER_CACHE_DIR", default=default_cache_dir)
+
+    @classmethod
+    def get_region_cache_dir(cls):
+        """Return the directory holding the cache data of the current ParallelCluster version and region."""
+        return os.path.join(cls.get_cache_dir(), PERSISTENT_CACHE_FORMAT_VERSION, get_installed_version(), get_region())
+
+    def _get_entries_path(self):
+        return os.path.join(self.get_region_cache_dir(), f"{self._namespace}.json")
+
+    def _load_entries(self):
+        """Load the entries of the namespace from disk, discarding the expired ones."""
+        entries_path = self._get_entries_path()
+        if self._entries is None or self._entries_path != entries_path:
+            self._entries_path = entries_path
+            self._entries = {}
+            try:
+                with open(entries_path, encoding="utf-8") as cache_file:
+                    now = time.time()
+                    self._entries = {
+                        key: entry for key, entry in json.load(cache_file).items() if entry.get("expiry", 0) > now
+                    }
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                LOGGER.debug("Unable to read persistent cache file %s: %s", entries_path, e)
+        return self._entries
+
+    def _store_entries(self):
+        """Atomically replace the namespace file with the current entries."""
+        cache_dir = os.path.dirname(self._entries_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                json.dump(self._entries, temp_file)
+            os.replace(temp_path, self._entries_path)
+        except (OSError, TypeError) as e:
+            LOGGER.debug("Unable to write persistent cache file %s: %s", self._entries_path, e)
+
+    def get(self, key: str):
+        """Return the value cached for the given key, None if missing, expired or the cache is not readable."""
+        if not self.is_readable():
+            return None
+        try:
+            with PersistentCache._lock:
+                entry = self._load_entries().get(key)
+        except AWSClientError:
+            return None
+        if entry:
+            LOGGER.debug("Persistent cache hit for key %s in namespace %s", key, self._namespace)
+            AWSCallsTracker.record_cache_hit()
+            return entry.get("value")
+        return None
+
+    def get_all(self, keys):
+        """Return a dict with the cached values for the given keys, skipping the ones not available."""
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def put(self, key: str, value):
+        """Store the given value."""
+        self.put_all({key: value})
+
+    def put_all(self, values: dict):
+        """Store all the given key-value pairs with a single write."""
+        if not self.is_enabled() or not values:
+            return
+        try:
+            with PersistentCache._lock:
+                # Reload the entries to preserve the ones written by other processes in the meantime
+                self._entries = None
+                entries = self._load_entries()
+                expiry = time.time() + self._ttl
+                for key, value in values.items():
+                    entries[key] = {"expiry": expiry, "value": value}
+                self._store_entries()
+        except AWSClientError as e:
+            LOGGER.debug("Unable to update persistent cache in namespace %s: %s", self._namespace, e)
@@ -0,0 +1,38 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from pcluster.aws.common import AWSExceptionHandler, Boto3Client
+
+
+class ResourceGroupsTaggingClient(Boto3Client):
+    """Implement Resource Groups Tagging API Boto3 client."""
+
+    def __init__(self):
+        super().__init__("resourcegroupstaggingapi")
+
+    @AWSExceptionHandler.handle_client_exception
+    def get_stacks_with_tag(self, tag_key: str, next_token: str = None):
+        """
+        Return a page of the CloudFormation stacks having the given tag, with the token of the next page.
+
+        :param tag_key: key of the tag the stacks must have, with any value
+        :param next_token: token of the page to return
+        :return: tags of the stacks by stack ARN, and the token of the next page, None if this is the last one
+        """
+        kwargs = {"ResourceTypeFilters": ["cloudformation:stack"], "TagFilters": [{"Key": tag_key}]}
+        if next_token:
+            kwargs["PaginationToken"] = next_token
+        response = self._client.get_resources(**kwargs)
+        stacks = {
+            resource["ResourceARN"]: {tag["Key"]: tag["Value"] for tag in resource.get("Tags", [])}
+            for resource in response.get("ResourceTagMappingList", [])
+        }
+        # The last page has an empty token
+        return stacks, response.get("PaginationToken") or None
@@ -8,9 +8,11 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
+from pcluster.constants import S3_MULTIPART_CHUNKSIZE, S3_MULTIPART_THRESHOLD
 
 
 class S3Client(Boto3Client):
@@ -115,8 +117,43 @@ class S3Client(Boto3Client):
 
     @AWSExceptionHandler.handle_client_exception
     def upload_fileobj(self, bucket_name, file_obj, key):
-        """Upload file-like object to S3 bucket."""
-        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key)
+        """
+        Upload file-like object to S3 bucket.
+
+        Objects larger than S3_MULTIPART_THRESHOLD are uploaded with concurrent multipart transfers.
+        """
+        self._client.upload_fileobj(
+            Fileobj=file_obj,
+            Bucket=bucket_name,
+            Key=key,
+            Config=TransferConfig(
+                multipart_threshold=S3_MULTIPART_THRESHOLD, multipart_chunksize=S3_MULTIPART_CHUNKSIZE
+            ),
+        )
+
+    @AWSExceptionHandler.handle_client_exception
+    def create_multipart_upload(self, bucket_name, key):
+        """Start a multipart upload and return its id."""
+        return self._client.create_multipart_upload(Bucket=bucket_name, Key=key)["UploadId"]
+
+    @AWSExceptionHandler.handle_client_exception
+    def upload_part(self, bucket_name, key, upload_id, part_number, body):
+        """Upload a part of a multipart upload and return its ETag."""
+        return self._client.upload_part(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+        )["ETag"]
+
+    @AWSExceptionHandler.handle_client_exception
+    def complete_multipart_upload(self, bucket_name, key, upload_id, parts):
+        """Complete a multipart upload, given the list of the uploaded parts, as dicts with PartNumber and ETag."""
+        return self._client.complete_multipart_upload(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    @AWSExceptionHandler.handle_client_exception
+    def abort_multipart_upload(self, bucket_name, key, upload_id):
+        """Abort a multipart upload, removing the uploaded parts."""
+        self._client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
 
     @AWSExceptionHandler.handle_client_exception
     def upload_file(self, bucket_name, file_path, key):
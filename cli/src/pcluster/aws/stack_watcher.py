@@ -0,0 +1,256 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the poller used to wait for CloudFormation stack operations.
+#
+import logging
+import random
+import time
+from typing import Dict, List, Optional
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, StackNotFoundError
+from pcluster.constants import (
+    STACK_WATCH_EVENTS_BURST,
+    STACK_WATCH_EVENTS_RATE,
+    STACK_WATCH_MAX_DELAY,
+    STACK_WATCH_MIN_DELAY,
+)
+from pcluster.utils import TokenBucket
+
+LOGGER = logging.getLogger(__name__)
+
+# Statuses of a stack marking the start of the operation being watched
+OPERATION_START_STATUSES = {"CREATE_IN_PROGRESS", "UPDATE_IN_PROGRESS", "DELETE_IN_PROGRESS", "IMPORT_IN_PROGRESS"}
+
+
+class StackWatch:
+    """State of a stack watched by a StackWatcher, updated with the events of the stack."""
+
+    def __init__(self, stack_name: str, waiting_states: List[str] = None, parent: "StackWatch" = None):
+        self.stack_name = stack_name
+        self.stack_id = stack_name
+        self.waiting_states = waiting_states
+        self.parent = parent
+        self.status = None
+        self.resources: Dict[str, dict] = {}
+        self.nested_watches: List[StackWatch] = []
+        self.last_event_id = None
+        self.delay = STACK_WATCH_MIN_DELAY
+        self.next_poll_time = 0
+
+    @property
+    def is_waiting(self):
+        """Tell if the stack operation is still running."""
+        if self.status is None:
+            return True
+        if self.waiting_states is not None:
+            return self.status in self.waiting_states
+        return self.status.endswith("_IN_PROGRESS")
+
+    def update(self, events: List[dict]):
+        """Update the state of the stack with the given events, in chronological order."""
+        for event in events:
+            LOGGER.debug(
+                "Stack %s event: %s %s %s",
+                self.stack_name,
+                event.get("ResourceStatus"),
+                event.get("ResourceType"),
+                event.get("LogicalResourceId"),
+            )
+            if event.get("LogicalResourceId") == event.get("StackName"):
+                self.status = event.get("ResourceStatus")
+            else:
+                self.resources[event.get("LogicalResourceId")] = {
+                    "type": event.get("ResourceType"),
+                    "status": event.get("ResourceStatus"),
+                    "physical_id": event.get("PhysicalResourceId"),
+                }
+
+    def get_progress(self):
+        """Return a one line summary of the progress of the stack, including the resources of its nested stacks."""
+        resources = self._get_all_resources()
+        completed = sum(1 for resource in resources if resource["status"].endswith("_COMPLETE"))
+        failed = sum(1 for resource in resources if resource["status"].endswith("_FAILED"))
+        progress = f"{self.stack_name}: {self.status} - {completed}/{len(resources)} resources completed"
+        if failed:
+            progress += f", {failed} failed"
+        running_nested_stacks = [
+            logical_id
+            for logical_id, resource in self.resources.items()
+            if resource["type"] == "AWS::CloudFormation::Stack" and resource["status"].endswith("_IN_PROGRESS")
+        ]
+        if running_nested_stacks:
+            progress += f" - nested stacks in progress: {', '.join(running_nested_stacks)}"
+        return progress
+
+    def _get_all_resources(self):
+        resources = list(self.resources.values())
+        for nested_watch in self.nested_watches:
+            resources.extend(nested_watch._get_all_resources())  # pylint: disable=protected-access
+        return resources
+
+
+class StackWatcher:
+    """
+    Poller waiting for the operations of many CloudFormation stacks at once.
+
+    Every stack is polled only for the events newer than the last seen one, with a delay growing exponentially, with
+    jitter, while the stack has no new events and reset to the minimum as soon as new events show up, so that many
+    concurrent waits do not poll CloudFormation in lockstep. The status of the stacks is tracked through their events,
+    and the nested stacks are watched as well to report the progress of their resources.
+    Since every nested stack adds its own polls, the calls of all the watchers of the process are limited by a shared
+    token bucket.
+    """
+
+    _events_rate_limiter = TokenBucket(rate=STACK_WATCH_EVENTS_RATE, capacity=STACK_WATCH_EVENTS_BURST)
+
+    def __init__(self, progress_stream=None, watch_nested_stacks: bool = True):
+        self._watches: List[StackWatch] = []
+        self._progress_stream = progress_stream
+        self._watch_nested_stacks = watch_nested_stacks
+        self._last_progress: Dict[str, str] = {}
+
+    def watch(self, stack_name: str, waiting_states: List[str] = None):
+        """
+        Add the given stack to the watched ones.
+
+        :param stack_name: the name or the id of the stack
+        :param waiting_states: statuses to wait for, the ones ending with _IN_PROGRESS by default
+        """
+        watch = StackWatch(stack_name, waiting_states)
+        try:
+            stack = AWSApi.instance().cfn.describe_stack(stack_name)
+            watch.stack_id = stack.get("StackId", stack_name)
+            watch.status = stack.get("StackStatus")
+        except StackNotFoundError:
+            watch.status = "DELETE_COMPLETE"
+        if watch.is_waiting:
+            self._update(watch, self._get_current_operation_events(watch))
+        self._watches.append(watch)
+        return watch
+
+    def wait(self) -> Dict[str, str]:
+        """Wait for the operations of all the watched stacks and return their final status by stack name."""
+        while any(watch.is_waiting for watch in self._get_root_watches()):
+            watch = min(filter(self._is_active, self._watches), key=lambda watch: watch.next_poll_time)
+            time.sleep(max(0.0, watch.next_poll_time - time.monotonic()))
+            self._poll(watch)
+        self._write_progress(final=True)
+        return {watch.stack_name: watch.status for watch in self._get_root_watches()}
+
+    def _is_active(self, watch: StackWatch):
+        """Tell if the given stack still has to be polled, nested stacks are not once their parent is complete."""
+        return watch.is_waiting and (watch.parent is None or self._is_active(watch.parent))
+
+    def _get_root_watches(self):
+        return [watch for watch in self._watches if not watch.parent]
+
+    def _poll(self, watch: StackWatch):
+        try:
+            if watch.last_event_id:
+                events = self._get_new_events(watch)
+            else:
+                events = self._get_current_operation_events(watch)
+        except AWSClientError as e:
+            if e.error_code != AWSClientError.ErrorCode.VALIDATION_ERROR.value:
+                raise
+            # Deleted stacks cannot be referenced by name anymore
+            events, watch.status = [], "DELETE_COMPLETE"
+        self._update(watch, events)
+        # The delay is reset when the stack is making progress and doubled otherwise, up to the maximum,
+        # and the jitter only adds to it, so that a stack is never polled more often than the minimum delay
+        watch.delay = STACK_WATCH_MIN_DELAY if events else min(watch.delay * 2, STACK_WATCH_MAX_DELAY)
+        watch.next_poll_time = time.monotonic() + watch.delay * random.uniform(1, 1.5)  # nosec B311
+
+    def _update(self, watch: StackWatch, events: List[dict]):
+        watch.update(events)
+        if self._watch_nested_stacks:
+            self._add_nested_watches(watch)
+        self._write_progress()
+
+    def _add_nested_watches(self, watch: StackWatch):
+        watched_ids = {nested_watch.stack_id for nested_watch in watch.nested_watches}
+        for resource in watch.resources.values():
+            if (
+                resource["type"] == "AWS::CloudFormation::Stack"
+                and resource["physical_id"]
+                and resource["physical_id"] not in watched_ids
+                and resource["status"].endswith("_IN_PROGRESS")
+            ):
+                nested_watch = StackWatch(resource["physical_id"], parent=watch)
+                nested_watch.status = resource["status"]
+                watch.nested_watches.append(nested_watch)
+                self._watches.append(nested_watch)
+
+    def _get_stack_events(self, watch: StackWatch, next_token: str = None):
+        self._events_rate_limiter.acquire()
+        return AWSApi.instance().cfn.get_stack_events(watch.stack_id, next_token=next_token)
+
+    def _get_current_operation_events(self, watch: StackWatch):
+        """Return the events of the stack since the start of the operation in progress, in chronological order."""
+        events = []
+        next_token = None
+        while True:
+            response = self._get_stack_events(watch, next_token)
+            for event in response.get("StackEvents", []):
+                events.append(event)
+                if event.get("LogicalResourceId") == event.get("StackName") and (
+                    event.get("ResourceStatus") in OPERATION_START_STATUSES
+                ):
+                    return self._set_last_event(watch, events)
+            next_token = response.get("NextToken")
+            if not next_token:
+                return self._set_last_event(watch, events)
+
+    def _get_new_events(self, watch: StackWatch):
+        """Return the events of the stack newer than the last seen one, in chronological order."""
+        events = []
+        next_token = None
+        while True:
+            response = self._get_stack_events(watch, next_token)
+            for event in response.get("StackEvents", []):
+                if event.get("EventId") == watch.last_event_id:
+                    return self._set_last_event(watch, events)
+                events.append(event)
+            next_token = response.get("NextToken")
+            if not next_token:
+                return self._set_last_event(watch, events)
+
+    @staticmethod
+    def _set_last_event(watch: StackWatch, events: List[dict]):
+        """Record the newest of the given events, returned newest first, and return them in chronological order."""
+        if events:
+            watch.last_event_id = events[0].get("EventId")
+        return list(reversed(events))
+
+    def _write_progress(self, final: bool = False):
+        if not self._progress_stream:
+            return
+        root_watches = self._get_root_watches()
+        # A single stack is shown on a line updated in place, while multiple stacks get a line at every change
+        in_place = len(root_watches) == 1 and self._progress_stream.isatty()
+        for watch in root_watches:
+            progress = watch.get_progress()
+            if self._last_progress.get(watch.stack_name) != progress:
+                self._last_progress[watch.stack_name] = progress
+                self._progress_stream.write(f"\r{progress.ljust(80)}" if in_place else f"{progress}\n")
+        if final and in_place:
+            self._progress_stream.write("\n")
+        self._progress_stream.flush()
+
+
+def wait_for_stacks(stack_names: List[str], progress_stream=None) -> Dict[str, Optional[str]]:
+    """Wait for the operations in progress on the given stacks and return their final status by stack name."""
+    watcher = StackWatcher(progress_stream=progress_stream)
+    for stack_name in stack_names:
+        watcher.watch(stack_name)
+    return watcher.wait()
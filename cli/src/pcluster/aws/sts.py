@@ -8,7 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
-from pcluster.aws.common import AWSExceptionHandler, Boto3Client, Cache
+from pcluster.aws.common import AWSExceptionHandler, Boto3Client, Cache, CacheVolatility
 
 
 class StsClient(Boto3Client):
@@ -18,7 +18,7 @@ class StsClient(Boto3Client):
         super().__init__("sts")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(volatility=CacheVolatility.IMMUTABLE)
     def get_account_id(self):
         """Get account id by get_caller_identity."""
         return self._client.get_caller_identity().get("Account")
@@ -0,0 +1,127 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import time
+from contextlib import nullcontext
+from typing import List
+
+from argparse import ArgumentParser, Namespace
+
+from pcluster import utils
+from pcluster.aws.persistent_cache import PersistentCache, PersistentCacheMode
+from pcluster.cli.commands.common import CliCommand
+from pcluster.constants import PCLUSTER_S3_ARTIFACTS_DICT
+
+LOGGER = logging.getLogger(__name__)
+
+# Timestamp of the rendered templates, in place of the one of the rendering time
+RENDERED_TEMPLATE_TIMESTAMP = "19700101000000"
+
+
+class BuildTemplateCommand(CliCommand):
+    """Implement pcluster build-template command."""
+
+    # CLI
+    name = "build-template"
+    help = (
+        "Render the CloudFormation template of a cluster configuration, without validating it and without creating "
+        "the cluster, and report the time spent building the main constructs of the cluster stack."
+    )
+    description = help
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, name=self.name, help=self.help, description=self.description)
+
+    def register_command_args(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument("-n", "--cluster-name", help="Name of the cluster to render.", required=True)
+        parser.add_argument(
+            "-c", "--cluster-configuration", help="Path to the cluster configuration file.", required=True
+        )
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            help="Serve the AWS data needed to render the template from the file given with --aws-data, "
+            "instead of calling the AWS services.",
+        )
+        parser.add_argument(
+            "--aws-data",
+            help="Path to the YAML or JSON file with the Region, AccountId and the InstanceTypes, Subnets and Images "
+            "described by EC2 to be used in offline mode.",
+        )
+        parser.add_argument(
+            "--output-file", help="File to write the rendered template to. If not provided, it is printed."
+        )
+
+    def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        self._validate_args(args)
+        try:
+            return self._build_template(args)
+        except Exception as e:
+            utils.error(f"Unable to build the cluster template.\n{e}")
+            return None
+
+    @staticmethod
+    def _validate_args(args: Namespace):
+        if args.offline and not args.aws_data:
+            utils.error("--aws-data is required in offline mode.")
+        if args.aws_data and not args.offline:
+            utils.error("--aws-data can only be used in offline mode.")
+
+    @staticmethod
+    def _build_template(args: Namespace):
+        """Render the template of the cluster, with a fixed timestamp so that the same inputs give the same output."""
+        from pcluster.aws.offline import offline_mode  # pylint: disable=C0415
+        from pcluster.models.common import parse_config  # pylint: disable=C0415
+        from pcluster.models.s3_bucket import S3Bucket  # pylint: disable=C0415
+        from pcluster.schemas.cluster_schema import ClusterSchema  # pylint: disable=C0415
+        from pcluster.templates.cdk_builder import CDKTemplateBuilder  # pylint: disable=C0415
+        from pcluster.templates.construct_profiler import ConstructProfiler  # pylint: disable=C0415
+
+        if args.offline:
+            # Neither the data of the actual AWS services nor the synthesized templates must be used or overwritten
+            PersistentCache.configure(PersistentCacheMode.BYPASS)
+        with open(args.cluster_configuration, encoding="utf-8") as config_file:
+            config_text = config_file.read()
+
+        profiler = ConstructProfiler()
+        with offline_mode(args.aws_data) if args.offline else nullcontext(), profiler.profile():
+            cluster_config = ClusterSchema(cluster_name=args.cluster_name).load(parse_config(config_text))
+            bucket = S3Bucket(
+                service_name=args.cluster_name,
+                stack_name=args.cluster_name,
+                artifact_directory="/".join(
+                    [
+                        PCLUSTER_S3_ARTIFACTS_DICT.get("root_directory"),
+                        utils.get_installed_version(),
+                        PCLUSTER_S3_ARTIFACTS_DICT.get("root_cluster_directory"),
+                        args.cluster_name,
+                    ]
+                ),
+                name=cluster_config.custom_s3_bucket,
+                is_custom_bucket=bool(cluster_config.custom_s3_bucket),
+            )
+            start = time.perf_counter()
+            synthesis = CDKTemplateBuilder.synthesize_cluster_template(
+                cluster_config, bucket, args.cluster_name, timestamp=RENDERED_TEMPLATE_TIMESTAMP
+            )
+            synthesis_time = time.perf_counter() - start
+
+        template = synthesis["template"]
+        LOGGER.info("Constructs build profile:\n%s", profiler.format_table())
+        result = {"timings": {"totalTime": round(synthesis_time, 3), "constructs": profiler.get_profiles()}}
+        if args.output_file:
+            with open(args.output_file, "w", encoding="utf-8") as output_file:
+                json.dump(template, output_file, indent=2)
+            result["path"] = args.output_file
+        else:
+            result["template"] = template
+        return result
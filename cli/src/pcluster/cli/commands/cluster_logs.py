@@ -16,7 +16,6 @@ from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
-from pcluster.models.cluster import Cluster
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,7 +25,10 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
 
     # CLI
     name = "export-cluster-logs"
-    help = "Export the logs of the cluster to a local tar.gz archive by passing through an Amazon S3 Bucket."
+    help = (
+        "Export the logs of the cluster to a local tar.gz archive by passing through an Amazon S3 Bucket, "
+        "or by fetching them directly from CloudWatch Logs."
+    )
     description = help
 
     def __init__(self, subparsers):
@@ -39,8 +41,9 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
         # Export options
         parser.add_argument(
             "--bucket",
-            required=True,
-            help="S3 bucket to export cluster logs data to. It must be in the same region of the cluster",
+            help="S3 bucket to export cluster logs data to. It must be in the same region of the cluster. "
+            "If not provided, the logs are fetched through the CloudWatch Logs API, without export tasks, "
+            "and --output-file is required.",
         )
         # Export options
         parser.add_argument(
@@ -74,6 +77,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_cluster_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the cluster."""
+        from pcluster.models.cluster import Cluster  # pylint: disable=C0415
+
         LOGGER.debug("Beginning export of logs for the cluster: %s", args.cluster_name)
         cluster = Cluster(args.cluster_name)
         url = cluster.export_logs(
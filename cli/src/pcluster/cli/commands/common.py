@@ -5,6 +5,12 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+"""
+This module contains the classes and the functions shared by the CLI commands.
+
+The CLI commands import the models, the API controllers and the CDK only within the functions using them, marked with
+pylint C0415, since importing them takes longer than running most of the commands not needing them.
+"""
 import json
 import logging
 import os
@@ -22,7 +22,6 @@ from argparse import ArgumentParser, Namespace
 
 from pcluster.cli.commands.common import CliCommand
 from pcluster.constants import PCLUSTER_ISSUES_LINK
-from pcluster.models.cluster import Cluster
 from pcluster.utils import error
 
 DCV_CONNECT_SCRIPT = "/opt/parallelcluster/scripts/pcluster_dcv_connect.sh"
@@ -48,6 +47,8 @@ def _dcv_connect(args):
 
     :param args: pcluster cli arguments.
     """
+    from pcluster.models.cluster import Cluster  # pylint: disable=C0415
+
     try:
         head_node = Cluster(args.cluster_name).head_node_instance
     except Exception as e:
@@ -23,16 +23,10 @@ from functools import partial
 import argparse
 from botocore.exceptions import NoCredentialsError  # TODO: remove
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller
-import pcluster.api.controllers.cluster_instances_controller
-import pcluster.api.controllers.cluster_operations_controller
-import pcluster.api.controllers.image_operations_controller
-import pcluster.api.errors
 import pcluster.cli.commands.commands as cli_commands
 import pcluster.cli.logger as pcluster_logging
 import pcluster.cli.model
-from pcluster.api import encoder
+from pcluster.aws.persistent_cache import PersistentCache, PersistentCacheMode
 from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number
 from pcluster.cli.exceptions import APIOperationException, ParameterException
 from pcluster.cli.logger import redirect_stdouterr_to_logger
@@ -198,6 +192,17 @@ def add_cli_commands(parser_map):
     add_additional_args(parser_map)
 
 
+def _encode_api_exception(exception):
+    """Format exception messages in the same manner as the api."""
+    # API modules are imported only when needed, since they considerably slow down the CLI startup
+    import pcluster.api.errors
+    from pcluster.api import encoder
+
+    message = pcluster.api.errors.exception_message(exception)
+    error_encoded = encoder.JSONEncoder().encode(message)
+    return APIOperationException(json.loads(error_encoded))
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
@@ -210,25 +215,20 @@ def _run_operation(model, args, extra_args):
         except ParameterException as e:
             raise e
         except Exception as e:
-            # format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
+            raise _encode_api_exception(e)
     else:
         try:
             return args.func(args, extra_args)
-        except pcluster.api.errors.ParallelClusterApiException as e:
-            # Format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
         except Exception as e:
+            from pcluster.api.errors import ParallelClusterApiException
+
+            if isinstance(e, ParallelClusterApiException):
+                raise _encode_api_exception(e)
             raise e
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
+    model = model or pcluster.cli.model.load_cached_model()
     parser, parser_map = gen_parser(model)
     add_cli_commands(parser_map)
     args, extra_args = parser.parse_known_args(sys_args)
@@ -247,6 +247,9 @@ def run(sys_args, model=None):
     if "debug" in args.__dict__:
         del args.__dict__["debug"]
 
+    # The cache mode is a CLI-only setting, it must not be passed to api operations as well
+    PersistentCache.configure(PersistentCacheMode(args.__dict__.pop("cache_mode", str(PersistentCacheMode.USE))))
+
     # TODO: remove this logic from here
     # set region in the environment to make it available to all the boto3 calls
     if "region" in args and args.region:
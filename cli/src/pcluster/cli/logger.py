@@ -77,6 +77,10 @@ class LogWriter:
         """No-op."""
         pass
 
+    def isatty(self):
+        """Tell that the log is not an interactive terminal."""
+        return False
+
 
 @contextmanager
 def redirect_stdouterr_to_logger():
@@ -20,13 +20,14 @@ provided.
 """
 
 import logging
+import sys
 
 import argparse
-import boto3
 import jmespath
-from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
+from pcluster.aws.persistent_cache import PersistentCacheMode
+from pcluster.aws.stack_watcher import wait_for_stacks
 from pcluster.cli.exceptions import APIOperationException, ParameterException
 
 LOGGER = logging.getLogger(__name__)
@@ -39,6 +40,14 @@ def _cluster_status(cluster_name):
     return pcluster.cli.model.call(full_func_name, cluster_name=cluster_name)
 
 
+def _wait_for_cluster_stack(cluster_name):
+    """Wait for the operation in progress on the cluster stack and return its final status."""
+    # The progress goes to the terminal, bypassing the redirection of the standard streams to the log, and only when
+    # interactive, not to mix it with the JSON output of the command
+    progress_stream = sys.__stderr__ if sys.__stderr__ and sys.__stderr__.isatty() else None
+    return wait_for_stacks([cluster_name], progress_stream=progress_stream).get(cluster_name)
+
+
 def add_additional_args(parser_map):
     """Add any additional arguments to parsers for individual operations.
 
@@ -50,13 +59,34 @@ def add_additional_args(parser_map):
     parser_map["delete-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["update-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
 
+    parser_map["describe-cluster-instances"].add_argument(
+        "--all",
+        action="store_true",
+        help="Retrieve the instances of all the pages, following the next tokens from the given one if any.",
+    )
+
+    for operation in ["create-cluster", "update-cluster", "build-image"]:
+        parser_map[operation].add_argument(
+            "--cache-mode",
+            choices=[str(mode) for mode in PersistentCacheMode],
+            default=str(PersistentCacheMode.USE),
+            help="How to use the local cache of immutable AWS data (e.g. instance types) shared across invocations: "
+            "'use' reads and populates it, 'refresh' ignores cached entries and repopulates them, "
+            "'bypass' does not use it at all. (Defaults to 'use'.)",
+        )
+
 
 def middleware_hooks():
     """Return a map and from operation to middleware functions.
 
     The map has operation names as the keys and functions as values.
     """
-    return {"create-cluster": create_cluster, "delete-cluster": delete_cluster, "update-cluster": update_cluster}
+    return {
+        "create-cluster": create_cluster,
+        "delete-cluster": delete_cluster,
+        "update-cluster": update_cluster,
+        "describe-cluster-instances": describe_cluster_instances,
+    }
 
 
 def queryable(func):
@@ -76,12 +106,9 @@ def update_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_update_complete")
-        try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster update with error: %s", e)
+        status = _wait_for_cluster_stack(kwargs["cluster_name"])
+        if status != "UPDATE_COMPLETE":
+            LOGGER.error("Failed when waiting for cluster update, stack status: %s", status)
             raise APIOperationException(_cluster_status(kwargs["cluster_name"]))
         ret = _cluster_status(kwargs["cluster_name"])
     return ret
@@ -92,12 +119,9 @@ def create_cluster(func, body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_create_complete")
-        try:
-            waiter.wait(StackName=body["clusterName"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster creation with error: %s", e)
+        status = _wait_for_cluster_stack(body["clusterName"])
+        if status != "CREATE_COMPLETE":
+            LOGGER.error("Failed when waiting for cluster creation, stack status: %s", status)
             raise APIOperationException(_cluster_status(body["clusterName"]))
         ret = _cluster_status(body["clusterName"])
     return ret
@@ -108,13 +132,28 @@ def delete_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait:
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_delete_complete")
-        try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster deletion with error: %s", e)
+        status = _wait_for_cluster_stack(kwargs["cluster_name"])
+        if status != "DELETE_COMPLETE":
+            LOGGER.error("Failed when waiting for cluster deletion, stack status: %s", status)
             raise APIOperationException({"message": f"Failed when deleting cluster '{kwargs['cluster_name']}'."})
         return {"message": f"Successfully deleted cluster '{kwargs['cluster_name']}'."}
     else:
         return ret
+
+
+def _iter_pages(func, kwargs):
+    """Call a paginated operation lazily, yielding its pages from the one of the given next token to the last one."""
+    kwargs = dict(kwargs)
+    while True:
+        page = func(**kwargs)
+        yield page
+        kwargs["next_token"] = page.get("nextToken")
+        if not kwargs["next_token"]:
+            return
+
+
+@queryable
+def describe_cluster_instances(func, _body, kwargs):
+    if not kwargs.pop("all", False):
+        return func(**kwargs)
+    return {"instances": [instance for page in _iter_pages(func, kwargs) for instance in page.get("instances", [])]}
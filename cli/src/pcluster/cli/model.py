@@ -11,12 +11,17 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import hashlib
 import importlib
 import json
+import logging
+import os
+import tempfile
 
 import jmespath
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
+from pcluster.aws.persistent_cache import PersistentCache
 from pcluster.cli.exceptions import APIOperationException
 from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
 
@@ -26,6 +31,11 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+LOGGER = logging.getLogger(__name__)
+
+# Bump this value every time the layout of the model returned by load_model changes
+CLI_MODEL_FORMAT_VERSION = "1"
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -86,10 +96,53 @@ def _resolve_body(spec, operation):
     return new_params
 
 
+def _read_spec_text():
+    with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:
+        return spec_file.read()
+
+
 def package_spec():
     """Load the OpenAPI specification from the package."""
-    with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:
-        return yaml_load(spec_file.read())
+    return yaml_load(_read_spec_text())
+
+
+def _get_cached_model_path(spec_text):
+    digest = hashlib.sha256(f"{CLI_MODEL_FORMAT_VERSION}:{spec_text}".encode("utf-8")).hexdigest()
+    return os.path.join(PersistentCache.get_cache_dir(), "cli-model", f"{digest}.json")
+
+
+def load_cached_model():
+    """Return the CLI model of the packaged OpenAPI specification, reusing the one compiled by previous invocations.
+
+    Parsing the specification and resolving its references takes a considerable share of the CLI startup time,
+    so the compiled model is stored in the persistent cache directory, keyed by the digest of the specification.
+    The cache is not used when the PCLUSTER_PERSISTENT_CACHE_DISABLED environment variable is set and any I/O error
+    is treated as a cache miss.
+    """
+    spec_text = _read_spec_text()
+    if os.environ.get("PCLUSTER_PERSISTENT_CACHE_DISABLED"):
+        return load_model(yaml_load(spec_text))
+
+    model_path = _get_cached_model_path(spec_text)
+    try:
+        with open(model_path, encoding="utf-8") as model_file:
+            return json.load(model_file)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        LOGGER.debug("Unable to read cached CLI model %s: %s", model_path, e)
+
+    model = load_model(yaml_load(spec_text))
+    model_dir = os.path.dirname(model_path)
+    try:
+        os.makedirs(model_dir, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=model_dir, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+            json.dump(model, temp_file)
+        os.replace(temp_path, model_path)
+    except OSError as e:
+        LOGGER.debug("Unable to write cached CLI model %s: %s", model_path, e)
+    return model
 
 
 def load_model(spec):
@@ -205,6 +258,9 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    # Imported here since it loads the whole API server stack, which is not needed to parse the CLI arguments
+    from pcluster.api import encoder
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
@@ -1047,6 +1047,11 @@ class AmiSearchFilters(Resource):
         self.tags = tags
         self.owner = owner
 
+    @property
+    def cache_scope(self):
+        """Identify the filters by their content in the caches shared across requests."""
+        return self.owner, tuple(sorted((tag.key, tag.value) for tag in self.tags or []))
+
 
 class Timeouts(Resource):
     """Represent the configuration for node boostrap timeout."""
@@ -1793,6 +1798,15 @@ class BaseClusterConfig(Resource):
         """Return tags configured in the cluster configuration."""
         return self.tags
 
+    @property
+    def all_instance_types(self) -> List[str]:
+        """Return the list of the instance types referenced in the configuration, without duplicates."""
+        instance_types = [self.head_node.instance_type]
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types or [])
+        return list(dict.fromkeys(instance_types))
+
     def get_instance_types_data(self) -> dict:
         """Get instance type infos for all instance types used in the configuration file."""
         return {}
@@ -13,19 +13,31 @@
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
 import asyncio
-import itertools
+import enum
+import hashlib
 import json
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Set
 
-from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationResult, Validator, ValidatorContext
+from pcluster.validators.common import (
+    AsyncValidator,
+    FailureLevel,
+    ValidationProfiler,
+    ValidationResult,
+    Validator,
+    ValidatorContext,
+)
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
 from pcluster.validators.s3_validators import UrlValidator
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of sync validators executed concurrently
+VALIDATORS_MAX_WORKERS = 16
+
 
 class ValidatorSuppressor(ABC):
     """Interface for a class that encapsulates the logic to suppress config validators."""
@@ -124,9 +136,9 @@ class Resource:
     def __init__(self, implied: bool = False):
         # Parameters registry
         self.__params = {}
-        self._validation_futures = []
         self._validation_failures: List[ValidationResult] = []
         self._validators: List = []
+        self._passed_validators: Set[str] = set()
         self.implied = implied
 
     @property
@@ -134,6 +146,15 @@ class Resource:
         """Return the params registry for this Resource."""
         return self.__params
 
+    @property
+    def passed_validators(self):
+        """
+        Return the digests of the validators of the nested resources that passed the last validation.
+
+        Only validators with JSON serializable arguments which were executed, or skipped, without failures are included.
+        """
+        return self._passed_validators
+
     def get_param(self, param_name):
         """Get the information related to the specified parameter name."""
         return self.__params.get(param_name, None)
@@ -171,15 +192,24 @@ class Resource:
         return Resource.Param(value, default=default, update_policy=update_policy)
 
     @staticmethod
-    def _validator_execute(validator_class, validator_args, suppressors, validation_executor):
+    def _validator_execute(validator_class, validator_args, suppressors, validation_executor, profiler=None):
         validator = validator_class()
 
-        if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
+        if Resource._is_suppressed(validator, suppressors):
             LOGGER.debug("Suppressing validator %s", validator_class.__name__)
             return []
 
         LOGGER.debug("Executing validator %s", validator_class.__name__)
-        return validation_executor(validator_args, validator)
+        if not profiler:
+            return validation_executor(validator_args, validator)
+        if issubclass(validator_class, AsyncValidator):
+            return profiler.profile_async(validator.type, validation_executor(validator_args, validator))
+        with profiler.profile(validator.type):
+            return validation_executor(validator_args, validator)
+
+    @staticmethod
+    def _is_suppressed(validator, suppressors):
+        return any(suppressor.suppress_validator(validator) for suppressor in (suppressors or []))
 
     @staticmethod
     def _validator_execute_sync(validator_args, validator):
@@ -193,16 +223,89 @@ class Resource:
     def _validator_execute_async(validator_args, validator):
         return validator.execute_async(**validator_args)
 
-    def _await_async_validators(self):
-        # here could be a good spot to add a cascading timeout for the async validators
-        # if they are taking too long to execute for a resource and its children since the use of
-        # get_async_timed_validator_type_for allows to decorate only on single validator at a time and
-        # does not cascade to child resources
-        return list(
-            itertools.chain.from_iterable(
-                asyncio.get_event_loop().run_until_complete(asyncio.gather(*self._validation_futures))
+    @staticmethod
+    def _validator_key(validator_class, validator_args):
+        """
+        Return a hashable key identifying the validator and its arguments, None if the arguments are not hashable.
+
+        Nested resources are compared by identity, collections by content.
+        """
+
+        def _freeze(value):
+            if isinstance(value, dict):
+                return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+            if isinstance(value, (list, tuple)):
+                return tuple(_freeze(item) for item in value)
+            if isinstance(value, set):
+                return frozenset(_freeze(item) for item in value)
+            return value
+
+        try:
+            key = (validator_class, _freeze(validator_args))
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _validator_digest(validator_class, validator_args):
+        """
+        Return a digest identifying the validator and its arguments across executions.
+
+        Return None if the arguments are not JSON serializable, e.g. when they include resources.
+        """
+
+        def _serialize(value):
+            if isinstance(value, (set, frozenset)):
+                return sorted(value)
+            if isinstance(value, enum.Enum):
+                return value.value
+            raise TypeError(f"{type(value).__name__} is not serializable")
+
+        try:
+            serialized_validator = json.dumps(
+                [f"{validator_class.__module__}.{validator_class.__qualname__}", validator_args],
+                sort_keys=True,
+                default=_serialize,
             )
-        )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(serialized_validator.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _execute_unique_validators(validators, execute):
+        """
+        Execute the given validators with the execute function, running only once the ones with identical arguments.
+
+        Return the list of the results in the same order of the validators.
+        """
+        results = {}
+        unique_validators = {}
+        for index, validator in enumerate(validators):
+            key = Resource._validator_key(*validator)
+            if key is None:
+                key = ("unhashable", index)
+            unique_validators.setdefault(key, []).append(index)
+
+        for key, indexes in unique_validators.items():
+            if len(indexes) > 1:
+                LOGGER.debug("Validator %s registered %d times with same arguments", key[0].__name__, len(indexes))
+        for indexes, result in zip(
+            unique_validators.values(), execute([validators[indexes[0]] for indexes in unique_validators.values()])
+        ):
+            for index in indexes:
+                results[index] = result
+        return [results[index] for index in range(len(validators))]
+
+    def _collect_validators(self, context):
+        """Register the validators of the resource tree and return them, nested resources first."""
+        validators = []
+        for nested_resource in self._nested_resources():
+            validators.extend(nested_resource._collect_validators(context))  # pylint: disable=protected-access
+        self._validators.clear()
+        self._register_validators(context)
+        validators.extend(self._validators)
+        return validators
 
     def _nested_resources(self):
         nested_resources = []
@@ -214,52 +317,93 @@ class Resource:
         return nested_resources
 
     def validate(
-        self, suppressors: List[ValidatorSuppressor] = None, context: ValidatorContext = None, nested: bool = False
+        self,
+        suppressors: List[ValidatorSuppressor] = None,
+        context: ValidatorContext = None,
+        profiler: ValidationProfiler = None,
+        skipped_validators: Set[str] = None,
     ):
         """
-        Execute registered validators.
+        Execute the validators registered by the resource and by all its nested resources.
+
+        Validators are first collected from the whole resource tree. Since most of them are I/O bound, sync validators
+        are executed concurrently on a bounded thread pool, while async validators are awaited on the event loop.
+        Validators registered more than once with identical arguments are executed only once.
+        Failures are returned in a deterministic order: sync validators first, in registration order.
+        If a profiler is given, the execution statistics of every validator are recorded in it.
 
-        The "nested" parameter is used only for internal recursive calls to distinguish those from the top level
-        one where the async validators results should be awaited for.
+        Validators of the nested resources whose digest is in skipped_validators, i.e. that recently passed a previous
+        validation with the same arguments, are not executed. The validators registered by the resource itself are
+        cross-cutting and are always executed.
         """
-        # this validation logic is a responsibility that could be completely separated from the resource tree
-        # also until we need to support both sync and async validation this logic will be unnecessarily complex
-        # embracing async validation completely is possible and will greatly simplify this
-        self._validation_futures.clear()
         self._validation_failures.clear()
+        self._passed_validators.clear()
+        validators = self._collect_validators(context)
+
+        own_validators = {id(validator) for validator in self._validators}
+        digests = {
+            id(validator): self._validator_digest(*validator)
+            for validator in validators
+            if id(validator) not in own_validators
+        }
+        if skipped_validators:
+            unchanged_validators = [
+                validator for validator in validators if digests.get(id(validator)) in skipped_validators
+            ]
+            if unchanged_validators:
+                LOGGER.info(
+                    "Skipping %d validators with arguments unchanged since the previous validation",
+                    len(unchanged_validators),
+                )
+                self._passed_validators.update(digests[id(validator)] for validator in unchanged_validators)
+                validators = [
+                    validator for validator in validators if digests.get(id(validator)) not in skipped_validators
+                ]
+
+        sync_validators = [validator for validator in validators if not issubclass(validator[0], AsyncValidator)]
+        async_validators = [validator for validator in validators if issubclass(validator[0], AsyncValidator)]
+        for executed_validators, execute in (
+            (sync_validators, self._execute_sync_validators),
+            (async_validators, self._execute_async_validators),
+        ):
+            results = self._execute_unique_validators(
+                executed_validators,
+                lambda unique_validators, execute=execute: execute(unique_validators, suppressors, profiler),
+            )
+            for validator, result in zip(executed_validators, results):
+                self._validation_failures.extend(result)
+                digest = digests.get(id(validator))
+                if digest and not result and not (suppressors and self._is_suppressed(validator[0](), suppressors)):
+                    self._passed_validators.add(digest)
 
-        try:
-            self._validate_nested_resources(context, suppressors)
-            self._validate_self(context, suppressors)
-        finally:
-            if nested:
-                result = self._validation_failures, self._validation_futures.copy()
-            else:
-                self._validation_failures.extend(self._await_async_validators())
-                result = self._validation_failures
-            self._validation_futures.clear()
-
-        return result
-
-    def _validate_nested_resources(self, context, suppressors):
-        # Call validators for nested resources
-        for nested_resource in self._nested_resources():
-            failures, futures = nested_resource.validate(suppressors, context, nested=True)
-            self._validation_futures.extend(futures)
-            self._validation_failures.extend(failures)
+        return self._validation_failures
 
-    def _validate_self(self, context, suppressors):
-        self._validators.clear()
-        self._register_validators(context)
-        for validator in self._validators:
-            if issubclass(validator[0], AsyncValidator):
-                self._validation_futures.extend(
-                    [self._validator_execute(*validator, suppressors, self._validator_execute_async)]
-                )
-            else:
-                self._validation_failures.extend(
-                    self._validator_execute(*validator, suppressors, self._validator_execute_sync)
+    def _execute_sync_validators(self, validators, suppressors, profiler):
+        if not validators:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(VALIDATORS_MAX_WORKERS, len(validators)), thread_name_prefix="validator"
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda validator: self._validator_execute(
+                        *validator, suppressors, self._validator_execute_sync, profiler
+                    ),
+                    validators,
                 )
+            )
+
+    def _execute_async_validators(self, validators, suppressors, profiler):
+        # here could be a good spot to add a cascading timeout for the async validators
+        # if they are taking too long to execute, since the use of get_async_timed_validator_type_for
+        # allows to decorate only on single validator at a time
+        futures = []
+        for validator in validators:
+            futures.append(self._validator_execute(*validator, suppressors, self._validator_execute_async, profiler))
+        # Suppressed validators return an empty list in place of the coroutine
+        coroutines = [future for future in futures if asyncio.iscoroutine(future)]
+        results = iter(asyncio.get_event_loop().run_until_complete(asyncio.gather(*coroutines)) if coroutines else [])
+        return [next(results) if asyncio.iscoroutine(future) else future for future in futures]
 
     def _register_validators(self, context: ValidatorContext = None):
         """
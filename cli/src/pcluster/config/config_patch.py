@@ -202,6 +202,31 @@ class ConfigPatch:
                     )
                 )
 
+    def get_unaffected_queues(self):
+        """
+        Return the names of the target Slurm queues whose settings are not affected by the patch.
+
+        Changes outside of the Slurm queues sections can affect the resources of any queue, so no queue is returned
+        when the patch contains any of them.
+        """
+        affected_queues = set()
+        for change in self.changes:
+            if change.path == ["Scheduling"] and change.key == "SlurmQueues" and change.is_list:
+                # Queue added or removed
+                affected_queues.add((change.old_value or change.new_value).get("Name"))
+                continue
+            queue_match = (
+                re.match(r"^SlurmQueues\[(.*)\]$", change.path[1])
+                if change.path[:1] == ["Scheduling"] and len(change.path) > 1
+                else None
+            )
+            if not queue_match:
+                return set()
+            affected_queues.add(queue_match.group(1))
+
+        target_queues = (self.target_config.get("Scheduling") or {}).get("SlurmQueues") or []
+        return {queue.get("Name") for queue in target_queues} - affected_queues
+
     @property
     def update_policy_level(self):
         """
@@ -127,6 +127,42 @@ CW_ALARM_EVALUATION_PERIODS_DEFAULT = 1
 CW_ALARM_DATAPOINTS_TO_ALARM_DEFAULT = 1
 DETAILED_MONITORING_ENABLED_DEFAULT = False
 
+INSTANCE_TYPES_PERSISTENT_CACHE_TTL = 24 * 60 * 60  # seconds
+CDK_SYNTHESIS_PERSISTENT_CACHE_TTL = 10 * 60  # seconds
+# Validators passed within this period are not executed again on update with the same arguments, since they also
+# validate the AWS resources referenced by the config, which may change in the meantime.
+# It can be changed with the PCLUSTER_VALIDATION_RESULTS_TTL environment variable, 0 to always execute all validators.
+VALIDATION_RESULTS_TTL = 24 * 60 * 60  # seconds
+
+# Uploads of the cluster artifacts to S3
+S3_UPLOAD_MAX_WORKERS = 8
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # bytes
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024  # bytes
+
+# Downloads of the CloudWatch logs exported to S3
+LOGS_EXPORT_MAX_WORKERS = 8
+LOGS_EXPORT_CHUNK_SIZE = 1024 * 1024  # bytes
+
+# Concurrent description of the cluster stacks listed through the Resource Groups Tagging API or requested by name
+LIST_CLUSTERS_MAX_WORKERS = 8
+
+# Instances retrieved for each page when iterating over all the instances of a cluster (max allowed by EC2)
+EC2_DESCRIBE_INSTANCES_PAGE_SIZE = 1000
+
+# Termination of the cluster instances: TerminateInstances calls are spread across a pool of workers, and limited to
+# a sustained rate below the EC2 API throttling limits
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_MAX_WORKERS = 8
+TERMINATE_INSTANCES_RATE = 5  # calls per second
+TERMINATE_INSTANCES_BURST = 10
+
+# Polling of the CloudFormation stack events while waiting for stack operations: the DescribeStackEvents calls of all
+# the watched stacks, nested ones included, are limited to a sustained rate shared by the whole process
+STACK_WATCH_MIN_DELAY = 5  # seconds
+STACK_WATCH_MAX_DELAY = 30  # seconds
+STACK_WATCH_EVENTS_RATE = 1  # calls per second
+STACK_WATCH_EVENTS_BURST = 5
+
 STACK_EVENTS_LOG_STREAM_NAME_FORMAT = "{}-cfn-events"
 
 PCLUSTER_IMAGE_NAME_REGEX = r"^[-_A-Za-z0-9{][-_A-Za-z0-9\s:{}\.]+[-_A-Za-z0-9}]$"
@@ -165,6 +201,7 @@ PCLUSTER_S3_ARTIFACTS_DICT = {
     "custom_artifacts_name": "artifacts.zip",
     "scheduler_resources_name": "scheduler_resources.zip",
     "change_set_name": "change-set.json",
+    "validation_results_name": "validation-results.json",
 }
 
 PCLUSTER_TAG_VALUE_REGEX = r"^([\w\+\-\=\.\_\:\@/]{0,256})$"
@@ -12,16 +12,15 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import functools
 import hashlib
 import json
 import logging
 import os
-import tempfile
 import time
-from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from urllib.request import urlopen
 
 import pkg_resources
@@ -41,7 +40,9 @@ from pcluster.constants import (
     PCLUSTER_QUEUE_NAME_TAG,
     PCLUSTER_S3_ARTIFACTS_DICT,
     PCLUSTER_VERSION_TAG,
+    S3_UPLOAD_MAX_WORKERS,
     STACK_EVENTS_LOG_STREAM_NAME_FORMAT,
+    VALIDATION_RESULTS_TTL,
 )
 from pcluster.models.cluster_resources import (
     ClusterInstance,
@@ -52,30 +53,31 @@ from pcluster.models.cluster_resources import (
 from pcluster.models.common import (
     BadRequest,
     CloudWatchLogsExporter,
+    CloudWatchLogsFetcher,
     Conflict,
     LimitExceeded,
+    LogsArchive,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
-    export_stack_events,
+    format_stack_events,
     parse_config,
-    upload_archive,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url, parse_bucket_url
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroups
 from pcluster.templates.import_cdk import start as start_cdk_import
 from pcluster.utils import (
     datetime_to_epoch,
     generate_random_name_with_prefix,
     get_attr,
     get_installed_version,
-    grouper,
+    run_concurrently,
     yaml_load,
 )
-from pcluster.validators.common import FailureLevel, ValidationResult, ValidatorContext
+from pcluster.validators.common import FailureLevel, ValidationProfiler, ValidationResult, ValidatorContext
 
 # pylint: disable=C0302
 
@@ -176,6 +178,7 @@ class Cluster:
         self.__official_ami = None
         self.__has_running_capacity = None
         self.__running_capacity = None
+        self.__previous_passed_validators = {}
 
     @property
     def stack(self):
@@ -346,10 +349,12 @@ class Cluster:
         disable_rollback: bool = False,
         validator_suppressors: Set[ValidatorSuppressor] = None,
         validation_failure_level: FailureLevel = FailureLevel.ERROR,
+        validation_profiler: ValidationProfiler = None,
     ) -> Tuple[Optional[str], List]:
         """
         Create cluster.
 
+        :param validation_profiler: if specified, collects the execution statistics of the validators.
         raises ClusterActionError: in case of generic error
         raises ConfigValidationError: if configuration is invalid
         """
@@ -358,7 +363,7 @@ class Cluster:
         artifact_dir_generated = False
         try:
             suppressed_validation_failures = self.validate_create_request(
-                validator_suppressors, validation_failure_level
+                validator_suppressors, validation_failure_level, validation_profiler=validation_profiler
             )
 
             LOGGER.info("Generating artifact dir and uploading config...")
@@ -396,6 +401,7 @@ class Cluster:
                     if asset_parameters
                 ],
             )
+            self._upload_validation_results()
 
             return creation_result.get("StackId"), suppressed_validation_failures
 
@@ -453,13 +459,20 @@ class Cluster:
             validation_failures = [ValidationResult(data, FailureLevel.ERROR, validator_type="ConfigSchemaValidator")]
             raise ConfigValidationError("Invalid cluster configuration.", validation_failures=validation_failures)
 
-    def validate_create_request(self, validator_suppressors, validation_failure_level, dry_run=False):
+    def validate_create_request(
+        self,
+        validator_suppressors,
+        validation_failure_level,
+        dry_run=False,
+        validation_profiler: ValidationProfiler = None,
+    ):
         """Validate a create cluster request."""
         self._validate_no_existing_stack()
         self.config, ignored_validation_failures = self._validate_and_parse_config(
             validator_suppressors=validator_suppressors,
             validation_failure_level=validation_failure_level,
             context=ValidatorContext(),
+            validation_profiler=validation_profiler,
         )
         if dry_run and isinstance(self.config.scheduling, SchedulerPluginScheduling):
             self._render_and_upload_scheduler_plugin_template(dry_run=dry_run)
@@ -470,12 +483,20 @@ class Cluster:
             raise BadRequestClusterActionError(f"Cluster {self.name} already exists.")
 
     def _validate_and_parse_config(
-        self, validator_suppressors, validation_failure_level, config_text=None, context: ValidatorContext = None
+        self,
+        validator_suppressors,
+        validation_failure_level,
+        config_text=None,
+        context: ValidatorContext = None,
+        validation_profiler: ValidationProfiler = None,
+        skipped_validators: Set[str] = None,
     ):
         """
         Perform syntactic and semantic validation and return parsed config.
 
         :param config_text: config to parse, self.source_config_text will be used if not specified.
+        :param validation_profiler: if specified, collects the execution statistics of the validators.
+        :param skipped_validators: digests of the validators of nested resources not to be executed again.
         """
         cluster_config_dict = parse_config(config_text or self.source_config_text)
 
@@ -483,12 +504,18 @@ class Cluster:
             LOGGER.info("Validating cluster configuration...")
             Cluster._load_additional_instance_type_data(cluster_config_dict)
             config = self._load_config(cluster_config_dict)
+            # Retrieve all the instance types info with bulk requests, before validators and properties ask for them
+            AWSApi.instance().ec2.prefetch_instance_types_info(config.all_instance_types)
             config.official_ami = self.__official_ami
             if context.during_update:
                 config.managed_head_node_security_group = self.stack.get_resource_physical_id("HeadNodeSecurityGroup")
                 config.managed_compute_security_group = self.stack.get_resource_physical_id("ComputeSecurityGroup")
 
-            validation_failures = config.validate(validator_suppressors, context)
+            validation_failures = config.validate(
+                validator_suppressors, context, validation_profiler, skipped_validators
+            )
+            if validation_profiler:
+                LOGGER.info("Validators execution profile:\n%s", validation_profiler.format_table())
             if any(f.level.value >= FailureLevel(validation_failure_level).value for f in validation_failures):
                 raise ConfigValidationError("Invalid cluster configuration.", validation_failures=validation_failures)
             LOGGER.info("Validation succeeded.")
@@ -514,7 +541,7 @@ class Cluster:
             # Upload config with default values and sections
             if self.config:
                 result = self.bucket.upload_config(
-                    config=ClusterSchema(cluster_name=self.name).dump(deepcopy(self.config)),
+                    config=ClusterSchema(cluster_name=self.name).dump(self.config),
                     config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("config_name"),
                 )
 
@@ -534,6 +561,62 @@ class Cluster:
                 e, f"Unable to upload cluster config to the S3 bucket {self.bucket.name} due to exception: {e}"
             )
 
+    def _upload_validation_results(self):
+        """
+        Upload the digests of the validators passed by the cluster config, with the time they were executed at.
+
+        The results are uploaded once the stack operation deploying the config is started and refer to the version of
+        the config, so that they are not used if the stack operation fails.
+        On update, the validators of the nested resources registered with the same arguments are not executed again
+        within the validation results TTL. The validators not executed again keep the time of their previous execution.
+        """
+        now = int(time.time())
+        try:
+            self.bucket.upload_config(
+                config={
+                    "Version": get_installed_version(),
+                    "ConfigVersion": self.config.original_config_version,
+                    "PassedValidators": {
+                        digest: self.__previous_passed_validators.get(digest, now)
+                        for digest in sorted(self.config.passed_validators)
+                    },
+                },
+                config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("validation_results_name"),
+                format=S3FileFormat.JSON,
+            )
+        except Exception as e:
+            # The whole config will be validated again on update
+            LOGGER.warning("Unable to upload validation results to the S3 bucket %s: %s", self.bucket.name, e)
+
+    def _get_passed_validators(self):
+        """
+        Return the digests of the validators passed by the config of the last successful create or update.
+
+        Only the validators executed within the validation results TTL are returned, and only if the stack completed
+        the create or update of the config they were recorded for.
+        """
+        self.__previous_passed_validators = {}
+        ttl = int(os.environ.get("PCLUSTER_VALIDATION_RESULTS_TTL", VALIDATION_RESULTS_TTL))
+        if ttl <= 0 or self.stack.status not in ("CREATE_COMPLETE", "UPDATE_COMPLETE"):
+            return set()
+        try:
+            validation_results = self.bucket.get_config(
+                config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("validation_results_name"), format=S3FileFormat.JSON
+            )
+            if (
+                validation_results.get("Version") == get_installed_version()
+                and validation_results.get("ConfigVersion") == self.stack.original_config_version
+            ):
+                min_timestamp = time.time() - ttl
+                self.__previous_passed_validators = {
+                    digest: timestamp
+                    for digest, timestamp in validation_results.get("PassedValidators", {}).items()
+                    if timestamp >= min_timestamp
+                }
+        except Exception as e:
+            LOGGER.info("Unable to retrieve the results of the previous validation: %s", e)
+        return set(self.__previous_passed_validators)
+
     def _upload_change_set(self, changes=None):
         """Upload change set."""
         if changes:
@@ -564,28 +647,49 @@ class Cluster:
         self._check_bucket_existence()
         try:
             resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
-            self.bucket.upload_resources(
-                resource_dir=resources, custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name")
-            )
+            uploads = [
+                functools.partial(
+                    self.bucket.upload_resources,
+                    resource_dir=resources,
+                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name"),
+                )
+            ]
             if self.config.scheduler_resources:
-                self.bucket.upload_resources(
-                    resource_dir=self.config.scheduler_resources,
-                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                uploads.append(
+                    functools.partial(
+                        self.bucket.upload_resources,
+                        resource_dir=self.config.scheduler_resources,
+                        custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                    )
                 )
 
             # Upload template
             if self.template_body:
-                self.bucket.upload_cfn_template(self.template_body, PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"))
+                uploads.append(
+                    functools.partial(
+                        self.bucket.upload_cfn_template,
+                        self.template_body,
+                        PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"),
+                        skip_unchanged=True,
+                    )
+                )
 
             # upload instance types data
-            self.bucket.upload_config(
-                self.config.get_instance_types_data(),
-                PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
-                format=S3FileFormat.JSON,
+            uploads.append(
+                functools.partial(
+                    self.bucket.upload_config,
+                    self.config.get_instance_types_data(),
+                    PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
+                    format=S3FileFormat.JSON,
+                    skip_unchanged=True,
+                )
             )
 
             if isinstance(self.config.scheduling, SchedulerPluginScheduling):
-                self._render_and_upload_scheduler_plugin_template()
+                uploads.append(self._render_and_upload_scheduler_plugin_template)
+
+            # The artifacts are independent of each other, so they are uploaded concurrently
+            run_concurrently(uploads, max_workers=S3_UPLOAD_MAX_WORKERS, thread_name_prefix="s3-upload")
             LOGGER.info("Cluster artifacts uploaded correctly.")
         except BadRequestClusterActionError:
             raise
@@ -644,7 +748,7 @@ class Cluster:
             )
             template = environment.from_string(file_content)
             rendered_template = template.render(
-                cluster_configuration=ClusterSchema(cluster_name=self.name).dump(deepcopy(self.config)),
+                cluster_configuration=ClusterSchema(cluster_name=self.name).dump(self.config),
                 cluster_name=self.name,
                 instance_types_info=self.config.get_instance_types_data(),
             )
@@ -734,14 +838,12 @@ class Cluster:
         try:
             LOGGER.info("\nChecking if there are running compute nodes that require termination...")
             filters = self._get_instance_filters(node_type=NodeType.COMPUTE)
-            instances = AWSApi.instance().ec2.list_instance_ids(filters)
-
-            for instance_ids in grouper(instances, 100):
-                LOGGER.info("Terminating following instances: %s", instance_ids)
-                if instance_ids:
-                    AWSApi.instance().ec2.terminate_instances(instance_ids)
+            ec2 = AWSApi.instance().ec2
+            # The instances are terminated while the next pages are being listed
+            instance_ids = (instance.get("InstanceId") for instance in ec2.iter_instances(filters))
+            terminated_count = ec2.terminate_instances_concurrently(instance_ids)
 
-            LOGGER.info("Compute fleet cleaned up.")
+            LOGGER.info("Compute fleet cleaned up, %s instances terminated.", terminated_count)
         except Exception as e:
             LOGGER.error("Failed when checking for running EC2 instances with error: %s", str(e))
             raise _cluster_error_mapper(e, f"Unable to delete running EC2 instances with error: {e}")
@@ -749,8 +851,7 @@ class Cluster:
     @property
     def compute_instances(self) -> List[ClusterInstance]:
         """Get compute instances."""
-        instances, _ = self.describe_instances(node_type=NodeType.COMPUTE)
-        return instances
+        return list(self.iter_instances(node_type=NodeType.COMPUTE))
 
     @property
     def head_node_instance(self) -> ClusterInstance:
@@ -761,9 +862,28 @@ class Cluster:
         else:
             raise ClusterActionError("Unable to retrieve head node information.")
 
+    @staticmethod
+    def get_head_node_instances(cluster_names: List[str]) -> Dict[str, ClusterInstance]:
+        """
+        Get the head node instances of the given clusters, by cluster name.
+
+        The head nodes are retrieved with a single (paginated) DescribeInstances query filtering on all the names,
+        rather than with a query for each cluster. Clusters without a head node are not part of the result.
+        """
+        try:
+            filters = Cluster._get_clusters_instance_filters(cluster_names, NodeType.HEAD_NODE)
+            head_nodes = (ClusterInstance(instance) for instance in AWSApi.instance().ec2.iter_instances(filters))
+            return {head_node.cluster_name: head_node for head_node in head_nodes}
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve head node instances. {e}")
+
     def _get_instance_filters(self, node_type: NodeType, queue_name: str = None):
+        return self._get_clusters_instance_filters([self.stack_name], node_type, queue_name)
+
+    @staticmethod
+    def _get_clusters_instance_filters(cluster_names: List[str], node_type: NodeType, queue_name: str = None):
         filters = [
-            {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": [self.stack_name]},
+            {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": list(cluster_names)},
             {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
         ]
         if node_type:
@@ -783,6 +903,20 @@ class Cluster:
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
 
+    def iter_instances(self, node_type: NodeType = None, queue_name: str = None) -> Iterator[ClusterInstance]:
+        """
+        Iterate over all the cluster instances filtered by node type and queue name.
+
+        The pages of instances are retrieved lazily while iterating, and the raw data of each page is released as soon
+        as its instances are converted, so that the instances of large clusters can be streamed.
+        """
+        try:
+            filters = self._get_instance_filters(node_type, queue_name)
+            for instance in AWSApi.instance().ec2.iter_instances(filters):
+                yield ClusterInstance(instance)
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
+
     def has_running_capacity(self, updated_value: bool = False) -> bool:
         """Return True if the cluster has running capacity. Note: the value will be cached."""
         if self.__has_running_capacity is None or updated_value:
@@ -889,6 +1023,7 @@ class Cluster:
         validation_failure_level: FailureLevel = FailureLevel.ERROR,
         force: bool = False,
         dry_run: bool = False,
+        validation_profiler: ValidationProfiler = None,
     ):
         """Validate a cluster update request."""
         self._validate_cluster_exists()
@@ -898,6 +1033,8 @@ class Cluster:
             validation_failure_level=validation_failure_level,
             config_text=target_source_config,
             context=ValidatorContext(head_node_instance_id=self.head_node_instance.id, during_update=True),
+            validation_profiler=validation_profiler,
+            skipped_validators=self._get_passed_validators(),
         )
         changes = self._validate_patch(force, target_config)
 
@@ -934,10 +1071,12 @@ class Cluster:
         validator_suppressors: Set[ValidatorSuppressor] = None,
         validation_failure_level: FailureLevel = FailureLevel.ERROR,
         force: bool = False,
+        validation_profiler: ValidationProfiler = None,
     ):
         """
         Update cluster.
 
+        :param validation_profiler: if specified, collects the execution statistics of the validators.
         raises ClusterActionError: in case of generic error
         raises ConfigValidationError: if configuration is invalid
         raises ClusterUpdateError: if update is not allowed
@@ -945,8 +1084,13 @@ class Cluster:
         start_cdk_import()
         try:
             target_config, changes, ignored_validation_failures = self.validate_update_request(
-                target_source_config, validator_suppressors, validation_failure_level, force
+                target_source_config,
+                validator_suppressors,
+                validation_failure_level,
+                force,
+                validation_profiler=validation_profiler,
             )
+            deployed_queue_groups = self._get_deployed_queue_groups(target_config)
 
             self.config = target_config
             self.__source_config_text = target_source_config
@@ -963,6 +1107,7 @@ class Cluster:
                     bucket=self.bucket,
                     stack_name=self.stack_name,
                     log_group_name=self.stack.log_group_name,
+                    deployed_queue_groups=deployed_queue_groups,
                 )
 
             # upload cluster artifacts and generated template
@@ -984,6 +1129,7 @@ class Cluster:
                     if asset_parameters
                 ],
             )
+            self._upload_validation_results()
 
             self.__stack = ClusterStack(AWSApi.instance().cfn.describe_stack(self.stack_name))
             LOGGER.debug("StackId: %s", self.stack.id)
@@ -998,6 +1144,22 @@ class Cluster:
             LOGGER.critical(e)
             raise _cluster_error_mapper(e, f"Cluster update failed.\n{e}")
 
+    def _get_deployed_queue_groups(self, target_config):
+        """Return the queue group stacks of the deployed cluster stack that the update may reuse, if any."""
+        if target_config.scheduling.scheduler != "slurm":
+            return None
+        unaffected_queues = ConfigPatch(
+            cluster=self, base_config=self.config.source_config, target_config=target_config.source_config
+        ).get_unaffected_queues()
+        if not unaffected_queues:
+            return None
+        try:
+            root_template = self._get_stack_template()
+        except ClusterActionError as e:
+            LOGGER.info("Unable to reuse the deployed queue group stacks: %s", e)
+            return None
+        return DeployedQueueGroups(root_template, self.bucket, unaffected_queues)
+
     def _add_tags(self):
         """Add tags PCLUSTER_CLUSTER_NAME_TAG and PCLUSTER_VERSION_TAG to the attribute config.tags."""
         if self.config.tags is None:
@@ -1024,7 +1186,7 @@ class Cluster:
 
     def export_logs(
         self,
-        bucket: str,
+        bucket: str = None,
         bucket_prefix: str = None,
         keep_s3_objects: bool = False,
         start_time: datetime = None,
@@ -1035,6 +1197,8 @@ class Cluster:
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
 
+        Without a bucket, the logs are fetched through the CloudWatch Logs API and an output file is required.
+
         :param output: file path to save log file archive to
         :param bucket: Temporary S3 bucket to be used to export cluster logs data
         :param bucket_prefix: Key path under which exported logs data will be stored in s3 bucket,
@@ -1048,29 +1212,38 @@ class Cluster:
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
             raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
+        if not bucket and not output_file:
+            raise BadRequestClusterActionError("An output file is required to export cluster's logs without a bucket.")
 
         try:
-            with tempfile.TemporaryDirectory() as output_tempdir:
-                # Create root folder for the archive
-                archive_name = f"{self.name}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
-                root_archive_dir = os.path.join(output_tempdir, archive_name)
-                os.makedirs(root_archive_dir, exist_ok=True)
+            # The archive is streamed straight to the output file or to the bucket, without temporary copies
+            archive_name = f"{self.name}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
+            if output_file:
+                archive = LogsArchive(archive_name, output_file=output_file)
+            else:
+                bucket_path = f"{bucket_prefix}/{archive_name}.tar.gz" if bucket_prefix else f"{archive_name}.tar.gz"
+                archive = LogsArchive(archive_name, bucket=bucket, key=bucket_path)
 
+            with archive:
                 if self.stack.log_group_name:
                     # Export logs from CloudWatch
                     export_logs_filters = self._init_export_logs_filters(start_time, end_time, filters)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.name,
-                        log_group_name=self.stack.log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
+                    if bucket:
+                        logs_exporter = CloudWatchLogsExporter(
+                            resource_id=self.name,
+                            log_group_name=self.stack.log_group_name,
+                            bucket=bucket,
+                            output_dir=None,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                        )
+                    else:
+                        logs_exporter = CloudWatchLogsFetcher(log_group_name=self.stack.log_group_name)
                     logs_exporter.execute(
                         log_stream_prefix=export_logs_filters.log_stream_prefix,
                         start_time=export_logs_filters.start_time,
                         end_time=export_logs_filters.end_time,
+                        archive=archive,
                     )
                 else:
                     LOGGER.debug(
@@ -1078,16 +1251,13 @@ class Cluster:
                         {self.name},
                     )
 
-                # Get stack events and write them into a file
-                stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                export_stack_events(self.stack_name, stack_events_file)
+                # Get stack events and add them to the archive
+                archive.add_bytes(self._stack_events_stream_name, format_stack_events(self.stack_name).encode("utf-8"))
 
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+            if output_file:
+                return output_file
+            else:
+                return create_s3_presigned_url(f"s3://{bucket}/{bucket_path}")
         except Exception as e:
             raise ClusterActionError(f"Unexpected error when exporting cluster's logs: {e}")
 
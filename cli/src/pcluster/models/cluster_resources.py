@@ -16,7 +16,13 @@ from typing import List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceInfo, StackInfo
-from pcluster.constants import CW_LOGS_CFN_PARAM_NAME, OS_MAPPING, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    CW_LOGS_CFN_PARAM_NAME,
+    OS_MAPPING,
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.models.common import FiltersParserError, LogGroupTimeFiltersParser, get_all_stack_events
 
 
@@ -185,8 +191,7 @@ class ClusterStack(StackInfo):
 class ClusterInstance(InstanceInfo):
     """Object to store cluster Instance info, initialized with a describe_instances call and other cluster info."""
 
-    def __init__(self, instance_data: dict):
-        super().__init__(instance_data)
+    __slots__ = ()
 
     @property
     def default_user(self) -> str:
@@ -208,8 +213,10 @@ class ClusterInstance(InstanceInfo):
         """Return os of the instance."""
         return self._get_tag(PCLUSTER_NODE_TYPE_TAG)
 
-    def _get_tag(self, tag_key: str):
-        return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
+    @property
+    def cluster_name(self) -> str:
+        """Return the name of the cluster the instance belongs to."""
+        return self._get_tag(PCLUSTER_CLUSTER_NAME_TAG)
 
 
 class ClusterLogsFiltersParser:
@@ -9,13 +9,18 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import functools
 import gzip
+import io
 import json
 import logging
 import os
 import os.path
+import shutil
 import tarfile
+import tempfile
 import time
+from contextlib import closing, suppress
 from typing import List
 
 import configparser
@@ -23,7 +28,15 @@ import configparser
 from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
+from pcluster.constants import LOGS_EXPORT_CHUNK_SIZE, LOGS_EXPORT_MAX_WORKERS, S3_MULTIPART_CHUNKSIZE
+from pcluster.utils import (
+    datetime_to_epoch,
+    iterate_concurrently,
+    run_concurrently,
+    to_iso_timestr,
+    to_utc_datetime,
+    yaml_load,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -160,16 +173,30 @@ class CloudWatchLogsExporter:
             self.bucket_prefix = f"{resource_id}-logs-{datetime.datetime.now().strftime('%Y%m%d%H%M')}"
             self.delete_everything_under_prefix = AWSApi.instance().s3_resource.is_empty(bucket, self.bucket_prefix)
 
-    def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
-        """Start export task. Returns logs streams folder."""
+    def execute(
+        self,
+        log_stream_prefix=None,
+        start_time: datetime.datetime = None,
+        end_time: datetime.datetime = None,
+        archive: "LogsArchive" = None,
+    ):
+        """
+        Start export task. Returns logs streams folder.
+
+        When an archive is given, the exported logs are streamed into it rather than downloaded to the output dir.
+        """
         # Export logs to S3
         task_id = self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
         LOGGER.info("Log export task id: %s", task_id)
         # Download exported S3 objects to output dir subfolder
         try:
-            log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
-            self._download_s3_objects_with_prefix(task_id, log_streams_dir)
-            LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
+            if archive:
+                self._archive_s3_objects_with_prefix(task_id, archive, "cloudwatch-logs")
+                LOGGER.info("CloudWatch logs added to the archive")
+            else:
+                log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
+                self._download_s3_objects_with_prefix(task_id, log_streams_dir)
+                LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
         except OSError:
             raise LogsExporterError("Unable to download archive logs from S3, double check your filters are correct.")
         finally:
@@ -222,27 +249,202 @@ class CloudWatchLogsExporter:
         return status
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir, decompressing them on the fly.
+
+        The log streams are downloaded concurrently and streamed through the decompressor, so the memory used does not
+        depend on the size of the logs.
+        Interrupted downloads are not resumed, since destdir and the exported objects only last as long as the export.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        downloads = [
+            functools.partial(self._download_log_stream_to_file, keys, os.path.join(destdir, log_stream_path))
+            for log_stream_path, keys in self._get_log_stream_keys(prefix).items()
+        ]
+
+        start_time = time.monotonic()
+        downloaded_bytes = sum(
+            run_concurrently(downloads, max_workers=LOGS_EXPORT_MAX_WORKERS, thread_name_prefix="logs-export")
+        )
+        elapsed_time = max(time.monotonic() - start_time, 0.001)
+        LOGGER.info(
+            "Downloaded %d exported log streams (%.1f MB) in %.1f seconds (%.1f MB/s)",
+            len(downloads),
+            downloaded_bytes / 2**20,
+            elapsed_time,
+            downloaded_bytes / 2**20 / elapsed_time,
+        )
+
+    def _archive_s3_objects_with_prefix(self, task_id, archive: "LogsArchive", archive_dir):
+        """Stream all object in bucket with given prefix, decompressed, into archive_dir of the given archive."""
+        prefix = f"{self.bucket_prefix}/{task_id}"
+        LOGGER.debug("Archiving exported logs from s3 bucket %s (under key %s)", self.bucket, prefix)
+        log_stream_keys = self._get_log_stream_keys(prefix)
+        # The tar headers need the size of the decompressed log streams upfront, so every log stream is decompressed
+        # to a temporary file, kept in memory if small, and at most LOGS_EXPORT_MAX_WORKERS of them are pending
+        log_files = iterate_concurrently(
+            [functools.partial(self._spool_log_stream, keys) for keys in log_stream_keys.values()],
+            max_workers=LOGS_EXPORT_MAX_WORKERS,
+            thread_name_prefix="logs-export",
+        )
+        for log_stream_path, log_file in zip(log_stream_keys, log_files):
+            LOGGER.debug("Archiving objects with keys=%s to %s", log_stream_keys[log_stream_path], log_stream_path)
+            with log_file:
+                size = log_file.tell()
+                log_file.seek(0)
+                archive.add_file(f"{archive_dir}/{log_stream_path}", log_file, size)
+
+    def _get_log_stream_keys(self, prefix):
+        """Return the keys of the exported objects of every log stream, by the path of the log stream under prefix."""
+        # Large log streams are exported to multiple objects, named after their position in the stream
+        log_stream_keys = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
-            decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
-            decompressed_path = decompressed_path.replace(
-                r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
+            log_stream_path = os.path.dirname(archive_object.key)[len(prefix) + 1 :]  # noqa: E203
+            log_stream_keys.setdefault(log_stream_path, []).append(archive_object.key)
+        return {log_stream_path: sorted(keys) for log_stream_path, keys in log_stream_keys.items()}
+
+    def _download_log_stream(self, keys, outfile):
+        """Decompress the given objects, in order, into outfile and return the number of bytes downloaded."""
+        downloaded_bytes = 0
+        for key in keys:
+            LOGGER.debug("Extracting object with key=%s", key)
+            response = AWSApi.instance().s3.get_object(bucket_name=self.bucket, key=key)
+            with closing(response["Body"]) as body, gzip.GzipFile(fileobj=body, mode="rb") as gfile:
+                shutil.copyfileobj(gfile, outfile, LOGS_EXPORT_CHUNK_SIZE)
+            downloaded_bytes += response.get("ContentLength", 0)
+        return downloaded_bytes
+
+    def _download_log_stream_to_file(self, keys, decompressed_path):
+        """Decompress the given objects, in order, into decompressed_path and return the number of bytes downloaded."""
+        os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+        with open(decompressed_path, "wb") as outfile:
+            return self._download_log_stream(keys, outfile)
+
+    def _spool_log_stream(self, keys):
+        """Return a temporary file with the decompressed content of the given objects, positioned at its end."""
+        log_file = tempfile.SpooledTemporaryFile(LOGS_EXPORT_CHUNK_SIZE)  # pylint: disable=consider-using-with
+        try:
+            self._download_log_stream(keys, log_file)
+        except Exception:
+            log_file.close()
+            raise
+        return log_file
+
+
+class CloudWatchLogsFetcher:
+    """
+    Utility class used to fetch log group logs through the CloudWatch Logs API, without export tasks and S3 buckets.
+
+    CloudWatch Logs runs a single export task per account at a time, so concurrent exports wait for each other.
+    The log streams are instead read with GetLogEvents by a pool of workers, whose requests are throttled by the
+    adaptive retry mode of the CloudWatch Logs client, and written with the same layout of the exported logs.
+    """
+
+    def __init__(self, log_group_name, output_dir=None):
+        self.log_group_name = log_group_name
+        self.output_dir = output_dir
+
+    def execute(
+        self,
+        log_stream_prefix=None,
+        start_time: datetime.datetime = None,
+        end_time: datetime.datetime = None,
+        archive: "LogsArchive" = None,
+    ):
+        """
+        Fetch the log streams into the output dir, or into the given archive if any.
+
+        Log streams without events in the given time window are skipped, as done by the export tasks.
+        """
+        log_stream_names = self._get_log_stream_names(log_stream_prefix)
+        LOGGER.debug("Fetching %d log streams from log group %s", len(log_stream_names), self.log_group_name)
+        fetch_log_stream = functools.partial(self._fetch_log_stream, start_time=start_time, end_time=end_time)
+        if archive:
+            # Log streams are buffered in memory, and on disk if large, until added to the archive in order:
+            # at most LOGS_EXPORT_MAX_WORKERS of them are pending, so the disk space used is bounded
+            log_files = iterate_concurrently(
+                [
+                    functools.partial(self._spool_log_stream, fetch_log_stream, log_stream_name)
+                    for log_stream_name in log_stream_names
+                ],
+                max_workers=LOGS_EXPORT_MAX_WORKERS,
+                thread_name_prefix="logs-fetch",
             )
-            compressed_path = f"{decompressed_path}.gz"
+            for log_stream_name, log_file in zip(log_stream_names, log_files):
+                with log_file:
+                    size = log_file.tell()
+                    if size:
+                        log_file.seek(0)
+                        archive.add_file(f"cloudwatch-logs/{log_stream_name}", log_file, size)
+            LOGGER.info("CloudWatch logs added to the archive")
+        else:
+            log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
+            run_concurrently(
+                [
+                    functools.partial(self._fetch_log_stream_to_file, fetch_log_stream, name, log_streams_dir)
+                    for name in log_stream_names
+                ],
+                max_workers=LOGS_EXPORT_MAX_WORKERS,
+                thread_name_prefix="logs-fetch",
+            )
+            LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
 
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
+    def _get_log_stream_names(self, log_stream_prefix=None):
+        log_stream_names = []
+        next_token = None
+        while True:
+            response = AWSApi.instance().logs.describe_log_streams(
+                log_group_name=self.log_group_name, log_stream_name_prefix=log_stream_prefix, next_token=next_token
             )
+            log_stream_names.extend(log_stream["logStreamName"] for log_stream in response.get("logStreams", []))
+            next_token = response.get("nextToken")
+            if not next_token:
+                return log_stream_names
+
+    @staticmethod
+    def _spool_log_stream(fetch_log_stream, log_stream_name):
+        log_file = tempfile.SpooledTemporaryFile(LOGS_EXPORT_CHUNK_SIZE)  # pylint: disable=consider-using-with
+        try:
+            return fetch_log_stream(log_stream_name, log_file)
+        except Exception:
+            log_file.close()
+            raise
 
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+    @staticmethod
+    def _fetch_log_stream_to_file(fetch_log_stream, log_stream_name, log_streams_dir):
+        log_stream_path = os.path.join(log_streams_dir, log_stream_name)
+        os.makedirs(os.path.dirname(log_stream_path), exist_ok=True)
+        partial_path = f"{log_stream_path}.part"
+        with open(partial_path, "wb") as log_file:
+            fetch_log_stream(log_stream_name, log_file)
+            size = log_file.tell()
+        if size:
+            os.replace(partial_path, log_stream_path)
+        else:
+            os.remove(partial_path)
+
+    def _fetch_log_stream(
+        self, log_stream_name, log_file, start_time: datetime.datetime = None, end_time: datetime.datetime = None
+    ):
+        """Write the events of the given log stream to log_file, in the format of the exported logs, and return it."""
+        next_token = None
+        while True:
+            response = AWSApi.instance().logs.get_log_events(
+                log_group_name=self.log_group_name,
+                log_stream_name=log_stream_name,
+                start_time=start_time and datetime_to_epoch(start_time),
+                end_time=end_time and datetime_to_epoch(end_time),
+                start_from_head=True,
+                next_token=next_token,
+            )
+            for event in response.get("events", []):
+                timestamp = datetime.datetime.fromtimestamp(event["timestamp"] / 1000, tz=datetime.timezone.utc)
+                log_file.write(f"{to_iso_timestr(timestamp)} {event['message']}\n".encode("utf-8"))
+            # Pages can be empty before the end of the stream, which is reached when the same token is returned
+            if response.get("nextForwardToken") in (None, next_token):
+                return log_file
+            next_token = response.get("nextForwardToken")
 
 
 def get_all_stack_events(stack_name: str):
@@ -256,12 +458,15 @@ def get_all_stack_events(stack_name: str):
     return stack_events
 
 
+def format_stack_events(stack_name: str):
+    """Return CFN stack events as a JSON document."""
+    return json.dumps(get_all_stack_events(stack_name), cls=JSONEncoder, indent=2)
+
+
 def export_stack_events(stack_name: str, output_file: str):
     """Save CFN stack events into a file."""
-    stack_events = get_all_stack_events(stack_name)
-
     with open(output_file, "w", encoding="utf-8") as cfn_events_file:
-        cfn_events_file.write(json.dumps(stack_events, cls=JSONEncoder, indent=2))
+        cfn_events_file.write(format_stack_events(stack_name))
 
 
 def create_logs_archive(directory: str, output_file: str = None):
@@ -283,6 +488,101 @@ def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
     return f"s3://{bucket}/{bucket_path}"
 
 
+class S3MultipartUploadWriter:
+    """Writable stream uploading the written data to an S3 object, with a multipart upload of parts of fixed size."""
+
+    def __init__(self, bucket: str, key: str, part_size: int = S3_MULTIPART_CHUNKSIZE):
+        self.bucket = bucket
+        self.key = key
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = AWSApi.instance().s3.create_multipart_upload(bucket_name=bucket, key=key)
+
+    def write(self, data):
+        """Buffer the given data, uploading a part every time enough data is buffered."""
+        self._buffer.extend(data)
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(data)
+
+    def close(self):
+        """Upload the buffered data and complete the upload."""
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        AWSApi.instance().s3.complete_multipart_upload(
+            bucket_name=self.bucket, key=self.key, upload_id=self._upload_id, parts=self._parts
+        )
+
+    def abort(self):
+        """Abort the upload, removing the parts already uploaded."""
+        AWSApi.instance().s3.abort_multipart_upload(bucket_name=self.bucket, key=self.key, upload_id=self._upload_id)
+
+    def _upload_part(self, body):
+        part_number = len(self._parts) + 1
+        etag = AWSApi.instance().s3.upload_part(
+            bucket_name=self.bucket, key=self.key, upload_id=self._upload_id, part_number=part_number, body=body
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": etag})
+
+
+class LogsArchive:
+    """
+    Archive of logs written in tar.gz format straight to a local file or to an S3 object.
+
+    The archive is written as a stream, so the logs are never copied to a temporary directory and only a buffer of
+    S3_MULTIPART_CHUNKSIZE bytes is kept in memory when uploading to S3. The archive is removed, or its upload aborted,
+    if an error occurs while writing it.
+    """
+
+    def __init__(self, root_dir_name: str, output_file: str = None, bucket: str = None, key: str = None):
+        self.root_dir_name = root_dir_name
+        self.output_file = output_file
+        self.bucket = bucket
+        self.key = key
+        self._fileobj = None
+        self._tar = None
+
+    def __enter__(self):
+        if self.output_file:
+            LOGGER.debug("Creating archive of logs and saving it to %s", self.output_file)
+            self._fileobj = open(self.output_file, "wb")  # pylint: disable=consider-using-with
+        else:
+            LOGGER.debug("Creating archive of logs and uploading it to s3://%s/%s", self.bucket, self.key)
+            self._fileobj = S3MultipartUploadWriter(self.bucket, self.key)
+        self._tar = tarfile.open(fileobj=self._fileobj, mode="w|gz")  # pylint: disable=consider-using-with
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self._tar.close()
+            self._fileobj.close()
+            return
+        # The archive is discarded, so the errors raised while flushing it are irrelevant
+        with suppress(Exception):
+            self._tar.close()
+        if self.output_file:
+            self._fileobj.close()
+            os.remove(self.output_file)
+        else:
+            self._fileobj.abort()
+
+    def add_file(self, name: str, fileobj, size: int):
+        """Add a file with the given name, relative to the root dir, reading exactly size bytes from fileobj."""
+        tarinfo = tarfile.TarInfo(f"{self.root_dir_name}/{name}")
+        tarinfo.size = size
+        tarinfo.mtime = int(time.time())
+        self._tar.addfile(tarinfo, fileobj)
+        if fileobj.read(1):
+            raise LogsExporterError(f"Unable to archive {name}: its content is larger than the expected {size} bytes")
+
+    def add_bytes(self, name: str, data: bytes):
+        """Add a file with the given name, relative to the root dir, and the given content."""
+        self.add_file(name, io.BytesIO(data), len(data))
+
+
 class LogStreams:
     """Class to manage list of logs along with next_token."""
 
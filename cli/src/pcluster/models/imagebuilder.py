@@ -52,6 +52,7 @@ from pcluster.models.cluster_resources import FiltersParserError
 from pcluster.models.common import (
     BadRequest,
     CloudWatchLogsExporter,
+    CloudWatchLogsFetcher,
     Conflict,
     LimitExceeded,
     LogGroupTimeFiltersParser,
@@ -672,7 +673,7 @@ class ImageBuilder:
 
     def export_logs(
         self,
-        bucket: str,
+        bucket: str = None,
         bucket_prefix: str = None,
         keep_s3_objects: bool = False,
         start_time: datetime = None,
@@ -682,6 +683,8 @@ class ImageBuilder:
         """
         Export image builder's logs in the given output path, by using given bucket as a temporary folder.
 
+        Without a bucket, the logs are fetched through the CloudWatch Logs API and an output file is required.
+
         :param bucket: S3 bucket to be used to export cluster logs data
         :param bucket_prefix: Key path under which exported logs data will be stored in s3 bucket,
                also serves as top-level directory in resulting archive
@@ -693,6 +696,10 @@ class ImageBuilder:
         stack_exists = self._stack_exists()
         if not stack_exists:
             LOGGER.debug("CloudFormation Stack for Image %s does not exist.", self.image_id)
+        if not bucket and not output_file:
+            raise BadRequestImageBuilderActionError(
+                "An output file is required to export image's logs without a bucket."
+            )
 
         try:
             with tempfile.TemporaryDirectory() as output_tempdir:
@@ -704,14 +711,19 @@ class ImageBuilder:
                 if AWSApi.instance().logs.log_group_exists(self._log_group_name):
                     # Export logs from CloudWatch
                     export_logs_filters = self._init_export_logs_filters(start_time, end_time)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.image_id,
-                        log_group_name=self._log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
+                    if bucket:
+                        logs_exporter = CloudWatchLogsExporter(
+                            resource_id=self.image_id,
+                            log_group_name=self._log_group_name,
+                            bucket=bucket,
+                            output_dir=root_archive_dir,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                        )
+                    else:
+                        logs_exporter = CloudWatchLogsFetcher(
+                            log_group_name=self._log_group_name, output_dir=root_archive_dir
+                        )
                     logs_exporter.execute(
                         start_time=export_logs_filters.start_time, end_time=export_logs_filters.end_time
                     )
@@ -12,19 +12,26 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import functools
 import hashlib
 import json
 import logging
 import os
 import re
 from enum import Enum
+from io import BytesIO
 
 import yaml
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.constants import PCLUSTER_S3_BUCKET_VERSION
-from pcluster.utils import get_partition, get_url_domain_suffix, yaml_load, zip_dir
+from pcluster.constants import (
+    PCLUSTER_S3_BUCKET_VERSION,
+    S3_MULTIPART_CHUNKSIZE,
+    S3_MULTIPART_THRESHOLD,
+    S3_UPLOAD_MAX_WORKERS,
+)
+from pcluster.utils import get_partition, get_url_domain_suffix, run_concurrently, yaml_load, zip_dir
 
 LOGGER = logging.getLogger(__name__)
 
@@ -198,43 +205,58 @@ class S3Bucket:
             bucket_name=self.name, object_name="/".join([self._root_directory, self._bootstrapped_file_name])
         )
 
-    def upload_config(self, config, config_name, format=S3FileFormat.YAML):
+    def upload_config(self, config, config_name, format=S3FileFormat.YAML, skip_unchanged=False):
         """Upload config file to S3 bucket."""
-        return self.upload_file(file_type=S3FileType.CONFIGS, content=config, file_name=config_name, format=format)
+        return self.upload_file(
+            file_type=S3FileType.CONFIGS,
+            content=config,
+            file_name=config_name,
+            format=format,
+            skip_unchanged=skip_unchanged,
+        )
 
-    def upload_cfn_template(self, template_body, template_name, format=S3FileFormat.YAML):
+    def upload_cfn_template(self, template_body, template_name, format=S3FileFormat.YAML, skip_unchanged=False):
         """Upload cloudformation template to S3 bucket."""
         return self.upload_file(
-            file_type=S3FileType.TEMPLATES, content=template_body, file_name=template_name, format=format
+            file_type=S3FileType.TEMPLATES,
+            content=template_body,
+            file_name=template_name,
+            format=format,
+            skip_unchanged=skip_unchanged,
         )
 
-    def upload_cfn_asset(self, asset_file_content, asset_name: str, format=S3FileFormat.YAML):
+    def upload_cfn_asset(self, asset_file_content, asset_name: str, format=S3FileFormat.YAML, skip_unchanged=False):
         """Upload cloudformation assets to S3 bucket."""
         return self.upload_file(
-            file_type=S3FileType.ASSETS, content=asset_file_content, file_name=asset_name, format=format
+            file_type=S3FileType.ASSETS,
+            content=asset_file_content,
+            file_name=asset_name,
+            format=format,
+            skip_unchanged=skip_unchanged,
         )
 
     def upload_resources(self, resource_dir, custom_artifacts_name):
         """
         Upload custom resources to S3 bucket.
 
+        The resources are uploaded concurrently, skipping the ones whose content is already in the bucket.
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
         """
+        resources = {}
         for res in os.listdir(resource_dir):
             path = os.path.join(resource_dir, res)
             if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
-                )
+                resources[self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name)] = zip_dir(path)
             elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
-                )
+                with open(path, "rb") as resource_file:
+                    resources[self.get_object_key(S3FileType.CUSTOM_RESOURCES, res)] = BytesIO(resource_file.read())
+
+        run_concurrently(
+            [functools.partial(self._upload_fileobj_if_changed, key, file_obj) for key, file_obj in resources.items()],
+            max_workers=S3_UPLOAD_MAX_WORKERS,
+            thread_name_prefix="s3-upload",
+        )
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
         """Get config file from S3 bucket."""
@@ -260,6 +282,10 @@ class S3Bucket:
             file_type=S3FileType.TEMPLATES, file_name=template_name, version_id=version_id, format=format
         )
 
+    def get_cfn_asset(self, asset_name, version_id=None, format=S3FileFormat.JSON):
+        """Get cfn asset from S3 bucket."""
+        return self._get_file(file_type=S3FileType.ASSETS, file_name=asset_name, version_id=version_id, format=format)
+
     def get_cfn_template_url(self, template_name):
         """Get cfn template http url from S3 bucket."""
         return self._get_file_url(file_type=S3FileType.TEMPLATES, file_name=template_name)
@@ -270,13 +296,36 @@ class S3Bucket:
 
     # --------------------------------------- S3 private functions --------------------------------------- #
 
-    def upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML):
-        """Upload file to S3 bucket."""
-        return AWSApi.instance().s3.put_object(
-            bucket_name=self.name,
-            body=format_content(content, format),
-            key=self.get_object_key(file_type, file_name),
-        )
+    def upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML, skip_unchanged=False):
+        """
+        Upload file to S3 bucket.
+
+        When skip_unchanged is set, the file is not uploaded if the object in the bucket has the same content, and
+        None is returned in place of the response of the upload.
+        """
+        body = format_content(content, format)
+        key = self.get_object_key(file_type, file_name)
+        if skip_unchanged and self._is_object_unchanged(
+            key, get_object_etag(body.encode("utf-8") if isinstance(body, str) else body)
+        ):
+            return None
+        return AWSApi.instance().s3.put_object(bucket_name=self.name, body=body, key=key)
+
+    def _upload_fileobj_if_changed(self, key, file_obj: BytesIO):
+        """Upload the given in-memory file object, with multipart transfers if large, unless already in the bucket."""
+        if not self._is_object_unchanged(key, get_object_etag(file_obj.getvalue(), S3_MULTIPART_THRESHOLD)):
+            AWSApi.instance().s3.upload_fileobj(file_obj=file_obj, bucket_name=self.name, key=key)
+
+    def _is_object_unchanged(self, key, etag):
+        """Tell if the object with the given key exists in the bucket with the given ETag."""
+        try:
+            existing_etag = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key).get("ETag")
+        except AWSClientError:
+            return False
+        if existing_etag and existing_etag.strip('"') == etag:
+            LOGGER.info("Skipping upload of unchanged object %s", key)
+            return True
+        return False
 
     def _get_file(self, file_name, file_type, version_id=None, format=S3FileFormat.YAML):
         """Get file from S3 bucket."""
@@ -414,6 +463,24 @@ def create_s3_presigned_url(s3_uri, expiration=3600):
     )
 
 
+def get_object_etag(body: bytes, multipart_threshold: int = None):
+    """
+    Return the ETag S3 assigns to an object with the given content, when not encrypted with KMS keys.
+
+    Objects uploaded with multipart transfers, i.e. larger than the given multipart threshold, have the digest of the
+    digests of their parts, of S3_MULTIPART_CHUNKSIZE bytes, followed by the number of parts.
+    """
+    # A nosec comment is appended to the following lines in order to disable the B324 check.
+    # The md5 is used just to compute the ETag of the S3 objects.
+    if not multipart_threshold or len(body) < multipart_threshold:
+        return hashlib.md5(body).hexdigest()  # nosec nosemgrep
+    part_digests = [
+        hashlib.md5(body[offset : offset + S3_MULTIPART_CHUNKSIZE]).digest()  # nosec nosemgrep # noqa: E203
+        for offset in range(0, len(body), S3_MULTIPART_CHUNKSIZE)
+    ]
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"  # nosec nosemgrep
+
+
 def format_content(content, s3_file_format: S3FileFormat):
     """
     Return content formatted by the given S3 File Format.
@@ -8,8 +8,11 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.config import Config
@@ -19,6 +22,15 @@ helper = CfnResource(json_logging=False, log_level="INFO", boto_level="ERROR", s
 logger = logging.getLogger(__name__)
 boto3_config = Config(retries={"max_attempts": 60})
 
+# Termination of the cluster instances: TerminateInstances calls are spread across a pool of workers, and limited to
+# a sustained rate below the EC2 API throttling limits
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_MAX_WORKERS = 8
+TERMINATE_INSTANCES_RATE = 5  # calls per second
+TERMINATE_INSTANCES_BURST = 10
+POLL_MIN_DELAY = 2  # seconds
+POLL_MAX_DELAY = 20  # seconds
+
 
 def _delete_dns_records(event):
     """Delete all DNS entries from the private Route53 hosted zone created within the cluster."""
@@ -105,24 +117,13 @@ def _terminate_cluster_nodes(event):
         stack_name = event["ResourceProperties"]["StackName"]
         ec2 = boto3.client("ec2", config=boto3_config)
 
-        completed_successfully = False
-        while not completed_successfully:
-            completed_successfully = True
-            for instance_ids in _describe_instance_ids_iterator(stack_name):
-                logger.info("Terminating instances %s", instance_ids)
-                if instance_ids:
-                    try:
-                        ec2.terminate_instances(InstanceIds=instance_ids)
-                    except Exception as e:
-                        logger.error("Failed when terminating instances with error %s", e)
-                        completed_successfully = False
-                        continue
-            logger.info("Sleeping for 10 seconds to allow all instances to initiate shut-down")
-            time.sleep(10)
+        delay = POLL_MIN_DELAY
+        while not _terminate_instances(ec2, itertools.chain.from_iterable(_describe_instance_ids_iterator(stack_name))):
+            logger.info("Retrying the termination of the instances in %s seconds", delay)
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
 
-        while _has_shuttingdown_instances(stack_name):
-            logger.info("Waiting for all nodes to shut-down...")
-            time.sleep(10)
+        _wait_for_instances_shutdown(stack_name)
 
         # Sleep for 30 more seconds to give PlacementGroups the time to update
         time.sleep(30)
@@ -133,15 +134,79 @@ def _terminate_cluster_nodes(event):
         raise
 
 
-def _has_shuttingdown_instances(stack_name):
-    ec2 = boto3.client("ec2", config=boto3_config)
-    filters = [
-        {"Name": "tag:parallelcluster:cluster-name", "Values": [stack_name]},
-        {"Name": "instance-state-name", "Values": ["shutting-down"]},
-    ]
+class _TokenBucket:
+    """Thread-safe token bucket, refilled at rate tokens per second up to capacity."""
+
+    def __init__(self, rate, capacity):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting for it to be available if needed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self._rate
+            time.sleep(wait_time)
 
-    result = ec2.describe_instances(Filters=filters)
-    return len(result.get("Reservations", [])) > 0
+
+def _terminate_instances(ec2, instance_ids):
+    """
+    Terminate the given instances in batches, with a pool of workers rate limited by a token bucket.
+
+    The instance ids are consumed while the batches are being terminated, so that listing and termination overlap.
+    Return True if all the batches have been terminated successfully.
+    """
+    bucket = _TokenBucket(TERMINATE_INSTANCES_RATE, TERMINATE_INSTANCES_BURST)
+
+    def _terminate(batch):
+        bucket.acquire()
+        logger.info("Terminating instances %s", batch)
+        ec2.terminate_instances(InstanceIds=batch)
+
+    with ThreadPoolExecutor(max_workers=TERMINATE_INSTANCES_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_terminate, batch) for batch in _grouper(instance_ids, TERMINATE_INSTANCES_BATCH_SIZE)
+        ]
+
+    completed_successfully = True
+    for future in futures:
+        if future.exception():
+            logger.error("Failed when terminating instances with error %s", future.exception())
+            completed_successfully = False
+    return completed_successfully
+
+
+def _wait_for_instances_shutdown(stack_name):
+    """Wait for the cluster instances to leave the shutting-down state, polling them with exponential backoff."""
+    delay = POLL_MIN_DELAY
+    while True:
+        shutting_down_count = sum(
+            len(instance_ids) for instance_ids in _describe_instance_ids_iterator(stack_name, ("shutting-down",))
+        )
+        if not shutting_down_count:
+            return
+        logger.info("Waiting for %s nodes to shut-down...", shutting_down_count)
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+
+def _grouper(iterable, size):
+    """Slice iterable into lists of at most size elements."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def _describe_instance_ids_iterator(stack_name, instance_state=("pending", "running", "stopping", "stopped")):
@@ -150,7 +215,7 @@ def _describe_instance_ids_iterator(stack_name, instance_state=("pending", "runn
         {"Name": "tag:parallelcluster:cluster-name", "Values": [stack_name]},
         {"Name": "instance-state-name", "Values": list(instance_state)},
     ]
-    pagination_config = {"PageSize": 100}
+    pagination_config = {"PageSize": 1000}
 
     paginator = ec2.get_paginator("describe_instances")
     for page in paginator.paginate(Filters=filters, PaginationConfig=pagination_config):
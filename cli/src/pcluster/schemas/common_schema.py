@@ -13,7 +13,6 @@
 # This module contains all the classes representing the Schema of the configuration file.
 # These classes are created by following marshmallow syntax.
 #
-import copy
 import enum
 import json
 
@@ -115,24 +114,10 @@ class BaseSchema(Schema):
     @pre_dump
     def prepare_objects(self, data, **kwargs):
         """Prepare objects to be ready for yaml conversion."""
-        adapted_data = copy.deepcopy(data)
-        if self.context.get("delete_defaults_when_dump"):
-            for key, value in vars(adapted_data).copy().items():
-                # Remove value implied by the code. i.e., only keep parameters that were specified in the yaml file
-                if _is_implied(adapted_data, key, value):
-                    delattr(adapted_data, key)
-                if isinstance(value, list):
-                    value[:] = [v for v in value if not _is_implied(adapted_data, key, v)]
-
-        for key, value in vars(adapted_data).items():
-            # Unwrap "param" attributes
-            if adapted_data.get_param(key) is not None:
-                setattr(adapted_data, key, value)
-
-            # Convert back enums to string
-            if isinstance(value, enum.Enum):
-                setattr(adapted_data, key, value.value)
-        return adapted_data
+        if isinstance(data, ResourceDumpView):
+            # Already prepared by the parent schema, e.g. SharedStorage settings
+            return data
+        return ResourceDumpView(data, delete_defaults=self.context.get("delete_defaults_when_dump"))
 
     @post_dump
     def remove_none_values(self, data, **kwargs):
@@ -142,6 +127,39 @@ class BaseSchema(Schema):
         return data
 
 
+class ResourceDumpView:
+    """
+    Shallow projection of a Resource to be dumped.
+
+    It exposes the attributes of the resource with enums converted back to strings and, if requested,
+    without the values implied by the code. The resource is neither modified nor copied: nested resources are
+    projected in turn by their own schema, and attributes set on the view are only kept in the view.
+    """
+
+    def __init__(self, resource, delete_defaults=False):
+        self.__resource = resource
+        self.__removed_attributes = set()
+        for key, value in vars(resource).items():
+            if delete_defaults:
+                # Remove value implied by the code. i.e., only keep parameters that were specified in the yaml file
+                if _is_implied(resource, key, value):
+                    self.__removed_attributes.add(key)
+                    continue
+                if isinstance(value, list):
+                    value = [v for v in value if not _is_implied(resource, key, v)]
+            # Convert back enums to string
+            if isinstance(value, enum.Enum):
+                value = value.value
+            self.__dict__[key] = value
+
+    def __getattr__(self, name):
+        """Fall back to the resource for the attributes not in the view, e.g. properties."""
+        resource = self.__dict__.get("_ResourceDumpView__resource")
+        if resource is None or name in self.__dict__["_ResourceDumpView__removed_attributes"]:
+            raise AttributeError(name)
+        return getattr(resource, name)
+
+
 def _is_implied(resource, attr, value):
     """Check if the value of the given attribute for the resource is implied."""
     if hasattr(value, "implied"):
@@ -740,6 +740,7 @@ class AwsBatchConstruct(Construct):
                         ],
                     ),
                     self._get_awsbatch_cli_read_policy(),
+                    self._get_awsbatch_cli_logs_policy(),
                     self._get_awsbatch_cli_write_policy(),
                 ]
             ),
@@ -762,6 +763,24 @@ class AwsBatchConstruct(Construct):
             resources=["*"],
         )
 
+    def _get_awsbatch_cli_logs_policy(self):
+        """Return list of log group level policies required by ParallelCluster AWS Batch CLI."""
+        return iam.PolicyStatement(
+            sid="BatchCliLogsPermissions",
+            actions=[
+                "logs:FilterLogEvents",  # required by awsbout --stream
+            ],
+            effect=iam.Effect.ALLOW,
+            resources=[
+                self._format_arn(
+                    service="logs",
+                    account=self._stack_account,
+                    region=self._stack_region,
+                    resource="log-group:/aws/batch/job:*",
+                ),
+            ],
+        )
+
     def _get_awsbatch_cli_write_policy(self):
         """Return list of WRITE policies required by ParallelCluster AWS Batch CLI."""
         return iam.PolicyStatement(
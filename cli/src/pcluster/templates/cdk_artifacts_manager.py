@@ -12,15 +12,19 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import functools
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
-
-from aws_cdk.cx_api import CloudAssembly, CloudFormationStackArtifact
+from typing import TYPE_CHECKING, List
 
+from pcluster.constants import S3_UPLOAD_MAX_WORKERS
 from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType
-from pcluster.utils import LOGGER, load_json_dict
+from pcluster.utils import LOGGER, load_json_dict, run_concurrently
+
+if TYPE_CHECKING:
+    # Only the synthesis needs the CDK runtime, the upload of already synthesized assets does not
+    from aws_cdk.cx_api import CloudAssembly, CloudFormationStackArtifact
 
 
 @dataclass
@@ -41,7 +45,7 @@ class ClusterCloudAssembly(ABC):
         self.cloud_assembly = cloud_assembly
 
     @abstractmethod
-    def _initialize_cloud_artifact(self, cloud_assembly: CloudAssembly) -> CloudFormationStackArtifact:
+    def _initialize_cloud_artifact(self, cloud_assembly: "CloudAssembly") -> "CloudFormationStackArtifact":
         pass
 
     @abstractmethod
@@ -71,7 +75,7 @@ class CDKV1ClusterCloudAssembly(ClusterCloudAssembly):
         """Return the template content."""
         return self.cloud_artifact.template
 
-    def _initialize_cloud_artifact(self, cloud_assembly: CloudAssembly) -> CloudFormationStackArtifact:
+    def _initialize_cloud_artifact(self, cloud_assembly: "CloudAssembly") -> "CloudFormationStackArtifact":
         return next(
             artifact for artifact in cloud_assembly.artifacts if isinstance(artifact, self._get_artifacts_class())
         )
@@ -97,23 +101,55 @@ class CDKV1ClusterCloudAssembly(ClusterCloudAssembly):
 
     @staticmethod
     def _get_artifacts_class():
+        from aws_cdk.cx_api import CloudFormationStackArtifact  # pylint: disable=C0415
+
         return CloudFormationStackArtifact
 
 
 class CDKArtifactsManager:
     """Manage the discovery and upload of CDK Assets to the cluster S3 bucket."""
 
-    def __init__(self, cloud_assembly: CloudAssembly):
+    def __init__(self, cloud_assembly: "CloudAssembly"):
         self.cluster_cdk_assembly = CDKV1ClusterCloudAssembly(cloud_assembly)
 
     def get_template_body(self):
         """Return the template content."""
         return self.cluster_cdk_assembly.get_template_body()
 
+    def get_assets(self) -> List[dict]:
+        """
+        Return the CFN parameters and the content of the assets in the cloud assembly directory.
+
+        The returned data does not refer to the cloud assembly directory, so it can be stored and uploaded later on.
+        """
+        cloud_assembly_directory = self.cluster_cdk_assembly.get_cloud_assembly_directory()
+        return [
+            {
+                "id": cdk_asset.id,
+                "artifact_hash_parameter": cdk_asset.artifact_hash_parameter,
+                "s3_bucket_parameter": cdk_asset.s3_bucket_parameter,
+                "s3_key_parameter": cdk_asset.s3_key_parameter,
+                "content": load_json_dict(os.path.join(cloud_assembly_directory, cdk_asset.path)),
+            }
+            for cdk_asset in self.cluster_cdk_assembly.get_assets()
+        ]
+
     def upload_assets(self, bucket: S3Bucket):
         """
         Upload the assets in the cloud assembly directory to the cluster artifacts S3 Bucket.
 
+        Returns a mapping of the Asset Logical ID and associated parameters to be passed to the root template.
+        See upload_assets_content for the output format.
+        """
+        return self.upload_assets_content(self.get_assets(), bucket)
+
+    @staticmethod
+    def upload_assets_content(assets: List[dict], bucket: S3Bucket):
+        """
+        Upload the given assets, as returned by get_assets, to the cluster artifacts S3 Bucket.
+
+        Assets marked as uploaded, e.g. the templates of the reused queue group stacks, are already in the bucket.
+
         Returns a mapping of the Asset Logical ID and associated parameters to be passed to the root template.
         Output:
         ```
@@ -133,30 +169,38 @@ class CDKArtifactsManager:
         ]
         ```
         """
-        cdk_assets = self.cluster_cdk_assembly.get_assets()
         assets_metadata = []
-
-        for cdk_asset in cdk_assets:
-            asset_file_path = os.path.join(self.cluster_cdk_assembly.get_cloud_assembly_directory(), cdk_asset.path)
-            asset_file_content = load_json_dict(asset_file_path)
-            asset_id = cdk_asset.id
+        uploads = []
+        for asset in assets:
+            asset_file_content = asset["content"]
+            asset_id = asset["id"]
             assets_metadata.append(
                 {
                     # `artifactHashParameter` only needed when using `cdk deploy` to check the integrity of files
                     # uploaded to S3
-                    "hash_parameter": {"key": cdk_asset.artifact_hash_parameter, "value": ""},
-                    "s3_bucket_parameter": {"key": cdk_asset.s3_bucket_parameter, "value": bucket.name},
+                    "hash_parameter": {"key": asset["artifact_hash_parameter"], "value": ""},
+                    "s3_bucket_parameter": {"key": asset["s3_bucket_parameter"], "value": bucket.name},
                     "s3_object_key_parameter": {
-                        "key": cdk_asset.s3_key_parameter,
+                        "key": asset["s3_key_parameter"],
                         "value": bucket.get_object_key(S3FileType.ASSETS, asset_id),
                     },
                     "content": asset_file_content,
                 }
             )
+            if asset.get("uploaded"):
+                continue
             LOGGER.info(f"Uploading asset {asset_id} to S3")
-
-            bucket.upload_cfn_asset(
-                asset_file_content=asset_file_content, asset_name=asset_id, format=S3FileFormat.MINIFIED_JSON
+            # Assets are named after the digest of their content, so an existing asset is never uploaded again
+            uploads.append(
+                functools.partial(
+                    bucket.upload_cfn_asset,
+                    asset_file_content=asset_file_content,
+                    asset_name=asset_id,
+                    format=S3FileFormat.MINIFIED_JSON,
+                    skip_unchanged=True,
+                )
             )
 
+        run_concurrently(uploads, max_workers=S3_UPLOAD_MAX_WORKERS, thread_name_prefix="s3-upload")
+
         return assets_metadata
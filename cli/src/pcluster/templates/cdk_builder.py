@@ -19,6 +19,17 @@ from pcluster.config.cluster_config import BaseClusterConfig
 from pcluster.config.imagebuilder_config import ImageBuilderConfig
 from pcluster.models.s3_bucket import S3Bucket
 from pcluster.templates.cdk_artifacts_manager import CDKArtifactsManager
+from pcluster.templates.cdk_synthesis_cache import (
+    LOG_GROUP_NAME_PLACEHOLDER,
+    TIMESTAMP_PLACEHOLDER,
+    CDKSynthesisCache,
+    config_versions_placeholders,
+    is_cacheable,
+    resolve_synthesis,
+    to_cacheable_synthesis,
+)
+from pcluster.templates.cdk_synthesis_daemon import CDKSynthesisClient
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroups
 from pcluster.utils import load_yaml_dict
 
 LOGGER = logging.getLogger(__name__)
@@ -29,34 +40,156 @@ class CDKTemplateBuilder:
 
     @staticmethod
     def build_cluster_template(
-        cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str = None,
+        deployed_queue_groups: DeployedQueueGroups = None,
     ):
-        """Build template for the given cluster and return as output in Yaml format."""
+        """
+        Build template for the given cluster and return as output in Yaml format.
+
+        When the CDK synthesis cache is enabled, the synthesized template and assets are cached, so a config identical
+        to a recently synthesized one skips the CDK synthesis and only uploads the assets.
+        When the queue group stacks deployed by the cluster stack are given, the ones not affected by the update are
+        reused as they are instead of being synthesized again.
+        The template is synthesized by the CDK synthesis daemon when available, in process otherwise.
+        """
+        synthesis_cache = CDKSynthesisCache()
+        if not (synthesis_cache.is_enabled() and is_cacheable(cluster_config)):
+            synthesis = CDKTemplateBuilder._synthesize_cluster_template(
+                cluster_config, bucket, stack_name, log_group_name, deployed_queue_groups
+            )
+        else:
+            cache_key = synthesis_cache.get_cluster_key(cluster_config, bucket, stack_name, log_group_name)
+            cacheable_synthesis = synthesis_cache.get(cache_key)
+            if cacheable_synthesis:
+                LOGGER.info("Reusing the CDK template synthesized for an identical configuration")
+            else:
+                # The values changing at every synthesis are replaced by placeholders, resolved at every use
+                with config_versions_placeholders(cluster_config):
+                    synthesis = CDKTemplateBuilder._synthesize_cluster_template(
+                        cluster_config,
+                        bucket,
+                        stack_name,
+                        log_group_name or LOG_GROUP_NAME_PLACEHOLDER,
+                        deployed_queue_groups,
+                        TIMESTAMP_PLACEHOLDER,
+                    )
+                cacheable_synthesis = to_cacheable_synthesis(synthesis)
+                synthesis_cache.put(cache_key, cacheable_synthesis)
+
+            from pcluster.templates.cdk_builder_utils import (  # pylint: disable=C0415
+                generate_cluster_log_group_name,
+                generate_stack_timestamp,
+            )
+
+            timestamp = generate_stack_timestamp()
+            synthesis = resolve_synthesis(
+                cacheable_synthesis,
+                cluster_config,
+                timestamp,
+                log_group_name or generate_cluster_log_group_name(stack_name, timestamp),
+            )
+        assets_metadata = CDKArtifactsManager.upload_assets_content(synthesis["assets"], bucket)
+
+        return synthesis["template"], assets_metadata
+
+    @staticmethod
+    def _synthesize_cluster_template(
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str = None,
+        deployed_queue_groups: DeployedQueueGroups = None,
+        timestamp: str = None,
+    ):
+        """Synthesize the template of the given cluster by the CDK synthesis daemon when available, in process else."""
+        LOGGER.info("Starting CDK template generation...")
+        synthesis = None
+        synthesis_client = CDKSynthesisClient.from_environment()
+        if synthesis_client:
+            synthesis = synthesis_client.synthesize_cluster(
+                cluster_config, bucket, stack_name, log_group_name, deployed_queue_groups, timestamp
+            )
+        if not synthesis:
+            synthesis = CDKTemplateBuilder.synthesize_cluster_template(
+                cluster_config, bucket, stack_name, log_group_name, deployed_queue_groups, timestamp
+            )
+        LOGGER.info("CDK template generation completed successfully")
+        return synthesis
+
+    @staticmethod
+    def synthesize_cluster_template(
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str = None,
+        deployed_queue_groups: DeployedQueueGroups = None,
+        timestamp: str = None,
+    ):
+        """
+        Synthesize the template of the given cluster in process, without uploading its assets.
+
+        The timestamp of the cluster stack is the synthesis time, unless a fixed one is given.
+        Return the template, the assets in the format returned by CDKArtifactsManager.get_assets, the timestamp of the
+        cluster stack and the name of the log group of the cluster, if any.
+        """
         LOGGER.info("Importing CDK...")
         from aws_cdk.core import App  # pylint: disable=C0415
 
         from pcluster.templates.cluster_stack import ClusterCdkStack  # pylint: disable=C0415
 
         LOGGER.info("CDK import completed successfully")
-        LOGGER.info("Starting CDK template generation...")
-        with tempfile.TemporaryDirectory() as cloud_assembly_dir:
-            output_file = str(stack_name)
+
+        def synthesize(cloud_assembly_dir, queue_groups):
             app = App(outdir=str(cloud_assembly_dir))
-            ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
+            stack = ClusterCdkStack(
+                app, str(stack_name), stack_name, cluster_config, bucket, log_group_name, queue_groups, timestamp
+            )
+            return stack, CDKArtifactsManager(app.synth())
 
-            cloud_assembly = app.synth()
+        with tempfile.TemporaryDirectory() as cloud_assembly_dir:
+            cluster_stack, cdk_artifacts_manager = synthesize(
+                os.path.join(cloud_assembly_dir, "cluster"), deployed_queue_groups
+            )
+            if deployed_queue_groups and not deployed_queue_groups.is_consistent_with(
+                cdk_artifacts_manager.get_template_body()
+            ):
+                LOGGER.info("The deployed queue group stacks cannot be reused, synthesizing all of them")
+                deployed_queue_groups = None
+                cluster_stack, cdk_artifacts_manager = synthesize(
+                    os.path.join(cloud_assembly_dir, "full-cluster"), None
+                )
 
-            cdk_artifacts_manager = CDKArtifactsManager(cloud_assembly)
-            assets_metadata = cdk_artifacts_manager.upload_assets(bucket=bucket)
-            generated_template = cdk_artifacts_manager.get_template_body()
+            assets = cdk_artifacts_manager.get_assets()
+            if deployed_queue_groups:
+                assets += deployed_queue_groups.get_reused_assets()
+            return {
+                "template": cdk_artifacts_manager.get_template_body(),
+                "assets": assets,
+                "timestamp": cluster_stack.timestamp,
+                "log_group_name": getattr(cluster_stack, "log_group_name", None),
+            }
 
-        LOGGER.info("CDK template generation completed successfully")
+    @staticmethod
+    def build_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
+        """
+        Build template for the given imagebuilder and return as output in Yaml format.
 
-        return generated_template, assets_metadata
+        The template is synthesized by the CDK synthesis daemon when available, in process otherwise.
+        """
+        synthesis_client = CDKSynthesisClient.from_environment()
+        synthesis = (
+            synthesis_client.synthesize_imagebuilder(image_config, image_id, bucket) if synthesis_client else None
+        )
+        if synthesis:
+            return synthesis["template"]
+        return CDKTemplateBuilder.synthesize_imagebuilder_template(image_config, image_id, bucket)
 
     @staticmethod
-    def build_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
-        """Build template for the given imagebuilder and return as output in Yaml format."""
+    def synthesize_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
+        """Synthesize the template of the given imagebuilder in process."""
         from aws_cdk.core import App  # pylint: disable=C0415
 
         from pcluster.templates.imagebuilder_stack import ImageBuilderCdkStack  # pylint: disable=C0415
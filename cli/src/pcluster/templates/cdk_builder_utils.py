@@ -10,6 +10,7 @@
 # limitations under the License.
 import abc
 import hashlib
+from datetime import datetime
 from hashlib import sha1
 from typing import List, Union
 
@@ -33,6 +34,7 @@ from pcluster.config.cluster_config import (
 )
 from pcluster.constants import (
     COOKBOOK_PACKAGES_VERSIONS,
+    CW_LOG_GROUP_NAME_PREFIX,
     CW_LOGS_RETENTION_DAYS_DEFAULT,
     IAM_ROLE_PATH,
     LAMBDA_VPC_ACCESS_MANAGED_POLICY,
@@ -54,6 +56,16 @@ from pcluster.utils import (
 PCLUSTER_LAMBDA_PREFIX = "pcluster-"
 
 
+def generate_stack_timestamp():
+    """Return the timestamp used to name the resources that must be replaced at every stack update."""
+    return datetime.utcnow().strftime("%Y%m%d%H%M%S")
+
+
+def generate_cluster_log_group_name(stack_name: str, timestamp: str):
+    """Return the name of the log group created along with a new cluster, suffixed with the timestamp minutes."""
+    return f"{CW_LOG_GROUP_NAME_PREFIX}{stack_name}-{timestamp[:12]}"
+
+
 def create_hash_suffix(string_to_hash: str):
     """Create 16digit hash string."""
     return (
@@ -0,0 +1,229 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the cache of the templates and assets synthesized by CDK.
+#
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from pcluster.aws.common import AWSCallsTracker, AWSClientError
+from pcluster.aws.persistent_cache import PersistentCache
+from pcluster.config.cluster_config import BaseClusterConfig
+from pcluster.constants import CDK_SYNTHESIS_PERSISTENT_CACHE_TTL
+from pcluster.models.s3_bucket import S3Bucket
+from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.utils import get_installed_version
+
+LOGGER = logging.getLogger(__name__)
+
+# Environment variable enabling the cache, which is disabled by default
+CDK_SYNTHESIS_CACHE_ENV = "PCLUSTER_CDK_SYNTHESIS_CACHE_ENABLED"
+
+# Placeholders the cacheable templates are synthesized with, in place of the values that change at every synthesis:
+# the S3 versions of the uploaded configs, the timestamp of the cluster stack and the generated log group name.
+# The locations of the placeholders are recorded along with the cached synthesis, so that only those strings are
+# resolved. They only contain characters that are not escaped in JSON, so they can be resolved as they are both in
+# plain strings and in embedded JSON documents, and alphanumeric ones can be part of logical ids.
+CONFIG_VERSION_PLACEHOLDER = "PclusterCachedConfigVersion"
+ORIGINAL_CONFIG_VERSION_PLACEHOLDER = "PclusterCachedOriginalConfigVersion"
+TIMESTAMP_PLACEHOLDER = "PclusterCachedTimestamp"
+LOG_GROUP_NAME_PLACEHOLDER = "PclusterCachedLogGroupName"
+PLACEHOLDERS = [
+    CONFIG_VERSION_PLACEHOLDER,
+    ORIGINAL_CONFIG_VERSION_PLACEHOLDER,
+    TIMESTAMP_PLACEHOLDER,
+    LOG_GROUP_NAME_PLACEHOLDER,
+]
+
+
+class CDKSynthesisCache:
+    """
+    Content addressed cache of the cluster templates and assets synthesized by CDK.
+
+    Every entry is stored in its own file, named after the digest of the inputs of the synthesis, inside the persistent
+    cache directory of the current ParallelCluster version and region. The AWS data read while synthesizing (e.g.
+    instance types info, subnets availability zones, FSx file systems, capacity reservations) is not part of the key,
+    so the cache is opt-in, through the PCLUSTER_CDK_SYNTHESIS_CACHE_ENABLED environment variable, and its entries
+    expire after a few minutes. It also follows the persistent cache mode configured by the CLI, and any I/O error is
+    treated as a cache miss.
+    """
+
+    def __init__(self, ttl: int = CDK_SYNTHESIS_PERSISTENT_CACHE_TTL):
+        self._ttl = ttl
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the cache is enabled."""
+        return os.environ.get(CDK_SYNTHESIS_CACHE_ENV, "false") == "true" and PersistentCache.is_enabled()
+
+    @staticmethod
+    def _get_cache_dir():
+        return os.path.join(PersistentCache.get_region_cache_dir(), "cdk-synthesis")
+
+    @staticmethod
+    def get_cluster_key(
+        cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
+    ):
+        """Return the digest of the inputs of the synthesis of the given cluster template."""
+        try:
+            official_ami = cluster_config.official_ami
+        except AWSClientError:
+            # Custom AMIs are used for all the nodes, so the official one is not part of the template
+            official_ami = None
+        key_data = {
+            "config": ClusterSchema(cluster_name=cluster_config.cluster_name).dump(cluster_config),
+            "official_ami": official_ami,
+            "version": get_installed_version(),
+            "bucket_name": bucket.name,
+            "artifact_directory": bucket.artifact_directory,
+            "stack_name": stack_name,
+            "log_group_name": log_group_name,
+        }
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return the synthesis result cached for the given key, None if missing, expired or not readable."""
+        if not PersistentCache.is_readable():
+            return None
+        try:
+            entry_path = os.path.join(self._get_cache_dir(), f"{key}.json")
+            with open(entry_path, encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AWSClientError) as e:
+            LOGGER.debug("Unable to read CDK synthesis cache entry %s: %s", key, e)
+            return None
+        if not isinstance(entry, dict) or entry.get("expiry", 0) <= time.time():
+            return None
+        LOGGER.debug("CDK synthesis cache hit for key %s", key)
+        AWSCallsTracker.record_cache_hit()
+        return entry.get("value")
+
+    def put(self, key: str, value):
+        """Store the given synthesis result and remove the expired entries."""
+        if not self.is_enabled():
+            return
+        try:
+            cache_dir = self._get_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            self._remove_expired_entries(cache_dir)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                json.dump({"expiry": time.time() + self._ttl, "value": value}, temp_file)
+            os.replace(temp_path, os.path.join(cache_dir, f"{key}.json"))
+        except (OSError, TypeError, AWSClientError) as e:
+            LOGGER.debug("Unable to write CDK synthesis cache entry %s: %s", key, e)
+
+    def _remove_expired_entries(self, cache_dir):
+        """Remove the entries not modified within the TTL, i.e. the expired ones."""
+        expired_mtime = time.time() - self._ttl
+        for file_name in os.listdir(cache_dir):
+            entry_path = os.path.join(cache_dir, file_name)
+            try:
+                if file_name.endswith(".json") and os.path.getmtime(entry_path) < expired_mtime:
+                    os.remove(entry_path)
+            except OSError:
+                pass
+
+
+def is_cacheable(cluster_config: BaseClusterConfig):
+    """Tell if the synthesis results of the given cluster can be cached."""
+    # The AWS Batch resources embed a timestamp computed apart from the cluster stack one
+    return (
+        cluster_config.scheduling.scheduler != "awsbatch"
+        and isinstance(cluster_config.config_version, str)
+        and isinstance(cluster_config.original_config_version, str)
+    )
+
+
+@contextmanager
+def config_versions_placeholders(cluster_config: BaseClusterConfig):
+    """Replace the S3 versions of the uploaded configs with placeholders within the context."""
+    config_version, original_config_version = cluster_config.config_version, cluster_config.original_config_version
+    cluster_config.config_version = CONFIG_VERSION_PLACEHOLDER
+    cluster_config.original_config_version = ORIGINAL_CONFIG_VERSION_PLACEHOLDER
+    try:
+        yield
+    finally:
+        cluster_config.config_version = config_version
+        cluster_config.original_config_version = original_config_version
+
+
+def _contains_placeholder(value: str):
+    return any(placeholder in value for placeholder in PLACEHOLDERS)
+
+
+def _locate_placeholders(data, path: list, locations: dict):
+    """Add the paths of the strings and of the keys holding a placeholder in the given JSON data to the locations."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if _contains_placeholder(key):
+                locations["keys"].append(path + [key])
+            _locate_placeholders(value, path + [key], locations)
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            _locate_placeholders(value, path + [index], locations)
+    elif isinstance(data, str) and _contains_placeholder(data):
+        locations["values"].append(path)
+
+
+def to_cacheable_synthesis(synthesis: dict):
+    """Return the template and the assets synthesized with the placeholders, along with the placeholder locations."""
+    cacheable_synthesis = {"template": synthesis["template"], "assets": synthesis["assets"]}
+    locations = {"keys": [], "values": []}
+    _locate_placeholders(cacheable_synthesis, [], locations)
+    cacheable_synthesis["placeholders"] = locations
+    return cacheable_synthesis
+
+
+def resolve_synthesis(synthesis: dict, cluster_config: BaseClusterConfig, timestamp: str, log_group_name: str):
+    """
+    Replace the placeholders of the given cacheable synthesis with the actual values, only at the recorded locations.
+
+    The returned template and assets share the parts not holding any placeholder with the given synthesis.
+    """
+    replacements = {
+        ORIGINAL_CONFIG_VERSION_PLACEHOLDER: cluster_config.original_config_version,
+        CONFIG_VERSION_PLACEHOLDER: cluster_config.config_version,
+        TIMESTAMP_PLACEHOLDER: timestamp,
+        LOG_GROUP_NAME_PLACEHOLDER: log_group_name,
+    }
+    key_paths = {tuple(path) for path in synthesis["placeholders"]["keys"]}
+    value_paths = {tuple(path) for path in synthesis["placeholders"]["values"]}
+    prefixes = {path[:length] for path in key_paths | value_paths for length in range(len(path) + 1)}
+
+    def _replace(value: str):
+        for placeholder, actual_value in replacements.items():
+            value = value.replace(placeholder, actual_value)
+        return value
+
+    def _resolve(data, path: tuple):
+        if path not in prefixes:
+            return data
+        if isinstance(data, dict):
+            return {
+                _replace(key) if path + (key,) in key_paths else key: _resolve(value, path + (key,))
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [_resolve(value, path + (index,)) for index, value in enumerate(data)]
+        return _replace(data) if path in value_paths else data
+
+    return {
+        "template": _resolve(synthesis["template"], ("template",)),
+        "assets": _resolve(synthesis["assets"], ("assets",)),
+    }
@@ -0,0 +1,250 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the optional daemon keeping the CDK runtime loaded to synthesize the cluster and imagebuilder
+# templates, and the client used by the CLI and by the API to send it the synthesis requests.
+#
+# The daemon listens on a Unix socket, whose path is read from the PCLUSTER_CDK_SYNTHESIS_SOCKET environment variable
+# by both the daemon and the client, and serves the requests one at a time. Every connection carries a single request,
+# a JSON document sent until the end of the stream, and the JSON document of its response.
+# The daemon can be started with:
+#   python -m pcluster.templates.cdk_synthesis_daemon [--socket <path>]
+#
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+
+import argparse
+import yaml
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, Cache, CacheVolatility, get_region
+from pcluster.config.cluster_config import BaseClusterConfig, Tag
+from pcluster.config.imagebuilder_config import ImageBuilderConfig
+from pcluster.models.common import parse_config
+from pcluster.models.s3_bucket import S3Bucket
+from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.schemas.imagebuilder_schema import ImageBuilderSchema
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroups
+from pcluster.utils import get_installed_version
+
+LOGGER = logging.getLogger(__name__)
+
+SOCKET_PATH_ENV = "PCLUSTER_CDK_SYNTHESIS_SOCKET"
+# Maximum time to wait for a synthesis, which includes the time spent in queue behind the requests of other clients
+CLIENT_TIMEOUT = 900
+
+
+class CDKSynthesisClient:
+    """
+    Client of the CDK synthesis daemon.
+
+    The synthesis methods return None when the daemon cannot synthesize the template, e.g. because it is not running
+    or it is running a different ParallelCluster version, so that the caller can fall back to the in process synthesis.
+    """
+
+    def __init__(self, socket_path: str, timeout: int = CLIENT_TIMEOUT):
+        self._socket_path = socket_path
+        self._timeout = timeout
+
+    @classmethod
+    def from_environment(cls):
+        """Return the client of the daemon configured in the environment, None if there is none."""
+        socket_path = os.environ.get(SOCKET_PATH_ENV)
+        return cls(socket_path) if socket_path and os.path.exists(socket_path) else None
+
+    def synthesize_cluster(
+        self,
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str = None,
+        deployed_queue_groups: DeployedQueueGroups = None,
+        timestamp: str = None,
+    ):
+        """Synthesize the cluster template, see CDKTemplateBuilder.synthesize_cluster_template for the output."""
+        if cluster_config.source_config is None:
+            # The daemon loads the config from its source, which only the configs loaded by the schema have
+            return None
+        try:
+            official_ami = cluster_config.official_ami
+        except AWSClientError:
+            # Custom AMIs are used for all the nodes, so the official one is not part of the template
+            official_ami = None
+        return self._send_request(
+            {
+                "type": "cluster",
+                "cluster_name": cluster_config.cluster_name,
+                "config_text": yaml.dump(cluster_config.source_config),
+                # The tags added to the cluster at runtime, e.g. the ParallelCluster version, are not in the source
+                "tags": [{"Key": tag.key, "Value": tag.value} for tag in cluster_config.tags or []],
+                "official_ami": official_ami,
+                "config_version": cluster_config.config_version,
+                "original_config_version": cluster_config.original_config_version,
+                "bucket_name": bucket.name,
+                "artifact_directory": bucket.artifact_directory,
+                "stack_name": stack_name,
+                "log_group_name": log_group_name,
+                "deployed_queue_groups": deployed_queue_groups.to_dict() if deployed_queue_groups else None,
+                "timestamp": timestamp,
+            }
+        )
+
+    def synthesize_imagebuilder(self, image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
+        """Synthesize the imagebuilder template, returning it in the template field of the response."""
+        if image_config.source_config is None:
+            return None
+        return self._send_request(
+            {
+                "type": "imagebuilder",
+                "image_id": image_id,
+                "config_text": yaml.dump(image_config.source_config),
+                "bucket_name": bucket.name,
+                "artifact_directory": bucket.artifact_directory,
+            }
+        )
+
+    def _send_request(self, request: dict):
+        request.update(version=get_installed_version(), region=get_region())
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+                client_socket.settimeout(self._timeout)
+                client_socket.connect(self._socket_path)
+                client_socket.sendall(json.dumps(request).encode("utf-8"))
+                client_socket.shutdown(socket.SHUT_WR)
+                with client_socket.makefile("rb") as response_file:
+                    response = json.load(response_file)
+        except (OSError, ValueError) as e:
+            LOGGER.warning("Unable to reach the CDK synthesis daemon at %s: %s", self._socket_path, e)
+            return None
+        if response.get("error"):
+            LOGGER.warning("The CDK synthesis daemon failed to synthesize the template: %s", response["error"])
+            return None
+        LOGGER.info("Template synthesized by the CDK synthesis daemon")
+        return response
+
+
+class _SynthesisRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a synthesis request, replying with the synthesis result or with the error that prevented it."""
+
+    def handle(self):
+        try:
+            response = _synthesize(json.loads(self.rfile.read()))
+        except Exception as e:
+            LOGGER.exception("Failed to synthesize template")
+            response = {"error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+def _synthesize(request: dict):
+    # Imported here because the CDK template builder and the cluster model are clients of the daemon
+    from pcluster.models.cluster import Cluster  # pylint: disable=C0415
+    from pcluster.templates.cdk_builder import CDKTemplateBuilder  # pylint: disable=C0415
+
+    if request.get("version") != get_installed_version():
+        return {
+            "error": f"Daemon version {get_installed_version()} differs from client version {request.get('version')}"
+        }
+
+    # As the API does at every request, only the stable AWS data is kept cached across requests
+    os.environ["AWS_DEFAULT_REGION"] = request["region"]
+    Cache.clear(CacheVolatility.REQUEST)
+    AWSApi.reset()
+
+    if request["type"] == "imagebuilder":
+        image_id = request["image_id"]
+        bucket = S3Bucket(
+            service_name=image_id,
+            stack_name=image_id,
+            artifact_directory=request["artifact_directory"],
+            name=request["bucket_name"],
+        )
+        image_config = ImageBuilderSchema().load(parse_config(request["config_text"]))
+        return {"template": CDKTemplateBuilder.synthesize_imagebuilder_template(image_config, image_id, bucket)}
+
+    bucket = S3Bucket(
+        service_name=request["cluster_name"],
+        stack_name=request["stack_name"],
+        artifact_directory=request["artifact_directory"],
+        name=request["bucket_name"],
+    )
+    # The config is loaded from its source as the CLI does, so that the values implied by the schema are kept as such
+    config_dict = parse_config(request["config_text"])
+    Cluster._load_additional_instance_type_data(config_dict)  # pylint: disable=W0212
+    cluster_config = ClusterSchema(cluster_name=request["cluster_name"]).load(config_dict)
+    if request["tags"]:
+        cluster_config.tags = [Tag(key=tag["Key"], value=tag["Value"]) for tag in request["tags"]]
+    if request["official_ami"]:
+        cluster_config.official_ami = request["official_ami"]
+    cluster_config.config_version = request["config_version"]
+    cluster_config.original_config_version = request["original_config_version"]
+    deployed_queue_groups = (
+        DeployedQueueGroups.from_dict(request["deployed_queue_groups"], bucket)
+        if request["deployed_queue_groups"]
+        else None
+    )
+    return CDKTemplateBuilder.synthesize_cluster_template(
+        cluster_config,
+        bucket,
+        request["stack_name"],
+        request["log_group_name"],
+        deployed_queue_groups,
+        request["timestamp"],
+    )
+
+
+def serve(socket_path: str):
+    """Load the CDK runtime and serve the synthesis requests received on the given Unix socket until interrupted."""
+    from pcluster.templates.import_cdk import import_cdk  # pylint: disable=C0415
+
+    import_cdk()
+    if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        # Left behind by a daemon that has not been stopped gracefully
+        os.remove(socket_path)
+    # Only the user running the daemon can connect to the socket
+    previous_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(socket_path, _SynthesisRequestHandler)
+    finally:
+        os.umask(previous_umask)
+    with server:
+        LOGGER.info("CDK synthesis daemon listening on %s", socket_path)
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def main():
+    """Run the CDK synthesis daemon."""
+    parser = argparse.ArgumentParser(
+        description="Keep the CDK runtime loaded to synthesize the templates requested by the ParallelCluster CLI "
+        f"and API processes having the {SOCKET_PATH_ENV} environment variable set to the same socket path."
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_PATH_ENV),
+        required=not os.environ.get(SOCKET_PATH_ENV),
+        help=f"Path of the Unix socket to listen on. Defaults to the value of {SOCKET_PATH_ENV}.",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        serve(args.socket)
+    except KeyboardInterrupt:
+        LOGGER.info("CDK synthesis daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,6 @@
 #
 import json
 from collections import defaultdict, namedtuple
-from datetime import datetime
 from typing import Union
 
 from aws_cdk import aws_cloudformation as cfn
@@ -58,7 +57,6 @@ from pcluster.constants import (
     CW_ALARM_EVALUATION_PERIODS_DEFAULT,
     CW_ALARM_PERCENT_THRESHOLD_DEFAULT,
     CW_ALARM_PERIOD_DEFAULT,
-    CW_LOG_GROUP_NAME_PREFIX,
     CW_LOGS_CFN_PARAM_NAME,
     DEFAULT_EPHEMERAL_DIR,
     LUSTRE,
@@ -77,7 +75,9 @@ from pcluster.templates.cdk_builder_utils import (
     apply_permissions_boundary,
     convert_deletion_policy,
     create_hash_suffix,
+    generate_cluster_log_group_name,
     generate_launch_template_version_cfn_parameter_hash,
+    generate_stack_timestamp,
     get_cloud_watch_logs_policy_statement,
     get_cloud_watch_logs_retention_days,
     get_common_user_data_env,
@@ -94,6 +94,7 @@ from pcluster.templates.cdk_builder_utils import (
 )
 from pcluster.templates.compute_fleet_stack import ComputeFleetConstruct
 from pcluster.templates.cw_dashboard_builder import CWDashboardConstruct
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroups
 from pcluster.templates.slurm_builder import SlurmConstruct
 from pcluster.utils import get_attr, get_http_tokens_setting, get_service_endpoint
 
@@ -111,6 +112,8 @@ class ClusterCdkStack:
         cluster_config: Union[SlurmClusterConfig, AwsBatchClusterConfig],
         bucket: S3Bucket,
         log_group_name=None,
+        deployed_queue_groups: DeployedQueueGroups = None,
+        timestamp: str = None,
         **kwargs,
     ) -> None:
         self.stack = Stack(scope=scope, id=construct_id, **kwargs)
@@ -118,7 +121,8 @@ class ClusterCdkStack:
         self._launch_template_builder = CdkLaunchTemplateBuilder()
         self.config = cluster_config
         self.bucket = bucket
-        self.timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        self._deployed_queue_groups = deployed_queue_groups
+        self.timestamp = timestamp or generate_stack_timestamp()
         if self.config.is_cw_logging_enabled:
             if log_group_name:
                 # pcluster update keep the log group,
@@ -126,8 +130,7 @@ class ClusterCdkStack:
                 self.log_group_name = log_group_name
             else:
                 # pcluster create create a log group with timestamp suffix
-                timestamp = f"{datetime.utcnow().strftime('%Y%m%d%H%M')}"
-                self.log_group_name = f"{CW_LOG_GROUP_NAME_PREFIX}{self.stack.stack_name}-{timestamp}"
+                self.log_group_name = generate_cluster_log_group_name(self.stack.stack_name, self.timestamp)
 
         self.shared_storage_infos = {storage_type: [] for storage_type in SharedStorageType}
         self.shared_storage_mount_dirs = {storage_type: [] for storage_type in SharedStorageType}
@@ -402,6 +405,7 @@ class ClusterCdkStack:
                 dynamodb_table=self.scheduler_resources.dynamodb_table if self.scheduler_resources else None,
                 head_eni=self._head_eni,
                 slurm_construct=self.scheduler_resources,
+                deployed_queue_groups=self._deployed_queue_groups,
             )
         self._add_scheduler_plugin_substack()
 
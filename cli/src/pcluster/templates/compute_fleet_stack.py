@@ -28,7 +28,12 @@ from pcluster.constants import (
     MAX_COMPUTE_RESOURCES_PER_QUEUE,
     PCLUSTER_CLUSTER_NAME_TAG,
 )
-from pcluster.templates.queue_group_stack import QueueGroupStack
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroups
+from pcluster.templates.queue_group_stack import (
+    QueueGroupStack,
+    ReusedQueueGroupStack,
+    get_launch_template_logical_id,
+)
 from pcluster.templates.slurm_builder import SlurmConstruct
 from pcluster.utils import LOGGER, batch_by_property_callback
 
@@ -55,6 +60,7 @@ class QueueBatchConstruct(Construct):
         head_eni,
         slurm_construct: SlurmConstruct,
         compute_security_group,
+        deployed_queue_groups: DeployedQueueGroups = None,
     ):
         super().__init__(scope, id)
         self._config = cluster_config
@@ -67,6 +73,7 @@ class QueueBatchConstruct(Construct):
         self._head_eni = head_eni
         self._slurm_construct = slurm_construct
         self._compute_security_group = compute_security_group
+        self._deployed_queue_groups = deployed_queue_groups
 
         self.compute_fleet_launch_templates = {}
         self.managed_compute_fleet_instance_roles = {}
@@ -83,26 +90,49 @@ class QueueBatchConstruct(Construct):
         )
         for group_index, queue_group in enumerate(queue_groups):
             LOGGER.info(f"QueueGroup{group_index}: {[queue.name for queue in queue_group]}")
-            queue_group_stack = QueueGroupStack(
-                scope=self,
-                id=f"QueueGroup{group_index}",
-                queues=queue_group,
-                cluster_config=self._config,
-                log_group=self._log_group,
-                shared_storage_infos=self._shared_storage_infos,
-                shared_storage_mount_dirs=self._shared_storage_mount_dirs,
-                shared_storage_attributes=self._shared_storage_attributes,
-                cluster_hosted_zone=self._cluster_hosted_zone,
-                dynamodb_table=self._dynamodb_table,
-                head_eni=self._head_eni,
-                slurm_construct=self._slurm_construct,
-                compute_security_group=self._compute_security_group,
-            )
+            deployed_stack = self._get_deployed_queue_group_stack(f"QueueGroup{group_index}", queue_group)
+            if deployed_stack:
+                queue_group_stack = ReusedQueueGroupStack(
+                    scope=self, id=f"QueueGroup{group_index}", queues=queue_group, deployed_stack=deployed_stack
+                )
+            else:
+                queue_group_stack = QueueGroupStack(
+                    scope=self,
+                    id=f"QueueGroup{group_index}",
+                    queues=queue_group,
+                    cluster_config=self._config,
+                    log_group=self._log_group,
+                    shared_storage_infos=self._shared_storage_infos,
+                    shared_storage_mount_dirs=self._shared_storage_mount_dirs,
+                    shared_storage_attributes=self._shared_storage_attributes,
+                    cluster_hosted_zone=self._cluster_hosted_zone,
+                    dynamodb_table=self._dynamodb_table,
+                    head_eni=self._head_eni,
+                    slurm_construct=self._slurm_construct,
+                    compute_security_group=self._compute_security_group,
+                )
             self.managed_compute_fleet_instance_roles.update(queue_group_stack.managed_compute_instance_roles)
             self.compute_fleet_launch_templates.update(queue_group_stack.compute_launch_templates)
             self.managed_compute_fleet_placement_groups.update(queue_group_stack.managed_placement_groups)
             self.queue_group_stacks.append(queue_group_stack)
 
+    def _get_deployed_queue_group_stack(self, id: str, queues):
+        """Return the deployed stack of the given queue group if it can be reused, None otherwise."""
+        if not self._deployed_queue_groups:
+            return None
+        # Logical id of the nested stack resource, as generated by CDK from the construct path within the stack
+        scope_ids = "".join(self.node.path.split("/")[1:])
+        return self._deployed_queue_groups.get_reusable_stack(
+            logical_id_prefix=f"{scope_ids}{id}NestedStack{id}NestedStackResource",
+            launch_template_ids={
+                queue.name: {
+                    compute_resource.name: get_launch_template_logical_id(queue, compute_resource)
+                    for compute_resource in queue.compute_resources
+                }
+                for queue in queues
+            },
+        )
+
 
 class ComputeFleetConstruct(Construct):
     """Construct defining compute fleet specific resources."""
@@ -123,6 +153,7 @@ class ComputeFleetConstruct(Construct):
         dynamodb_table,
         head_eni,
         slurm_construct: SlurmConstruct,
+        deployed_queue_groups: DeployedQueueGroups = None,
     ):
         super().__init__(scope, id)
         self._cleanup_lambda = cleanup_lambda
@@ -137,6 +168,7 @@ class ComputeFleetConstruct(Construct):
         self._dynamodb_table = dynamodb_table
         self._head_eni = head_eni
         self._slurm_construct = slurm_construct
+        self._deployed_queue_groups = deployed_queue_groups
 
         self.launch_templates = {}
         self.managed_compute_fleet_instance_roles = {}
@@ -180,6 +212,7 @@ class ComputeFleetConstruct(Construct):
                     head_eni=self._head_eni,
                     slurm_construct=self._slurm_construct,
                     compute_security_group=self._compute_security_group,
+                    deployed_queue_groups=self._deployed_queue_groups,
                 )
             )
 
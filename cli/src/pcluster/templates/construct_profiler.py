@@ -0,0 +1,101 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import List
+
+from tabulate import tabulate
+
+# Modules of the constructs profiled by default, by construct class name
+PROFILED_CONSTRUCTS = {
+    "ClusterCdkStack": "pcluster.templates.cluster_stack",
+    "ComputeFleetConstruct": "pcluster.templates.compute_fleet_stack",
+    "CWDashboardConstruct": "pcluster.templates.cw_dashboard_builder",
+    "SlurmConstruct": "pcluster.templates.slurm_builder",
+    "AwsBatchConstruct": "pcluster.templates.awsbatch_builder",
+}
+
+
+class ConstructProfiler:
+    """
+    Collect the time spent building the constructs of the cluster stack.
+
+    The time of a construct includes the one of the constructs it builds, e.g. the ClusterCdkStack time includes
+    the time of all the other constructs, while the synthesis of the CDK app is not part of any construct time.
+
+    The profiler is not thread-safe: profiling patches the constructors of the construct classes, which are shared by
+    the whole process, so the constructs built by other threads are timed too and concurrent profiles must not overlap.
+    """
+
+    def __init__(self, constructs: dict = None):
+        self._constructs = constructs or PROFILED_CONSTRUCTS
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def _record(self, construct: str, elapsed_time: float):
+        with self._lock:
+            profile = self._profiles.setdefault(
+                construct, {"construct": construct, "instances": 0, "totalTime": 0.0, "maxTime": 0.0}
+            )
+            profile["instances"] += 1
+            profile["totalTime"] += elapsed_time
+            profile["maxTime"] = max(profile["maxTime"], elapsed_time)
+
+    def _timed(self, construct: str, init):
+        @functools.wraps(init)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return init(*args, **kwargs)
+            finally:
+                self._record(construct, time.perf_counter() - start)
+
+        return wrapper
+
+    @contextmanager
+    def profile(self):
+        """Time the constructs built within the context, by wrapping their constructors until the context exits."""
+        original_inits = {}
+        try:
+            for construct, module_name in self._constructs.items():
+                construct_class = getattr(importlib.import_module(module_name), construct)
+                original_inits[construct_class] = construct_class.__dict__["__init__"]
+                construct_class.__init__ = self._timed(construct, original_inits[construct_class])
+            yield
+        finally:
+            for construct_class, init in original_inits.items():
+                construct_class.__init__ = init
+
+    def get_profiles(self) -> List[dict]:
+        """Return the statistics of the built constructs, sorted by total time."""
+        with self._lock:
+            profiles = [
+                {
+                    "construct": profile["construct"],
+                    "instances": profile["instances"],
+                    "totalTime": round(profile["totalTime"], 3),
+                    "maxTime": round(profile["maxTime"], 3),
+                }
+                for profile in self._profiles.values()
+            ]
+        return sorted(profiles, key=lambda profile: (-profile["totalTime"], profile["construct"]))
+
+    def format_table(self) -> str:
+        """Return the statistics of the built constructs as a table sorted by total time."""
+        headers = ["Construct", "Instances", "Total time (s)", "Max time (s)"]
+        rows = [
+            [profile["construct"], profile["instances"], profile["totalTime"], profile["maxTime"]]
+            for profile in self.get_profiles()
+        ]
+        return tabulate(rows, headers=headers, floatfmt=".3f")
@@ -0,0 +1,184 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the classes required to reuse the queue group stacks of a deployed cluster at update time.
+#
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from pcluster.aws.common import AWSClientError
+from pcluster.models.s3_bucket import S3Bucket
+
+LOGGER = logging.getLogger(__name__)
+
+ASSET_PARAMETER_PATTERN = re.compile(r"^AssetParameters([0-9a-f]{64})(S3Bucket|S3VersionKey|ArtifactHash)[0-9A-F]{8}$")
+
+
+@dataclass
+class DeployedQueueGroupStack:
+    """Queue group nested stack of the deployed cluster stack."""
+
+    logical_id: str
+    resource: dict
+    asset: dict
+    asset_parameters: Dict[str, dict]
+    # Names of the outputs with the launch template id and version of each queue and compute resource
+    launch_template_outputs: Dict[str, Dict[str, Tuple[str, str]]]
+
+
+class DeployedQueueGroups:
+    """
+    Queue group nested stacks of the deployed cluster stack that can be reused by a cluster update.
+
+    The nested stack of a queue group is not synthesized again when none of its queues is affected by the update and
+    the group still contains the same launch templates. The cluster stack keeps the logical id, the template URL and
+    the parameters of the deployed nested stack, which refer to the template already uploaded to the cluster bucket
+    by the previous deployment, so the nested stack is left untouched by CloudFormation.
+    """
+
+    def __init__(self, root_template: dict, bucket: S3Bucket, unaffected_queues: Set[str]):
+        self._root_template = root_template
+        self._bucket = bucket
+        self._unaffected_queues = unaffected_queues
+        self.reused_stacks: List[DeployedQueueGroupStack] = []
+
+    def to_dict(self) -> dict:
+        """Return the JSON serializable inputs of the object, e.g. to send them to the CDK synthesis daemon."""
+        return {"root_template": self._root_template, "unaffected_queues": sorted(self._unaffected_queues)}
+
+    @classmethod
+    def from_dict(cls, data: dict, bucket: S3Bucket):
+        """Return the object with the given inputs, as returned by to_dict."""
+        return cls(data["root_template"], bucket, set(data["unaffected_queues"]))
+
+    def get_reusable_stack(
+        self, logical_id_prefix: str, launch_template_ids: Dict[str, Dict[str, str]]
+    ) -> Optional[DeployedQueueGroupStack]:
+        """
+        Return the deployed queue group stack reusable for the given queues, None if it must be synthesized again.
+
+        :param logical_id_prefix: prefix of the logical id of the nested stack resource in the cluster stack
+        :param launch_template_ids: logical ids of the launch templates of each queue and compute resource of the group
+        """
+        if not launch_template_ids or not set(launch_template_ids).issubset(self._unaffected_queues):
+            return None
+        try:
+            deployed_stack = self._get_deployed_stack(logical_id_prefix, launch_template_ids)
+        except (AWSClientError, KeyError, TypeError, ValueError) as e:
+            LOGGER.info("Unable to reuse the deployed stack of queues %s: %s", list(launch_template_ids), e)
+            return None
+        if deployed_stack:
+            LOGGER.info("Reusing the deployed stack of queues %s", list(launch_template_ids))
+            self.reused_stacks.append(deployed_stack)
+        return deployed_stack
+
+    def get_reused_assets(self) -> List[dict]:
+        """Return the assets of the reused stacks, in the format returned by CDKArtifactsManager.get_assets."""
+        return [deployed_stack.asset for deployed_stack in self.reused_stacks]
+
+    def is_consistent_with(self, template: dict):
+        """Tell if all the resources referenced by the parameters of the reused stacks exist in the given template."""
+        declared_ids = set(template.get("Resources", {})) | set(template.get("Parameters", {}))
+        return all(
+            referenced_id.startswith("AWS::") or referenced_id in declared_ids
+            for deployed_stack in self.reused_stacks
+            for referenced_id in _get_referenced_ids(deployed_stack.resource["Properties"].get("Parameters", {}))
+        )
+
+    def _get_deployed_stack(self, logical_id_prefix: str, launch_template_ids: Dict[str, Dict[str, str]]):
+        logical_id_pattern = re.compile(rf"^{re.escape(logical_id_prefix)}[0-9A-F]{{8}}$")
+        logical_id, resource = next(
+            (
+                (logical_id, resource)
+                for logical_id, resource in self._root_template.get("Resources", {}).items()
+                if resource.get("Type") == "AWS::CloudFormation::Stack" and logical_id_pattern.match(logical_id)
+            ),
+            (None, None),
+        )
+        if not logical_id:
+            return None
+
+        asset_ids = {
+            match.group(1)
+            for match in map(ASSET_PARAMETER_PATTERN.match, _get_referenced_ids(resource["Properties"]["TemplateURL"]))
+            if match
+        }
+        if len(asset_ids) != 1:
+            return None
+        asset_id = asset_ids.pop()
+        asset_parameters, asset_parameter_names = {}, {}
+        for name, definition in self._root_template.get("Parameters", {}).items():
+            match = ASSET_PARAMETER_PATTERN.match(name)
+            if match and match.group(1) == asset_id:
+                asset_parameters[name] = definition
+                asset_parameter_names[match.group(2)] = name
+        if len(asset_parameter_names) != 3:
+            return None
+
+        template = self._bucket.get_cfn_asset(asset_id)
+        deployed_launch_template_ids = {
+            logical_id
+            for logical_id, resource in template.get("Resources", {}).items()
+            if resource.get("Type") == "AWS::EC2::LaunchTemplate"
+        }
+        if deployed_launch_template_ids != {
+            launch_template_id
+            for compute_resources in launch_template_ids.values()
+            for launch_template_id in compute_resources.values()
+        }:
+            # Compute resources have been moved from or to this queue group
+            return None
+
+        outputs = {
+            json.dumps(output.get("Value"), sort_keys=True): name
+            for name, output in template.get("Outputs", {}).items()
+        }
+        launch_template_outputs = {}
+        for queue_name, compute_resources in launch_template_ids.items():
+            launch_template_outputs[queue_name] = {}
+            for compute_resource_name, launch_template_id in compute_resources.items():
+                id_output = outputs.get(json.dumps({"Ref": launch_template_id}))
+                version_output = outputs.get(json.dumps({"Fn::GetAtt": [launch_template_id, "LatestVersionNumber"]}))
+                if not (id_output and version_output):
+                    return None
+                launch_template_outputs[queue_name][compute_resource_name] = (id_output, version_output)
+
+        return DeployedQueueGroupStack(
+            logical_id=logical_id,
+            resource=resource,
+            asset={
+                "id": asset_id,
+                "artifact_hash_parameter": asset_parameter_names["ArtifactHash"],
+                "s3_bucket_parameter": asset_parameter_names["S3Bucket"],
+                "s3_key_parameter": asset_parameter_names["S3VersionKey"],
+                "content": template,
+                # The template of the reused stack has already been uploaded by the previous deployment
+                "uploaded": True,
+            },
+            asset_parameters=asset_parameters,
+            launch_template_outputs=launch_template_outputs,
+        )
+
+
+def _get_referenced_ids(data):
+    """Return the logical ids referenced by Ref and Fn::GetAtt in the given template snippet."""
+    if isinstance(data, dict):
+        if isinstance(data.get("Ref"), str):
+            return [data["Ref"]]
+        if isinstance(data.get("Fn::GetAtt"), list) and data["Fn::GetAtt"]:
+            return [data["Fn::GetAtt"][0]]
+        return [referenced_id for value in data.values() for referenced_id in _get_referenced_ids(value)]
+    if isinstance(data, list):
+        return [referenced_id for value in data for referenced_id in _get_referenced_ids(value)]
+    return []
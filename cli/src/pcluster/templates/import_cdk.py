@@ -20,8 +20,16 @@ def start():
     """
     Import cdk libraries in a separate thread.
 
-    :return: thread importing cdk libraries
+    The libraries are not imported when the templates are synthesized by the CDK synthesis daemon.
+
+    :return: thread importing cdk libraries, None if they are not imported
     """
+    from pcluster.templates.cdk_synthesis_daemon import (  # pylint: disable=import-outside-toplevel
+        CDKSynthesisClient,
+    )
+
+    if CDKSynthesisClient.from_environment():
+        return None
     thread = Thread(target=import_cdk)
     thread.start()
     return thread
@@ -2,8 +2,7 @@ from typing import Dict, List
 
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_logs as logs
-from aws_cdk.core import CfnTag, Fn, NestedStack, Stack
-from constructs import Construct
+from aws_cdk.core import CfnParameter, CfnStack, CfnTag, Construct, Fn, NestedStack, Stack, Token
 
 from pcluster.config.cluster_config import (
     SchedulerPluginQueue,
@@ -34,10 +33,16 @@ from pcluster.templates.cdk_builder_utils import (
     scheduler_is_slurm,
     to_comma_separated_string,
 )
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroupStack
 from pcluster.templates.slurm_builder import SlurmConstruct
 from pcluster.utils import get_attr, get_http_tokens_setting
 
 
+def get_launch_template_logical_id(queue, compute_resource):
+    """Return the logical id of the launch template of the given compute resource in the queue group stack."""
+    return f"LaunchTemplate{create_hash_suffix(queue.name + compute_resource.name)}"
+
+
 class QueueGroupStack(NestedStack):
     """Stack encapsulating a set of queues and the associated resources."""
 
@@ -186,7 +191,7 @@ class QueueGroupStack(NestedStack):
 
         return ec2.CfnLaunchTemplate(
             self,
-            f"LaunchTemplate{create_hash_suffix(queue.name + compute_resource.name)}",
+            get_launch_template_logical_id(queue, compute_resource),
             launch_template_name=f"{self.stack_name}-{queue.name}-{compute_resource.name}",
             launch_template_data=ec2.CfnLaunchTemplate.LaunchTemplateDataProperty(
                 block_device_mappings=self._launch_template_builder.get_block_device_mappings(
@@ -328,3 +333,57 @@ class QueueGroupStack(NestedStack):
                 **conditional_template_properties,
             ),
         )
+
+
+class DeployedLaunchTemplate:
+    """Launch template of a reused queue group stack, referenced through the outputs of the nested stack."""
+
+    def __init__(self, stack_resource: CfnStack, id_output: str, version_output: str):
+        self.ref = Token.as_string(stack_resource.get_att(f"Outputs.{id_output}"))
+        self.attr_latest_version_number = Token.as_string(stack_resource.get_att(f"Outputs.{version_output}"))
+
+
+class ReusedQueueGroupStack(Construct):
+    """
+    Queue group stack deployed by a previous cluster stack update and reused as it is.
+
+    It replaces the QueueGroupStack of a group of queues not affected by the update: the nested stack resource is
+    copied from the deployed cluster stack, and the parameters of its template asset are declared in the cluster stack.
+    """
+
+    def __init__(self, scope: Construct, id: str, queues: List[SlurmQueue], deployed_stack: DeployedQueueGroupStack):
+        super().__init__(scope, id)
+        self._queues = queues
+        self._deployed_stack = deployed_stack
+        self._add_resources()
+
+    def _add_resources(self):
+        for name, definition in self._deployed_stack.asset_parameters.items():
+            CfnParameter(
+                Stack.of(self), name, type=definition.get("Type", "String"), description=definition.get("Description")
+            )
+
+        deployed_resource = self._deployed_stack.resource
+        # The template URL is overridden with the one of the deployed stack, referring to the declared parameters
+        self.stack_resource = CfnStack(self, "NestedStackResource", template_url="")
+        self.stack_resource.override_logical_id(self._deployed_stack.logical_id)
+        self.stack_resource.add_property_override("TemplateURL", deployed_resource["Properties"]["TemplateURL"])
+        if deployed_resource["Properties"].get("Parameters"):
+            self.stack_resource.add_property_override("Parameters", deployed_resource["Properties"]["Parameters"])
+        for attribute in ["UpdateReplacePolicy", "DeletionPolicy"]:
+            if attribute in deployed_resource:
+                self.stack_resource.add_override(attribute, deployed_resource[attribute])
+
+        self.compute_launch_templates = {
+            queue_name: {
+                compute_resource_name: DeployedLaunchTemplate(self.stack_resource, id_output, version_output)
+                for compute_resource_name, (id_output, version_output) in compute_resources.items()
+            }
+            for queue_name, compute_resources in self._deployed_stack.launch_template_outputs.items()
+        }
+        # The compute node roles are only referenced by the cluster stack for scheduler plugins, never reused
+        self.managed_compute_instance_roles = {}
+        # The placement groups are created by the reused stack, so the dependencies on them become on the stack
+        self.managed_placement_groups = {
+            key: self.stack_resource for queue in self._queues for key in queue.get_managed_placement_group_keys()
+        }
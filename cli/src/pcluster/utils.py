@@ -11,20 +11,24 @@
 import asyncio
 import datetime
 import functools
+import hashlib
 import itertools
 import json
 import logging
 import os
+import pickle  # nosec B403
 import random
 import re
 import string
 import sys
+import threading
 import time
 import zipfile
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from shlex import quote
-from typing import Callable, NoReturn
+from typing import Callable, Iterable, List, NoReturn
 from urllib.parse import urlparse
 
 import dateutil.parser
@@ -34,6 +38,11 @@ from yaml import SafeLoader
 from yaml.constructor import ConstructorError
 from yaml.resolver import BaseResolver
 
+try:
+    from yaml import CSafeLoader as _LibyamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    _LibyamlSafeLoader = None
+
 from pcluster.aws.common import get_region
 from pcluster.constants import SUPPORTED_OSES_FOR_ARCHITECTURE, SUPPORTED_OSES_FOR_SCHEDULER
 
@@ -54,6 +63,9 @@ DOMAIN_MAP = {
     "aws-iso-b": "sc2s.sgov.gov",
 }
 
+# Number of parsed YAML documents kept in memory by yaml_load
+YAML_CACHE_SIZE = 32
+
 DEFAULT_DOCS_URL = "docs.aws.amazon.com"
 DOCS_URL_MAP = {
     "aws-cn": "docs.amazonaws.cn",
@@ -256,22 +268,12 @@ def verify_stack_status(stack_name, waiting_states, successful_states):
     :param successful_states: list of final status considered as successful
     :return: True if the final status is in the successful_states list, False otherwise.
     """
-    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
-
-    status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
-    resource_status = ""
-    while status in waiting_states:
-        status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
-        events = AWSApi.instance().cfn.get_stack_events(stack_name)["StackEvents"][0]
-        resource_status = ("Status: %s - %s" % (events.get("LogicalResourceId"), events.get("ResourceStatus"))).ljust(
-            80
-        )
-        sys.stdout.write("\r%s" % resource_status)
-        sys.stdout.flush()
-        time.sleep(5)
-    # print the last status update in the logs
-    if resource_status != "":
-        LOGGER.debug(resource_status)
+    from pcluster.aws.stack_watcher import StackWatcher  # pylint: disable=import-outside-toplevel
+
+    watcher = StackWatcher(progress_stream=sys.stdout)
+    watcher.watch(stack_name, waiting_states)
+    status = watcher.wait().get(stack_name)
+    LOGGER.debug("Stack %s final status: %s", stack_name, status)
     return status in successful_states
 
 
@@ -384,10 +386,42 @@ def get_attr(obj, attributes, default=None):
 
 
 def yaml_load(stream):
-    yaml.add_constructor(
-        tag=BaseResolver.DEFAULT_MAPPING_TAG, constructor=yaml_no_duplicates_constructor, Loader=SafeLoader
-    )
-    return yaml.safe_load(stream)
+    """
+    Load a YAML document with the safe loader, failing on duplicate keys.
+
+    The document is parsed with libyaml when available. Parsed documents are memoized by content hash,
+    and every call returns a new copy of the document, so that callers can modify it.
+
+    :param stream: YAML document, as string, bytes or file-like object
+    :return: the loaded document
+    """
+    content = stream.read() if hasattr(stream, "read") else stream
+    digest = hashlib.sha256(content.encode("utf-8", "surrogatepass") if isinstance(content, str) else content).digest()
+    with _yaml_cache_lock:
+        serialized_document = _yaml_cache.get(digest)
+        if serialized_document is not None:
+            _yaml_cache.move_to_end(digest)
+    if serialized_document is None:
+        # Documents are cached serialized, unpickling is much faster than parsing or deep copying them
+        serialized_document = pickle.dumps(_yaml_parse(content), protocol=pickle.HIGHEST_PROTOCOL)
+        with _yaml_cache_lock:
+            _yaml_cache[digest] = serialized_document
+            if len(_yaml_cache) > YAML_CACHE_SIZE:
+                _yaml_cache.popitem(last=False)
+    return pickle.loads(serialized_document)  # nosec B301
+
+
+def _yaml_parse(content):
+    """Parse a YAML document with the fastest available loader."""
+    if _LibyamlYamlLoader is None:
+        return yaml.load(content, Loader=_YamlLoader)  # nosec B506
+    try:
+        return yaml.load(content, Loader=_LibyamlYamlLoader)  # nosec B506
+    except yaml.YAMLError:
+        # libyaml error marks do not include the snippet of the document,
+        # parse it again with the pure-Python loader to report the error with it
+        yaml.load(content, Loader=_YamlLoader)  # nosec B506
+        raise
 
 
 def yaml_no_duplicates_constructor(loader, node, deep=False):
@@ -403,6 +437,25 @@ def yaml_no_duplicates_constructor(loader, node, deep=False):
     return loader.construct_mapping(node, deep)
 
 
+class _YamlLoader(SafeLoader):
+    """Pure-Python safe YAML loader failing on duplicate keys."""
+
+
+_YamlLoader.add_constructor(BaseResolver.DEFAULT_MAPPING_TAG, yaml_no_duplicates_constructor)
+
+if _LibyamlSafeLoader is not None:
+
+    class _LibyamlYamlLoader(_LibyamlSafeLoader):
+        """Safe YAML loader backed by libyaml failing on duplicate keys."""
+
+    _LibyamlYamlLoader.add_constructor(BaseResolver.DEFAULT_MAPPING_TAG, yaml_no_duplicates_constructor)
+else:
+    _LibyamlYamlLoader = None
+
+_yaml_cache = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
 def get_http_tokens_setting(imds_support):
     """Get http tokens settings for supported IMDS version."""
     return "required" if imds_support == "v2.0" else "optional"
@@ -455,6 +508,72 @@ def batch_by_property_callback(items, property_callback: Callable[..., int], bat
             yield current_batch
 
 
+def run_concurrently(functions: List[Callable], max_workers: int, thread_name_prefix: str = ""):
+    """
+    Run the given functions in a pool of at most max_workers threads and return their results in the same order.
+
+    All the functions are completed before raising the exception of the first failed one, if any.
+    """
+    if len(functions) <= 1:
+        return [function() for function in functions]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(functions)), thread_name_prefix=thread_name_prefix
+    ) as executor:
+        futures = [executor.submit(function) for function in functions]
+    return [future.result() for future in futures]
+
+
+def iterate_concurrently(functions: Iterable[Callable], max_workers: int, thread_name_prefix: str = ""):
+    """
+    Run the given functions in a pool of max_workers threads and yield their results in the same order.
+
+    A function is started only when the result of a previous one is consumed, so at most max_workers results are
+    pending besides the one being consumed: this bounds the resources held by the results, e.g. temporary files, and
+    not only the threads.
+    The functions not yet started are cancelled if the iteration is interrupted.
+    """
+    functions = iter(functions)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix) as executor:
+        futures = deque(executor.submit(function) for function in itertools.islice(functions, max_workers))
+        try:
+            while futures:
+                result = futures.popleft().result()
+                for function in itertools.islice(functions, 1):
+                    futures.append(executor.submit(function))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket, to limit the rate of the operations performed by concurrent workers.
+
+    Up to capacity tokens can be taken at once, and the bucket is refilled at rate tokens per second.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting for it to be available if needed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self._rate
+            time.sleep(wait_time)
+
+
 class AsyncUtils:
     """Utility class for async functions."""
 
@@ -14,10 +14,17 @@
 #
 import asyncio
 import functools
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from enum import Enum
 from typing import List
 
+from tabulate import tabulate
+
+from pcluster.aws.common import AWSCallsTracker
+
 ASYNC_TIMED_VALIDATORS_DEFAULT_TIMEOUT_SEC = 10
 
 
@@ -143,3 +150,88 @@ class ValidatorContext:
     def __init__(self, head_node_instance_id: str = None, during_update: bool = None):
         self.head_node_instance_id = head_node_instance_id
         self.during_update = during_update
+
+
+class ValidationProfiler:
+    """
+    Collect execution time, AWS calls and cache hits of the executed validators.
+
+    Statistics are aggregated by validator type. AWS calls and cache hits are tracked per thread, so they are recorded
+    only for sync validators; for async validators only the elapsed time, which includes the time spent waiting for
+    the other coroutines, is recorded.
+    """
+
+    def __init__(self):
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def _record(self, validator_type: str, elapsed_time: float, aws_calls: dict = None, cache_hits: int = 0):
+        with self._lock:
+            profile = self._profiles.setdefault(
+                validator_type,
+                {
+                    "type": validator_type,
+                    "executions": 0,
+                    "totalTime": 0.0,
+                    "maxTime": 0.0,
+                    "calls": {},
+                    "cacheHits": 0,
+                },
+            )
+            profile["executions"] += 1
+            profile["totalTime"] += elapsed_time
+            profile["maxTime"] = max(profile["maxTime"], elapsed_time)
+            profile["cacheHits"] += cache_hits
+            for call, count in (aws_calls or {}).items():
+                profile["calls"][call] = profile["calls"].get(call, 0) + count
+
+    @contextmanager
+    def profile(self, validator_type: str):
+        """Profile the execution of a sync validator in the current thread."""
+        start = time.perf_counter()
+        with AWSCallsTracker() as tracker:
+            try:
+                yield
+            finally:
+                self._record(validator_type, time.perf_counter() - start, tracker.calls, tracker.cache_hits)
+
+    async def profile_async(self, validator_type: str, coroutine):
+        """Await the given validator coroutine recording its execution time."""
+        start = time.perf_counter()
+        try:
+            return await coroutine
+        finally:
+            self._record(validator_type, time.perf_counter() - start)
+
+    def get_profiles(self) -> List[dict]:
+        """Return the statistics of the executed validators, sorted by total execution time."""
+        with self._lock:
+            profiles = [
+                {
+                    "type": profile["type"],
+                    "executions": profile["executions"],
+                    "totalTime": round(profile["totalTime"], 3),
+                    "maxTime": round(profile["maxTime"], 3),
+                    "awsCalls": sum(profile["calls"].values()),
+                    "awsOperations": sorted(profile["calls"]),
+                    "cacheHits": profile["cacheHits"],
+                }
+                for profile in self._profiles.values()
+            ]
+        return sorted(profiles, key=lambda profile: (-profile["totalTime"], profile["type"]))
+
+    def format_table(self) -> str:
+        """Return the statistics of the executed validators as a table sorted by total execution time."""
+        headers = ["Validator", "Executions", "Total time (s)", "Max time (s)", "AWS calls", "Cache hits"]
+        rows = [
+            [
+                profile["type"],
+                profile["executions"],
+                profile["totalTime"],
+                profile["maxTime"],
+                profile["awsCalls"],
+                profile["cacheHits"],
+            ]
+            for profile in self.get_profiles()
+        ]
+        return tabulate(rows, headers=headers, floatfmt=".3f")
@@ -12,8 +12,6 @@
 import re
 from urllib.parse import urlparse
 
-from aws_cdk.core import Arn, ArnFormat
-
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
 from pcluster.constants import DIRECTORY_SERVICE_RESERVED_SETTINGS
@@ -83,6 +81,8 @@ class PasswordSecretArnValidator(Validator):
          2. a readable parameter in SSM Parameter Store, which is supported only in us-isob-east-1.
         """
         try:
+            from aws_cdk.core import Arn, ArnFormat  # pylint: disable=C0415
+
             # We only require the secret to exist; we do not validate its content.
             arn_components = Arn.split(password_secret_arn, ArnFormat.COLON_RESOURCE_NAME)
             service, resource = arn_components.service, arn_components.resource
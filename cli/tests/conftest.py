@@ -31,6 +31,28 @@ def clear_env(mocker):
     mocker.patch("botocore.session.Session.get_scoped_config", return_value={})
 
 
+@pytest.fixture(autouse=True)
+def disable_persistent_cache(monkeypatch):
+    """Prevent tests from sharing data through the persistent cache stored in the user home."""
+    monkeypatch.setenv("PCLUSTER_PERSISTENT_CACHE_DISABLED", "true")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear the caches to remove dependencies between tests, since some of them are shared across AWSApi resets."""
+    from pcluster.aws.common import Cache
+
+    Cache.clear_all()
+
+
+@pytest.fixture(autouse=True)
+def clear_boto3_client_pool():
+    """Remove the pooled boto3 clients, so that every test uses the clients mocked by itself."""
+    from pcluster.aws.common import Boto3ClientPool
+
+    Boto3ClientPool.clear()
+
+
 @pytest.fixture(autouse=True)
 def reset_aws_api():
     """Reset AWSApi singleton to remove dependencies between tests."""
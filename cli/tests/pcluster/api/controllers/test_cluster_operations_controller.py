@@ -14,6 +14,7 @@ from marshmallow.exceptions import ValidationError
 
 from pcluster.api.controllers.cluster_operations_controller import _analyze_changes, _cluster_update_change_succeded
 from pcluster.api.controllers.common import get_validator_suppressors
+from pcluster.api.converters import cloud_formation_status_to_cluster_status
 from pcluster.api.models import CloudFormationStackStatus
 from pcluster.api.models.cluster_status import ClusterStatus
 from pcluster.api.models.validation_level import ValidationLevel
@@ -24,6 +25,7 @@ from pcluster.models.cluster import (
     BadRequestClusterActionError,
     ClusterActionError,
     ClusterUpdateError,
+    ConfigValidationError,
     ConflictClusterActionError,
     LimitExceededClusterActionError,
 )
@@ -90,6 +92,7 @@ Scheduling:
         dryrun=None,
         region=None,
         rollback_on_failure=None,
+        debug_validation_profile=None,
     ):
         query_string = []
         if suppress_validators:
@@ -100,6 +103,8 @@ Scheduling:
             query_string.append(("dryrun", dryrun))
         if rollback_on_failure is not None:
             query_string.append(("rollbackOnFailure", rollback_on_failure))
+        if debug_validation_profile is not None:
+            query_string.append(("debugValidationProfile", debug_validation_profile))
         if region:
             query_string.append(("region", region))
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -189,6 +194,7 @@ Scheduling:
             disable_rollback=rollback_on_failure is False,
             validator_suppressors=mocker.ANY,
             validation_failure_level=FailureLevel[validation_failure_level or ValidationLevel.ERROR],
+            validation_profiler=None,
         )
         cluster_create_mock.assert_called_once()
         if suppress_validators:
@@ -212,6 +218,118 @@ Scheduling:
             assert_that(response.status_code).is_equal_to(412)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_dryrun_with_validation_profile(self, client, mocker):
+        def _validate_create_request(*args, validation_profiler=None, **kwargs):
+            validation_profiler._record("FastValidator", 0.1, {"ec2:DescribeSubnets": 1}, 0)
+            validation_profiler._record("SlowValidator", 2.0, {"ec2:DescribeImages": 2, "iam:GetRole": 1}, 3)
+            return []
+
+        mocker.patch("pcluster.models.cluster.Cluster.validate_create_request", side_effect=_validate_create_request)
+
+        response = self._send_test_request(
+            client,
+            create_cluster_request_content={"clusterName": "cluster", "clusterConfiguration": self.CONFIG},
+            dryrun=True,
+            region="us-east-1",
+            debug_validation_profile=True,
+        )
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(412)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "message": "Request would have succeeded, but DryRun flag is set.",
+                    "validationProfile": [
+                        {
+                            "type": "SlowValidator",
+                            "executions": 1,
+                            "totalTime": 2.0,
+                            "maxTime": 2.0,
+                            "awsCalls": 3,
+                            "awsOperations": ["ec2:DescribeImages", "iam:GetRole"],
+                            "cacheHits": 3,
+                        },
+                        {
+                            "type": "FastValidator",
+                            "executions": 1,
+                            "totalTime": 0.1,
+                            "maxTime": 0.1,
+                            "awsCalls": 1,
+                            "awsOperations": ["ec2:DescribeSubnets"],
+                            "cacheHits": 0,
+                        },
+                    ],
+                }
+            )
+
+    def test_create_with_validation_profile(self, client, mocker):
+        def _create(*args, validation_profiler=None, **kwargs):
+            validation_profiler._record("SlowValidator", 2.0, {"ec2:DescribeImages": 2}, 1)
+            return "id", []
+
+        mocker.patch("pcluster.models.cluster.Cluster.create", side_effect=_create)
+
+        response = self._send_test_request(
+            client,
+            create_cluster_request_content={"clusterName": "cluster", "clusterConfiguration": self.CONFIG},
+            region="us-east-1",
+            debug_validation_profile=True,
+        )
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(202)
+            assert_that(response.get_json()["validationProfile"]).is_equal_to(
+                [
+                    {
+                        "type": "SlowValidator",
+                        "executions": 1,
+                        "totalTime": 2.0,
+                        "maxTime": 2.0,
+                        "awsCalls": 2,
+                        "awsOperations": ["ec2:DescribeImages"],
+                        "cacheHits": 1,
+                    }
+                ]
+            )
+
+    def test_config_validation_error_with_validation_profile(self, client, mocker):
+        def _create(*args, validation_profiler=None, **kwargs):
+            validation_profiler._record("FailingValidator", 0.5, {}, 0)
+            raise ConfigValidationError(
+                "Invalid cluster configuration.", [ValidationResult("message", FailureLevel.ERROR, "FailingValidator")]
+            )
+
+        mocker.patch("pcluster.models.cluster.Cluster.create", side_effect=_create)
+
+        response = self._send_test_request(
+            client,
+            create_cluster_request_content={"clusterName": "cluster", "clusterConfiguration": self.CONFIG},
+            region="us-east-1",
+            debug_validation_profile=True,
+        )
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "message": "Invalid cluster configuration.",
+                    "configurationValidationErrors": [
+                        {"level": "ERROR", "message": "message", "type": "FailingValidator"}
+                    ],
+                    "validationProfile": [
+                        {
+                            "type": "FailingValidator",
+                            "executions": 1,
+                            "totalTime": 0.5,
+                            "maxTime": 0.5,
+                            "awsCalls": 0,
+                            "awsOperations": [],
+                            "cacheHits": 0,
+                        }
+                    ],
+                }
+            )
+
     @pytest.mark.parametrize(
         "create_cluster_request_content, suppress_validators, validation_failure_level, dryrun, region, "
         "rollback_on_failure, expected_response",
@@ -1123,6 +1241,215 @@ class TestDescribeCluster:
             assert_that(response.get_json()).is_equal_to(expected_response)
 
 
+class TestListClustersByName:
+    url = "/v3/clusters"
+    method = "GET"
+
+    def _send_test_request(
+        self, client, cluster_names, detail=None, region="us-east-1", next_token=None, cluster_status_list=None
+    ):
+        query_string = [("clusterNames", cluster_name) for cluster_name in cluster_names] + [("region", region)]
+        if detail is not None:
+            query_string.append(("detail", detail))
+        if next_token:
+            query_string.append(("nextToken", next_token))
+        if cluster_status_list:
+            query_string.extend([("clusterStatus", status) for status in cluster_status_list])
+        headers = {"Accept": "application/json"}
+        return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
+
+    @pytest.fixture
+    def describe_stack_mock(self, mocker):
+        stacks = {
+            "cluster1": cfn_describe_stack_mock_response({"StackName": "cluster1"}),
+            "cluster2": cfn_describe_stack_mock_response({"StackName": "cluster2", "StackStatus": "UPDATE_COMPLETE"}),
+            "old-cluster": cfn_describe_stack_mock_response(
+                {"StackName": "old-cluster", "Tags": [{"Key": "parallelcluster:version", "Value": "2.0.0"}]}
+            ),
+        }
+
+        def _describe_stack(stack_name):
+            if stack_name not in stacks:
+                raise StackNotFoundError("describe_stack", stack_name)
+            return stacks[stack_name]
+
+        return mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=_describe_stack)
+
+    @staticmethod
+    def _mock_cluster_properties(mocker):
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).return_value = ComputeFleetStatus.RUNNING
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+        return mocker.patch("pcluster.models.cluster.Cluster.config", new_callable=mocker.PropertyMock)
+
+    expected_failed_clusters = [
+        {
+            "clusterName": "missing",
+            "message": "Cluster 'missing' does not exist or belongs to an incompatible ParallelCluster major version.",
+        },
+        {
+            "clusterName": "old-cluster",
+            "message": "Bad Request: Cluster 'old-cluster' belongs to an incompatible ParallelCluster major version.",
+        },
+    ]
+
+    def test_successful_request(self, mocker, client, describe_stack_mock):
+        describe_instances_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances")
+
+        response = self._send_test_request(client, ["cluster1", "cluster2", "missing", "old-cluster"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_json = response.get_json()
+            assert_that(response_json).does_not_contain_key("nextToken", "clusterDetails")
+            assert_that([cluster["clusterName"] for cluster in response_json["clusters"]]).is_equal_to(
+                ["cluster1", "cluster2"]
+            )
+            assert_that(response_json["clusters"][1]).is_equal_to(
+                {
+                    "cloudformationStackArn": "arn:aws:cloudformation:us-east-1:123:stack/pcluster3-2/123",
+                    "cloudformationStackStatus": "UPDATE_COMPLETE",
+                    "clusterName": "cluster2",
+                    "clusterStatus": "UPDATE_COMPLETE",
+                    "region": "us-east-1",
+                    "version": get_installed_version(),
+                    "scheduler": {"type": "slurm"},
+                }
+            )
+            assert_that(response_json["failedClusters"]).is_equal_to(self.expected_failed_clusters)
+        # The head nodes are only needed by the detailed information
+        describe_instances_mock.assert_not_called()
+
+    def test_successful_request_with_detail(self, mocker, client, describe_stack_mock):
+        head_node = {
+            "InstanceId": "i-020c2ec1b6d550000",
+            "InstanceType": "t2.micro",
+            "LaunchTime": datetime(2021, 5, 10, 13, 55, 48),
+            "PrivateIpAddress": "192.168.61.109",
+            "State": {"Code": 16, "Name": "running"},
+            "Tags": [{"Key": "parallelcluster:cluster-name", "Value": "cluster2"}],
+        }
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=[([], "token"), ([head_node], None)]
+        )
+        config_mock = self._mock_cluster_properties(mocker)
+
+        response = self._send_test_request(client, ["cluster1", "cluster2", "missing", "old-cluster"], detail=True)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_json = response.get_json()
+            assert_that([cluster["clusterName"] for cluster in response_json["clusters"]]).is_equal_to(
+                ["cluster1", "cluster2"]
+            )
+            assert_that([cluster["clusterName"] for cluster in response_json["clusterDetails"]]).is_equal_to(
+                ["cluster1", "cluster2"]
+            )
+            assert_that(response_json["clusterDetails"][0]).does_not_contain_key("headNode")
+            assert_that(response_json["clusterDetails"][1]["computeFleetStatus"]).is_equal_to("RUNNING")
+            assert_that(response_json["clusterDetails"][1]["headNode"]).is_equal_to(
+                {
+                    "instanceId": "i-020c2ec1b6d550000",
+                    "instanceType": "t2.micro",
+                    "launchTime": to_iso_timestr(datetime(2021, 5, 10, 13, 55, 48)),
+                    "privateIpAddress": "192.168.61.109",
+                    "state": "running",
+                }
+            )
+            assert_that(response_json["failedClusters"]).is_equal_to(self.expected_failed_clusters)
+        # The head nodes of all the clusters are retrieved with a single paginated query
+        assert_that(describe_instances_mock.call_count).is_equal_to(2)
+        filters = describe_instances_mock.call_args[0][0]
+        assert_that(filters).contains(
+            {
+                "Name": "tag:parallelcluster:cluster-name",
+                "Values": ["cluster1", "cluster2", "missing", "old-cluster"],
+            },
+            {"Name": "tag:parallelcluster:node-type", "Values": ["HeadNode"]},
+        )
+        # The configuration is not loaded when the scheduler cannot have plugin metadata
+        config_mock.assert_not_called()
+
+    def test_cluster_status_filter(self, mocker, client, describe_stack_mock):
+        self._mock_cluster_properties(mocker)
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([], None))
+
+        response = self._send_test_request(
+            client, ["cluster1", "cluster2", "missing"], detail=True, cluster_status_list=["UPDATE_COMPLETE"]
+        )
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_json = response.get_json()
+            assert_that([cluster["clusterName"] for cluster in response_json["clusters"]]).is_equal_to(["cluster2"])
+            assert_that([cluster["clusterName"] for cluster in response_json["clusterDetails"]]).is_equal_to(
+                ["cluster2"]
+            )
+            assert_that([cluster["clusterName"] for cluster in response_json["failedClusters"]]).is_equal_to(
+                ["missing"]
+            )
+
+    def test_head_nodes_failure(self, mocker, client):
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", return_value=cfn_describe_stack_mock_response())
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=AWSClientError("describe_instances", "error"),
+        )
+        self._mock_cluster_properties(mocker)
+
+        response = self._send_test_request(client, ["clustername"], detail=True)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["clusterDetails"][0]).does_not_contain_key("headNode")
+            assert_that(response.get_json()["failedClusters"]).is_empty()
+
+    @pytest.mark.parametrize(
+        "error_type, error_code, http_code",
+        [
+            (BadRequestError, AWSClientError.ErrorCode.VALIDATION_ERROR.value, 400),
+            (LimitExceededError, AWSClientError.ErrorCode.THROTTLING_EXCEPTION.value, 429),
+        ],
+    )
+    def test_error_conversion(self, client, mocker, error_type, error_code, http_code):
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([], None))
+        error = error_type("describe_stack", "error message", error_code)
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=error)
+
+        response = self._send_test_request(client, ["cluster1", "cluster2"], detail=True)
+
+        expected_response = {"message": "error message"}
+        if error_type == BadRequestError:
+            expected_response["message"] = "Bad Request: " + expected_response["message"]
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(http_code)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+    @pytest.mark.parametrize(
+        "cluster_names, detail, next_token, expected_message",
+        [
+            (
+                [],
+                True,
+                None,
+                "Bad Request: The detailed information of the clusters can only be requested with clusterNames.",
+            ),
+            (["cluster"], None, "token", "Bad Request: clusterNames cannot be used with nextToken."),
+            (["aaaaa.aaa"], None, None, "Bad Request: 'aaaaa.aaa' does not match '^[a-zA-Z][a-zA-Z0-9-]+$'"),
+        ],
+    )
+    def test_malformed_request(self, client, cluster_names, detail, next_token, expected_message):
+        response = self._send_test_request(client, cluster_names, detail=detail, next_token=next_token)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()["message"]).starts_with(expected_message)
+
+
 class TestListClusters:
     url = "/v3/clusters"
     method = "GET"
@@ -1296,13 +1623,24 @@ class TestListClusters:
     def test_successful_request(
         self, mocker, client, region, next_token, cluster_status, existing_stacks, expected_response
     ):
-        mocker.patch("pcluster.aws.cfn.CfnClient.list_pcluster_stacks", return_value=(existing_stacks, next_token))
+        list_pcluster_stacks_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks", return_value=(existing_stacks, next_token)
+        )
 
         response = self._send_test_request(client, region, next_token, cluster_status)
 
         with soft_assertions():
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
+        # The status filter is pushed down to the listing of the stacks
+        stack_statuses = list_pcluster_stacks_mock.call_args[1]["stack_statuses"]
+        if cluster_status:
+            assert_that(stack_statuses).contains(CloudFormationStackStatus.CREATE_IN_PROGRESS)
+            assert_that({cloud_formation_status_to_cluster_status(status) for status in stack_statuses}).is_equal_to(
+                set(cluster_status)
+            )
+        else:
+            assert_that(stack_statuses).is_none()
 
     @pytest.mark.parametrize(
         "region, next_token, cluster_status, expected_response",
@@ -1368,6 +1706,7 @@ class TestUpdateCluster:
         validation_failure_level=None,
         dryrun=None,
         force_update=None,
+        debug_validation_profile=None,
     ):
         query_string = []
         if region:
@@ -1380,6 +1719,8 @@ class TestUpdateCluster:
             query_string.append(("dryrun", dryrun))
         if force_update is not None:
             query_string.append(("forceUpdate", force_update))
+        if debug_validation_profile is not None:
+            query_string.append(("debugValidationProfile", debug_validation_profile))
 
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
         return client.open(
@@ -1474,12 +1815,52 @@ class TestUpdateCluster:
             target_source_config="Image:\n  Os: alinux2\nHeadNode:\n  InstanceType: t2.micro",
             validator_suppressors=mocker.ANY,
             validation_failure_level=FailureLevel[validation_failure_level or ValidationLevel.ERROR],
+            validation_profiler=None,
         )
         cluster_update_mock.assert_called_once()
         if suppress_validators:
             _, kwargs = cluster_update_mock.call_args
             assert_that(kwargs["validator_suppressors"].pop()._validators_to_suppress).is_equal_to({"type1", "type2"})
 
+    def test_config_validation_error_with_validation_profile(self, mocker, client):
+        def _update(*args, validation_profiler=None, **kwargs):
+            validation_profiler._record("FailingValidator", 0.5, {"ec2:DescribeSubnets": 1}, 0)
+            raise ConfigValidationError(
+                "Invalid cluster configuration.", [ValidationResult("message", FailureLevel.ERROR, "FailingValidator")]
+            )
+
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", return_value=cfn_describe_stack_mock_response())
+        mocker.patch("pcluster.models.cluster.Cluster.update", side_effect=_update)
+
+        response = self._send_test_request(
+            client,
+            "clusterName",
+            update_cluster_request_content={"clusterConfiguration": self.CONFIG},
+            debug_validation_profile=True,
+        )
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "message": "Invalid cluster configuration.",
+                    "configurationValidationErrors": [
+                        {"level": "ERROR", "message": "message", "type": "FailingValidator"}
+                    ],
+                    "validationProfile": [
+                        {
+                            "type": "FailingValidator",
+                            "executions": 1,
+                            "totalTime": 0.5,
+                            "maxTime": 0.5,
+                            "awsCalls": 1,
+                            "awsOperations": ["ec2:DescribeSubnets"],
+                            "cacheHits": 0,
+                        }
+                    ],
+                }
+            )
+
     @pytest.mark.parametrize("errors", [([]), ([ValidationResult("message", FailureLevel.WARNING, "type")])])
     def test_dryrun(self, mocker, client, errors):
         stack_data = cfn_describe_stack_mock_response()
@@ -24,6 +24,7 @@ from pcluster.aws.imagebuilder import ImageBuilderClient
 from pcluster.aws.kms import KmsClient
 from pcluster.aws.logs import LogsClient
 from pcluster.aws.resource_groups import ResourceGroupsClient
+from pcluster.aws.resource_groups_tagging import ResourceGroupsTaggingClient
 from pcluster.aws.route53 import Route53Client
 from pcluster.aws.s3 import S3Client
 from pcluster.aws.s3_resource import S3Resource
@@ -107,6 +108,7 @@ class _DummyAWSApi(AWSApi):
         self._ddb_resource = _DummyDynamoResource()
         self._route53 = _DummyRoute53Client()
         self._resource_groups = _DummyResourceGroupsClient()
+        self._resource_groups_tagging = _DummyResourceGroupsTaggingClient()
         self._secretsmanager = _DummySecretsManagerClient()
         self._ssm = _DummySsmClient()
 
@@ -134,6 +136,9 @@ class _DummyEc2Client(Ec2Client):
     def get_official_image_id(self, os, architecture, filters=None):
         return "dummy-ami-id"
 
+    def prefetch_instance_types_info(self, instance_types):
+        pass
+
     def describe_subnets(self, subnet_ids):
         return [
             {
@@ -326,6 +331,12 @@ class _DummyRoute53Client(Route53Client):
         pass
 
 
+class _DummyResourceGroupsTaggingClient(ResourceGroupsTaggingClient):
+    def __init__(self):
+        """Override Parent constructor. No real boto3 client is created."""
+        pass
+
+
 class _DummyResourceGroupsClient(ResourceGroupsClient):
     def __init__(self):
         """Override Parent constructor. No real boto3 client is created."""
@@ -17,7 +17,8 @@ from datetime import datetime
 import pytest
 from assertpy import assert_that
 
-from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSExceptionHandler, Boto3ClientPool, ImageNotFoundError, StackNotFoundError
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
 from tests.utils import MockedBoto3Request
@@ -122,3 +123,31 @@ def test_ssm_get_parameter(mocker, response):
     mock_aws_api(mocker)
     mocker.patch("pcluster.aws.ssm.SsmClient.get_parameter", side_effect=response)
     assert_that(_DummyAWSApi().instance().ssm.get_parameter(FAKE_SSM_PARAMETER)).is_equal_to(response)
+
+
+def test_boto3_client_pool(mocker, monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("PCLUSTER_BOTO3_MAX_POOL_CONNECTIONS", "42")
+    fingerprint_mock = mocker.patch.object(
+        Boto3ClientPool, "_get_credentials_fingerprint", return_value="credentials-1"
+    )
+
+    # Clients are reused across AWSApi resets
+    ec2_client = AWSApi.instance().ec2._client
+    AWSApi.reset()
+    assert_that(AWSApi.instance().ec2._client).is_same_as(ec2_client)
+    assert_that(ec2_client.meta.config.max_pool_connections).is_equal_to(42)
+
+    # Clients of different services, configs or regions are not shared
+    assert_that(AWSApi.instance().s3._client).is_not_same_as(Boto3ClientPool.get_client("s3"))
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+    eu_ec2_client = Boto3ClientPool.get_client("ec2")
+    assert_that(eu_ec2_client).is_not_same_as(ec2_client)
+    assert_that(eu_ec2_client.meta.region_name).is_equal_to("eu-west-1")
+
+    # Clients created with different credentials are replaced
+    fingerprint_mock.return_value = "credentials-2"
+    assert_that(Boto3ClientPool.get_client("ec2")).is_not_same_as(eu_ec2_client)
+
+    # Resources are not thread safe and are never shared
+    assert_that(Boto3ClientPool.get_resource("s3")).is_not_same_as(Boto3ClientPool.get_resource("s3"))
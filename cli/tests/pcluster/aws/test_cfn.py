@@ -12,7 +12,8 @@ from assertpy import assert_that
 
 from pcluster import utils as utils
 from pcluster.aws.cfn import CfnClient
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, StackNotFoundError
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
 
@@ -24,79 +25,68 @@ def boto3_stubber_path():
 
 class TestCfnClient:
     @pytest.mark.parametrize(
-        "next_token, describe_stacks_response, expected_stacks",
+        "stack_statuses, expected_stacks",
         [
-            (None, {"Stacks": []}, set()),
-            (
-                None,
+            (None, ["cluster1", "cluster2"]),
+            (["CREATE_IN_PROGRESS"], ["cluster1"]),
+            (["CREATE_FAILED"], []),
+        ],
+    )
+    def test_list_pcluster_stacks(self, mocker, stack_statuses, expected_stacks):
+        mock_aws_api(mocker)
+        version_tag = {"parallelcluster:version": "3.0.0"}
+        get_stacks_with_tag_mock = mocker.patch(
+            "pcluster.aws.resource_groups_tagging.ResourceGroupsTaggingClient.get_stacks_with_tag",
+            return_value=(
                 {
-                    "Stacks": [
-                        {
-                            "StackName": "name1",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
-                        },
-                        {"StackName": "name2", "CreationTime": datetime.now(), "StackStatus": "CREATE_IN_PROGRESS"},
-                        {
-                            "StackName": "name3",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
-                            "ParentId": "id",
-                        },
-                    ],
+                    "arn:cluster2": version_tag,
+                    "arn:cluster1": version_tag,
+                    "arn:image": {**version_tag, "parallelcluster:image_id": "image"},
+                    "arn:nested": {**version_tag, "aws:cloudformation:stack-id": "arn:cluster1"},
+                    "arn:untagged-nested": version_tag,
+                    "arn:deleted": version_tag,
+                    "arn:vanished": version_tag,
                 },
-                {"name1"},
+                "next-token",
             ),
-            (
-                "token",
-                {
-                    "Stacks": [
-                        {
-                            "StackName": "name1",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
-                        },
-                        {
-                            "StackName": "name2",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "2.0.0"}],
-                        },
-                    ],
-                    "NextToken": "token",
-                },
-                {"name1", "name2"},
-            ),
-            ("invalid", Exception(), set()),
-        ],
-    )
-    def test_list_pcluster_stacks(self, set_env, boto3_stubber, next_token, describe_stacks_response, expected_stacks):
-        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        )
+        stacks = {
+            "arn:cluster1": {"StackName": "cluster1", "StackStatus": "CREATE_IN_PROGRESS"},
+            "arn:cluster2": {"StackName": "cluster2", "StackStatus": "UPDATE_COMPLETE"},
+            "arn:untagged-nested": {"StackName": "nested", "StackStatus": "CREATE_COMPLETE", "ParentId": "id"},
+            "arn:deleted": {"StackName": "deleted", "StackStatus": "DELETE_COMPLETE"},
+        }
 
-        expected_describe_stacks_params = {} if not next_token else {"NextToken": next_token}
-        generate_error = isinstance(describe_stacks_response, Exception)
-        mocked_requests = [
-            MockedBoto3Request(
-                method="describe_stacks",
-                response=describe_stacks_response if not generate_error else "error",
-                expected_params=expected_describe_stacks_params,
-                generate_error=generate_error,
-                error_code="error" if generate_error else None,
-            )
-        ]
-        boto3_stubber("cloudformation", mocked_requests)
+        def _describe_stack(stack_name):
+            if stack_name not in stacks:
+                raise StackNotFoundError("describe_stack", stack_name)
+            return stacks[stack_name]
 
-        if not generate_error:
-            stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
-            assert_that(next_token).is_equal_to(describe_stacks_response.get("NextToken"))
-            assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
-        else:
-            with pytest.raises(AWSClientError) as e:
-                CfnClient().list_pcluster_stacks(next_token=next_token)
-            assert_that(e.value.error_code).is_equal_to("error")
+        describe_stack_mock = mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=_describe_stack)
+
+        stacks_list, next_token = CfnClient().list_pcluster_stacks(next_token="token", stack_statuses=stack_statuses)
+        assert_that([stack["StackName"] for stack in stacks_list]).is_equal_to(expected_stacks)
+        assert_that(next_token).is_equal_to("next-token")
+        get_stacks_with_tag_mock.assert_called_with("parallelcluster:version", "token")
+        # Image and nested stacks are discarded by their tags, the others are filtered on their described status
+        described_stacks = {call[0][0] for call in describe_stack_mock.call_args_list}
+        assert_that(described_stacks).is_equal_to(
+            {"arn:cluster1", "arn:cluster2", "arn:untagged-nested", "arn:deleted", "arn:vanished"}
+        )
+
+    def test_list_pcluster_stacks_error(self, mocker):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.resource_groups_tagging.ResourceGroupsTaggingClient.get_stacks_with_tag",
+            return_value=({"arn:cluster": {"parallelcluster:version": "3.0.0"}}, None),
+        )
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=AWSClientError("describe_stack", "error", error_code="error"),
+        )
+        with pytest.raises(AWSClientError) as e:
+            CfnClient().list_pcluster_stacks(stack_statuses=["CREATE_COMPLETE"])
+        assert_that(e.value.error_code).is_equal_to("error")
 
     def test_get_stack_events_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -145,8 +135,14 @@ class TestCfnClient:
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         mocker.patch(
             "pcluster.aws.cfn.CfnClient.describe_stack",
-            side_effect=[{"StackStatus": "CREATE_IN_PROGRESS"}, {"StackStatus": "CREATE_FAILED"}],
+            return_value={"StackId": FAKE_NAME, "StackStatus": "CREATE_IN_PROGRESS"},
         )
+        stack_failed_event = {
+            **_generate_stack_event(),
+            "EventId": "stack-failed",
+            "LogicalResourceId": FAKE_NAME,
+            "ResourceStatus": "CREATE_FAILED",
+        }
         mocked_requests = [
             MockedBoto3Request(
                 method="describe_stack_events",
@@ -160,11 +156,16 @@ class TestCfnClient:
                 response={"StackEvents": [_generate_stack_event()]},
                 expected_params={"StackName": FAKE_NAME},
             ),
+            MockedBoto3Request(
+                method="describe_stack_events",
+                response={"StackEvents": [stack_failed_event, _generate_stack_event()]},
+                expected_params={"StackName": FAKE_NAME},
+            ),
         ]
         boto3_stubber("cloudformation", mocked_requests)
         verified = utils.verify_stack_status(FAKE_NAME, ["CREATE_IN_PROGRESS"], "CREATE_COMPLETE")
         assert_that(verified).is_false()
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_any_call(5)
 
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
@@ -240,5 +241,5 @@ class TestCfnClient:
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
-                CfnClient().list_pcluster_stacks(next_token=next_token)
+                CfnClient().get_imagebuilder_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
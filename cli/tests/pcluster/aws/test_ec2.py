@@ -16,8 +16,9 @@ from assertpy import assert_that, soft_assertions
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSCallsTracker, AWSClientError, Cache, CacheVolatility
 from pcluster.aws.ec2 import Ec2Client
+from pcluster.aws.persistent_cache import PersistentCache, PersistentCacheMode
 from pcluster.config.cluster_config import AmiSearchFilters, Tag
 from pcluster.constants import OS_TO_IMAGE_NAME_PART_MAP
 from pcluster.utils import get_installed_version, to_iso_timestr
@@ -109,6 +110,66 @@ def test_get_supported_architectures(mocker, instance_type, supported_architectu
     get_instance_types_info_patch.assert_called_with(instance_type)
 
 
+@pytest.mark.parametrize("cache_mode, expect_describe_call", [("use", False), ("refresh", True), ("bypass", True)])
+def test_get_instance_type_info_persistent_cache(
+    boto3_stubber, tmp_path, monkeypatch, cache_mode, expect_describe_call
+):
+    monkeypatch.delenv("PCLUSTER_PERSISTENT_CACHE_DISABLED")
+    monkeypatch.setenv("PCLUSTER_CACHE_DIR", str(tmp_path))
+    instance_type_data = {"InstanceType": "c5.xlarge", "VCpuInfo": {"DefaultVCpus": 4}}
+    PersistentCache.configure(PersistentCacheMode.USE)
+    PersistentCache("instance-types", ttl=60).put("c5.xlarge", instance_type_data)
+
+    mocked_requests = []
+    if expect_describe_call:
+        mocked_requests.append(
+            MockedBoto3Request(
+                method="describe_instance_types",
+                response={"InstanceTypes": [instance_type_data]},
+                expected_params={"InstanceTypes": ["c5.xlarge"]},
+            )
+        )
+    boto3_stubber("ec2", mocked_requests)
+
+    PersistentCache.configure(PersistentCacheMode(cache_mode))
+    try:
+        assert_that(Ec2Client().get_instance_type_info("c5.xlarge").vcpus_count()).is_equal_to(4)
+    finally:
+        PersistentCache.configure(None)
+
+
+def test_prefetch_instance_types_info(boto3_stubber):
+    instance_types = [f"c5.{size}xlarge" for size in range(1, 151)]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in chunk]},
+            expected_params={"InstanceTypes": chunk},
+        )
+        for chunk in [instance_types[:100], instance_types[100:]]
+    ]
+    # The second batch fails, so its instance types will be described one by one
+    mocked_requests[1] = mocked_requests[1]._replace(
+        response="Invalid instance type", generate_error=True, error_code="InvalidInstanceType"
+    )
+    mocked_requests.append(
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": [{"InstanceType": "c5.150xlarge"}]},
+            expected_params={"InstanceTypes": ["c5.150xlarge"]},
+        )
+    )
+    boto3_stubber("ec2", mocked_requests)
+
+    ec2_client = Ec2Client()
+    ec2_client.additional_instance_types_data = {"custom.large": {"InstanceType": "custom.large"}}
+    ec2_client.prefetch_instance_types_info(instance_types + ["c5.1xlarge", "custom.large", "optimal", "c5"])
+
+    assert_that(Ec2Client._instance_types_data_cache).is_length(100)
+    for instance_type in ["c5.1xlarge", "c5.100xlarge", "c5.150xlarge"]:
+        assert_that(ec2_client.get_instance_type_info(instance_type).instance_type()).is_equal_to(instance_type)
+
+
 @pytest.mark.parametrize(
     "os_part, expected_os",
     [
@@ -324,6 +385,39 @@ def test_get_official_image_id(boto3_stubber, os, architecture, filters, boto3_r
         assert_that(ami_id).is_equal_to(expected_ami_id)
 
 
+def test_get_official_image_id_cache(boto3_stubber):
+    def mocked_request(owner, tags, ami_id):
+        return MockedBoto3Request(
+            method="describe_images",
+            expected_params={
+                "Filters": [
+                    {"Name": "name", "Values": [f"aws-parallelcluster-{get_installed_version()}-amzn2-hvm-x86_64*"]}
+                ]
+                + [{"Name": f"tag:{key}", "Values": [value]} for key, value in tags],
+                "Owners": [owner],
+                "IncludeDeprecated": True,
+            },
+            response={"Images": [{"ImageId": ami_id, "CreationDate": "2018-11-09T01:21:00.000Z"}]},
+        )
+
+    boto3_stubber(
+        "ec2",
+        [
+            mocked_request("self", [("key1", "value1")], "ami-00000000000000001"),
+            mocked_request("self", [("key1", "value2")], "ami-00000000000000002"),
+        ],
+    )
+
+    # The image ids are shared across requests by filters with the same content, not by filter instances
+    for filters, expected_ami_id in [
+        (AmiSearchFilters(owner="self", tags=[Tag("key1", "value1")]), "ami-00000000000000001"),
+        (AmiSearchFilters(owner="self", tags=[Tag("key1", "value2")]), "ami-00000000000000002"),
+        (AmiSearchFilters(owner="self", tags=[Tag("key1", "value1")]), "ami-00000000000000001"),
+    ]:
+        Cache.clear(CacheVolatility.REQUEST)
+        assert_that(Ec2Client().get_official_image_id("alinux2", "x86_64", filters)).is_equal_to(expected_ami_id)
+
+
 @pytest.mark.parametrize(
     "boto3_response, expected_ami_id",
     [
@@ -514,6 +608,45 @@ def test_get_subnet_ids_az_mapping(boto3_stubber):
     assert_that(response["subnet-456"]).is_equal_to("us-east-1b")
 
 
+def test_immutable_data_shared_across_clients(boto3_stubber):
+    avail_zones = {"subnet-123": "us-east-1a"}
+    boto3_stubber(
+        "ec2",
+        [
+            get_describe_subnets_mocked_request(["subnet-123"], "available", avail_zones),
+            MockedBoto3Request(
+                method="describe_instance_types",
+                response={"InstanceTypes": [{"InstanceType": "c5.xlarge"}]},
+                expected_params={"InstanceTypes": ["c5.xlarge"]},
+            ),
+        ],
+    )
+
+    for _ in range(2):
+        # Request scoped caches are cleared at every request, data that never changes is reused by the new clients
+        Cache.clear(CacheVolatility.REQUEST)
+        AWSApi.reset()
+        assert_that(AWSApi.instance().ec2.get_subnet_avail_zone("subnet-123")).is_equal_to("us-east-1a")
+        assert_that(AWSApi.instance().ec2.get_instance_type_info("c5.xlarge").instance_type()).is_equal_to("c5.xlarge")
+
+
+def test_aws_calls_tracker(boto3_stubber):
+    avail_zones = {"subnet-123": "us-east-1a"}
+    boto3_stubber("ec2", [get_describe_subnets_mocked_request(["subnet-123"], "available", avail_zones)])
+
+    with AWSCallsTracker() as outer_tracker:
+        with AWSCallsTracker() as inner_tracker:
+            # First call goes to boto3, second one is served by the cache
+            AWSApi.instance().ec2.get_subnet_avail_zone("subnet-123")
+            AWSApi.instance().ec2.get_subnet_avail_zone("subnet-123")
+        AWSApi.instance().ec2.get_subnet_avail_zone("subnet-123")
+
+    assert_that(inner_tracker.calls).is_equal_to({"ec2:DescribeSubnets": 1})
+    assert_that(inner_tracker.cache_hits).is_equal_to(1)
+    assert_that(outer_tracker.calls_count).is_equal_to(1)
+    assert_that(outer_tracker.cache_hits).is_equal_to(2)
+
+
 def get_describe_capacity_reservation_mocked_request(capacity_reservations, state):
     return MockedBoto3Request(
         method="describe_capacity_reservations",
@@ -619,3 +752,58 @@ def test_describe_volume(boto3_stubber):
     response = AWSApi.instance().ec2.describe_volume(volume_id)
 
     assert_that(response["AvailabilityZone"] == az).is_true()
+
+
+def test_iter_instances(boto3_stubber):
+    filters = [{"Name": "tag:parallelcluster:cluster-name", "Values": ["cluster"]}]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instances",
+            response={
+                "Reservations": [{"Instances": [{"InstanceId": "i-1"}, {"InstanceId": "i-2"}]}],
+                "NextToken": "token",
+            },
+            expected_params={"Filters": filters, "MaxResults": 1000},
+        ),
+        MockedBoto3Request(
+            method="describe_instances",
+            response={"Reservations": [{"Instances": [{"InstanceId": "i-3"}]}, {"Instances": []}]},
+            expected_params={"Filters": filters, "MaxResults": 1000, "NextToken": "token"},
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    instances = AWSApi.instance().ec2.iter_instances(filters)
+    # Pages are only retrieved while iterating
+    assert_that(next(instances)["InstanceId"]).is_equal_to("i-1")
+    assert_that([instance["InstanceId"] for instance in instances]).is_equal_to(["i-2", "i-3"])
+
+
+@pytest.mark.parametrize("failing_batch", [None, 1])
+def test_terminate_instances_concurrently(mocker, failing_batch):
+    mock_aws_api(mocker)
+    token_bucket_mock = mocker.patch("pcluster.aws.ec2.TokenBucket")
+    terminated_batches = []
+
+    def _terminate_instances(instance_ids):
+        if failing_batch is not None and instance_ids[0] == f"i-{failing_batch * 100}":
+            raise AWSClientError("terminate_instances", "error")
+        terminated_batches.append(instance_ids)
+
+    mocker.patch("pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances)
+    instance_ids = (f"i-{index}" for index in range(250))
+
+    if failing_batch is None:
+        assert_that(AWSApi.instance().ec2.terminate_instances_concurrently(instance_ids)).is_equal_to(250)
+    else:
+        with pytest.raises(AWSClientError, match="error"):
+            AWSApi.instance().ec2.terminate_instances_concurrently(instance_ids)
+
+    # All the batches are processed, each one after taking a token from the rate limiter
+    expected_batches = [
+        batch for index, batch in enumerate([(0, 100), (100, 200), (200, 250)]) if index != failing_batch
+    ]
+    assert_that(sorted(terminated_batches)).is_equal_to(
+        sorted(tuple(f"i-{index}" for index in range(*batch)) for batch in expected_batches)
+    )
+    assert_that(token_bucket_mock.return_value.acquire.call_count).is_equal_to(3)
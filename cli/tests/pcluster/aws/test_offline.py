@@ -0,0 +1,79 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+import yaml
+from assertpy import assert_that
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, Boto3ClientPool
+from pcluster.aws.offline import UNSUPPORTED_OPERATION_ERROR_CODE, offline_mode
+from pcluster.config.cluster_config import AmiSearchFilters, Tag
+
+
+@pytest.fixture
+def aws_data_file(tmp_path):
+    aws_data = {
+        "Region": "eu-west-1",
+        "AccountId": "111122223333",
+        "InstanceTypes": [
+            {"InstanceType": "t2.micro", "FreeTierEligible": True, "CurrentGeneration": True},
+            {"InstanceType": "c5.xlarge", "FreeTierEligible": False, "CurrentGeneration": True},
+        ],
+        "Subnets": [{"SubnetId": "subnet-1", "AvailabilityZone": "eu-west-1a", "VpcId": "vpc-1"}],
+        "Images": [
+            {
+                "ImageId": f"ami-{index}",
+                "Name": f"aws-parallelcluster-{version}-amzn2-hvm-x86_64-20230101",
+                "Architecture": "x86_64",
+                "CreationDate": f"2023-01-0{index}T00:00:00.000Z",
+                "Tags": [{"Key": "build", "Value": f"build-{index}"}],
+            }
+            for index, version in [(1, "3.5.0"), (2, "3.6.0"), (3, "3.6.0")]
+        ],
+    }
+    aws_data_file = tmp_path / "aws-data.yaml"
+    aws_data_file.write_text(yaml.dump(aws_data))
+    return str(aws_data_file)
+
+
+def test_offline_mode(mocker, aws_data_file, monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    mocker.patch("pcluster.aws.ec2.utils.get_installed_version", return_value="3.6.0")
+    mocker.patch("pcluster.aws.persistent_cache.PersistentCache.is_enabled", return_value=False)
+    boto3_client_mock = mocker.patch("pcluster.aws.common.boto3.client")
+
+    with offline_mode(aws_data_file):
+        assert_that(os.environ["AWS_DEFAULT_REGION"]).is_equal_to("eu-west-1")
+        aws_api = AWSApi.instance()
+        assert_that(aws_api.sts.get_account_id()).is_equal_to("111122223333")
+        assert_that(aws_api.ec2.get_subnet_avail_zone("subnet-1")).is_equal_to("eu-west-1a")
+        assert_that(aws_api.ec2.get_instance_type_info("c5.xlarge").instance_type()).is_equal_to("c5.xlarge")
+        assert_that(aws_api.ec2.get_default_instance_type()).is_equal_to("t2.micro")
+        # Name and tag filters select the images, the most recent one is the official one
+        assert_that(aws_api.ec2.get_official_image_id("alinux2", "x86_64")).is_equal_to("ami-3")
+        assert_that(
+            aws_api.ec2.get_official_image_id(
+                "alinux2", "x86_64", AmiSearchFilters(tags=[Tag(key="build", value="build-2")])
+            )
+        ).is_equal_to("ami-2")
+
+        with pytest.raises(AWSClientError, match="The following supplied instance types do not exist"):
+            aws_api.ec2.get_instance_type_info("c5.2xlarge")
+        with pytest.raises(AWSClientError, match="cloudformation.describe_stacks is not available") as error:
+            aws_api.cfn.describe_stack("stack")
+        assert_that(error.value.error_code).is_equal_to(UNSUPPORTED_OPERATION_ERROR_CODE)
+
+    # The boto3 clients and the region are restored on exit
+    assert_that(os.environ["AWS_DEFAULT_REGION"]).is_equal_to("us-east-1")
+    assert_that(Boto3ClientPool._backend).is_none()
+    boto3_client_mock.assert_not_called()
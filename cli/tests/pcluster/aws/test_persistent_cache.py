@@ -0,0 +1,89 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.persistent_cache import PersistentCache, PersistentCacheMode
+
+
+@pytest.fixture()
+def persistent_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("PCLUSTER_PERSISTENT_CACHE_DISABLED", raising=False)
+    monkeypatch.setenv("PCLUSTER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    yield tmp_path
+    PersistentCache.configure(None)
+
+
+@pytest.mark.parametrize(
+    "mode, expected_value",
+    [
+        (PersistentCacheMode.USE, {"InstanceType": "c5.xlarge"}),
+        (PersistentCacheMode.REFRESH, None),
+        (PersistentCacheMode.BYPASS, None),
+        (None, None),
+    ],
+)
+def test_persistent_cache_modes(persistent_cache_dir, mode, expected_value):
+    PersistentCache.configure(PersistentCacheMode.USE)
+    PersistentCache("test", ttl=60).put("c5.xlarge", {"InstanceType": "c5.xlarge"})
+
+    PersistentCache.configure(mode)
+    assert_that(PersistentCache("test", ttl=60).get("c5.xlarge")).is_equal_to(expected_value)
+
+
+def test_persistent_cache_layout(persistent_cache_dir, mocker):
+    mocker.patch("pcluster.aws.persistent_cache.get_installed_version", return_value="3.6.0")
+    PersistentCache.configure(PersistentCacheMode.USE)
+    cache = PersistentCache("test", ttl=60)
+    cache.put_all({"a": 1, "b": 2})
+
+    assert_that(os.path.join(persistent_cache_dir, "1", "3.6.0", "us-east-1", "test.json")).is_file()
+    assert_that(cache.get_all(["a", "b", "c"])).is_equal_to({"a": 1, "b": 2})
+
+    os.environ["AWS_DEFAULT_REGION"] = "eu-west-1"
+    assert_that(cache.get("a")).is_none()
+
+
+def test_persistent_cache_expiration(persistent_cache_dir, mocker):
+    PersistentCache.configure(PersistentCacheMode.USE)
+    mocker.patch("pcluster.aws.persistent_cache.time.time", return_value=1000)
+    PersistentCache("test", ttl=60).put("key", "value")
+
+    mocker.patch("pcluster.aws.persistent_cache.time.time", return_value=1059)
+    assert_that(PersistentCache("test", ttl=60).get("key")).is_equal_to("value")
+    mocker.patch("pcluster.aws.persistent_cache.time.time", return_value=1061)
+    assert_that(PersistentCache("test", ttl=60).get("key")).is_none()
+
+
+def test_persistent_cache_disabled_by_env(persistent_cache_dir, monkeypatch):
+    PersistentCache.configure(PersistentCacheMode.USE)
+    monkeypatch.setenv("PCLUSTER_PERSISTENT_CACHE_DISABLED", "true")
+    cache = PersistentCache("test", ttl=60)
+    cache.put("key", "value")
+
+    assert_that(cache.get("key")).is_none()
+    assert_that(list(persistent_cache_dir.iterdir())).is_empty()
+
+
+def test_persistent_cache_corrupted_file(persistent_cache_dir, mocker):
+    mocker.patch("pcluster.aws.persistent_cache.get_installed_version", return_value="3.6.0")
+    PersistentCache.configure(PersistentCacheMode.USE)
+    cache_file = persistent_cache_dir / "1" / "3.6.0" / "us-east-1" / "test.json"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text("not a json")
+
+    cache = PersistentCache("test", ttl=60)
+    assert_that(cache.get("key")).is_none()
+    cache.put("key", "value")
+    assert_that(PersistentCache("test", ttl=60).get("key")).is_equal_to("value")
@@ -0,0 +1,51 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.resource_groups_tagging import ResourceGroupsTaggingClient
+from tests.utils import MockedBoto3Request
+
+
+@pytest.fixture()
+def boto3_stubber_path():
+    return "pcluster.aws.common.boto3"
+
+
+@pytest.mark.parametrize(
+    "next_token, pagination_token, expected_next_token",
+    [(None, "", None), ("token", "next-token", "next-token")],
+)
+def test_get_stacks_with_tag(boto3_stubber, next_token, pagination_token, expected_next_token):
+    expected_params = {"ResourceTypeFilters": ["cloudformation:stack"], "TagFilters": [{"Key": "tag"}]}
+    if next_token:
+        expected_params["PaginationToken"] = next_token
+    mocked_requests = [
+        MockedBoto3Request(
+            method="get_resources",
+            response={
+                "PaginationToken": pagination_token,
+                "ResourceTagMappingList": [
+                    {"ResourceARN": "arn:stack1", "Tags": [{"Key": "tag", "Value": "value1"}]},
+                    {
+                        "ResourceARN": "arn:stack2",
+                        "Tags": [{"Key": "tag", "Value": "value2"}, {"Key": "k", "Value": ""}],
+                    },
+                ],
+            },
+            expected_params=expected_params,
+        )
+    ]
+    boto3_stubber("resourcegroupstaggingapi", mocked_requests)
+
+    stacks, result_token = ResourceGroupsTaggingClient().get_stacks_with_tag("tag", next_token)
+    assert_that(stacks).is_equal_to({"arn:stack1": {"tag": "value1"}, "arn:stack2": {"tag": "value2", "k": ""}})
+    assert_that(result_token).is_equal_to(expected_next_token)
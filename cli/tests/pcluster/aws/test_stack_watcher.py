@@ -0,0 +1,180 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import itertools
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import AWSClientError, StackNotFoundError
+from pcluster.aws.stack_watcher import StackWatch, StackWatcher
+from pcluster.constants import STACK_WATCH_MAX_DELAY, STACK_WATCH_MIN_DELAY
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+
+_EVENT_IDS = itertools.count()
+
+
+def _event(stack_name, logical_id, status, resource_type="AWS::EC2::Instance", physical_id=None):
+    return {
+        "EventId": f"event-{next(_EVENT_IDS)}",
+        "StackName": stack_name,
+        "LogicalResourceId": logical_id,
+        "ResourceStatus": status,
+        "ResourceType": resource_type,
+        "PhysicalResourceId": physical_id,
+    }
+
+
+class FakeStackEvents:
+    """Fake CloudFormation events, every call to describe the events of a stack reveals its next batch of events."""
+
+    def __init__(self, stacks, page_size=2):
+        # Events of each stack, newest first, and batches of events still to be revealed
+        self.events = {stack_id: list(reversed(old_events)) for stack_id, (old_events, _) in stacks.items()}
+        self.batches = {stack_id: list(batches) for stack_id, (_, batches) in stacks.items()}
+        self.page_size = page_size
+        self.calls = []
+
+    def get_stack_events(self, stack_name, next_token=None):
+        self.calls.append((stack_name, next_token))
+        if not next_token and self.batches[stack_name]:
+            self.events[stack_name] = list(reversed(self.batches[stack_name].pop(0))) + self.events[stack_name]
+        start = int(next_token or 0)
+        response = {"StackEvents": self.events[stack_name][start : start + self.page_size]}  # noqa: E203
+        if start + self.page_size < len(self.events[stack_name]):
+            response["NextToken"] = str(start + self.page_size)
+        return response
+
+
+@pytest.fixture
+def sleep_mock(mocker):
+    return mocker.patch("pcluster.aws.stack_watcher.time.sleep")
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter_mock(mocker):
+    return mocker.patch.object(StackWatcher, "_events_rate_limiter")
+
+
+def test_stack_watcher(mocker, sleep_mock, rate_limiter_mock):
+    mock_aws_api(mocker)
+    nested_stack_id = "arn:nested"
+    fake_events = FakeStackEvents(
+        {
+            "arn:stack1": (
+                # Events of a previous operation, not part of the one being watched
+                [_event("stack1", "stack1", "UPDATE_COMPLETE"), _event("stack1", "OldResource", "DELETE_COMPLETE")],
+                [
+                    [
+                        _event("stack1", "stack1", "UPDATE_IN_PROGRESS"),
+                        _event("stack1", "Instance", "UPDATE_IN_PROGRESS"),
+                        _event("stack1", "Nested", "UPDATE_IN_PROGRESS", "AWS::CloudFormation::Stack", nested_stack_id),
+                    ],
+                    [],
+                    [
+                        _event("stack1", "Instance", "UPDATE_COMPLETE"),
+                        _event("stack1", "Nested", "UPDATE_COMPLETE", "AWS::CloudFormation::Stack", nested_stack_id),
+                        _event("stack1", "stack1", "UPDATE_COMPLETE"),
+                    ],
+                ],
+            ),
+            nested_stack_id: (
+                [],
+                [
+                    [_event("nested", "nested", "UPDATE_IN_PROGRESS")],
+                    [_event("nested", "LaunchTemplate", "UPDATE_FAILED", "AWS::EC2::LaunchTemplate")],
+                ],
+            ),
+            "arn:stack2": (
+                [],
+                [
+                    [_event("stack2", "stack2", "CREATE_IN_PROGRESS"), _event("stack2", "Queue", "CREATE_IN_PROGRESS")],
+                    [_event("stack2", "Queue", "CREATE_FAILED"), _event("stack2", "stack2", "ROLLBACK_COMPLETE")],
+                ],
+            ),
+        }
+    )
+    mocker.patch("pcluster.aws.cfn.CfnClient.get_stack_events", side_effect=fake_events.get_stack_events)
+    mocker.patch(
+        "pcluster.aws.cfn.CfnClient.describe_stack",
+        side_effect=lambda stack_name: {"StackId": f"arn:{stack_name}", "StackStatus": "UPDATE_IN_PROGRESS"},
+    )
+    progress_stream = io.StringIO()
+
+    watcher = StackWatcher(progress_stream=progress_stream)
+    stack1_watch = watcher.watch("stack1")
+    watcher.watch("stack2")
+    assert_that(watcher.wait()).is_equal_to({"stack1": "UPDATE_COMPLETE", "stack2": "ROLLBACK_COMPLETE"})
+
+    # Only the resources of the operation being watched are tracked, the nested stack ones included
+    assert_that(stack1_watch.resources).does_not_contain_key("OldResource")
+    assert_that(stack1_watch.nested_watches).is_length(1)
+    assert_that(stack1_watch.nested_watches[0].resources).contains_key("LaunchTemplate")
+    assert_that(stack1_watch.get_progress()).is_equal_to("stack1: UPDATE_COMPLETE - 2/3 resources completed, 1 failed")
+    # The events of the stacks are polled incrementally, the ones already seen are not paged through again
+    assert_that(fake_events.calls.count(("arn:stack1", None))).is_equal_to(3)
+    assert_that(fake_events.calls).does_not_contain(("arn:stack1", "4"))
+    # Every call, of every page and of every stack, takes a token from the rate limiter shared by the watchers
+    assert_that(rate_limiter_mock.acquire.call_count).is_equal_to(len(fake_events.calls))
+    assert_that(progress_stream.getvalue().splitlines()).contains(
+        "stack1: UPDATE_IN_PROGRESS - 0/2 resources completed - nested stacks in progress: Nested",
+        "stack2: ROLLBACK_COMPLETE - 0/1 resources completed, 1 failed",
+    )
+
+
+@pytest.mark.parametrize(
+    "describe_stack_side_effect, get_stack_events_side_effect",
+    [
+        (StackNotFoundError("describe_stack", "stack"), None),
+        (
+            [{"StackId": "arn:stack", "StackStatus": "DELETE_IN_PROGRESS"}],
+            [
+                {"StackEvents": [_event("stack", "stack", "DELETE_IN_PROGRESS")]},
+                AWSClientError("get_stack_events", "Stack does not exist", "ValidationError"),
+            ],
+        ),
+    ],
+)
+def test_stack_watcher_deleted_stack(mocker, sleep_mock, describe_stack_side_effect, get_stack_events_side_effect):
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=describe_stack_side_effect)
+    mocker.patch("pcluster.aws.cfn.CfnClient.get_stack_events", side_effect=get_stack_events_side_effect)
+
+    watcher = StackWatcher()
+    watcher.watch("stack")
+    assert_that(watcher.wait()).is_equal_to({"stack": "DELETE_COMPLETE"})
+
+
+def test_stack_watcher_backoff(mocker, sleep_mock):
+    mock_aws_api(mocker)
+    get_stack_events_mock = mocker.patch(
+        "pcluster.aws.cfn.CfnClient.get_stack_events", return_value={"StackEvents": [_event("s", "s", "IN_PROGRESS")]}
+    )
+    mocker.patch("pcluster.aws.stack_watcher.time.monotonic", return_value=100)
+    watch = StackWatch("s")
+    watch.last_event_id = get_stack_events_mock.return_value["StackEvents"][0]["EventId"]
+    watcher = StackWatcher()
+
+    # The delay grows exponentially while there are no new events, with jitter adding to it
+    delays = []
+    for _ in range(6):
+        watcher._poll(watch)
+        delays.append(watch.delay)
+        assert_that(watch.next_poll_time).is_between(100 + watch.delay, 100 + watch.delay * 1.5)
+    assert_that(delays).is_equal_to(
+        [STACK_WATCH_MIN_DELAY * 2, STACK_WATCH_MIN_DELAY * 4] + [STACK_WATCH_MAX_DELAY] * 4
+    )
+
+    # The delay is reset as soon as the stack makes progress
+    get_stack_events_mock.return_value = {"StackEvents": [_event("s", "Resource", "CREATE_COMPLETE")]}
+    watcher._poll(watch)
+    assert_that(watch.delay).is_equal_to(STACK_WATCH_MIN_DELAY)
+    assert_that(watch.next_poll_time).is_greater_than_or_equal_to(100 + STACK_WATCH_MIN_DELAY)
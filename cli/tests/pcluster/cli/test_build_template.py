@@ -0,0 +1,98 @@
+#  Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import Boto3ClientPool, Cache
+from pcluster.aws.persistent_cache import PersistentCache
+from pcluster.utils import get_installed_version
+
+BASE_COMMAND = ["pcluster", "build-template"]
+
+
+@pytest.fixture
+def reset_offline_state():
+    """Reset the state of the process changed by the offline mode, so that it does not leak across tests."""
+
+    def reset():
+        Boto3ClientPool.set_backend(None)
+        Boto3ClientPool.clear()
+        Cache.clear_all()
+        PersistentCache.configure(None)
+
+    reset()
+    yield
+    reset()
+
+
+class TestBuildTemplateCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = BASE_COMMAND + ["--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    def test_required_args(self, run_cli, capsys):
+        run_cli(BASE_COMMAND + ["-c", "config.yaml"], expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains("the following arguments are required: -n/--cluster-name")
+
+    @pytest.mark.parametrize(
+        "args, expected_message",
+        [
+            (["--offline"], "--aws-data is required in offline mode"),
+            (["--aws-data", "aws-data.yaml"], "--aws-data can only be used in offline mode"),
+        ],
+    )
+    def test_offline_args(self, run_cli, args, expected_message):
+        run_cli(
+            BASE_COMMAND + ["-n", "cluster", "-c", "config.yaml"] + args,
+            expect_failure=True,
+            expect_message=expected_message,
+        )
+
+    @pytest.mark.usefixtures("reset_offline_state")
+    def test_build_template_offline(self, test_datadir, tmp_path, run_cli, capsys, mocker):
+        aws_data_file = tmp_path / "aws-data.yaml"
+        aws_data_file.write_text(
+            (test_datadir / "aws-data.yaml").read_text().replace("{version}", get_installed_version())
+        )
+        command = BASE_COMMAND + [
+            "-n",
+            "cluster",
+            "-c",
+            str(test_datadir / "pcluster.config.yaml"),
+            "--offline",
+            "--aws-data",
+            str(aws_data_file),
+        ]
+        # Patched right before the commands, so that only the AWS calls made by them are detected
+        boto3_client_mock = mocker.patch("pcluster.aws.common.boto3.client")
+
+        run_cli(command + ["--output-file", str(tmp_path / "template.json")])
+        output = json.loads(capsys.readouterr().out)
+        assert_that(output).does_not_contain_key("template")
+        assert_that([profile["construct"] for profile in output["timings"]["constructs"]]).contains_only(
+            "ClusterCdkStack", "ComputeFleetConstruct", "CWDashboardConstruct", "SlurmConstruct"
+        )
+        template = json.loads((tmp_path / "template.json").read_text())
+        assert_that(template["Resources"]).contains_key("HeadNodeWaitCondition19700101000000")
+        assert_that(
+            template["Resources"]["HeadNodeLaunchTemplate"]["Properties"]["LaunchTemplateData"]["ImageId"]
+        ).is_equal_to("ami-0123456789abcdef0")
+
+        # The same inputs render the same template
+        run_cli(command)
+        assert_that(json.loads(capsys.readouterr().out)["template"]).is_equal_to(template)
+
+        # No AWS call is made and the boto3 clients are restored
+        boto3_client_mock.assert_not_called()
+        assert_that(Boto3ClientPool._backend).is_none()
@@ -11,6 +11,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.api.models import CreateClusterResponseContent, DescribeClusterResponseContent
+from pcluster.aws.persistent_cache import PersistentCache, PersistentCacheMode
 from pcluster.cli.entrypoint import run
 from pcluster.cli.exceptions import APIOperationException
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -100,7 +101,9 @@ class TestCreateClusterCommand:
         describe_cluster_mock = mocker.patch(
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        wait_for_stacks_mock = mocker.patch(
+            "pcluster.cli.middleware.wait_for_stacks", return_value={"cluster": "CREATE_COMPLETE"}
+        )
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -115,11 +118,12 @@ class TestCreateClusterCommand:
             "validation_failure_level": None,
             "dryrun": None,
             "rollback_on_failure": None,
+            "debug_validation_profile": None,
             "region": "eu-west-1",
             "create_cluster_request_content": {"clusterName": "cluster", "clusterConfiguration": ""},
         }
         create_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(wait_for_stacks_mock.call_args[0]).is_equal_to((["cluster"],))
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     @pytest.mark.parametrize("cluster_name_arg, region_arg", [("--cluster-name", "--region"), ("-n", "-r")])
@@ -153,11 +157,44 @@ class TestCreateClusterCommand:
             "validation_failure_level": None,
             "dryrun": None,
             "rollback_on_failure": None,
+            "debug_validation_profile": None,
             "region": "eu-west-1",
             "create_cluster_request_content": {"clusterName": "cluster", "clusterConfiguration": ""},
         }
         create_cluster_mock.assert_called_with(**expected_args)
 
+    @pytest.mark.parametrize(
+        "cache_mode_args, expected_mode",
+        [
+            ([], PersistentCacheMode.USE),
+            (["--cache-mode", "refresh"], PersistentCacheMode.REFRESH),
+            (["--cache-mode", "bypass"], PersistentCacheMode.BYPASS),
+        ],
+    )
+    def test_execute_with_cache_mode(self, mocker, test_datadir, cache_mode_args, expected_mode):
+        response_dict = {
+            "cluster": {
+                "clusterName": "cluster",
+                "cloudformationStackStatus": "CREATE_IN_PROGRESS",
+                "cloudformationStackArn": "arn:aws:cloudformation:us-east-2:000000000000:stack/cluster/aa",
+                "region": "eu-west-1",
+                "version": "3.0.0",
+                "clusterStatus": "CREATE_IN_PROGRESS",
+            }
+        }
+        create_cluster_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.create_cluster",
+            return_value=CreateClusterResponseContent().from_dict(response_dict),
+            autospec=True,
+        )
+        configure_mock = mocker.patch.object(PersistentCache, "configure")
+
+        path = str(test_datadir / "config.yaml")
+        run(["create-cluster", "-n", "cluster", "-c", path, "-r", "eu-west-1"] + cache_mode_args)
+
+        configure_mock.assert_called_with(expected_mode)
+        assert_that(create_cluster_mock.call_args[1]).does_not_contain_key("cache_mode")
+
     def test_error(self, mocker, test_datadir):
         api_response = {"message": "error"}, 400
         mocker.patch(
@@ -62,7 +62,9 @@ class TestDeleteClusterCommand:
             autospec=True,
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        wait_for_stacks_mock = mocker.patch(
+            "pcluster.cli.middleware.wait_for_stacks", return_value={"cluster": "DELETE_COMPLETE"}
+        )
         mock_aws_api(mocker)
 
         command = ["delete-cluster", "--cluster-name", "cluster", "--wait"]
@@ -72,7 +74,7 @@ class TestDeleteClusterCommand:
         assert_that(delete_cluster_mock.call_args).is_length(2)
         args_expected = {"region": None, "cluster_name": "cluster"}
         delete_cluster_mock.assert_called_with(**args_expected)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(wait_for_stacks_mock.call_args[0]).is_equal_to((["cluster"],))
 
     def test_execute(self, mocker):
         response_dict = {
@@ -8,6 +8,8 @@
 import pytest
 from assertpy import assert_that
 
+from pcluster.cli.entrypoint import run
+
 
 class TestDescribeClusterInstancesCommand:
     def test_helper(self, test_datadir, run_cli, assert_out_err):
@@ -38,3 +40,26 @@ class TestDescribeClusterInstancesCommand:
 
         out, err = capsys.readouterr()
         assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "args, expected_tokens, expected_output",
+        [
+            ([], [None], {"instances": [{"instanceId": "i-1"}], "nextToken": "token1"}),
+            (["--all"], [None, "token1", "token2"], {"instances": [{"instanceId": "i-1"}, {"instanceId": "i-2"}]}),
+            (["--all", "--next-token", "token1"], ["token1", "token2"], {"instances": [{"instanceId": "i-2"}]}),
+            (["--all", "--query", "instances[].instanceId"], [None, "token1", "token2"], ["i-1", "i-2"]),
+        ],
+    )
+    def test_execute(self, mocker, args, expected_tokens, expected_output):
+        pages = {
+            None: {"instances": [{"instanceId": "i-1"}], "nextToken": "token1"},
+            "token1": {"instances": [{"instanceId": "i-2"}], "nextToken": "token2"},
+            "token2": {"instances": []},
+        }
+        call_mock = mocker.patch(
+            "pcluster.cli.model.call", side_effect=lambda func_name, next_token=None, **kwargs: pages[next_token]
+        )
+
+        out = run(["describe-cluster-instances", "--cluster-name", "cluster"] + args)
+        assert_that(out).is_equal_to(expected_output)
+        assert_that([call[1].get("next_token") for call in call_mock.call_args_list]).is_equal_to(expected_tokens)
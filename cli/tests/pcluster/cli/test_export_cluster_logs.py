@@ -27,7 +27,7 @@ class TestExportClusterLogsCommand:
 
     @pytest.mark.parametrize(
         "args, error_message",
-        [({"output_file": "path"}, "the following arguments are required: -n/--cluster-name, --bucket")],
+        [({"output_file": "path"}, "the following arguments are required: -n/--cluster-name")],
     )
     def test_required_args(self, args, error_message, run_cli, capsys):
         command = BASE_COMMAND + self._build_cli_args(args)
@@ -88,7 +88,7 @@ class TestExportClusterLogsCommand:
     )
     def test_execute(self, mocker, set_env, args):
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.cluster_logs.Cluster.export_logs",
+            "pcluster.models.cluster.Cluster.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
@@ -122,6 +122,16 @@ class TestExportClusterLogsCommand:
         )
         export_logs_mock.assert_called_with(**expected_params)
 
+    def test_execute_without_bucket(self, mocker, set_env):
+        export_logs_mock = mocker.patch("pcluster.models.cluster.Cluster.export_logs", return_value="output-path")
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        out = run(
+            ["export-cluster-logs"] + self._build_cli_args({"cluster-name": "name", "output_file": "output-path"})
+        )
+        assert_that(out).is_equal_to({"path": os.path.realpath("output-path")})
+        assert_that(export_logs_mock.call_args.kwargs["bucket"]).is_none()
+
     @staticmethod
     def _build_cli_args(args):
         cli_args = []
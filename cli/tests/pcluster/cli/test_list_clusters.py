@@ -10,7 +10,7 @@ from unittest.mock import ANY
 import pytest
 from assertpy import assert_that
 
-from pcluster.api.models import ListClustersResponseContent
+from pcluster.api.models import ClusterDescriptionFailure, ListClustersResponseContent
 from pcluster.cli.entrypoint import run
 from pcluster.cli.exceptions import APIOperationException
 
@@ -28,6 +28,7 @@ class TestListClustersCommand:
             (["--invalid"], "Invalid arguments ['--invalid']"),
             (["--region", "eu-west-"], "Bad Request: invalid or unsupported region 'eu-west-'"),
             (["--cluster-status", "invalid"], "argument --cluster-status: invalid choice: 'invalid'"),
+            (["--cluster-names"], "argument --cluster-names: expected at least one argument"),
         ],
     )
     def test_invalid_args(self, args, error_message, run_cli, capsys):
@@ -64,8 +65,27 @@ class TestListClustersCommand:
                 ListClustersResponseContent(clusters=[], next_token="token"),
                 {"clusters": [], "nextToken": "token"},
             ),
+            (
+                {
+                    "cluster_names": ["cluster1", "cluster2"],
+                    "detail": True,
+                    "region": "us-east-1",
+                },
+                ListClustersResponseContent(
+                    clusters=[],
+                    cluster_details=[],
+                    failed_clusters=[
+                        ClusterDescriptionFailure(cluster_name="cluster2", message="Cluster 'cluster2' does not exist.")
+                    ],
+                ),
+                {
+                    "clusters": [],
+                    "clusterDetails": [],
+                    "failedClusters": [{"clusterName": "cluster2", "message": "Cluster 'cluster2' does not exist."}],
+                },
+            ),
         ],
-        ids=["all", "required", "duplicated_status"],
+        ids=["all", "required", "duplicated_status", "by_name_with_detail"],
     )
     def test_execute(self, mocker, args, mocked_api_response, expected_cli_response):
         list_clusters_mock = mocker.patch(
@@ -83,7 +103,7 @@ class TestListClustersCommand:
                 *args.get("cluster_status")
             )
             args["cluster_status"] = ANY
-        base_args = {"region": None, "next_token": None, "cluster_status": None}
+        base_args = {"region": None, "next_token": None, "cluster_status": None, "cluster_names": None, "detail": None}
         list_clusters_mock.assert_called_with(**{**base_args, **args})
 
     def test_error(self, mocker):
@@ -109,4 +129,9 @@ class TestListClustersCommand:
         if "cluster_status" in args:
             cli_args.extend(["--cluster-status"])
             cli_args.extend(args["cluster_status"])
+        if "cluster_names" in args:
+            cli_args.extend(["--cluster-names"])
+            cli_args.extend(args["cluster_names"])
+        if "detail" in args:
+            cli_args.extend(["--detail", str(args["detail"])])
         return cli_args
@@ -6,10 +6,14 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+
 import pytest
 from assertpy import assert_that
 
+import pcluster.cli.model
 from pcluster.cli.entrypoint import ParameterException, gen_parser
+from pcluster.cli.model import load_cached_model, load_model, package_spec
 
 
 def _model(params):
@@ -93,3 +97,30 @@ class TestCliModel:
         path = str(test_datadir / "notfound")
         with pytest.raises(ParameterException):
             _run_model(model, ["op", "--file", path])
+
+    def test_load_cached_model(self, mocker, monkeypatch, tmpdir):
+        monkeypatch.delenv("PCLUSTER_PERSISTENT_CACHE_DISABLED")
+        monkeypatch.setenv("PCLUSTER_CACHE_DIR", str(tmpdir))
+        expected_model = load_model(package_spec())
+        load_model_spy = mocker.spy(pcluster.cli.model, "load_model")
+
+        # The first invocation compiles the model and stores it in the cache
+        assert_that(load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+        assert_that(os.listdir(os.path.join(str(tmpdir), "cli-model"))).is_length(1)
+
+        # Following invocations reuse the compiled model
+        assert_that(load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+
+        # A corrupted cache file is treated as a miss
+        for file_name in os.listdir(os.path.join(str(tmpdir), "cli-model")):
+            with open(os.path.join(str(tmpdir), "cli-model", file_name), "w", encoding="utf-8") as model_file:
+                model_file.write("{not json")
+        assert_that(load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(2)
+
+        # The cache is bypassed when the persistent cache is disabled
+        monkeypatch.setenv("PCLUSTER_PERSISTENT_CACHE_DISABLED", "true")
+        assert_that(load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(3)
@@ -105,7 +105,9 @@ class TestUpdateClusterCommand:
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        wait_for_stacks_mock = mocker.patch(
+            "pcluster.cli.middleware.wait_for_stacks", return_value={"cluster": "UPDATE_COMPLETE"}
+        )
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -120,12 +122,13 @@ class TestUpdateClusterCommand:
             "cluster_name": "cluster",
             "dryrun": None,
             "force_update": None,
+            "debug_validation_profile": None,
             "region": None,
             "suppress_validators": None,
             "validation_failure_level": None,
         }
         update_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(wait_for_stacks_mock.call_args[0]).is_equal_to((["cluster"],))
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     def test_execute(self, mocker, test_datadir):
@@ -164,6 +167,7 @@ class TestUpdateClusterCommand:
             "cluster_name": "cluster",
             "dryrun": None,
             "force_update": None,
+            "debug_validation_profile": None,
             "region": None,
             "suppress_validators": None,
             "validation_failure_level": None,
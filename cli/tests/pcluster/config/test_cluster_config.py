@@ -167,6 +167,38 @@ class TestBaseClusterConfig:
         assert_that(queue.instance_type_list).is_length(len(expected_instance_type_list))
         assert_that(set(queue.instance_type_list) - set(expected_instance_type_list)).is_length(0)
 
+    def test_all_instance_types(self):
+        cluster_config = SlurmClusterConfig(
+            cluster_name="clustername",
+            image=Image("alinux2"),
+            head_node=HeadNode("t2.micro", HeadNodeNetworking("subnet")),
+            scheduling=SlurmScheduling(
+                [
+                    SlurmQueue(
+                        name="queue0",
+                        networking=SlurmQueueNetworking(subnet_ids=["subnet"]),
+                        compute_resources=[
+                            SlurmComputeResource(name="compute_resource_1", instance_type="c5n.4xlarge"),
+                            SlurmFlexibleComputeResource(
+                                name="compute_resource_2",
+                                instances=[
+                                    FlexibleInstanceType(instance_type="c5n.4xlarge"),
+                                    FlexibleInstanceType(instance_type="c5n.9xlarge"),
+                                ],
+                            ),
+                        ],
+                    ),
+                    SlurmQueue(
+                        name="queue1",
+                        networking=SlurmQueueNetworking(subnet_ids=["subnet"]),
+                        compute_resources=[SlurmComputeResource(name="compute_resource_1", instance_type="t2.micro")],
+                    ),
+                ]
+            ),
+        )
+
+        assert_that(cluster_config.all_instance_types).is_equal_to(["t2.micro", "c5n.4xlarge", "c5n.9xlarge"])
+
     def test_placement_group_in_compute_resource(self):
         queue = SlurmQueue(
             name="queue0",
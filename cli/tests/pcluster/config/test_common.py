@@ -9,15 +9,19 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import threading
+import time
 from typing import List
 
 import pytest
 from assertpy import assert_that
 
-from pcluster.config.common import Resource
+from pcluster.aws.common import AWSCallsTracker
+from pcluster.config.common import AllValidatorsSuppressor, Resource
 from pcluster.validators.common import (
     AsyncValidator,
     FailureLevel,
+    ValidationProfiler,
     Validator,
     ValidatorContext,
     get_async_timed_validator_type_for,
@@ -273,6 +277,137 @@ def test_nested_resource_validate():
     assert_validation_result(validation_failures[2], FailureLevel.INFO, "Wrong value other-value.")
 
 
+def test_sync_validators_concurrent_execution():
+    """Verify that sync validators run concurrently and their failures are returned in registration order."""
+    executing_threads = set()
+
+    class FakeSlowValidator(Validator):
+        """Dummy validator simulating an I/O bound check."""
+
+        def _validate(self, param, delay):
+            executing_threads.add(threading.current_thread().name)
+            time.sleep(delay)
+            self._add_failure(f"Slow {param}.", FailureLevel.INFO)
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            for index in range(8):
+                self._register_validator(FakeSlowValidator, param=index, delay=0.4 - index * 0.05)
+
+    start_time = time.time()
+    validation_failures = FakeResource().validate()
+
+    assert_that(time.time() - start_time).is_less_than(1.6)
+    assert_that(len(executing_threads)).is_greater_than(1)
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        [f"Slow {index}." for index in range(8)]
+    )
+
+
+def test_validators_deduplication(mocker):
+    """Verify that validators registered with identical arguments are executed only once."""
+    validate_spy = mocker.spy(FakeComplexValidator, "_validate")
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(
+                FakeComplexValidator, fake_attribute=self.fake_attribute, other_attribute={"key": ["value"]}
+            )
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, list_of_resources: List[FakeNestedResource]):
+            super().__init__()
+            self.list_of_resources = list_of_resources
+
+    fake_resource = FakeParentResource(
+        [FakeNestedResource("value1"), FakeNestedResource("value2"), FakeNestedResource("value1")]
+    )
+    validation_failures = fake_resource.validate()
+
+    assert_that(validate_spy.call_count).is_equal_to(2)
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        [
+            "Combination value1 - {'key': ['value']}.",
+            "Combination value2 - {'key': ['value']}.",
+            "Combination value1 - {'key': ['value']}.",
+        ]
+    )
+
+
+def test_skipped_validators(mocker):
+    """Verify that nested validators which passed with the same arguments are skipped and tracked as passed."""
+    info_validate_spy = mocker.spy(FakeInfoValidator, "_validate")
+    error_validate_spy = mocker.spy(FakeErrorValidator, "_validate")
+    complex_validate_spy = mocker.spy(FakeComplexValidator, "_validate")
+
+    class FakePassingValidator(Validator):
+        """Dummy validator without failures."""
+
+        def _validate(self, param):
+            pass
+
+    passing_validate_spy = mocker.spy(FakePassingValidator, "_validate")
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakePassingValidator, param=self.fake_attribute)
+            self._register_validator(FakeErrorValidator, param=self.fake_attribute)
+            # Validators with resources in their arguments cannot be tracked
+            self._register_validator(FakeComplexValidator, fake_attribute=self, other_attribute=None)
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, list_of_resources: List[FakeNestedResource]):
+            super().__init__()
+            self.list_of_resources = list_of_resources
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakePassingValidator, param="parent")
+            self._register_validator(FakeInfoValidator, param="parent")
+
+    fake_resource = FakeParentResource([FakeNestedResource("value1"), FakeNestedResource("value2")])
+    fake_resource.validate()
+    # Only nested validators passed without failures are tracked
+    passed_validators = set(fake_resource.passed_validators)
+    assert_that(passed_validators).is_length(2)
+    assert_that(passing_validate_spy.call_count).is_equal_to(3)
+
+    mocker.resetall()
+    target_resource = FakeParentResource([FakeNestedResource("value1"), FakeNestedResource("value3")])
+    validation_failures = target_resource.validate(skipped_validators=passed_validators)
+
+    # The passing validator of value1 is skipped, the ones of the parent resource are always executed
+    assert_that([call[1]["param"] for call in passing_validate_spy.call_args_list]).is_equal_to(["value3", "parent"])
+    assert_that(error_validate_spy.call_count).is_equal_to(2)
+    assert_that(complex_validate_spy.call_count).is_equal_to(2)
+    assert_that(info_validate_spy.call_count).is_equal_to(1)
+    assert_that([failure.message for failure in validation_failures]).contains("Error value1.", "Error value3.")
+    # The skipped validator of value1 is still passed, the one of value2 is no more registered
+    assert_that(target_resource.passed_validators).is_length(2)
+    assert_that(target_resource.passed_validators & passed_validators).is_length(1)
+
+    # Suppressed validators are not tracked as passed
+    target_resource.validate(suppressors=[AllValidatorsSuppressor()])
+    assert_that(target_resource.passed_validators).is_empty()
+
+
 @pytest.mark.parametrize(
     "value, default, expected_value, expected_implied",
     [
@@ -312,3 +447,50 @@ def test_resource_params(value, default, expected_value, expected_implied):
     assert_that(param).is_not_none()
     assert_that(param.value).is_equal_to("new_value")
     assert_that(param.default).is_equal_to(default)
+
+
+def test_validation_profiler():
+    """Verify that the profiler records executions, AWS calls and cache hits of every validator type."""
+
+    class FakeAwsValidator(Validator):
+        """Dummy validator simulating AWS calls."""
+
+        def _validate(self, param):
+            AWSCallsTracker.record_call("ec2", "DescribeSubnets")
+            if param == "cached":
+                AWSCallsTracker.record_cache_hit()
+            else:
+                AWSCallsTracker.record_call("ec2", "DescribeVpcs")
+
+    class FakeAsyncValidator(AsyncValidator):
+        """Dummy async validator."""
+
+        async def _validate_async(self, param):
+            await asyncio.sleep(0.1)
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeAwsValidator, param="cached")
+            self._register_validator(FakeAwsValidator, param="not-cached")
+            self._register_validator(FakeAsyncValidator, param="value")
+            self._register_validator(FakeInfoValidator, param="value")
+
+    profiler = ValidationProfiler()
+    FakeResource().validate(profiler=profiler)
+    profiles = profiler.get_profiles()
+
+    assert_that([profile["type"] for profile in profiles]).contains_only(
+        "FakeAsyncValidator", "FakeAwsValidator", "FakeInfoValidator"
+    )
+    assert_that(profiles[0]["type"]).is_equal_to("FakeAsyncValidator")
+    assert_that(profiles[0]["totalTime"]).is_greater_than_or_equal_to(0.1)
+    aws_validator_profile = next(profile for profile in profiles if profile["type"] == "FakeAwsValidator")
+    assert_that(aws_validator_profile).contains_entry(
+        {"executions": 2},
+        {"awsCalls": 3},
+        {"awsOperations": ["ec2:DescribeSubnets", "ec2:DescribeVpcs"]},
+        {"cacheHits": 1},
+    )
+    assert_that(profiler.format_table().splitlines()[2]).starts_with("FakeAsyncValidator")
@@ -1004,3 +1004,35 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+def _queues_config(queues, head_node_instance_type="t2.micro"):
+    return {
+        "HeadNode": {"InstanceType": head_node_instance_type},
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": queue_name,
+                    "ComputeResources": [{"Name": "cr1", "InstanceType": instance_type, "MaxCount": 10}],
+                }
+                for queue_name, instance_type in queues.items()
+            ],
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "target_config, expected_unaffected_queues",
+    [
+        (_queues_config({"q1": "c5.xlarge", "q2": "c5.xlarge", "q3": "c5.xlarge"}), {"q1", "q2", "q3"}),
+        (_queues_config({"q1": "c5.2xlarge", "q2": "c5.xlarge", "q3": "c5.xlarge"}), {"q2", "q3"}),
+        (_queues_config({"q1": "c5.xlarge", "q3": "c5.xlarge", "q4": "c5.xlarge"}), {"q1", "q3"}),
+        (_queues_config({"q1": "c5.xlarge", "q2": "c5.xlarge", "q3": "c5.xlarge"}, "t3.micro"), set()),
+    ],
+    ids=["no changes", "queue updated", "queues added and removed", "cluster wide change"],
+)
+def test_get_unaffected_queues(target_config, expected_unaffected_queues):
+    base_config = _queues_config({"q1": "c5.xlarge", "q2": "c5.xlarge", "q3": "c5.xlarge"})
+    patch = ConfigPatch(dummy_cluster(), base_config=base_config, target_config=target_config)
+    assert_that(patch.get_unaffected_queues()).is_equal_to(expected_unaffected_queues)
@@ -481,9 +481,10 @@ class TestCluster:
         mock_aws_api(mocker)
         set_env("AWS_DEFAULT_REGION", "us-east-2")
         stack_exists_mock = mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=stack_exists)
-        download_stack_events_mock = mocker.patch("pcluster.models.cluster.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.cluster.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.cluster.upload_archive")
+        download_stack_events_mock = mocker.patch(
+            "pcluster.models.cluster.format_stack_events", return_value="stack events"
+        )
+        logs_archive_mock = mocker.patch("pcluster.models.cluster.LogsArchive", autospec=True)
         presign_mock = mocker.patch("pcluster.models.cluster.create_s3_presigned_url")
         mocker.patch(
             "pcluster.models.cluster.ClusterStack.log_group_name",
@@ -505,7 +506,8 @@ class TestCluster:
             cluster.export_logs(**kwargs)
             # check archive steps
             download_stack_events_mock.assert_called()
-            create_logs_archive_mock.assert_called()
+            archive = logs_archive_mock.return_value
+            archive.add_bytes.assert_called_with(cluster._stack_events_stream_name, b"stack events")
 
             # check preliminary steps
             stack_exists_mock.assert_called_with(cluster.stack_name)
@@ -513,14 +515,47 @@ class TestCluster:
             if logging_enabled:
                 cw_logs_exporter_mock.assert_called()
                 logs_filter_mock.assert_called()
+                assert_that(cw_logs_exporter_mock.return_value.execute.call_args.kwargs["archive"]).is_equal_to(archive)
             else:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
 
+            archive_name = logs_archive_mock.call_args.args[0]
+            assert_that(archive_name).matches(f"{cluster.name}-logs-[0-9]{{12}}")
             if "output_file" not in kwargs:
-                print("kwargs", kwargs)
-                upload_archive_mock.assert_called()
-                presign_mock.assert_called()
+                bucket_path = "/".join(filter(None, [kwargs.get("bucket_prefix"), f"{archive_name}.tar.gz"]))
+                logs_archive_mock.assert_called_with(archive_name, bucket="bucket_name", key=bucket_path)
+                presign_mock.assert_called_with(f"s3://bucket_name/{bucket_path}")
+            else:
+                logs_archive_mock.assert_called_with(archive_name, output_file="path")
+                presign_mock.assert_not_called()
+
+    @pytest.mark.parametrize("output_file", ["path", None])
+    def test_export_logs_without_bucket(self, cluster, mocker, set_env, output_file):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch("pcluster.models.cluster.format_stack_events", return_value="stack events")
+        mocker.patch("pcluster.models.cluster.LogsArchive", autospec=True)
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name"),
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster._init_export_logs_filters",
+            return_value=_MockExportClusterLogsFiltersParser(),
+        )
+        cw_logs_exporter_mock = mocker.patch("pcluster.models.cluster.CloudWatchLogsExporter", autospec=True)
+        cw_logs_fetcher_mock = mocker.patch("pcluster.models.cluster.CloudWatchLogsFetcher", autospec=True)
+
+        if output_file:
+            assert_that(cluster.export_logs(output_file=output_file)).is_equal_to(output_file)
+            cw_logs_fetcher_mock.assert_called_with(log_group_name="log-group-name")
+            cw_logs_fetcher_mock.return_value.execute.assert_called()
+            cw_logs_exporter_mock.assert_not_called()
+        else:
+            with pytest.raises(BadRequestClusterActionError, match="An output file is required"):
+                cluster.export_logs()
 
     @pytest.mark.parametrize(
         "stack_exists, logging_enabled, client_error, expected_error",
@@ -934,6 +969,118 @@ Scheduling:
         else:
             assert_that(bucket_object_utils_dict.get("upload_config").call_count).is_equal_to(0)
 
+    @pytest.mark.parametrize(
+        "validation_results, get_config_error, stack_status, ttl, expected_passed_validators, "
+        "expected_uploaded_validators",
+        [
+            (
+                {
+                    "Version": "3.6.0",
+                    "ConfigVersion": "config-1",
+                    "PassedValidators": {"digest1": 1000, "digest2": 1000},
+                },
+                None,
+                "UPDATE_COMPLETE",
+                None,
+                {"digest1", "digest2"},
+                {"digest1": 1000, "digest2": 1000, "digest4": 1600},
+            ),
+            (
+                {"Version": "3.6.0", "ConfigVersion": "config-1", "PassedValidators": {"digest1": 99, "digest2": 1000}},
+                None,
+                "CREATE_COMPLETE",
+                "900",
+                {"digest2"},
+                {"digest1": 1600, "digest2": 1000, "digest4": 1600},
+            ),
+            (
+                {"Version": "3.6.0", "ConfigVersion": "config-1", "PassedValidators": {"digest1": 1000}},
+                None,
+                "UPDATE_COMPLETE",
+                "0",
+                set(),
+                {"digest1": 1600, "digest2": 1600, "digest4": 1600},
+            ),
+            (
+                {"Version": "3.5.0", "ConfigVersion": "config-1", "PassedValidators": {"digest1": 1000}},
+                None,
+                "UPDATE_COMPLETE",
+                None,
+                set(),
+                {"digest1": 1600, "digest2": 1600, "digest4": 1600},
+            ),
+            (
+                {"Version": "3.6.0", "ConfigVersion": "config-0", "PassedValidators": {"digest1": 1000}},
+                None,
+                "UPDATE_ROLLBACK_COMPLETE",
+                None,
+                set(),
+                {"digest1": 1600, "digest2": 1600, "digest4": 1600},
+            ),
+            (
+                {"Version": "3.6.0", "ConfigVersion": "config-1", "PassedValidators": {"digest1": 1000}},
+                None,
+                "CREATE_FAILED",
+                None,
+                set(),
+                {"digest1": 1600, "digest2": 1600, "digest4": 1600},
+            ),
+            (
+                None,
+                AWSClientError("get_object", "NoSuchKey"),
+                "UPDATE_COMPLETE",
+                None,
+                set(),
+                {"digest1": 1600, "digest2": 1600, "digest4": 1600},
+            ),
+        ],
+        ids=["recent", "expired", "disabled", "other_version", "rolled_back_update", "failed_create", "missing"],
+    )
+    def test_validation_results(
+        self,
+        mocker,
+        monkeypatch,
+        cluster,
+        validation_results,
+        get_config_error,
+        stack_status,
+        ttl,
+        expected_passed_validators,
+        expected_uploaded_validators,
+    ):
+        mock_aws_api(mocker)
+        mock_bucket(mocker)
+        mock_bucket_utils(mocker)
+        bucket_object_utils_dict = mock_bucket_object_utils(mocker, get_config_side_effect=get_config_error)
+        bucket_object_utils_dict.get("get_config").return_value = validation_results
+        mocker.patch("pcluster.models.cluster.get_installed_version", return_value="3.6.0")
+        mocker.patch("pcluster.models.cluster.time.time", return_value=1600)
+        if ttl:
+            monkeypatch.setenv("PCLUSTER_VALIDATION_RESULTS_TTL", ttl)
+        # The deployed config is the one the validation results were recorded for, unless the stack rolled back
+        mocker.patch(
+            "pcluster.models.cluster_resources.ClusterStack.status",
+            new_callable=PropertyMock(return_value=stack_status),
+        )
+        mocker.patch(
+            "pcluster.models.cluster_resources.ClusterStack.original_config_version",
+            new_callable=PropertyMock(return_value="config-1"),
+        )
+        cluster.config = dummy_slurm_cluster_config(mocker)
+
+        # The validators passed too long ago, or by a config not deployed successfully, are executed again
+        assert_that(cluster._get_passed_validators()).is_equal_to(expected_passed_validators)
+
+        # The validators not executed again keep the time of their previous execution
+        cluster.config.passed_validators.update({"digest4", "digest2", "digest1"})
+        cluster.config.original_config_version = "config-2"
+        cluster._upload_validation_results()
+        bucket_object_utils_dict.get("upload_config").assert_called_with(
+            config={"Version": "3.6.0", "ConfigVersion": "config-2", "PassedValidators": expected_uploaded_validators},
+            config_name="validation-results.json",
+            format=S3FileFormat.JSON,
+        )
+
     @pytest.mark.parametrize(
         "assets_metadata, expected_parameters",
         [
@@ -208,3 +208,34 @@ class TestExportClusterLogsFiltersParser:
             if "start_time" not in attrs:
                 describe_log_group_mock.assert_called_with(log_group_name)
                 assert_that(export_logs_filters.start_time).is_equal_to(creation_time_mock)
+
+
+class TestClusterInstance:
+    def test_compact_record(self):
+        instance = ClusterInstance(
+            {
+                "InstanceId": "i-123",
+                "InstanceType": "t2.micro",
+                "LaunchTime": datetime.datetime(2021, 5, 10),
+                "PrivateDnsName": "ip-10-0-0-102.eu-west2.compute.internal",
+                "PrivateIpAddress": "10.0.0.102",
+                "State": {"Code": 16, "Name": "running"},
+                "BlockDeviceMappings": [{"DeviceName": "/dev/xvda", "Ebs": {"VolumeId": "vol-123"}}],
+                "Tags": [
+                    {"Key": "parallelcluster:cluster-name", "Value": "cluster"},
+                    {"Key": "parallelcluster:node-type", "Value": "Compute"},
+                    {"Key": "parallelcluster:queue-name", "Value": "queue1"},
+                    {"Key": "parallelcluster:attributes", "Value": "alinux2, slurm, 3.6.0, x86_64"},
+                    {"Key": "user-tag", "Value": "value"},
+                ],
+            }
+        )
+
+        assert_that(instance).has_id("i-123").has_instance_type("t2.micro").has_state("running")
+        assert_that(instance).has_private_ip("10.0.0.102").has_private_dns_name_short("ip-10-0-0-102")
+        assert_that(instance.public_ip).is_none()
+        assert_that(instance).has_cluster_name("cluster").has_node_type("Compute").has_queue_name("queue1")
+        assert_that(instance).has_os("alinux2").has_default_user("ec2-user")
+        # The instance data is not kept, only the exposed fields and the ParallelCluster tags are
+        assert_that(hasattr(instance, "__dict__")).is_false()
+        assert_that(instance._tags).does_not_contain_key("user-tag")
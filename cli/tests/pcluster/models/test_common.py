@@ -9,7 +9,11 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
 import os
+import tarfile
+import tempfile
 import time
 
 import pytest
@@ -18,9 +22,12 @@ from assertpy import assert_that
 from pcluster.aws.common import AWSClientError
 from pcluster.models.common import (
     CloudWatchLogsExporter,
+    CloudWatchLogsFetcher,
     FiltersParserError,
     LogGroupTimeFiltersParser,
+    LogsArchive,
     LogsExporterError,
+    S3MultipartUploadWriter,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -326,3 +333,172 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir):
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects = {
+            f"{prefix}/stream1/000001.gz": b"second part\n",
+            f"{prefix}/stream1/000000.gz": b"first part\n",
+            f"{prefix}/stream2/000000.gz": b"stream2\n",
+            f"{prefix}/stream3/000000.gz": b"stream3\n",
+        }
+        destdir = str(tmpdir)
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=key) for key in objects],
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {
+                "Body": io.BytesIO(gzip.compress(objects[key])),
+                "ContentLength": len(gzip.compress(objects[key])),
+            },
+        )
+
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", destdir)
+
+        assert_that(tmpdir.join("stream1").read()).is_equal_to("first part\nsecond part\n")
+        assert_that(tmpdir.join("stream2").read()).is_equal_to("stream2\n")
+        assert_that(tmpdir.join("stream3").read()).is_equal_to("stream3\n")
+        assert_that(get_object_mock.call_count).is_equal_to(4)
+
+    def test_archive_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir):
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects = {
+            f"{prefix}/stream1/000001.gz": gzip.compress(b"second part\n"),
+            f"{prefix}/stream1/000000.gz": gzip.compress(b"first part\n"),
+            # The trailer of a multi-member gzip object only holds the size of its last member
+            f"{prefix}/stream2/000000.gz": gzip.compress(b"stream2 ") + gzip.compress(b"member2\n"),
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=key) for key in objects],
+        )
+
+        mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(objects[key])},
+        )
+        archive_path = str(tmpdir.join("archive.tar.gz"))
+
+        with LogsArchive("root", output_file=archive_path) as archive:
+            cw_logs_exporter._archive_s3_objects_with_prefix("task_id", archive, "cloudwatch-logs")
+            archive.add_bytes("stack-events", b"events")
+
+        with tarfile.open(archive_path) as tar:
+            assert_that(tar.getnames()).is_equal_to(
+                ["root/cloudwatch-logs/stream1", "root/cloudwatch-logs/stream2", "root/stack-events"]
+            )
+            assert_that(tar.extractfile("root/cloudwatch-logs/stream1").read()).is_equal_to(
+                b"first part\nsecond part\n"
+            )
+            assert_that(tar.extractfile("root/cloudwatch-logs/stream2").read()).is_equal_to(b"stream2 member2\n")
+            assert_that(tar.extractfile("root/stack-events").read()).is_equal_to(b"events")
+
+
+class TestCloudWatchLogsFetcher:
+    @pytest.fixture()
+    def mock_log_events(self, mocker):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_streams",
+            side_effect=[
+                {"logStreams": [{"logStreamName": "stream1"}], "nextToken": "token"},
+                {"logStreams": [{"logStreamName": "stream2"}, {"logStreamName": "empty"}]},
+            ],
+        )
+        pages = {
+            ("stream1", None): {"events": [{"timestamp": 1622592000000, "message": "first"}], "nextForwardToken": "f1"},
+            ("stream1", "f1"): {"events": [], "nextForwardToken": "f2"},
+            ("stream1", "f2"): {
+                "events": [{"timestamp": 1622592001000, "message": "second"}],
+                "nextForwardToken": "f3",
+            },
+            ("stream1", "f3"): {"events": [], "nextForwardToken": "f3"},
+            ("stream2", None): {"events": [{"timestamp": 1622592002000, "message": "other"}], "nextForwardToken": "f1"},
+            ("stream2", "f1"): {"events": [], "nextForwardToken": "f1"},
+            ("empty", None): {"events": [], "nextForwardToken": "f1"},
+            ("empty", "f1"): {"events": [], "nextForwardToken": "f1"},
+        }
+        return mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=lambda log_stream_name, next_token, **kwargs: pages[(log_stream_name, next_token)],
+        )
+
+    def test_execute(self, mock_log_events, tmpdir):
+        CloudWatchLogsFetcher("groupname", output_dir=str(tmpdir)).execute(
+            log_stream_prefix="stream", start_time=datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc)
+        )
+
+        assert_that(sorted(os.listdir(tmpdir.join("cloudwatch-logs")))).is_equal_to(["stream1", "stream2"])
+        assert_that(tmpdir.join("cloudwatch-logs", "stream1").read()).is_equal_to(
+            "2021-06-02T00:00:00.000Z first\n2021-06-02T00:00:01.000Z second\n"
+        )
+        assert_that(mock_log_events.call_args.kwargs).contains_entry(
+            {"log_group_name": "groupname"}, {"start_time": 1622592000000}, {"start_from_head": True}
+        )
+
+    def test_execute_with_archive(self, mock_log_events, mocker, tmpdir):
+        # The log streams are spooled to temporary files, at most max workers of them pending besides the archived one
+        mocker.patch("pcluster.models.common.LOGS_EXPORT_MAX_WORKERS", 1)
+        spooled_files = []
+        spooled_file_class = tempfile.SpooledTemporaryFile
+
+        def _spooled_file(*args, **kwargs):
+            open_files = [spooled_file for spooled_file in spooled_files if not spooled_file.closed]
+            assert_that(len(open_files)).is_less_than_or_equal_to(1)
+            spooled_files.append(spooled_file_class(*args, **kwargs))
+            return spooled_files[-1]
+
+        mocker.patch("pcluster.models.common.tempfile.SpooledTemporaryFile", side_effect=_spooled_file)
+
+        archive_path = str(tmpdir.join("archive.tar.gz"))
+        with LogsArchive("root", output_file=archive_path) as archive:
+            CloudWatchLogsFetcher("groupname").execute(archive=archive)
+        assert_that(spooled_files).is_length(3)
+
+        with tarfile.open(archive_path) as tar:
+            assert_that(tar.getnames()).is_equal_to(["root/cloudwatch-logs/stream1", "root/cloudwatch-logs/stream2"])
+            assert_that(tar.extractfile("root/cloudwatch-logs/stream2").read()).is_equal_to(
+                b"2021-06-02T00:00:02.000Z other\n"
+            )
+
+
+def test_logs_archive_failure(tmpdir):
+    archive_path = str(tmpdir.join("archive.tar.gz"))
+    with pytest.raises(LogsExporterError, match="larger than the expected 2 bytes"):
+        with LogsArchive("root", output_file=archive_path) as archive:
+            archive.add_file("file", io.BytesIO(b"content"), 2)
+    assert_that(os.path.exists(archive_path)).is_false()
+
+
+@pytest.mark.parametrize("failure", [False, True])
+def test_s3_multipart_upload_writer(mocker, failure):
+    mock_aws_api(mocker)
+    create_mock = mocker.patch("pcluster.aws.s3.S3Client.create_multipart_upload", return_value="upload-id")
+    upload_part_mock = mocker.patch(
+        "pcluster.aws.s3.S3Client.upload_part", side_effect=lambda **kwargs: f"etag{kwargs['part_number']}"
+    )
+    complete_mock = mocker.patch("pcluster.aws.s3.S3Client.complete_multipart_upload")
+    abort_mock = mocker.patch("pcluster.aws.s3.S3Client.abort_multipart_upload")
+
+    writer = S3MultipartUploadWriter("bucket", "key", part_size=4)
+    create_mock.assert_called_once_with(bucket_name="bucket", key="key")
+    writer.write(b"abc")
+    writer.write(b"defghij")
+    assert_that([call.kwargs["body"] for call in upload_part_mock.call_args_list]).is_equal_to([b"abcd", b"efgh"])
+    if failure:
+        writer.abort()
+        abort_mock.assert_called_once_with(bucket_name="bucket", key="key", upload_id="upload-id")
+        complete_mock.assert_not_called()
+    else:
+        writer.close()
+        assert_that(upload_part_mock.call_args.kwargs["body"]).is_equal_to(b"ij")
+        complete_mock.assert_called_once_with(
+            bucket_name="bucket",
+            key="key",
+            upload_id="upload-id",
+            parts=[{"PartNumber": number, "ETag": f"etag{number}"} for number in (1, 2, 3)],
+        )
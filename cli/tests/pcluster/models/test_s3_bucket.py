@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
 import textwrap
 
@@ -15,7 +16,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
-from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType, format_content
+from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType, format_content, get_object_etag
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket
 
@@ -301,3 +302,82 @@ def test_upload_file(mocker, content, file_name, file_type, s3_file_format, expe
         body=expected_object_body,
         key=f"{artifact_directory}/{expected_object_key}",
     )
+
+
+@pytest.mark.parametrize(
+    "body, multipart_threshold, expected_etag",
+    [
+        (b"content", None, "9a0364b9e99bb480dd25e1f0284c8555"),
+        (b"content", 8, "9a0364b9e99bb480dd25e1f0284c8555"),
+        (b"c" * 10, 4, "-2"),
+    ],
+)
+def test_get_object_etag(mocker, body, multipart_threshold, expected_etag):
+    mocker.patch("pcluster.models.s3_bucket.S3_MULTIPART_CHUNKSIZE", 5)
+    etag = get_object_etag(body, multipart_threshold)
+    assert_that(etag).ends_with(expected_etag)
+    if multipart_threshold and len(body) >= multipart_threshold:
+        part_digest = hashlib.md5(b"c" * 5).digest()
+        assert_that(etag).is_equal_to(f"{hashlib.md5(part_digest * 2).hexdigest()}-2")
+
+
+@pytest.mark.parametrize(
+    "head_object_response, head_object_error, upload_expected",
+    [
+        ({"ETag": '"85a63f4e5f1055072c2691c649d1d1be"'}, None, False),
+        ({"ETag": '"other-etag"'}, None, True),
+        (None, AWSClientError("head_object", "Not Found", 404), True),
+    ],
+)
+def test_upload_file_skip_unchanged(mocker, head_object_response, head_object_error, upload_expected):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    head_object_mock = mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object", return_value=head_object_response, side_effect=head_object_error
+    )
+    put_object_mock = mocker.patch("pcluster.aws.s3.S3Client.put_object", return_value={"VersionId": "v1"})
+
+    result = bucket.upload_file({"Test": "Content"}, "test_file_name", S3FileType.ASSETS, skip_unchanged=True)
+
+    head_object_mock.assert_called_once_with(
+        bucket_name="test-bucket", object_name="pcluster_artifact_directory/assets/test_file_name"
+    )
+    if upload_expected:
+        put_object_mock.assert_called_once()
+        assert_that(result).is_equal_to({"VersionId": "v1"})
+    else:
+        put_object_mock.assert_not_called()
+        assert_that(result).is_none()
+
+
+def test_upload_resources(mocker, tmpdir):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    resource_dir = tmpdir.mkdir("resources")
+    resource_dir.join("unchanged.sh").write("unchanged")
+    resource_dir.join("changed.sh").write("changed")
+    resource_dir.mkdir("custom_resources_code").join("handler.py").write("code")
+    existing_etags = {
+        "pcluster_artifact_directory/custom_resources/unchanged.sh": hashlib.md5(b"unchanged").hexdigest(),
+        "pcluster_artifact_directory/custom_resources/changed.sh": "outdated-etag",
+    }
+
+    def _head_object(bucket_name, object_name):
+        if object_name not in existing_etags:
+            raise AWSClientError("head_object", "Not Found", 404)
+        return {"ETag": f'"{existing_etags[object_name]}"'}
+
+    mocker.patch("pcluster.aws.s3.S3Client.head_object", side_effect=_head_object)
+    upload_fileobj_mock = mocker.patch("pcluster.aws.s3.S3Client.upload_fileobj")
+
+    bucket.upload_resources(str(resource_dir), "artifacts.zip")
+
+    uploaded_keys = {call.kwargs["key"] for call in upload_fileobj_mock.call_args_list}
+    assert_that(uploaded_keys).is_equal_to(
+        {
+            "pcluster_artifact_directory/custom_resources/changed.sh",
+            "pcluster_artifact_directory/custom_resources/artifacts.zip",
+        }
+    )
@@ -61,6 +61,8 @@ def _check_cluster_schema(config_file_name):
     assert_that(replace_url_parameters(json.dumps(input_yaml, sort_keys=True))).is_equal_to(
         json.dumps(output_json, sort_keys=True)
     )
+    # Dumping the model does not modify it
+    assert_that(cluster_schema.dump(cluster)).is_equal_to(output_json)
 
     # Print output yaml
     output_yaml = yaml.dump(output_json)
@@ -1073,7 +1075,7 @@ def test_scheduler_plugin_settings_schema(
                 "pcluster.schemas.cluster_schema.urlopen", side_effect=https_error
             ).return_value.__enter__.return_value = file_mock
     if yaml_load_error:
-        mocker.patch("pcluster.utils.yaml.safe_load", side_effect=yaml_load_error)
+        mocker.patch("pcluster.schemas.cluster_schema.yaml_load", side_effect=yaml_load_error)
     if scheduler_definition:
         scheduler_plugin_settings_schema["SchedulerDefinition"] = scheduler_definition
     if grant_sudo_privileges:
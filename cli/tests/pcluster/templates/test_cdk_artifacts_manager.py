@@ -44,5 +44,8 @@ def test_upload_assets(mocker, mock_cloud_assembly, file_assets, asset_content):
 
     bucket_upload_asset_mock = mock_dict.get("upload_cfn_asset")
     bucket_upload_asset_mock.assert_called_with(
-        asset_file_content=asset_content, asset_name=file_assets[0].id, format=S3FileFormat.MINIFIED_JSON
+        asset_file_content=asset_content,
+        asset_name=file_assets[0].id,
+        format=S3FileFormat.MINIFIED_JSON,
+        skip_unchanged=True,
     )
@@ -0,0 +1,182 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import re
+
+import pytest
+from assertpy import assert_that
+from freezegun import freeze_time
+
+from pcluster.aws.persistent_cache import PersistentCache, PersistentCacheMode
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.cdk_synthesis_cache import CDKSynthesisCache, resolve_synthesis, to_cacheable_synthesis
+from pcluster.templates.cluster_stack import ClusterCdkStack
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket, mock_bucket_object_utils
+from tests.pcluster.utils import load_cluster_model_from_yaml
+
+
+@pytest.fixture
+def enable_persistent_cache(monkeypatch, tmpdir):
+    monkeypatch.delenv("PCLUSTER_PERSISTENT_CACHE_DISABLED")
+    monkeypatch.setenv("PCLUSTER_CACHE_DIR", str(tmpdir))
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(PersistentCache, "_mode", PersistentCacheMode.USE)
+    monkeypatch.setenv("PCLUSTER_CDK_SYNTHESIS_CACHE_ENABLED", "true")
+
+
+def _build_cluster_template(cluster, config_version, stack_name="clustername"):
+    cluster.config_version = config_version
+    cluster.original_config_version = f"original-{config_version}"
+    return CDKTemplateBuilder().build_cluster_template(
+        cluster_config=cluster, bucket=dummy_cluster_bucket(), stack_name=stack_name
+    )
+
+
+def _without_asset_hashes(data):
+    """Return the JSON text of the given data with the hashes of the assets, and the ids derived from them, removed."""
+    data_text = re.sub(r"AssetParameters[0-9a-f]{64}\w+", "AssetParameters", json.dumps(data, sort_keys=True))
+    return re.sub(r"[0-9a-f]{64}", "hash", data_text)
+
+
+def test_build_cluster_template_with_synthesis_cache(mocker, enable_persistent_cache):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    mock_dict = mock_bucket_object_utils(mocker)
+    _, cluster = load_cluster_model_from_yaml("slurm.required.yaml")
+
+    # Template synthesized without cache to compare the cached results with
+    PersistentCache.configure(None)
+    with freeze_time("2021-01-01T01:01:01"):
+        expected_template, expected_assets_metadata = _build_cluster_template(cluster, "version1")
+    PersistentCache.configure(PersistentCacheMode.USE)
+
+    # The nested stacks are synthesized with the placeholders, so their asset hashes differ from the ones of the
+    # template synthesized without cache, but are the same at every reuse
+    cluster_stack_spy = mocker.patch("pcluster.templates.cluster_stack.ClusterCdkStack", wraps=ClusterCdkStack)
+    with freeze_time("2021-01-01T01:01:01"):
+        template, assets_metadata = _build_cluster_template(cluster, "version1")
+    assert_that(cluster_stack_spy.call_count).is_equal_to(1)
+    assert_that(_without_asset_hashes(template)).is_equal_to(_without_asset_hashes(expected_template))
+    assert_that(_without_asset_hashes(assets_metadata)).is_equal_to(_without_asset_hashes(expected_assets_metadata))
+    assert_that(cluster.config_version).is_equal_to("version1")
+    with freeze_time("2021-01-01T01:01:01"):
+        assert_that(_build_cluster_template(cluster, "version1")).is_equal_to((template, assets_metadata))
+    assert_that(cluster_stack_spy.call_count).is_equal_to(1)
+
+    # The cached synthesis is reused, within its TTL, with the new config versions and timestamps
+    mock_dict.get("upload_cfn_asset").reset_mock()
+    with freeze_time("2021-01-01T01:05:05"):
+        template, assets_metadata = _build_cluster_template(cluster, "version2")
+    assert_that(cluster_stack_spy.call_count).is_equal_to(1)
+    assert_that(template["Parameters"]["ConfigVersion"]["Default"]).is_equal_to("original-version2")
+    assert_that(template["Resources"]).contains_key("HeadNodeWaitCondition20210101010505")
+    template_text = json.dumps(template)
+    assert_that(template_text).contains('\\"cluster_config_version\\": \\"version2\\"')
+    assert_that(template_text).contains("/aws/parallelcluster/clustername-202101010105")
+    for stale_value in ["version1", "202101010101", "PclusterCached"]:
+        assert_that(template_text).does_not_contain(stale_value)
+    assert_that(mock_dict.get("upload_cfn_asset").call_count).is_equal_to(len(expected_assets_metadata))
+
+    # The entries expire after a few minutes, since the AWS data used by the synthesis is not part of their key
+    with freeze_time("2021-01-01T01:11:02"):
+        _build_cluster_template(cluster, "version2")
+    assert_that(cluster_stack_spy.call_count).is_equal_to(2)
+
+    # A change of the synthesis inputs is a cache miss
+    with freeze_time("2021-01-01T01:11:02"):
+        _build_cluster_template(cluster, "version2", stack_name="otherclustername")
+    assert_that(cluster_stack_spy.call_count).is_equal_to(3)
+
+    # Refresh mode synthesizes the template again
+    PersistentCache.configure(PersistentCacheMode.REFRESH)
+    with freeze_time("2021-01-01T01:11:02"):
+        _build_cluster_template(cluster, "version2")
+    assert_that(cluster_stack_spy.call_count).is_equal_to(4)
+
+
+def test_synthesis_cache_is_opt_in(enable_persistent_cache, monkeypatch):
+    assert_that(CDKSynthesisCache.is_enabled()).is_true()
+    monkeypatch.delenv("PCLUSTER_CDK_SYNTHESIS_CACHE_ENABLED")
+    assert_that(CDKSynthesisCache.is_enabled()).is_false()
+    monkeypatch.setenv("PCLUSTER_CDK_SYNTHESIS_CACHE_ENABLED", "true")
+    PersistentCache.configure(PersistentCacheMode.BYPASS)
+    assert_that(CDKSynthesisCache.is_enabled()).is_false()
+
+
+def test_synthesis_cache_entries(enable_persistent_cache, tmpdir):
+    synthesis_cache = CDKSynthesisCache(ttl=60)
+    synthesis_cache.put("key", {"template": {"Resources": {}}, "assets": []})
+    assert_that(synthesis_cache.get("key")).is_equal_to({"template": {"Resources": {}}, "assets": []})
+    assert_that(synthesis_cache.get("missing-key")).is_none()
+
+    # Corrupted entries are treated as misses
+    entry_path = os.path.join(CDKSynthesisCache._get_cache_dir(), "key.json")
+    with open(entry_path, "w", encoding="utf-8") as entry_file:
+        entry_file.write("{not json")
+    assert_that(synthesis_cache.get("key")).is_none()
+
+    # Expired entries are ignored and removed at the next write
+    expired_cache = CDKSynthesisCache(ttl=-1)
+    expired_cache.put("expired-key", {})
+    assert_that(expired_cache.get("expired-key")).is_none()
+    expired_cache.put("other-key", {})
+    assert_that(os.path.exists(entry_path)).is_false()
+
+
+def test_cacheable_synthesis(mocker):
+    synthesis = {
+        "template": {
+            "Parameters": {"ConfigVersion": {"Default": "PclusterCachedOriginalConfigVersion"}},
+            "Resources": {
+                "WaitConditionPclusterCachedTimestamp": {"Properties": {"Handle": "20210101010101"}},
+                "LogGroup": {"Name": "PclusterCachedLogGroupName"},
+            },
+        },
+        "assets": [{"content": ['{"cluster_config_version": "PclusterCachedConfigVersion"}', 1, None]}],
+        "timestamp": "PclusterCachedTimestamp",
+    }
+    cacheable_synthesis = to_cacheable_synthesis(synthesis)
+    assert_that(cacheable_synthesis["placeholders"]).is_equal_to(
+        {
+            "keys": [["template", "Resources", "WaitConditionPclusterCachedTimestamp"]],
+            "values": [
+                ["template", "Parameters", "ConfigVersion", "Default"],
+                ["template", "Resources", "LogGroup", "Name"],
+                ["assets", 0, "content", 0],
+            ],
+        }
+    )
+
+    cluster = mocker.MagicMock(config_version="v1", original_config_version="ov1")
+    expected_synthesis = {
+        "template": {
+            "Parameters": {"ConfigVersion": {"Default": "ov1"}},
+            "Resources": {
+                "WaitCondition20220202020202": {"Properties": {"Handle": "20210101010101"}},
+                "LogGroup": {"Name": "/aws/pcluster/name-202202020202"},
+            },
+        },
+        "assets": [{"content": ['{"cluster_config_version": "v1"}', 1, None]}],
+    }
+    # The entries are stored as JSON
+    cacheable_synthesis = json.loads(json.dumps(cacheable_synthesis))
+    assert_that(
+        resolve_synthesis(cacheable_synthesis, cluster, "20220202020202", "/aws/pcluster/name-202202020202")
+    ).is_equal_to(expected_synthesis)
+
+    # Only the recorded locations are resolved
+    cacheable_synthesis["placeholders"]["values"].remove(["template", "Resources", "LogGroup", "Name"])
+    expected_synthesis["template"]["Resources"]["LogGroup"]["Name"] = "PclusterCachedLogGroupName"
+    assert_that(
+        resolve_synthesis(cacheable_synthesis, cluster, "20220202020202", "/aws/pcluster/name-202202020202")
+    ).is_equal_to(expected_synthesis)
@@ -0,0 +1,172 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import socketserver
+import tempfile
+import threading
+
+import pytest
+from assertpy import assert_that
+from freezegun import freeze_time
+
+from pcluster.aws.aws_resources import ImageInfo
+from pcluster.config.cluster_config import Tag
+from pcluster.schemas.imagebuilder_schema import ImageBuilderSchema
+from pcluster.templates import cdk_synthesis_daemon
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.cdk_synthesis_daemon import SOCKET_PATH_ENV, CDKSynthesisClient, _SynthesisRequestHandler
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+from tests.pcluster.models.dummy_s3_bucket import (
+    dummy_cluster_bucket,
+    dummy_imagebuilder_bucket,
+    mock_bucket,
+    mock_bucket_object_utils,
+)
+from tests.pcluster.utils import load_cluster_model_from_yaml
+
+
+@pytest.fixture
+def synthesis_socket_path(monkeypatch):
+    # Unix socket paths are limited to about 100 characters, so pytest temporary directories may be too long
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "synthesis.sock")
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        monkeypatch.setenv(SOCKET_PATH_ENV, socket_path)
+        yield socket_path
+
+
+@pytest.fixture
+def synthesis_daemon(synthesis_socket_path):
+    server = socketserver.UnixStreamServer(synthesis_socket_path, _SynthesisRequestHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _build_cluster_template(cluster):
+    with freeze_time("2021-01-01T01:01:01"):
+        return CDKTemplateBuilder().build_cluster_template(
+            cluster_config=cluster, bucket=dummy_cluster_bucket(), stack_name="clustername"
+        )
+
+
+def test_build_cluster_template_with_synthesis_daemon(mocker, monkeypatch, synthesis_daemon):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    mock_dict = mock_bucket_object_utils(mocker)
+    _, cluster = load_cluster_model_from_yaml("slurm.required.yaml")
+    # Tags added at runtime, as Cluster._add_tags does before building the template
+    cluster.tags = [Tag(key="parallelcluster:version", value="version"), Tag(key="tag", value="value")]
+    cluster.config_version = "version"
+    cluster.original_config_version = "original-version"
+
+    with monkeypatch.context() as context:
+        context.delenv(SOCKET_PATH_ENV)
+        expected_template, expected_assets_metadata = _build_cluster_template(cluster)
+
+    synthesize_spy = mocker.spy(cdk_synthesis_daemon, "_synthesize")
+    in_process_synthesis_spy = mocker.spy(CDKTemplateBuilder, "synthesize_cluster_template")
+    mock_dict.get("upload_cfn_asset").reset_mock()
+    template, assets_metadata = _build_cluster_template(cluster)
+
+    # The template is synthesized by the daemon from the source config, while the assets are uploaded by the client
+    assert_that(synthesize_spy.call_count).is_equal_to(1)
+    assert_that(synthesize_spy.call_args[0][0]).contains_entry(
+        {"config_version": "version"}, {"original_config_version": "original-version"}
+    )
+    assert_that(synthesize_spy.spy_return).does_not_contain_key("error")
+    assert_that(synthesize_spy.spy_return["template"]).is_equal_to(template)
+    # The only synthesis is the one of the daemon, the client did not fall back to the in process one
+    assert_that(in_process_synthesis_spy.call_count).is_equal_to(1)
+    daemon_cluster_config = in_process_synthesis_spy.call_args[0][0]
+    assert_that(daemon_cluster_config).is_not_same_as(cluster)
+    assert_that(daemon_cluster_config.source_config).is_equal_to(cluster.source_config)
+    assert_that([(tag.key, tag.value) for tag in daemon_cluster_config.tags]).is_equal_to(
+        [("parallelcluster:version", "version"), ("tag", "value")]
+    )
+    assert_that(json.dumps(expected_template)).contains('"parallelcluster:version"')
+    assert_that(template).is_equal_to(expected_template)
+    assert_that(assets_metadata).is_equal_to(expected_assets_metadata)
+    assert_that(mock_dict.get("upload_cfn_asset").call_count).is_equal_to(len(expected_assets_metadata))
+
+
+def test_build_imagebuilder_template_with_synthesis_daemon(mocker, monkeypatch, synthesis_daemon):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.describe_image",
+        return_value=ImageInfo(
+            {"Architecture": "x86_64", "BlockDeviceMappings": [{"DeviceName": "/dev/xvda", "Ebs": {"VolumeSize": 50}}]}
+        ),
+    )
+    image_config = ImageBuilderSchema().load(
+        {"Build": {"ParentImage": "ami-0185634c5a8a37250", "InstanceType": "c5.xlarge"}}
+    )
+
+    with monkeypatch.context() as context:
+        context.delenv(SOCKET_PATH_ENV)
+        expected_template = CDKTemplateBuilder().build_imagebuilder_template(
+            image_config, "Pcluster", dummy_imagebuilder_bucket()
+        )
+
+    synthesize_spy = mocker.spy(cdk_synthesis_daemon, "_synthesize")
+    in_process_synthesis_spy = mocker.spy(CDKTemplateBuilder, "synthesize_imagebuilder_template")
+    template = CDKTemplateBuilder().build_imagebuilder_template(image_config, "Pcluster", dummy_imagebuilder_bucket())
+
+    assert_that(synthesize_spy.call_count).is_equal_to(1)
+    assert_that(synthesize_spy.spy_return).is_equal_to({"template": template})
+    # The only synthesis is the one of the daemon, the client did not fall back to the in process one
+    assert_that(in_process_synthesis_spy.call_count).is_equal_to(1)
+    assert_that(in_process_synthesis_spy.call_args[0][0]).is_not_same_as(image_config)
+    assert_that(template).is_equal_to(expected_template)
+
+
+@pytest.mark.parametrize("daemon_failure", ["not_running", "synthesis_error"])
+def test_build_cluster_template_without_synthesis_daemon(mocker, synthesis_socket_path, daemon_failure, caplog):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    mock_bucket_object_utils(mocker)
+    _, cluster = load_cluster_model_from_yaml("slurm.required.yaml")
+    in_process_synthesis_spy = mocker.spy(CDKTemplateBuilder, "synthesize_cluster_template")
+
+    if daemon_failure == "not_running":
+        # Socket left behind by a daemon that is no longer running
+        open(synthesis_socket_path, "w").close()
+        template, _ = _build_cluster_template(cluster)
+        expected_warning = "Unable to reach the CDK synthesis daemon"
+    else:
+        mocker.patch(
+            "pcluster.templates.cdk_synthesis_daemon.ClusterSchema.load", side_effect=ValueError("invalid config")
+        )
+        server = socketserver.UnixStreamServer(synthesis_socket_path, _SynthesisRequestHandler)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        template, _ = _build_cluster_template(cluster)
+        thread.join()
+        server.server_close()
+        expected_warning = "failed to synthesize the template: ValueError: invalid config"
+
+    # The template is synthesized in process
+    assert_that(in_process_synthesis_spy.call_count).is_equal_to(1)
+    assert_that(template["Resources"]).contains_key("HeadNode")
+    assert_that(caplog.text).contains(expected_warning)
+
+
+def test_synthesis_client_from_environment(monkeypatch, synthesis_socket_path):
+    assert_that(CDKSynthesisClient.from_environment()).is_none()
+    open(synthesis_socket_path, "w").close()
+    assert_that(CDKSynthesisClient.from_environment()).is_not_none()
+    monkeypatch.delenv(SOCKET_PATH_ENV)
+    assert_that(CDKSynthesisClient.from_environment()).is_none()
@@ -0,0 +1,107 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from copy import deepcopy
+
+import pytest
+from assertpy import assert_that
+from freezegun import freeze_time
+
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.deployed_queue_groups import DeployedQueueGroups
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket, mock_bucket_object_utils
+from tests.pcluster.utils import load_cluster_model_from_yaml
+
+
+def _get_queue_group_stack(template):
+    return next(
+        (logical_id, resource)
+        for logical_id, resource in template["Resources"].items()
+        if resource["Type"] == "AWS::CloudFormation::Stack" and logical_id.startswith("ComputeFleet")
+    )
+
+
+def _get_launch_templates_config(template):
+    cfn_init = template["Resources"]["HeadNodeLaunchTemplate"]["Metadata"]["AWS::CloudFormation::Init"]
+    return cfn_init["deployConfigFiles"]["files"]["/opt/parallelcluster/shared/launch-templates-config.json"]
+
+
+def _build_cluster_template(cluster, deployed_queue_groups=None):
+    # The log group name embedded in the queue group stack depends on the build time, as the hash of its asset
+    with freeze_time("2021-01-01T01:01:01"):
+        return CDKTemplateBuilder().build_cluster_template(
+            cluster_config=cluster,
+            bucket=dummy_cluster_bucket(),
+            stack_name="clustername",
+            deployed_queue_groups=deployed_queue_groups,
+        )
+
+
+@pytest.fixture
+def deployed_cluster(mocker):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    mock_dict = mock_bucket_object_utils(mocker)
+    _, cluster = load_cluster_model_from_yaml("slurm.required.yaml")
+    template, assets_metadata = _build_cluster_template(cluster)
+    get_cfn_asset_mock = mocker.patch(
+        "pcluster.models.s3_bucket.S3Bucket.get_cfn_asset", return_value=assets_metadata[0]["content"]
+    )
+    mock_dict.get("upload_cfn_asset").reset_mock()
+    return cluster, template, assets_metadata, get_cfn_asset_mock, mock_dict.get("upload_cfn_asset")
+
+
+@pytest.mark.parametrize("unaffected_queues", [{"queue1"}, set()])
+def test_build_cluster_template_with_deployed_queue_groups(deployed_cluster, unaffected_queues):
+    cluster, deployed_template, deployed_assets_metadata, get_cfn_asset_mock, upload_cfn_asset_mock = deployed_cluster
+    deployed_queue_groups = DeployedQueueGroups(deployed_template, dummy_cluster_bucket(), unaffected_queues)
+
+    template, assets_metadata = _build_cluster_template(cluster, deployed_queue_groups)
+
+    # The queue group stack is the same either it is reused or synthesized again
+    assert_that(_get_queue_group_stack(template)).is_equal_to(_get_queue_group_stack(deployed_template))
+    assert_that(template["Parameters"]).is_equal_to(deployed_template["Parameters"])
+    assert_that(assets_metadata).is_equal_to(deployed_assets_metadata)
+    assert_that(_get_launch_templates_config(template)).is_equal_to(_get_launch_templates_config(deployed_template))
+
+    if unaffected_queues:
+        assert_that(deployed_queue_groups.reused_stacks).is_length(1)
+        get_cfn_asset_mock.assert_called_once_with(
+            deployed_assets_metadata[0]["s3_object_key_parameter"]["value"][-64:]
+        )
+        upload_cfn_asset_mock.assert_not_called()
+    else:
+        assert_that(deployed_queue_groups.reused_stacks).is_empty()
+        get_cfn_asset_mock.assert_not_called()
+        upload_cfn_asset_mock.assert_called_once()
+
+
+def test_deployed_queue_groups_not_reusable(deployed_cluster):
+    cluster, deployed_template, _, _, upload_cfn_asset_mock = deployed_cluster
+
+    # The deployed stack refers to a resource not in the cluster stack anymore, so it is synthesized again
+    inconsistent_template = deepcopy(deployed_template)
+    _, stack_resource = _get_queue_group_stack(inconsistent_template)
+    stack_resource["Properties"]["Parameters"]["referencetoRemovedResource"] = {"Ref": "RemovedResource"}
+    template, _ = _build_cluster_template(
+        cluster, DeployedQueueGroups(inconsistent_template, dummy_cluster_bucket(), {"queue1"})
+    )
+    assert_that(_get_queue_group_stack(template)).is_equal_to(_get_queue_group_stack(deployed_template))
+    upload_cfn_asset_mock.assert_called_once()
+
+    # The deployed stack contains different launch templates
+    deployed_queue_groups = DeployedQueueGroups(deployed_template, dummy_cluster_bucket(), {"queue1"})
+    assert_that(
+        deployed_queue_groups.get_reusable_stack(
+            _get_queue_group_stack(deployed_template)[0][:-8], {"queue1": {"compute-resource2": "LaunchTemplateOther"}}
+        )
+    ).is_none()
+    assert_that(deployed_queue_groups.reused_stacks).is_empty()
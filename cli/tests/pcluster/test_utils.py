@@ -10,10 +10,12 @@
 # limitations under the License.
 # This module provides unit tests for the functions in the pcluster.utils module."""
 import asyncio
+import datetime
 import os
 import time
 import unittest
 from collections import namedtuple
+from io import BytesIO
 
 import pytest
 from assertpy import assert_that
@@ -23,9 +25,9 @@ import pcluster.aws.common
 import pcluster.utils as utils
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
-from pcluster.aws.common import Cache
+from pcluster.aws.common import Cache, CacheStore, CacheVolatility
 from pcluster.models.cluster import Cluster, ClusterStack
-from pcluster.utils import batch_by_property_callback, yaml_load
+from pcluster.utils import batch_by_property_callback, iterate_concurrently, run_concurrently, yaml_load
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
 FAKE_NAME = "cluster-name"
@@ -168,6 +170,56 @@ class TestCache:
 
         assert_that(self.invocations).is_length(4)
 
+    @staticmethod
+    @Cache.cached(volatility=CacheVolatility.IMMUTABLE)
+    def _immutable_cached_method(arg1):
+        TestCache.invocations.append(arg1)
+        return arg1
+
+    def test_clear_by_volatility(self):
+        for _ in range(0, 2):
+            assert_that(self._cached_method_1(1, 2)).is_equal_to((1, 2))
+            assert_that(self._immutable_cached_method(1)).is_equal_to(1)
+
+        Cache.clear(CacheVolatility.REQUEST)
+
+        assert_that(self._cached_method_1(1, 2)).is_equal_to((1, 2))
+        assert_that(self._immutable_cached_method(1)).is_equal_to(1)
+        assert_that(self.invocations).is_equal_to([(1, 2), 1, (1, 2)])
+
+    def test_scoped_key(self):
+        class FakeClient:
+            def __init__(self, region):
+                self.cache_scope = ("FakeClient", region)
+
+            @Cache.cached(volatility=CacheVolatility.IMMUTABLE)
+            def get_value(self, arg):
+                TestCache.invocations.append((self.cache_scope, arg))
+                return arg
+
+        for _ in range(0, 2):
+            # New instances with the same scope share the cached entries
+            assert_that(FakeClient("us-east-1").get_value(1)).is_equal_to(1)
+            assert_that(FakeClient("eu-west-1").get_value(1)).is_equal_to(1)
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_cache_store_ttl_and_eviction(self, mocker):
+        monotonic_mock = mocker.patch("pcluster.aws.common.time.monotonic", return_value=0)
+        store = CacheStore(CacheVolatility.STABLE, max_size=2)
+        store.put("key1", "value1")
+        store.put("key2", "value2")
+        # Reading key1 makes key2 the least recently used entry
+        assert_that(store.get("key1")).is_equal_to("value1")
+        store.put("key3", "value3")
+        assert_that("key2" in store).is_false()
+        assert_that(store).is_length(2)
+
+        monotonic_mock.return_value = 10 * 60
+        assert_that(store.get("key1")).is_none()
+        assert_that(store.get("key3", "default")).is_equal_to("default")
+        assert_that(store).is_length(0)
+
 
 def test_init_from_instance_type(mocker, caplog):
     mock_aws_api(mocker, mock_instance_type_info=False)
@@ -399,6 +451,29 @@ def test_yaml_load(yaml_string, expected_yaml_dict, expected_error):
         assert_that(yaml_dict).is_equal_to(expected_yaml_dict)
 
 
+def test_yaml_load_error_mark():
+    with pytest.raises(ConstructorError) as exc:
+        yaml_load("PropA:\n  PropB: ValueB1\n  PropB: ValueB2")
+    assert_that(exc.value.problem_mark.line).is_equal_to(2)
+    # The error reports the snippet of the document also when parsed with libyaml
+    assert_that(str(exc.value)).contains("    PropB: ValueB2\n      ^")
+
+
+def test_yaml_load_memoization(mocker):
+    yaml_string = "PropA:\n  PropB: [ValueB1, ValueB2]\nPropC: 2023-05-01"
+    yaml_parse_spy = mocker.spy(utils, "_yaml_parse")
+
+    first_yaml_dict = yaml_load(yaml_string)
+    first_yaml_dict["PropA"]["PropB"].append("ValueB3")
+    second_yaml_dict = yaml_load(BytesIO(yaml_string.encode("utf-8")))
+
+    # The document is parsed once, and each call returns a new copy of it
+    yaml_parse_spy.assert_called_once()
+    assert_that(second_yaml_dict).is_equal_to(
+        {"PropA": {"PropB": ["ValueB1", "ValueB2"]}, "PropC": datetime.date(2023, 5, 1)}
+    )
+
+
 @pytest.mark.parametrize("imds_support, http_tokens", [("v1.0", "optional"), ("v2.0", "required")])
 def test_get_http_token_settings(imds_support, http_tokens):
     assert_that(utils.get_http_tokens_setting(imds_support)).is_equal_to(http_tokens)
@@ -431,6 +506,75 @@ def test_split_resource_prefix(resource_prefix, expected_output):
 Item = namedtuple("Item", "property")
 
 
+def test_run_concurrently():
+    completed = []
+
+    def _function(value):
+        time.sleep(0.01 * (3 - value))
+        completed.append(value)
+        return value
+
+    assert_that(run_concurrently([lambda i=i: _function(i) for i in range(3)], max_workers=3)).is_equal_to([0, 1, 2])
+
+    def _failing_function():
+        raise ValueError("failure")
+
+    # All the functions are completed before raising the failure
+    completed.clear()
+    with pytest.raises(ValueError, match="failure"):
+        run_concurrently([_failing_function, lambda: _function(2)], max_workers=2)
+    assert_that(completed).is_equal_to([2])
+    assert_that(run_concurrently([], max_workers=2)).is_empty()
+
+
+def test_iterate_concurrently():
+    started = []
+    consumed = []
+
+    def _function(value):
+        started.append(value)
+        return value
+
+    results = iterate_concurrently([lambda i=i: _function(i) for i in range(5)], max_workers=2)
+    for result in results:
+        consumed.append(result)
+        # At most max_workers functions are started ahead of the consumed results
+        assert_that(len(started)).is_less_than_or_equal_to(len(consumed) + 2)
+    assert_that(consumed).is_equal_to([0, 1, 2, 3, 4])
+
+    # The functions not yet started are not run once the iteration is interrupted
+    started.clear()
+    results = iterate_concurrently([lambda i=i: _function(i) for i in range(5)], max_workers=2)
+    assert_that(next(results)).is_equal_to(0)
+    results.close()
+    assert_that(len(started)).is_less_than_or_equal_to(3)
+
+
+def test_token_bucket(mocker):
+    clock = {"now": 100.0}
+    mocker.patch("pcluster.utils.time.monotonic", side_effect=lambda: clock["now"])
+    sleep_mock = mocker.patch(
+        "pcluster.utils.time.sleep", side_effect=lambda seconds: clock.update(now=clock["now"] + seconds)
+    )
+    bucket = utils.TokenBucket(rate=2, capacity=3)
+
+    # The burst is served without waiting, then the tokens are taken at the refill rate
+    for _ in range(3):
+        bucket.acquire()
+    sleep_mock.assert_not_called()
+    bucket.acquire()
+    sleep_mock.assert_called_once_with(0.5)
+
+    # The bucket does not refill beyond its capacity
+    clock["now"] += 60
+    sleep_mock.reset_mock()
+    for _ in range(3):
+        bucket.acquire()
+    sleep_mock.assert_not_called()
+    bucket.acquire()
+    sleep_mock.assert_called_once_with(0.5)
+
+
 @pytest.mark.parametrize(
     "items, expected_batches, batch_size, raises",
     [
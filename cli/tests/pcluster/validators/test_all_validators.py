@@ -287,12 +287,12 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
         [
             # Defaults of min_count=0, max_count=10
             call(min_count=0, max_count=5),
-            call(min_count=0, max_count=10),
-            call(min_count=0, max_count=10),
+            # Validators registered with identical arguments by different resources are executed only once
             call(min_count=0, max_count=10),
         ],
         any_order=True,
     )
+    assert_that(compute_resource_size_validator.call_count).is_equal_to(2)
     max_count_validator.assert_has_calls(
         [
             call(resources_length=2, max_length=100, resource_name="SlurmQueues"),
@@ -310,8 +310,6 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
             call(instance_type="t2.large", image="ami-12345678"),
             call(instance_type="c4.2xlarge", image="ami-12345678"),
             call(instance_type="c5.4xlarge", image="ami-12345678"),
-            call(instance_type="c5d.xlarge", image="ami-12345678"),
-            call(instance_type="t2.large", image="ami-12345678"),
         ],
         any_order=True,
     )
@@ -328,9 +326,7 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
             ),
         ]
     )
-    security_groups_validator.assert_has_calls(
-        [call(security_group_ids=None), call(security_group_ids=None)], any_order=True
-    )
+    security_groups_validator.assert_has_calls([call(security_group_ids=None)], any_order=True)
     architecture_os_validator.assert_has_calls(
         [call(os="alinux2", architecture="x86_64", custom_ami="ami-12345678", ami_search_filters=None)]
     )